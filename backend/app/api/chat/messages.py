@@ -19,8 +19,8 @@ from app.core.rag import RAGService
 from app.repositories.session_repository import SessionRepository
 from app.repositories.rag_repository import RAGRepository
 from app.utils.logging import logger
-from app.services.service_locator import get_reranker
 from app.api.chat.schemas import ComparisonConfirmRequest
+from app.core.executors import run_in_db_executor
 
 router = APIRouter()
 
@@ -86,7 +86,7 @@ async def chat_with_session(
     rag_repo = RAGRepository(db)
 
     # Verify session exists and belongs to user (with documents eagerly loaded)
-    session = session_repo.get_session(session_id, user.id, user.org_id)
+    session = await run_in_db_executor(session_repo.get_session, session_id, user.id, user.org_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -102,7 +102,7 @@ async def chat_with_session(
     document_names = [link.document.filename for link in session.document_links]
 
     # Edge case: Validate documents are indexed (have chunks)
-    chunk_count = rag_repo.count_chunks_for_documents(document_ids)
+    chunk_count = await run_in_db_executor(rag_repo.count_chunks_for_documents, document_ids)
 
     if chunk_count == 0:
         logger.warning(
@@ -129,9 +129,8 @@ async def chat_with_session(
         }
     )
 
-    # Initialize RAG service (still needs db session for vector search)
-    reranker = get_reranker()
-    rag_service = RAGService(db, reranker=reranker)
+    # Per-request RAG service over the shared component graph (db session for vector search)
+    rag_service = RAGService(db)
 
     # Stream chat response
     async def event_generator():
@@ -155,7 +154,7 @@ async def chat_with_session(
         from app.repositories.chat_repository import ChatRepository
         from app.config import settings
         chat_repo = ChatRepository()
-        user_message_count = chat_repo.get_user_message_count(session_id)
+        user_message_count = await run_in_db_executor(chat_repo.get_user_message_count, session_id)
 
         if user_message_count >= settings.chat_max_turns_before_warning:
             logger.info(
@@ -342,9 +341,8 @@ async def confirm_comparison_selection(
             detail="Selected documents haven't been indexed yet"
         )
 
-    # Initialize RAG service
-    reranker = get_reranker()
-    rag_service = RAGService(db, reranker=reranker)
+    # Per-request RAG service over the shared component graph
+    rag_service = RAGService(db)
 
     # Stream chat response
     async def event_generator():
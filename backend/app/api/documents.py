@@ -284,7 +284,8 @@ async def upload_document(
                 job_id=job.job_id,
                 document_id=document.id,  # Canonical document ID
                 collection_id=collection_id,
-                user_id=user.id
+                user_id=user.id,
+                content_hash=content_hash
             )
 
             logger.info(
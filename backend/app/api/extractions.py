@@ -430,7 +430,7 @@ async def extract_document(
             with open(temp_path, "wb") as f_out:
                 f_out.write(content)
             logger.info("Saved uploaded file for Celery processing", extra={"job_id": job_id, "path": temp_path})
-            start_extraction_chain(temp_path, file.filename, job_id, request_id, user.id, context)
+            start_extraction_chain(temp_path, file.filename, job_id, request_id, user.id, context, content_hash=content_hash)
 
         # ============================================
         # STEP 7: Return 202 Accepted with job_id (async behavior)
@@ -669,7 +669,8 @@ async def extract_temp_document(
             job_id=job_id,
             extraction_id=extraction_id,
             user_id=user.id,
-            context=context_clean
+            context=context_clean,
+            content_hash=content_hash
         )
 
         return JSONResponse(
@@ -32,6 +32,7 @@ from app.core.metrics_setup import setup_prometheus_multiproc_dir
 setup_prometheus_multiproc_dir(clear_on_startup=False)  # Don't clear - API already did
 
 from celery import Celery
+from celery.signals import worker_process_init, task_postrun
 from app.config import settings
 
 celery_app = Celery(
@@ -47,6 +48,8 @@ celery_app.conf.update(
     result_serializer="json",
     task_track_started=True,
     worker_max_tasks_per_child=100,  # recycle to avoid memory leaks
+    # Children load models in worker_process_init (warm_worker_models) before signalling ready
+    worker_proc_alive_timeout=settings.worker_proc_alive_timeout_seconds,
     broker_connection_retry_on_startup=True,
 )
 
@@ -74,6 +77,24 @@ except Exception:
     # Avoid hard failure if tasks module temporarily missing; log later after logging init.
     pass
 
+@worker_process_init.connect
+def warm_worker_models(**kwargs):
+    """Load shared models in each worker child before it accepts tasks."""
+    if not settings.worker_model_warmup_enabled:
+        return
+    from app.services.model_registry import warm_models
+    from app.utils.logging import logger
+    loaded = warm_models(settings.worker_warmup_models.split(","))
+    logger.info("Worker models warmed", extra={"models": loaded, "pid": os.getpid()})
+
+
+@task_postrun.connect
+def flush_job_progress(**kwargs):
+    """Persist coalesced job progress before the worker picks up the next task."""
+    from app.services.job_tracker import flush_pending_job_progress
+    flush_pending_job_progress()
+
+
 @celery_app.task(bind=True)
 def ping(self):  # simple health check task
     return {"status": "ok"}
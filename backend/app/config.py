@@ -22,6 +22,9 @@ class Settings(BaseSettings):
     azure_doc_intelligence_endpoint: str = ""
     azure_doc_model: str = "prebuilt-layout"  # Azure Document Intelligence model to use
     azure_doc_timeout_seconds: int = 700  # Timeout for Azure parsing
+    azure_doc_segment_pages: int = 50  # Pages per concurrently analyzed segment (0 = one request per document)
+    azure_doc_parallel_min_pages: int = 100  # Only documents at least this long are split
+    azure_doc_max_concurrency: int = 4  # Segments analyzed at once per document
 
     # Email notifications (simpler for MVP - using Gmail SMTP)
     notification_email: str = ""  # Your email to receive feedback notifications
@@ -40,6 +43,15 @@ class Settings(BaseSettings):
     excel_schema_only: bool = False  # If True, only use schema (skip generic analyzer)
     excel_skip_schema: bool = False  # If True, skip schema (use generic analyzer only)
     # Default (both False) = Hybrid mode: schema first, generic fallback
+    template_map_concurrency: int = 6  # Sheet batches auto-mapped concurrently by the LLM
+    template_map_batch_retries: int = 2  # Extra attempts for a failed sheet batch
+
+    # ===== PARSER OUTPUT CACHE =====
+    # Reuse parser output for identical files (SHA256 + parser name/version/model + tier)
+    parser_cache_enabled: bool = True
+    parser_cache_ttl_seconds: int = 604_800  # 7 days (Redis index; blobs live in the artifact store)
+    parser_cache_lock_timeout_seconds: int = 900  # Max lifetime of a parse lock (slowest expected parse)
+    parser_cache_lock_wait_seconds: int = 600  # Max wait for a concurrent parse before parsing anyway
 
     # ===== PARSER CONFIGURATION =====
     # Which parser to use for each tier + PDF type combination
@@ -53,6 +65,12 @@ class Settings(BaseSettings):
     # ===== PARSER TIMEOUTS =====
     parser_timeout_seconds: int = 300  # Generic parser timeout
 
+    # ===== PYMUPDF PARALLEL PARSING =====
+    # Large digital PDFs are split into page ranges parsed in a process pool
+    pymupdf_parallel_min_pages: int = 150  # Page count that switches to the process pool (0 = never)
+    pymupdf_parallel_workers: int = 0  # Pool size (0 = CPU count, capped at 8)
+    pymupdf_extract_tables: bool = False  # Also run page.find_tables() and keep block layout per page (slow; adds tables and page_layouts to metadata)
+
     # ===== GOOGLE DOCUMENT AI (Optional) =====
     # Google Cloud settings for Document AI OCR
     google_cloud_project_id: str = ""
@@ -92,6 +110,10 @@ class Settings(BaseSettings):
     synthesis_llm_max_tokens: int = 50000  # Haiku 4.5 max output: 64K tokens (leave room for overhead)
     synthesis_llm_timeout_seconds: int = 600  # 10 minutes for large workflow outputs
 
+    # Input-token budget per model per minute for fan-out LLM calls (map phase, batch summaries).
+    # Shared via Redis across runs and workers; 0 disables. Keep below the provider tier's ITPM limit.
+    llm_tokens_per_minute: int = 400_000
+
     # ===== CHAT MEMORY SETTINGS =====
     # Number of most recent messages (user+assistant turns) to include verbatim
     chat_verbatim_message_count: int = 4
@@ -113,11 +135,45 @@ class Settings(BaseSettings):
     chat_summary_cache_ttl_seconds: int = 86_400
     # Warn user after N user messages (round-trip count) - recommend new session
     chat_max_turns_before_warning: int = 30
+    # Thread pool for blocking DB work in the async chat pipeline (history, doc lookups, retrieval SQL)
+    # Keep <= SQLAlchemy pool capacity (pool_size 5 + max_overflow 10 by default)
+    chat_db_executor_workers: int = 8
+    # Thread pool for model inference (query embedding, cross-encoder). Small on purpose:
+    # torch already parallelizes each forward pass, more threads just contend for cores
+    chat_inference_executor_workers: int = 2
+
+    # ===== LOCAL MODEL INFERENCE BACKEND =====
+    # ONNX exports of the embedder / cross-encoder (embedding_backend, rag_reranker_backend)
+    onnx_model_dir: str = "./models/onnx"  # Built once per model/variant, shared by all processes
+    onnx_quantization_config: str = "avx2"  # onnx-int8 target: arm64 | avx2 | avx512 | avx512_vnni
+    # Intra-op threads per model (ONNX Runtime session / torch.set_num_threads); 0 = library default
+    inference_threads: int = 0
+
+    # ===== INFERENCE MICRO-BATCHING =====
+    # Coalesce concurrent chat embed/rerank calls into shared forward passes (API process only)
+    inference_batching_enabled: bool = True
+    # Query embeddings: dispatch at N texts or after max wait, whichever comes first
+    inference_embed_max_batch_size: int = 64
+    inference_embed_max_wait_ms: float = 5.0
+    # Cross-encoder: max (query, chunk) pairs per forward pass (one chat turn is ~18 pairs)
+    inference_rerank_max_batch_size: int = 128
+    inference_rerank_max_wait_ms: float = 5.0
 
     # Celery / Task Queue
     use_celery: bool = False  # Toggle to enable Celery task pipeline
     celery_broker_url: str = "redis://localhost:6379/0"
     celery_result_backend: str = "redis://localhost:6379/0"
+    # Job progress write-behind: max seconds before a progress-only update reaches the DB
+    # (status/stage changes and terminal states are always written immediately)
+    job_progress_flush_seconds: float = 2.0
+    # Load models once per worker child (worker_process_init) instead of inside the first task
+    worker_model_warmup_enabled: bool = True
+    # Comma-separated model registry names: embedder, reranker, compressor
+    # (reranker/compressor are skipped when rag_use_reranker/rag_use_compression are off)
+    worker_warmup_models: str = "embedder,reranker,compressor"
+    # Time a prefork child may take to start (Celery's worker_proc_alive_timeout, default 4s);
+    # must cover model warm-up or the parent kills and respawns the child in a loop
+    worker_proc_alive_timeout_seconds: float = 180.0
 
     # Cache backend selection
     # If enabled, DocumentCache will use Redis instead of file-backed JSON files
@@ -126,7 +182,9 @@ class Settings(BaseSettings):
 
     # Chunking Settings
     enable_chunking: bool = True  # Enable multi-stage LLM processing with chunking
-    chunk_batch_size: int = 10  # Number of narrative chunks to process per cheap LLM call
+    chunk_batch_size: int = 10  # Max narrative chunks per cheap LLM call
+    chunk_batch_max_tokens: int = 12_000  # Close a batch early once its chunks reach this many tokens
+    chunk_summary_concurrency: int = 4  # Batch summary calls in flight per extraction task
 
     # ===== EMBEDDINGS CONFIGURATION =====
     # Which embedding provider to use: "sentence-transformer" (free, local) or "openai" (paid, API)
@@ -135,6 +193,8 @@ class Settings(BaseSettings):
     # Sentence Transformer settings (used if embedding_provider="sentence-transformer")
     sentence_transformer_model: str = "all-MiniLM-L6-v2"  # Fast, good quality, 384 dimensions
     # Other options: "all-mpnet-base-v2" (768d, slower but better), "multi-qa-MiniLM-L6-cos-v1" (384d, optimized for Q&A)
+    # Inference backend: "torch" (fp32 PyTorch), "onnx" (ONNX Runtime fp32) or "onnx-int8" (dynamic int8, CPU)
+    embedding_backend: str = "torch"
 
     # OpenAI settings (used if embedding_provider="openai")
     openai_api_key: str = ""  # Required if using OpenAI embeddings
@@ -145,6 +205,14 @@ class Settings(BaseSettings):
     # all-MiniLM-L6-v2: 384, all-mpnet-base-v2: 768, text-embedding-3-small: 1536
     embedding_dimension: int = 384
 
+    # ===== EMBEDDING CACHE =====
+    # Two-tier cache (in-process LRU + Redis) for repeated texts, keyed by provider/model/normalized text
+    embedding_cache_enabled: bool = True
+    # In-process entries (~1.5KB each at 384d)
+    embedding_cache_lru_size: int = 10_000
+    # Redis tier TTL (seconds); 0 disables the Redis tier (uses use_redis_cache / redis_url)
+    embedding_cache_ttl_seconds: int = 604_800  # 7 days
+
     # ===== RAG HYBRID SEARCH SETTINGS =====
     # Combines semantic (vector) search with keyword (BM25/FTS) search
     # using Reciprocal Rank Fusion (RRF) for improved retrieval quality
@@ -157,6 +225,11 @@ class Settings(BaseSettings):
     # Number of candidates to retrieve from each search method before merging
     rag_retrieval_candidates: int = 18
 
+    # Fused retrieval: run semantic + keyword candidate sets as CTEs in ONE statement,
+    # compute ranks/RRF in Postgres and fetch chunk text once per unique chunk.
+    # False = legacy two-query path with RRF merge in Python
+    rag_hybrid_fused_query: bool = False
+
     # Final number of chunks to return after re-ranking (Phase 2)
     # Increased to 12 to provide room for context expansion
     rag_final_top_k: int = 12
@@ -165,6 +238,44 @@ class Settings(BaseSettings):
     rag_chat_semantic_similarity_floor: float = 0.12
     rag_workflow_semantic_similarity_floor: float = 0.06
 
+    # Speculative retrieval: start hybrid retrieval + cross-encoder scoring on the raw
+    # message while the query-understanding LLM call is in flight, then reuse/merge
+    # those candidates with the refined (reformulated + HyDE) retrieval
+    rag_speculative_retrieval_enabled: bool = False
+    # Reuse speculative candidates as-is when the reformulated query keeps at least
+    # this fraction of the raw message's words (Jaccard) and there is no HyDE text
+    rag_speculative_reuse_overlap: float = 0.8
+
+    # ===== SESSION VECTOR INDEX =====
+    # Semantic search for document-scoped (session) retrieval from an exact in-memory
+    # NumPy index per document set instead of the table-wide pgvector HNSW index
+    rag_session_index_enabled: bool = True
+    rag_session_index_max_chunks: int = 20_000  # Larger document sets use pgvector
+    rag_session_index_cache_size: int = 32  # Document sets kept per process (LRU)
+    rag_session_index_max_mb: int = 256  # Embedding matrix memory per process across cached sets
+    # Seconds a checked document signature is trusted before re-querying it; bounds how
+    # long another process's re-index or delete can go unnoticed (0 = check every search)
+    rag_session_index_signature_ttl_seconds: float = 5.0
+
+    # ===== QUERY UNDERSTANDING CACHE =====
+    # Cache QueryUnderstanding results per (normalized query, document filename set)
+    query_understanding_cache_enabled: bool = True
+    query_understanding_cache_lru_size: int = 2_000  # In-process entries
+    query_understanding_cache_ttl_seconds: int = 86_400  # Redis tier TTL; 0 disables the Redis tier
+    # Opt-in near-duplicate lookup: reuse the most similar cached query for the same document
+    # set when query embeddings have cosine similarity >= threshold and the numbers/entities
+    # match (0 disables; questions differing only in a year or property embed very closely)
+    query_understanding_near_duplicate_threshold: float = 0.0
+    query_understanding_near_duplicate_max_entries: int = 500  # Indexed queries per document set
+
+    # ===== CHAT ANSWER CACHE =====
+    # Opt-in: replay the stored answer (text, citations, usage) for a repeated question over
+    # the same document set and index versions; follow-ups that depend on history bypass it
+    chat_answer_cache_enabled: bool = False
+    chat_answer_cache_lru_size: int = 256  # In-process entries
+    chat_answer_cache_ttl_seconds: int = 86_400  # Redis tier TTL; 0 disables the Redis tier
+    chat_answer_cache_replay_chunk_chars: int = 64  # Characters per replayed SSE chunk
+
     # ===== DOCUMENT COMPARISON SETTINGS =====
     # Schema-based comparison system for multi-document analysis
     comparison_enabled: bool = True  # Enable document comparison feature
@@ -172,6 +283,7 @@ class Settings(BaseSettings):
     comparison_chunks_per_doc: int = 10  # Chunks to retrieve per document
     comparison_max_pairs: int = 8  # Max pairs/clusters to include in prompt
     comparison_max_documents: int = 3  # Max number of documents to compare (2-3)
+    comparison_pairing_top_k: int = 3  # Bi-encoder neighbours per chunk sent to the cross-encoder (0 = all pairs)
 
     # ===== RAG RE-RANKER SETTINGS =====
     # Cross-encoder re-ranking for improved relevance scoring
@@ -183,6 +295,9 @@ class Settings(BaseSettings):
     # Options: "cross-encoder/ms-marco-MiniLM-L-6-v2", "BAAI/bge-reranker-base", "BAAI/bge-reranker-large"
     rag_reranker_model: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
 
+    # Inference backend: "torch", "onnx" or "onnx-int8" (see embedding_backend)
+    rag_reranker_backend: str = "torch"
+
     # Batch size for re-ranking (process multiple query-doc pairs together)
     rag_reranker_batch_size: int = 8
 
@@ -192,6 +307,12 @@ class Settings(BaseSettings):
     # Apply metadata boosting to re-ranker scores (gentle nudge for tables/narrative)
     rag_reranker_apply_metadata_boost: bool = True
 
+    # Cache raw cross-encoder scores per (model, normalized query, chunk id + text version)
+    # Skips tokenization + predict for pairs already scored (retries, comparisons, workflow re-runs)
+    rag_rerank_cache_enabled: bool = True
+    rag_rerank_cache_lru_size: int = 50_000  # In-process entries
+    rag_rerank_cache_ttl_seconds: int = 86_400  # Redis tier TTL; 0 disables the Redis tier
+
     # ===== CONTEXT EXPANSION SETTINGS =====
     # Expand retrieved chunks with related context (tables, narratives, parents)
 
@@ -281,12 +402,31 @@ class Settings(BaseSettings):
     # Options: "r2" or "local" - automatically determined by use_r2_for_documents
     storage_backend: str = "r2"  # Auto-set based on use_r2_for_documents
 
+    # ===== INDEXING ARTIFACTS =====
+    # Indexing stages pass pointers to msgpack/.npy artifacts instead of inline Celery payloads
+    indexing_artifact_backend: str = "local"  # "local" (shared volume) or "r2"
+    indexing_artifact_dir: Path = Path("/tmp/indexing_artifacts")  # Must be shared by all indexing workers
+
+    # ===== STREAMING INDEXING =====
+    # Chunk → embed → store pipelined in one task, committing each batch (documents become searchable early)
+    indexing_streaming_enabled: bool = False
+    indexing_stream_batch_size: int = 32  # Chunks per embed/commit batch
+
+    # ===== CHUNK INGESTION =====
+    chunk_ingest_method: str = "copy"  # "copy" (binary COPY, psycopg 3) or "insert" (executemany)
+    chunk_ingest_large_batch_rows: int = 5000  # Apply index maintenance hints at/above this many rows
+    chunk_ingest_gin_pending_list_kb: int = 65536  # SET LOCAL gin_pending_list_limit for large batches
+
     # ===== WORKFLOW BUDGET SETTINGS =====
     # Maximum tokens and cost per workflow run (to prevent runaway costs)
     workflow_max_tokens_per_run: int = 200_000  # Max tokens (input + output) per workflow run
     workflow_max_cost_per_run_usd: float = 5.0  # Max USD cost per workflow run
     workflow_max_attempts: int = 3  # Max LLM generation attempts with retry
     workflow_context_max_chars: int = 150_000  # Max context characters per workflow run
+    # Map-reduce: sections summarized concurrently (bounded by llm_tokens_per_minute too)
+    workflow_map_concurrency: int = 4
+    # Map-reduce: extra attempts per section summary after a failed LLM call
+    workflow_map_section_retries: int = 2
     
     class Config:
         # Point explicitly to backend/.env so scripts run from repo root still load variables
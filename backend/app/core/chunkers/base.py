@@ -5,7 +5,7 @@ Different parsers may require different chunking strategies based on their outpu
 """
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from enum import Enum
 
 from app.core.parsers.base import ParserOutput
@@ -128,6 +128,22 @@ class DocumentChunker(ABC):
         """
         pass
 
+    def iter_chunks(self, parser_output: ParserOutput) -> Iterator[Chunk]:
+        """Yield chunks incrementally (used by streaming indexing).
+
+        Default implementation chunks the whole document and then yields;
+        streaming indexing then pipelines embedding and storage of the chunks.
+        A chunker whose output for a page does not depend on later pages may
+        override this to yield as it goes.
+
+        Args:
+            parser_output: Output from DocumentParser
+
+        Yields:
+            Chunk objects in document order
+        """
+        yield from self.chunk(parser_output).chunks
+
     @property
     @abstractmethod
     def name(self) -> str:
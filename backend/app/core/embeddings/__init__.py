@@ -12,14 +12,19 @@ Usage:
     embedding = embedder.embed_text("Your text here")
     embeddings = embedder.embed_batch(["Text 1", "Text 2", "Text 3"])
 
+Repeated texts are served from a two-tier cache (LRU + Redis), see cache.py.
+Bulk indexing should use `embedder.uncached`.
+
 To switch embedding providers, just change config:
     .env: EMBEDDING_PROVIDER=openai (instead of sentence-transformer)
 """
 from app.core.embeddings.base import EmbeddingProvider
 from app.core.embeddings.factory import get_embedding_provider, create_embedding_provider
+from app.core.embeddings.cache import CachedEmbeddingProvider
 
 __all__ = [
     "EmbeddingProvider",
     "get_embedding_provider",
     "create_embedding_provider",
+    "CachedEmbeddingProvider",
 ]
@@ -67,3 +67,13 @@ class EmbeddingProvider(ABC):
             String model name (e.g., "all-MiniLM-L6-v2", "text-embedding-3-small")
         """
         pass
+
+    @property
+    def uncached(self) -> "EmbeddingProvider":
+        """
+        Provider that bypasses any embedding cache (used for bulk chunk indexing).
+
+        Returns:
+            The underlying provider (self unless wrapped by a cache)
+        """
+        return self
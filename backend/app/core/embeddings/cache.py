@@ -0,0 +1,246 @@
+# backend/app/core/embeddings/cache.py
+"""
+Two-tier embedding cache (in-process LRU + Redis).
+
+Query embeddings repeat constantly: HyDE + query per chat turn, and the fixed
+workflow section queries ("revenue growth", "ebitda margin", ...) on every
+workflow run. CachedEmbeddingProvider wraps any EmbeddingProvider and serves
+repeats from cache.
+
+Key design:
+    cache key: emb:<provider>:<model>:<sha256(normalized text)>
+    normalized text: NFC + collapsed whitespace (case preserved)
+    value: packed float32 bytes (array('f')), ~1.5KB at 384d
+
+Tiers:
+    1. LRU (per process, settings.embedding_cache_lru_size entries)
+    2. Redis (shared across API + Celery workers, settings.embedding_cache_ttl_seconds)
+
+Empty texts are never cached. Bulk document indexing should call
+`embedder.uncached` so unique chunk texts don't churn the query cache.
+"""
+import hashlib
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from app.config import settings
+from app.core.embeddings.base import EmbeddingProvider
+from app.core.inference_backend import backend_tag
+from app.utils.logging import logger
+from app.utils.metrics import EMBEDDING_CACHE_HITS, EMBEDDING_CACHE_MISSES
+
+try:
+    import redis  # type: ignore
+except Exception:
+    redis = None
+
+
+def normalize_embedding_text(text: str) -> str:
+    """Normalize text for cache keys (unicode NFC, collapsed whitespace)."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def _pack(vector: List[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(raw: bytes) -> List[float]:
+    values = array("f")
+    values.frombytes(raw)
+    return values.tolist()
+
+
+class CachedEmbeddingProvider(EmbeddingProvider):
+    """EmbeddingProvider decorator adding LRU + Redis caching."""
+
+    def __init__(
+        self,
+        inner: EmbeddingProvider,
+        lru_size: Optional[int] = None,
+        ttl_seconds: Optional[int] = None
+    ):
+        """
+        Initialize cached provider.
+
+        Args:
+            inner: Provider that actually computes embeddings
+            lru_size: Max in-process entries (default from settings)
+            ttl_seconds: Redis TTL; <= 0 disables the Redis tier (default from settings)
+        """
+        self.inner = inner
+        self.lru_size = lru_size if lru_size is not None else settings.embedding_cache_lru_size
+        self.ttl = ttl_seconds if ttl_seconds is not None else settings.embedding_cache_ttl_seconds
+
+        self._lru: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Non-torch backends (e.g. int8) produce slightly different vectors: keep their keys apart
+        backend = getattr(inner, "backend", None)
+        backend_suffix = f"@{backend_tag(backend)}" if backend and backend_tag(backend) else ""
+        self._key_prefix = f"emb:{inner.provider_name}:{inner.model_name}{backend_suffix}:"
+
+        self.client = None
+        if redis is not None and settings.use_redis_cache and self.ttl > 0:
+            try:
+                self.client = redis.Redis.from_url(settings.redis_url)
+            except Exception as e:
+                logger.warning(f"Failed to init Redis for embedding cache: {e}; using LRU only")
+
+        logger.info(
+            "Embedding cache enabled",
+            extra={
+                "lru_size": self.lru_size,
+                "redis_tier": self.client is not None,
+                "ttl_seconds": self.ttl
+            }
+        )
+
+    # -------- Keys / LRU --------
+    def _key(self, text: str) -> str:
+        digest = hashlib.sha256(normalize_embedding_text(text).encode("utf-8")).hexdigest()
+        return self._key_prefix + digest
+
+    def _lru_get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            raw = self._lru.get(key)
+            if raw is not None:
+                self._lru.move_to_end(key)
+            return raw
+
+    def _lru_put(self, key: str, raw: bytes) -> None:
+        if self.lru_size <= 0:
+            return
+        with self._lock:
+            self._lru[key] = raw
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+    # -------- Lookup / store --------
+    def _lookup(self, keys: List[str]) -> Dict[str, bytes]:
+        """Resolve keys from LRU, then Redis (one MGET); returns found entries."""
+        found: Dict[str, bytes] = {}
+        redis_keys = []
+        for key in keys:
+            raw = self._lru_get(key)
+            if raw is not None:
+                found[key] = raw
+            else:
+                redis_keys.append(key)
+
+        if found:
+            EMBEDDING_CACHE_HITS.labels(tier="lru").inc(len(found))
+
+        if redis_keys and self.client:
+            try:
+                values = self.client.mget(redis_keys)
+                redis_hits = 0
+                for key, raw in zip(redis_keys, values):
+                    if raw:
+                        found[key] = raw
+                        self._lru_put(key, raw)
+                        redis_hits += 1
+                if redis_hits:
+                    EMBEDDING_CACHE_HITS.labels(tier="redis").inc(redis_hits)
+            except Exception as e:
+                logger.debug(f"Redis embedding cache get failed: {e}")
+
+        misses = len(keys) - len(found)
+        if misses:
+            EMBEDDING_CACHE_MISSES.inc(misses)
+        return found
+
+    def _store(self, entries: Dict[str, bytes]) -> None:
+        for key, raw in entries.items():
+            self._lru_put(key, raw)
+        if entries and self.client:
+            try:
+                pipe = self.client.pipeline(transaction=False)
+                for key, raw in entries.items():
+                    pipe.setex(key, self.ttl, raw)
+                pipe.execute()
+            except Exception as e:
+                logger.debug(f"Redis embedding cache set failed: {e}")
+
+    # -------- EmbeddingProvider API --------
+    def embed_text(self, text: str) -> List[float]:
+        if not isinstance(text, str) or not text.strip():
+            return self.inner.embed_text(text)
+
+        key = self._key(text)
+        found = self._lookup([key])
+        if key in found:
+            return _unpack(found[key])
+
+        vector = self.inner.embed_text(text)
+        self._store({key: _pack(vector)})
+        return vector
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        if not isinstance(texts, list) or not texts:
+            return self.inner.embed_batch(texts)
+
+        # Only non-empty strings are cacheable; everything else goes to the provider as-is
+        keys: List[Optional[str]] = [
+            self._key(t) if isinstance(t, str) and t.strip() else None
+            for t in texts
+        ]
+        found = self._lookup(list({k for k in keys if k is not None}))
+
+        # Embed each missing text once (dedupe within the batch)
+        miss_keys: List[str] = []
+        miss_texts: List[str] = []
+        seen = set()
+        for key, text in zip(keys, texts):
+            if key is not None and key not in found and key not in seen:
+                seen.add(key)
+                miss_keys.append(key)
+                miss_texts.append(text)
+
+        if miss_texts:
+            computed = self.inner.embed_batch(miss_texts)
+            new_entries = {key: _pack(vec) for key, vec in zip(miss_keys, computed)}
+            self._store(new_entries)
+            found.update(new_entries)
+
+        results: List[List[float]] = []
+        uncacheable = [t for k, t in zip(keys, texts) if k is None]
+        uncacheable_vectors = iter(self.inner.embed_batch(uncacheable)) if uncacheable else iter(())
+        for key in keys:
+            results.append(_unpack(found[key]) if key is not None else next(uncacheable_vectors))
+        return results
+
+    def warm(self, texts: List[str]) -> int:
+        """
+        Pre-embed texts into the cache (e.g. workflow retrieval queries).
+
+        Returns:
+            Number of texts that had to be embedded (cache misses)
+        """
+        unique = list({normalize_embedding_text(t): t for t in texts if isinstance(t, str) and t.strip()}.values())
+        if not unique:
+            return 0
+        keys = [self._key(t) for t in unique]
+        found = self._lookup(keys)
+        missing = [(k, t) for k, t in zip(keys, unique) if k not in found]
+        if missing:
+            computed = self.inner.embed_batch([t for _, t in missing])
+            self._store({k: _pack(vec) for (k, _), vec in zip(missing, computed)})
+        return len(missing)
+
+    def get_dimension(self) -> int:
+        return self.inner.get_dimension()
+
+    @property
+    def provider_name(self) -> str:
+        return self.inner.provider_name
+
+    @property
+    def model_name(self) -> str:
+        return self.inner.model_name
+
+    @property
+    def uncached(self) -> EmbeddingProvider:
+        return self.inner
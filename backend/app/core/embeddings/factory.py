@@ -8,6 +8,7 @@ import threading
 from app.core.embeddings.base import EmbeddingProvider
 from app.core.embeddings.sentence_transformer import SentenceTransformerEmbedding
 from app.core.embeddings.openai_provider import OpenAIEmbedding
+from app.core.embeddings.cache import CachedEmbeddingProvider
 from app.config import Settings
 from app.utils.logging import logger
 
@@ -64,7 +65,10 @@ def create_embedding_provider(settings: Settings) -> EmbeddingProvider:
                 f"Set SENTENCE_TRANSFORMER_MODEL in your .env file."
             )
 
-        return SentenceTransformerEmbedding(model_name=model_name)
+        return SentenceTransformerEmbedding(
+            model_name=model_name,
+            backend=getattr(settings, "embedding_backend", None)
+        )
 
     elif provider == "openai":
         # Edge case: Validate API key attribute
@@ -151,6 +155,9 @@ def get_embedding_provider(settings: Settings | None = None) -> EmbeddingProvide
                 # Edge case: Handle provider creation failures
                 try:
                     _embedding_provider = create_embedding_provider(settings)
+                    # Transparent two-tier cache (LRU + Redis) for repeated texts
+                    if getattr(settings, "embedding_cache_enabled", False):
+                        _embedding_provider = CachedEmbeddingProvider(_embedding_provider)
                 except Exception as e:
                     logger.error(f"Failed to create embedding provider: {e}", exc_info=True)
                     raise RuntimeError(f"Failed to initialize embedding provider: {e}") from e
@@ -3,9 +3,10 @@
 Sentence Transformer embedding provider (free, local).
 Uses HuggingFace sentence-transformers library.
 """
-from typing import List
+from typing import List, Optional
 from sentence_transformers import SentenceTransformer
 from app.core.embeddings.base import EmbeddingProvider
+from app.core.inference_backend import load_transformer_model, normalize_backend
 from app.utils.logging import logger
 
 
@@ -24,7 +25,7 @@ class SentenceTransformerEmbedding(EmbeddingProvider):
     - First run downloads model (~80MB for all-MiniLM-L6-v2)
     """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", backend: Optional[str] = None):
         """
         Initialize Sentence Transformer model.
 
@@ -33,6 +34,8 @@ class SentenceTransformerEmbedding(EmbeddingProvider):
                 - all-MiniLM-L6-v2: Fast, 384 dimensions, good quality
                 - all-mpnet-base-v2: Slower, 768 dimensions, better quality
                 - multi-qa-MiniLM-L6-cos-v1: Optimized for Q&A, 384 dimensions
+            backend: Inference backend - "torch" (default), "onnx" or "onnx-int8"
+                (see app/core/inference_backend.py)
 
         Raises:
             ValueError: If model_name is invalid
@@ -46,12 +49,13 @@ class SentenceTransformerEmbedding(EmbeddingProvider):
             raise ValueError("model_name cannot be empty string")
 
         self._model_name = model_name
-        logger.info(f"Loading Sentence Transformer model: {model_name}")
+        self.backend = normalize_backend(backend)
+        logger.info(f"Loading Sentence Transformer model: {model_name} (backend: {self.backend})")
 
         # Load model (auto-downloads on first run, cached afterwards)
         # Edge case: Handle model loading failures
         try:
-            self.model = SentenceTransformer(model_name)
+            self.model = load_transformer_model(SentenceTransformer, model_name, backend=self.backend)
         except Exception as e:
             logger.error(
                 f"Failed to load Sentence Transformer model '{model_name}': {e}",
@@ -0,0 +1,86 @@
+# backend/app/core/executors.py
+"""
+Executor pools for blocking work called from async request handlers.
+
+The chat pipeline is an async SSE generator but several of its stages are
+synchronous (SQLAlchemy Session queries, SentenceTransformer.encode,
+CrossEncoder.predict). Running them inline blocks the event loop and stalls
+every other stream on the worker, so they are dispatched to bounded pools:
+
+- DB pool: sync SQLAlchemy / repository calls. Sized at or below the
+  SQLAlchemy connection pool so threads never queue on connections.
+- Inference pool: embedding + cross-encoder forward passes. Kept small -
+  torch already parallelizes each forward pass across cores, so extra
+  threads only add contention.
+
+Pools are created lazily (thread-safe) and shut down from the app lifespan.
+"""
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.config import settings
+from app.utils.logging import logger
+
+T = TypeVar("T")
+
+_db_executor: Optional[ThreadPoolExecutor] = None
+_inference_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def get_db_executor() -> ThreadPoolExecutor:
+    """Get (or lazily create) the shared DB executor."""
+    global _db_executor
+    if _db_executor is None:
+        with _lock:
+            if _db_executor is None:
+                workers = max(1, settings.chat_db_executor_workers)
+                _db_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="db-exec")
+                logger.info("DB executor created", extra={"max_workers": workers})
+    return _db_executor
+
+
+def get_inference_executor() -> ThreadPoolExecutor:
+    """Get (or lazily create) the shared model inference executor."""
+    global _inference_executor
+    if _inference_executor is None:
+        with _lock:
+            if _inference_executor is None:
+                workers = max(1, settings.chat_inference_executor_workers)
+                _inference_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="inference-exec")
+                logger.info("Inference executor created", extra={"max_workers": workers})
+    return _inference_executor
+
+
+async def _run_in(executor: ThreadPoolExecutor, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    # Copy contextvars like asyncio.to_thread so request-scoped context (logging) follows the call
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, fn, *args, **kwargs)
+    return await loop.run_in_executor(executor, call)
+
+
+async def run_in_db_executor(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking DB call on the DB pool and await its result."""
+    return await _run_in(get_db_executor(), fn, *args, **kwargs)
+
+
+async def run_in_inference_executor(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking model call on the inference pool and await its result."""
+    return await _run_in(get_inference_executor(), fn, *args, **kwargs)
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    """Shut down both pools (called on app shutdown)."""
+    global _db_executor, _inference_executor
+    with _lock:
+        for executor in (_db_executor, _inference_executor):
+            if executor is not None:
+                executor.shutdown(wait=wait, cancel_futures=True)
+        _db_executor = None
+        _inference_executor = None
+    logger.info("Executor pools shut down")
@@ -0,0 +1,164 @@
+# backend/app/core/inference_backend.py
+"""
+Inference backends for local transformer models (embedder + cross-encoder).
+
+Our API and worker hosts are CPU-only, where full-precision PyTorch is the
+slowest way to run the small MiniLM models we use. The same models can be
+served through ONNX Runtime instead:
+
+    torch      - full-precision PyTorch (previous behaviour, default)
+    onnx       - ONNX export of the same weights (fp32, ONNX Runtime)
+    onnx-int8  - ONNX export with dynamic int8 quantization
+                 (settings.onnx_quantization_config: arm64 | avx2 | avx512 | avx512_vnni)
+
+Exports are built once per model/variant under settings.onnx_model_dir and
+reused by every process afterwards; a variant directory is written to a
+temporary path and renamed into place, so concurrent worker children never
+load a half-written export.
+
+settings.inference_threads caps intra-op threads per model (ONNX Runtime
+session options / torch.set_num_threads); 0 keeps the library default.
+
+Usage:
+    model = load_transformer_model(CrossEncoder, "cross-encoder/ms-marco-MiniLM-L-6-v2",
+                                   backend="onnx-int8", max_length=512)
+"""
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.config import settings
+from app.utils.logging import logger
+
+TORCH = "torch"
+ONNX = "onnx"
+ONNX_INT8 = "onnx-int8"
+BACKENDS = (TORCH, ONNX, ONNX_INT8)
+
+_export_lock = threading.Lock()
+_torch_threads_set = False
+
+
+def normalize_backend(backend: Optional[str]) -> str:
+    """Validate a backend name ('' / None -> torch)."""
+    backend = (backend or TORCH).strip().lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown inference backend: '{backend}'. Supported backends: {', '.join(BACKENDS)}")
+    return backend
+
+
+def backend_tag(backend: str) -> str:
+    """Short identifier for cache keys ('' for torch, so existing keys stay valid)."""
+    backend = normalize_backend(backend)
+    if backend == TORCH:
+        return ""
+    if backend == ONNX_INT8:
+        return f"{ONNX_INT8}-{settings.onnx_quantization_config}"
+    return backend
+
+
+def _quantized_file_suffix() -> str:
+    # Passed to export_dynamic_quantized_onnx_model explicitly: its default suffix follows the
+    # weights dtype (e.g. "quint8_avx2"), which differs between quantization configs
+    return f"qint8_{settings.onnx_quantization_config}"
+
+
+def _onnx_file_name(backend: str) -> str:
+    if backend == ONNX_INT8:
+        return f"onnx/model_{_quantized_file_suffix()}.onnx"
+    return "onnx/model.onnx"
+
+
+def _export_dir(model_name: str, backend: str) -> Path:
+    return Path(settings.onnx_model_dir) / model_name.replace("/", "__") / backend_tag(backend)
+
+
+def _configure_torch_threads() -> None:
+    global _torch_threads_set
+    if _torch_threads_set or settings.inference_threads <= 0:
+        return
+    import torch
+
+    torch.set_num_threads(settings.inference_threads)
+    _torch_threads_set = True
+    logger.info(f"torch intra-op threads set to {settings.inference_threads}")
+
+
+def _onnx_model_kwargs(backend: str) -> Dict[str, Any]:
+    import onnxruntime as ort
+
+    session_options = ort.SessionOptions()
+    session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if settings.inference_threads > 0:
+        session_options.intra_op_num_threads = settings.inference_threads
+        session_options.inter_op_num_threads = 1
+    return {
+        "file_name": _onnx_file_name(backend),
+        "provider": "CPUExecutionProvider",
+        "session_options": session_options,
+    }
+
+
+def _export(model_cls: type, model_name: str, backend: str, target: Path, **init_kwargs: Any) -> None:
+    """Export (and optionally quantize) a model into target via a temporary directory."""
+    from sentence_transformers import export_dynamic_quantized_onnx_model
+
+    tmp = target.with_name(f"{target.name}.tmp-{os.getpid()}")
+    shutil.rmtree(tmp, ignore_errors=True)
+    logger.info(f"Exporting {model_name} to ONNX ({backend_tag(backend)})", extra={"path": str(target)})
+
+    # backend="onnx" on a model without ONNX weights exports it on load
+    model = model_cls(model_name, backend=ONNX, **init_kwargs)
+    model.save_pretrained(str(tmp))
+    if backend == ONNX_INT8:
+        export_dynamic_quantized_onnx_model(
+            model, settings.onnx_quantization_config, str(tmp), file_suffix=_quantized_file_suffix()
+        )
+    if not (tmp / _onnx_file_name(backend)).exists():
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise RuntimeError(f"ONNX export of {model_name} did not produce {_onnx_file_name(backend)}")
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.exists() and not (target / _onnx_file_name(backend)).exists():
+        # Leftover export without the expected model file (e.g. older file naming)
+        shutil.rmtree(target, ignore_errors=True)
+    try:
+        os.rename(tmp, target)
+    except OSError:
+        # Another process finished the same export first; keep theirs
+        shutil.rmtree(tmp, ignore_errors=True)
+        if not (target / _onnx_file_name(backend)).exists():
+            raise
+
+
+def load_transformer_model(model_cls: type, model_name: str, backend: Optional[str] = None, **init_kwargs: Any):
+    """
+    Load a SentenceTransformer / CrossEncoder on the requested backend.
+
+    Args:
+        model_cls: sentence_transformers.SentenceTransformer or CrossEncoder
+        model_name: HuggingFace model name
+        backend: torch | onnx | onnx-int8 (default: torch)
+        **init_kwargs: Extra constructor arguments (e.g. max_length)
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    backend = normalize_backend(backend)
+    if backend == TORCH:
+        _configure_torch_threads()
+        return model_cls(model_name, **init_kwargs)
+
+    target = _export_dir(model_name, backend)
+    if not (target / _onnx_file_name(backend)).exists():
+        with _export_lock:
+            if not (target / _onnx_file_name(backend)).exists():
+                _export(model_cls, model_name, backend, target, **init_kwargs)
+
+    logger.info(
+        f"Loading {model_name} with {backend_tag(backend)} backend",
+        extra={"path": str(target), "threads": settings.inference_threads}
+    )
+    return model_cls(str(target), backend=ONNX, model_kwargs=_onnx_model_kwargs(backend), **init_kwargs)
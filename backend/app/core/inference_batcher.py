@@ -0,0 +1,218 @@
+# backend/app/core/inference_batcher.py
+"""
+Dynamic micro-batching for in-process model inference.
+
+Concurrent chat requests each embed one query and score ~20 (query, chunk)
+pairs. Run separately, they never share a forward pass. MicroBatcher collects
+items submitted by concurrent coroutines for up to `max_wait_ms` (or until
+`max_batch_size` items are queued), runs them as ONE batch on the inference
+executor, and resolves each caller's future with its slice of the results.
+
+- Items from one submit_many() call always stay together in one batch
+- A single request larger than max_batch_size runs as its own batch
+- Batch failures propagate to every caller in that batch
+- Queue depth / batch size / wait / forward-pass time exported via app.utils.metrics
+
+Used by HybridRetriever.aembed_query (query embeddings) and
+Reranker.arerank (cross-encoder pairs). Sync callers (Celery workers)
+keep calling the models directly.
+"""
+import asyncio
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+from app.config import settings
+from app.core.executors import run_in_inference_executor
+from app.utils.logging import logger
+from app.utils.metrics import (
+    INFERENCE_QUEUE_DEPTH,
+    INFERENCE_BATCH_SIZE,
+    INFERENCE_BATCH_WAIT_SECONDS,
+    INFERENCE_BATCH_SECONDS,
+)
+
+
+class _PendingRequest:
+    __slots__ = ("items", "future", "enqueued_at")
+
+    def __init__(self, items: List[Any], future: asyncio.Future):
+        self.items = items
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent inference calls into shared batches.
+
+    batch_fn receives a flat list of items and must return a list of results
+    of the same length and order. It runs on the inference executor.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        batch_fn: Callable[[List[Any]], List[Any]],
+        max_batch_size: int,
+        max_wait_ms: float
+    ):
+        """
+        Initialize micro-batcher.
+
+        Args:
+            name: Metrics label (e.g. "embed", "rerank")
+            batch_fn: Sync function mapping a list of items to a list of results
+            max_batch_size: Dispatch as soon as this many items are queued
+            max_wait_ms: Max time the first queued item waits for company
+        """
+        self.name = name
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_s = max(0.0, max_wait_ms) / 1000.0
+
+        self._pending: List[_PendingRequest] = []
+        self._pending_items = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks = set()
+
+    async def submit(self, item: Any) -> Any:
+        """Submit one item and await its result."""
+        results = await self.submit_many([item])
+        return results[0]
+
+    async def submit_many(self, items: List[Any]) -> List[Any]:
+        """Submit items that must be processed together and await their results."""
+        if not items:
+            return []
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use (or a new event loop, e.g. in scripts/tests): drop state bound to the old loop
+            self._reset(loop)
+
+        future = loop.create_future()
+        self._pending.append(_PendingRequest(list(items), future))
+        self._pending_items += len(items)
+        INFERENCE_QUEUE_DEPTH.labels(model=self.name).inc(len(items))
+
+        if self._pending_items >= self.max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_s, self._dispatch, True)
+
+        return await future
+
+    def _reset(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._pending_items:
+            INFERENCE_QUEUE_DEPTH.labels(model=self.name).dec(self._pending_items)
+        self._pending = []
+        self._pending_items = 0
+        self._timer = None
+        self._tasks = set()
+        self._loop = loop
+
+    def _dispatch(self, flush_all: bool = False) -> None:
+        """
+        Move queued requests into running batches.
+
+        Size-triggered: dispatch full batches only. Timer-triggered (flush_all):
+        dispatch everything that is queued.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._pending and (flush_all or self._pending_items >= self.max_batch_size):
+            batch: List[_PendingRequest] = []
+            batch_items = 0
+            while self._pending:
+                request = self._pending[0]
+                if batch and batch_items + len(request.items) > self.max_batch_size:
+                    break
+                batch.append(self._pending.pop(0))
+                batch_items += len(request.items)
+
+            self._pending_items -= batch_items
+            INFERENCE_QUEUE_DEPTH.labels(model=self.name).dec(batch_items)
+
+            task = self._loop.create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        # Leftovers below the size threshold wait for the next window
+        if self._pending:
+            self._timer = self._loop.call_later(self.max_wait_s, self._dispatch, True)
+
+    async def _run_batch(self, batch: List[_PendingRequest]) -> None:
+        items = [item for request in batch for item in request.items]
+        INFERENCE_BATCH_SIZE.labels(model=self.name).observe(len(items))
+        INFERENCE_BATCH_WAIT_SECONDS.labels(model=self.name).observe(time.monotonic() - batch[0].enqueued_at)
+
+        start = time.monotonic()
+        try:
+            results = await run_in_inference_executor(self.batch_fn, items)
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"{self.name} batch returned {len(results)} results for {len(items)} items"
+                )
+        except Exception as e:
+            logger.error(
+                f"Micro-batch failed: {e}",
+                extra={"model": self.name, "batch_size": len(items), "requests": len(batch)}
+            )
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+        finally:
+            INFERENCE_BATCH_SECONDS.labels(model=self.name).observe(time.monotonic() - start)
+
+        offset = 0
+        for request in batch:
+            n = len(request.items)
+            # Caller may have been cancelled (client disconnected) - skip it
+            if not request.future.done():
+                request.future.set_result(list(results[offset:offset + n]))
+            offset += n
+
+        logger.debug(
+            "Micro-batch complete",
+            extra={
+                "model": self.name,
+                "batch_size": len(items),
+                "requests": len(batch),
+                "batch_ms": round((time.monotonic() - start) * 1000, 2)
+            }
+        )
+
+
+# Global embedding batcher (bound to the embedding provider singleton)
+_embedding_batcher: Optional[MicroBatcher] = None
+_embedding_batcher_lock = threading.Lock()
+
+
+def get_embedding_batcher() -> MicroBatcher:
+    """Get (or lazily create) the shared query-embedding micro-batcher."""
+    global _embedding_batcher
+    if _embedding_batcher is None:
+        with _embedding_batcher_lock:
+            if _embedding_batcher is None:
+                from app.core.embeddings.factory import get_embedding_provider
+
+                embedder = get_embedding_provider()
+                _embedding_batcher = MicroBatcher(
+                    name="embed",
+                    batch_fn=embedder.embed_batch,
+                    max_batch_size=settings.inference_embed_max_batch_size,
+                    max_wait_ms=settings.inference_embed_max_wait_ms
+                )
+                logger.info(
+                    "Embedding micro-batcher created",
+                    extra={
+                        "max_batch_size": settings.inference_embed_max_batch_size,
+                        "max_wait_ms": settings.inference_embed_max_wait_ms
+                    }
+                )
+    return _embedding_batcher
@@ -8,9 +8,11 @@ from app.config import settings
 from app.utils.logging import logger
 from app.api.dependencies import cache
 from app.database import get_db
-from app.verticals.private_equity.workflows.seeding import seed_workflows
-from app.core.embeddings.factory import get_embedding_provider
+from app.verticals.private_equity.workflows.seeding import seed_workflows, warm_retrieval_query_embeddings
+from app.services.model_registry import get_embedder
 from app.services.service_locator import get_reranker
+from app.core.executors import shutdown_executors
+from app.core.rag.components import get_rag_components
 
 # Retention settings (could later move to settings)
 UPLOAD_RETENTION_HOURS = 6  # Delete uploaded source PDFs older than this
@@ -55,10 +57,12 @@ async def lifespan(app):
     # Start background cleanup task (cache + uploaded file pruning)
     cleanup_task = asyncio.create_task(periodic_cleanup())
     
-    get_embedding_provider()
+    get_embedder()
+    warm_retrieval_query_embeddings()  # Workflow section queries -> embedding cache
     if settings.rag_use_reranker:
         get_reranker()  # Preload reranker
-    
+    get_rag_components()  # Shared RAG graph (LLM/HTTP clients, Redis, retrievers) reused by every chat request
+
     logger.info("✅ Models ready")
 
     # yield control to the running app
@@ -71,6 +75,7 @@ async def lifespan(app):
         await cleanup_task
     except asyncio.CancelledError:
         pass
+    shutdown_executors(wait=False)
     logger.info("Application shutting down")
 
 
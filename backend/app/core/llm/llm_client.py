@@ -26,6 +26,18 @@ from app.utils.metrics import (
 )
 from app.utils.costs import compute_llm_cost
 
+
+def is_retryable_api_error(error: Exception) -> bool:
+    """Transient API errors (429 rate limit, 529/overloaded) that extract_structured_data retries itself."""
+    error_str = str(error)
+    return (
+        "Overloaded" in error_str or
+        "overloaded_error" in error_str or
+        "Error code: 429" in error_str or  # Rate limit
+        "Error code: 529" in error_str     # Overloaded
+    )
+
+
 class LLMClient:
     """Core Anthropic Claude API client.
 
@@ -185,12 +197,7 @@ class LLMClient:
             except Exception as api_error:
                 # Check if it's a retryable error (429 rate limit, 500/529 overloaded)
                 error_str = str(api_error)
-                is_retryable = (
-                    "Overloaded" in error_str or
-                    "overloaded_error" in error_str or
-                    "Error code: 429" in error_str or  # Rate limit
-                    "Error code: 529" in error_str     # Overloaded
-                )
+                is_retryable = is_retryable_api_error(api_error)
 
                 if is_retryable and attempt < max_retries - 1:
                     wait_time = retry_delay * (2 ** attempt)  # Exponential backoff: 2s, 4s, 8s
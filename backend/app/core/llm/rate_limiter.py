@@ -0,0 +1,141 @@
+# backend/app/core/llm/rate_limiter.py
+"""
+Token-rate limiter for fan-out LLM calls.
+
+Parallel section summaries (and other concurrent batch calls) can burst past
+the provider's input-tokens-per-minute limit and turn into 429 retry storms.
+Callers reserve their estimated input tokens before each call:
+
+    limiter = get_token_rate_limiter(model)
+    await limiter.acquire(estimated_tokens)
+
+Accounting uses fixed one-minute windows in Redis (key llm:tpm:<name>:<window>),
+so the budget is shared by every run on every worker. When Redis is disabled
+or unreachable, an in-process sliding window is used instead (shared by the
+runs in that process only). Redis round-trips run in a worker thread so
+acquire() never blocks the event loop.
+
+A reservation larger than the whole budget is still admitted once the window
+is otherwise empty, so oversized prompts are slowed down, never blocked.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from app.config import settings
+from app.utils.logging import logger
+
+try:
+    import redis  # type: ignore
+except Exception:
+    redis = None
+
+WINDOW_SECONDS = 60
+
+
+class TokenRateLimiter:
+    """Tokens-per-minute budget shared across concurrent LLM calls."""
+
+    def __init__(self, name: str, tokens_per_minute: Optional[int] = None):
+        """
+        Initialize limiter.
+
+        Args:
+            name: Budget name (usually the model); callers with the same name share it
+            tokens_per_minute: Budget per minute; <= 0 disables limiting
+                               (default: settings.llm_tokens_per_minute)
+        """
+        self.name = name
+        self.tokens_per_minute = (
+            tokens_per_minute if tokens_per_minute is not None else settings.llm_tokens_per_minute
+        )
+        self._local: Deque[Tuple[float, int]] = deque()
+        self._local_used = 0
+        self._lock = threading.Lock()
+
+        self.client = None
+        if redis is not None and settings.use_redis_cache and self.enabled:
+            try:
+                self.client = redis.Redis.from_url(settings.redis_url)
+            except Exception as e:
+                logger.warning(f"Failed to init Redis for token rate limiter: {e}; using in-process window")
+
+    @property
+    def enabled(self) -> bool:
+        return self.tokens_per_minute > 0
+
+    async def acquire(self, tokens: int) -> float:
+        """
+        Wait until `tokens` fit in the budget, then reserve them.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if not self.enabled or tokens <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            if self.client:
+                delay = await asyncio.to_thread(self._try_reserve, tokens)
+            else:
+                delay = self._try_reserve(tokens)
+            if delay <= 0:
+                if waited:
+                    logger.debug(
+                        f"Token rate limiter '{self.name}' delayed {tokens} tokens by {waited:.1f}s",
+                        extra={"limiter": self.name, "tokens": tokens, "waited_seconds": round(waited, 2)}
+                    )
+                return waited
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def _try_reserve(self, tokens: int) -> float:
+        """Reserve tokens now (returns 0) or return the seconds to wait before retrying."""
+        if self.client:
+            try:
+                return self._try_reserve_redis(tokens)
+            except Exception as e:
+                logger.debug(f"Redis token rate limiter failed: {e}; using in-process window")
+        return self._try_reserve_local(tokens)
+
+    def _try_reserve_redis(self, tokens: int) -> float:
+        now = time.time()
+        window = int(now // WINDOW_SECONDS)
+        key = f"llm:tpm:{self.name}:{window}"
+        pipe = self.client.pipeline(transaction=True)
+        pipe.incrby(key, tokens)
+        pipe.expire(key, WINDOW_SECONDS * 2)
+        used, _ = pipe.execute()
+        if used <= self.tokens_per_minute or used == tokens:
+            return 0.0
+        self.client.decrby(key, tokens)  # Over budget: give the reservation back
+        return (window + 1) * WINDOW_SECONDS - now + 0.05
+
+    def _try_reserve_local(self, tokens: int) -> float:
+        now = time.monotonic()
+        with self._lock:
+            while self._local and now - self._local[0][0] >= WINDOW_SECONDS:
+                self._local_used -= self._local.popleft()[1]
+            if self._local and self._local_used + tokens > self.tokens_per_minute:
+                return WINDOW_SECONDS - (now - self._local[0][0]) + 0.05
+            self._local.append((now, tokens))
+            self._local_used += tokens
+            return 0.0
+
+
+_limiters: Dict[str, TokenRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_token_rate_limiter(name: str) -> TokenRateLimiter:
+    """Process-wide limiter for a budget name (thread-safe)."""
+    limiter = _limiters.get(name)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(name)
+            if limiter is None:
+                limiter = TokenRateLimiter(name)
+                _limiters[name] = limiter
+    return limiter
@@ -3,15 +3,26 @@
 Extracts page-wise text and table content, merges them into a unified text output,
 and returns standardized ParserOutput.
 
+Analysis runs on the async client, so the event loop is never blocked while Azure
+polls. Documents of settings.azure_doc_parallel_min_pages pages or more are split
+into page-range segments (settings.azure_doc_segment_pages each) that are analyzed
+concurrently (at most settings.azure_doc_max_concurrency in flight); the segment
+results are merged back into one result with page numbers, bounding regions, spans
+and element references rebased onto the original document.
+
 Pricing (per user request): $10 per 1000 pages (i.e., $0.01/page).
 """
 from __future__ import annotations
 
+import asyncio
+import re
 import time
 from dataclasses import dataclass
-from typing import List, Optional, Dict
+from types import SimpleNamespace
+from typing import Any, List, Optional, Dict, Tuple
 
-from azure.ai.documentintelligence import DocumentIntelligenceClient
+import fitz  # PyMuPDF
+from azure.ai.documentintelligence.aio import DocumentIntelligenceClient as AsyncDocumentIntelligenceClient
 from azure.ai.documentintelligence.models import AnalyzeResult, DocumentAnalysisFeature
 from azure.ai.documentintelligence.models import AnalyzeDocumentRequest
 from azure.core.credentials import AzureKeyCredential
@@ -21,6 +32,8 @@ from app.core.parsers.base import DocumentParser, ParserOutput
 from app.config import settings
 from app.utils.logging import logger
 
+_ELEMENT_REF = re.compile(r"^/(paragraphs|tables|figures|sections)/(\d+)$")
+
 
 @dataclass
 class _PageData:
@@ -36,6 +49,139 @@ class _PageData:
             self.table_data = []
 
 
+def split_pdf(pdf_bytes: bytes, segment_pages: int) -> List[Tuple[int, bytes]]:
+    """Split a PDF into page-range segments.
+
+    Returns:
+        (page_offset, segment_bytes) per segment, in page order
+        (page_offset = pages preceding the segment in the original document)
+    """
+    src = fitz.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        page_count = len(src)
+        segments = []
+        for start in range(0, page_count, segment_pages):
+            dst = fitz.open()
+            try:
+                dst.insert_pdf(src, from_page=start, to_page=min(start + segment_pages, page_count) - 1)
+                segments.append((start, dst.tobytes()))
+            finally:
+                dst.close()
+        return segments
+    finally:
+        src.close()
+
+
+def _rebase_regions(obj: Any, page_offset: int) -> None:
+    for br in getattr(obj, "bounding_regions", None) or []:
+        if br is not None and getattr(br, "page_number", None) is not None:
+            br.page_number += page_offset
+
+
+def _rebase_spans(obj: Any, content_offset: int) -> None:
+    for span in getattr(obj, "spans", None) or []:
+        if span is not None and getattr(span, "offset", None) is not None:
+            span.offset += content_offset
+
+
+def _rebase_elements(elements: Optional[List[str]], offsets: Dict[str, int]) -> Optional[List[str]]:
+    """Rewrite element references like '/paragraphs/3' to indices in the merged result."""
+    if not elements:
+        return elements
+    rebased = []
+    for ref in elements:
+        match = _ELEMENT_REF.match(ref) if isinstance(ref, str) else None
+        rebased.append(f"/{match.group(1)}/{int(match.group(2)) + offsets[match.group(1)]}" if match else ref)
+    return rebased
+
+
+def merge_analyze_results(segments: List[Tuple[int, AnalyzeResult]]) -> SimpleNamespace:
+    """Merge per-segment AnalyzeResults into one result for the whole document.
+
+    Page numbers and bounding regions are shifted by each segment's page offset,
+    spans by the segment's offset in the merged content, and element references
+    (sections, figures, captions) by the element counts of preceding segments.
+    Segment objects are rebased in place.
+
+    Args:
+        segments: (page_offset, result) per segment, in page order
+
+    Returns:
+        Result exposing content, pages, tables, paragraphs, sections, figures, key_value_pairs
+    """
+    merged = SimpleNamespace(
+        content="", pages=[], tables=[], paragraphs=[], sections=[], figures=[], key_value_pairs=[]
+    )
+    for page_offset, result in segments:
+        content_offset = len(merged.content) + (1 if merged.content else 0)
+        offsets = {
+            "paragraphs": len(merged.paragraphs),
+            "tables": len(merged.tables),
+            "figures": len(merged.figures),
+            "sections": len(merged.sections),
+        }
+
+        for page in getattr(result, "pages", None) or []:
+            if page is None:
+                continue
+            page.page_number += page_offset
+            _rebase_spans(page, content_offset)
+            for line in getattr(page, "lines", None) or []:
+                _rebase_spans(line, content_offset)
+            merged.pages.append(page)
+
+        for table in getattr(result, "tables", None) or []:
+            if table is None:
+                continue
+            _rebase_regions(table, page_offset)
+            _rebase_spans(table, content_offset)
+            for cell in getattr(table, "cells", None) or []:
+                _rebase_regions(cell, page_offset)
+                _rebase_spans(cell, content_offset)
+            merged.tables.append(table)
+
+        for para in getattr(result, "paragraphs", None) or []:
+            if para is None:
+                continue
+            _rebase_regions(para, page_offset)
+            _rebase_spans(para, content_offset)
+            merged.paragraphs.append(para)
+
+        for section in getattr(result, "sections", None) or []:
+            if section is None:
+                continue
+            _rebase_spans(section, content_offset)
+            section.elements = _rebase_elements(getattr(section, "elements", None), offsets)
+            merged.sections.append(section)
+
+        for figure in getattr(result, "figures", None) or []:
+            if figure is None:
+                continue
+            _rebase_regions(figure, page_offset)
+            _rebase_spans(figure, content_offset)
+            figure.elements = _rebase_elements(getattr(figure, "elements", None), offsets)
+            caption = getattr(figure, "caption", None)
+            if caption is not None:
+                _rebase_regions(caption, page_offset)
+                _rebase_spans(caption, content_offset)
+                caption.elements = _rebase_elements(getattr(caption, "elements", None), offsets)
+            merged.figures.append(figure)
+
+        for kv in getattr(result, "key_value_pairs", None) or []:
+            if kv is None:
+                continue
+            for element in (kv.key, kv.value):
+                if element is not None:
+                    _rebase_regions(element, page_offset)
+                    _rebase_spans(element, content_offset)
+            merged.key_value_pairs.append(kv)
+
+        content = getattr(result, "content", "") or ""
+        merged.content = f"{merged.content}\n{content}" if merged.content else content
+
+    return merged
+
+
 class AzureDocumentIntelligenceParser(DocumentParser):
     """Parser using Azure Document Intelligence prebuilt models.
 
@@ -45,6 +191,7 @@ class AzureDocumentIntelligenceParser(DocumentParser):
         - Supports both digital and scanned PDFs (Azure handles OCR automatically).
         - Merges table data into page text with a simple tab-separated format.
         - Assigns cost based on $0.01 per page.
+        - Large PDFs are analyzed as concurrent page-range segments (see module docstring).
     """
 
     def __init__(
@@ -53,7 +200,14 @@ class AzureDocumentIntelligenceParser(DocumentParser):
         api_key: Optional[str] = None,
         model_name: Optional[str] = None,
         timeout_seconds: Optional[int] = None,
+        async_client: Optional[Any] = None,
     ) -> None:
+        """
+        Args:
+            async_client: Pre-built async DocumentIntelligenceClient (or a fake with the same
+                          begin_analyze_document coroutine); by default one is opened per parse
+                          so it is bound to the running event loop
+        """
         endpoint = endpoint or settings.azure_doc_intelligence_endpoint
         api_key = api_key or settings.azure_doc_intelligence_api_key
         model_name = model_name or settings.azure_doc_model
@@ -68,12 +222,11 @@ class AzureDocumentIntelligenceParser(DocumentParser):
         self.api_key = api_key
         self.model_name = model_name
         self.timeout_seconds = timeout_seconds
+        self.segment_pages = settings.azure_doc_segment_pages
+        self.parallel_min_pages = settings.azure_doc_parallel_min_pages
+        self.max_concurrency = max(1, settings.azure_doc_max_concurrency)
         self._cost_per_page = 0.01  # $10 per 1000 pages
-
-        try:
-            self.client = DocumentIntelligenceClient(endpoint=endpoint, credential=AzureKeyCredential(api_key))
-        except Exception as e:
-            raise RuntimeError(f"Failed to initialize Azure DocumentIntelligenceClient: {e}")
+        self._async_client = async_client
 
         logger.info(
             f"AzureDocumentIntelligenceParser initialized: model={self.model_name}, timeout={self.timeout_seconds}s"
@@ -97,6 +250,83 @@ class AzureDocumentIntelligenceParser(DocumentParser):
         # Azure handles both digital & scanned via OCR.
         return pdf_type in ("digital", "scanned")
 
+    # --- Analysis ---
+    async def _analyze_bytes(self, client: Any, pdf_bytes: bytes) -> AnalyzeResult:
+        """Submit one document (or segment) and await the async poller."""
+        try:
+            # Some releases of azure-ai-documentintelligence (including 1.0.0) can mis-handle
+            # keyword usage, producing a TypeError about missing positional 'body'.
+            # Add KEY_VALUE_PAIRS feature to extract form-like key-value pairs
+            poller = await client.begin_analyze_document(
+                self.model_name,
+                body=AnalyzeDocumentRequest(bytes_source=pdf_bytes),
+                features=[DocumentAnalysisFeature.KEY_VALUE_PAIRS]
+            )
+        except TypeError as te:
+            # Retry using raw bytes (older/alternate signature accepting the document directly)
+            logger.warning(
+                "Azure begin_analyze_document signature mismatch; retrying with raw bytes",
+                extra={"error": str(te)}
+            )
+            try:
+                poller = await client.begin_analyze_document(
+                    self.model_name,
+                    pdf_bytes,
+                    features=[DocumentAnalysisFeature.KEY_VALUE_PAIRS]
+                )
+            except Exception as e:
+                raise RuntimeError(f"parse_error: Azure begin_analyze_document failed after fallback: {e}") from e
+        except AzureError as ae:
+            raise RuntimeError(f"parse_error: Azure analyze call failed: {ae}") from ae
+
+        result = await poller.result()
+        # Edge case: Validate result is not None
+        if result is None:
+            raise RuntimeError("parse_error: Azure API returned None result")
+        return result
+
+    async def _analyze_segments(self, client: Any, pdf_bytes: bytes) -> Tuple[Any, int]:
+        """Analyze the document, split into concurrent page-range segments when large.
+
+        Returns:
+            (result, segment_count)
+        """
+        page_count = 0
+        if self.segment_pages > 0:
+            try:
+                doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+                page_count = len(doc)
+                doc.close()
+            except Exception as e:
+                logger.warning(f"Could not count PDF pages for segmenting ({e}); submitting as one request")
+
+        if self.segment_pages <= 0 or page_count < max(self.parallel_min_pages, self.segment_pages + 1):
+            return await self._analyze_bytes(client, pdf_bytes), 1
+
+        segments = await asyncio.to_thread(split_pdf, pdf_bytes, self.segment_pages)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _run(segment_bytes: bytes) -> AnalyzeResult:
+            async with semaphore:
+                return await self._analyze_bytes(client, segment_bytes)
+
+        logger.info(
+            f"Azure parser analyzing {page_count} pages as {len(segments)} segments "
+            f"(concurrency={self.max_concurrency})",
+            extra={"page_count": page_count, "segments": len(segments)}
+        )
+        results = await asyncio.gather(*(_run(segment_bytes) for _, segment_bytes in segments))
+        merged = merge_analyze_results([(offset, result) for (offset, _), result in zip(segments, results)])
+        return merged, len(segments)
+
+    async def _analyze(self, pdf_bytes: bytes) -> Tuple[Any, int]:
+        if self._async_client is not None:
+            return await self._analyze_segments(self._async_client, pdf_bytes)
+        async with AsyncDocumentIntelligenceClient(
+            endpoint=self.endpoint, credential=AzureKeyCredential(self.api_key)
+        ) as client:
+            return await self._analyze_segments(client, pdf_bytes)
+
     # --- Core parse method ---
     async def parse(self, file_path: str, pdf_type: str) -> ParserOutput:  # type: ignore[override]
         start_time = time.time()
@@ -124,42 +354,10 @@ class AzureDocumentIntelligenceParser(DocumentParser):
             raise ValueError(f"parse_error: PDF file at {file_path} is empty (0 bytes)")
 
         try:
-            # Attempt calling SDK using new AnalyzeDocumentRequest signature.
-            # Some releases of azure-ai-documentintelligence (including 1.0.0) expect a positional 'body'
-            # and can mis-handle keyword usage, producing a TypeError about missing positional 'body'.
-            analyze_request = AnalyzeDocumentRequest(bytes_source=pdf_bytes)
-            poller = None
             try:
-                # Prefer positional invocation to avoid signature mismatch issues.
-                # Add KEY_VALUE_PAIRS feature to extract form-like key-value pairs
-                poller = self.client.begin_analyze_document(
-                    self.model_name,
-                    body=analyze_request,
-                    features=[DocumentAnalysisFeature.KEY_VALUE_PAIRS]
-                )
-            except TypeError as te:
-                # Retry using raw bytes (older/alternate signature accepting the document directly)
-                logger.warning(
-                    "Azure begin_analyze_document signature mismatch; retrying with raw bytes",
-                    extra={"error": str(te)}
-                )
-                try:
-                    poller = self.client.begin_analyze_document(
-                        self.model_name,
-                        pdf_bytes,
-                        features=[DocumentAnalysisFeature.KEY_VALUE_PAIRS]
-                    )
-                except Exception as e:
-                    raise RuntimeError(f"parse_error: Azure begin_analyze_document failed after fallback: {e}") from e
-            except AzureError as ae:
-                raise RuntimeError(f"parse_error: Azure analyze call failed: {ae}") from ae
-            except Exception as e:
-                # Any unexpected failure during invocation – classify as parse_error
-                raise RuntimeError(f"parse_error: Unexpected Azure analyze invocation failure: {e}") from e
-            try:
-                # Apply explicit timeout; Azure SDK raises TimeoutError on wait expiry
-                result: AnalyzeResult = poller.result(timeout=self.timeout_seconds)
-            except TimeoutError as te:
+                # Apply explicit timeout to the whole analysis (all segments)
+                result, segment_count = await asyncio.wait_for(self._analyze(pdf_bytes), self.timeout_seconds)
+            except asyncio.TimeoutError as te:
                 processing_time_ms = int((time.time() - start_time) * 1000)
                 logger.error(
                     f"Azure Document Intelligence timeout after {self.timeout_seconds}s (elapsed {processing_time_ms}ms)",
@@ -169,10 +367,6 @@ class AzureDocumentIntelligenceParser(DocumentParser):
                     f"Azure Document Intelligence processing exceeded timeout of {self.timeout_seconds}s"
                 ) from te
 
-            # Edge case: Validate result is not None
-            if result is None:
-                raise RuntimeError("parse_error: Azure API returned None result")
-
             # Extract structured data (paragraphs, sections, figures)
             structured_data = self._extract_structured_data(result)
 
@@ -208,7 +402,8 @@ class AzureDocumentIntelligenceParser(DocumentParser):
             cost = page_count * self.cost_per_page
 
             logger.info(
-                f"Azure parser extracted {len(full_text)} chars from {page_count} pages in {processing_time_ms}ms (cost=${cost:.2f})"
+                f"Azure parser extracted {len(full_text)} chars from {page_count} pages in {processing_time_ms}ms "
+                f"(cost=${cost:.2f}, segments={segment_count})"
             )
 
             # Build tables summary if available
@@ -285,6 +480,7 @@ class AzureDocumentIntelligenceParser(DocumentParser):
 
             metadata = {
                 "model_name": self.model_name,
+                "segments": segment_count,
                 "char_count": len(full_text),
                 "avg_chars_per_page": len(full_text) / page_count if page_count else 0,
                 "pages": [
@@ -71,6 +71,15 @@ class DocumentParser(ABC):
         """Cost per page in USD"""
         pass
 
+    @property
+    def classifies_pdf_type(self) -> bool:
+        """Whether parse(file_path, pdf_type=None) classifies the PDF from its own open
+
+        Such parsers return an output with pdf_type='scanned' (and no text) when
+        the PDF is not digital, so callers can skip detect_pdf_type.
+        """
+        return False
+
     @abstractmethod
     def supports_pdf_type(self, pdf_type: str) -> bool:
         """Check if parser supports this PDF type
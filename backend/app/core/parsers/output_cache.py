@@ -0,0 +1,376 @@
+# backend/app/core/parsers/output_cache.py
+"""
+Parser Output Cache
+
+The same PDF is routinely uploaded by several analysts (and again by the
+extraction pipeline), and every upload used to download the file, run
+detect_pdf_type and pay for a full parser run (30-90s and per-page cost on
+Azure Document Intelligence). Parser outputs are now cached by content hash.
+
+Key design:
+    entry key: parsecache:<sha256>:<parser name>:<parser version>[+<model>]:<tier>
+    blob: msgpack ParserOutput fields in the artifact store
+          (parser_cache/<sha256>/<parser>-<version>-<tier>.msgpack)
+    pdf type: parsecache:type:<sha256> -> "digital" | "scanned", so a hit
+              skips the download and detect_pdf_type as well
+
+A tier whose digital parser classifies PDFs itself (PyMuPDF) never calls
+detect_pdf_type: the parser's single open classifies and parses.
+
+Concurrency:
+    A Redis lock per entry key (parsecache:lock:<...>) makes concurrent
+    requests for the same file wait for the first parse instead of running
+    their own; waiters re-check the cache once the lock is released. If the
+    lock cannot be acquired within settings.parser_cache_lock_wait_seconds the
+    waiter parses anyway. Without Redis, an in-process lock de-duplicates
+    within the worker only.
+
+Invalidation:
+    - TTL on the Redis index (settings.parser_cache_ttl_seconds)
+    - Parser version / model / tier are part of the key, so parser upgrades
+      never serve old output
+    - Without Redis the blob is looked up directly (no TTL)
+"""
+import asyncio
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from app.config import settings
+from app.core.parsers.base import DocumentParser, ParserOutput
+from app.core.parsers.parser_factory import ParserFactory
+from app.utils.logging import logger
+from app.utils.metrics import PARSER_CACHE_REQUESTS, PARSER_CACHE_SAVED_USD
+
+try:
+    import redis  # type: ignore
+except Exception:
+    redis = None
+
+_local_locks: Dict[str, threading.Lock] = {}
+_local_locks_guard = threading.Lock()
+
+
+def file_sha256(file_path: str) -> str:
+    """SHA256 of a file, streamed in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ParserOutputCache:
+    """Content-hash cache of parser outputs with per-entry parse de-duplication."""
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[int] = None,
+        lock_timeout_seconds: Optional[int] = None,
+        lock_wait_seconds: Optional[int] = None
+    ):
+        """
+        Initialize parser output cache.
+
+        Args:
+            ttl_seconds: Redis index TTL (default: settings.parser_cache_ttl_seconds)
+            lock_timeout_seconds: Max lifetime of a parse lock (default from settings)
+            lock_wait_seconds: Max wait for another worker's parse (default from settings)
+        """
+        self.ttl = ttl_seconds if ttl_seconds is not None else settings.parser_cache_ttl_seconds
+        self.lock_timeout = lock_timeout_seconds or settings.parser_cache_lock_timeout_seconds
+        self.lock_wait = lock_wait_seconds if lock_wait_seconds is not None else settings.parser_cache_lock_wait_seconds
+
+        self.client = None
+        if redis is not None and settings.use_redis_cache:
+            try:
+                self.client = redis.Redis.from_url(settings.redis_url)
+            except Exception as e:
+                logger.warning(f"Failed to init Redis for parser output cache: {e}; using blob lookups only")
+
+    # -------- Keys --------
+    @staticmethod
+    def _parser_id(parser: DocumentParser) -> Tuple[str, str]:
+        version = parser.version or "0"
+        model_name = getattr(parser, "model_name", None)
+        if model_name:
+            version = f"{version}+{model_name}"
+        return parser.name, version
+
+    def key_for(self, content_hash: str, parser: DocumentParser, tier: str) -> str:
+        name, version = self._parser_id(parser)
+        return f"parsecache:{content_hash}:{name}:{version}:{tier}"
+
+    def _blob_ref(self, content_hash: str, parser: DocumentParser, tier: str) -> Dict[str, Any]:
+        from app.core.storage.artifact_store import get_artifact_store
+
+        name, version = self._parser_id(parser)
+        safe_version = version.replace("/", "_")
+        return get_artifact_store().ref_for(f"parser_cache/{content_hash}/{name}-{safe_version}-{tier}.msgpack")
+
+    # -------- PDF type --------
+    def get_pdf_type(self, content_hash: str) -> Optional[str]:
+        if not self.client:
+            return None
+        try:
+            raw = self.client.get(f"parsecache:type:{content_hash}")
+            return raw.decode() if isinstance(raw, bytes) else raw
+        except Exception as e:
+            logger.debug(f"Redis parser cache pdf type get failed: {e}")
+            return None
+
+    def set_pdf_type(self, content_hash: str, pdf_type: str) -> None:
+        if not self.client or self.ttl <= 0:
+            return
+        try:
+            self.client.setex(f"parsecache:type:{content_hash}", self.ttl, pdf_type)
+        except Exception as e:
+            logger.debug(f"Redis parser cache pdf type set failed: {e}")
+
+    # -------- Get / set --------
+    def get(self, content_hash: str, parser: DocumentParser, tier: str) -> Optional[ParserOutput]:
+        """Return the cached ParserOutput for this file + parser + tier."""
+        from app.core.storage.artifact_store import get_artifact_store
+
+        ref = self._blob_ref(content_hash, parser, tier)
+        if self.client:
+            try:
+                if not self.client.exists(self.key_for(content_hash, parser, tier)):
+                    return None
+            except Exception as e:
+                logger.debug(f"Redis parser cache get failed: {e}")
+                return None
+        try:
+            data = get_artifact_store().get_msgpack(ref)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read cached parser output {ref['key']}: {e}")
+            return None
+        return ParserOutput(
+            text=data["text"],
+            page_count=data["page_count"],
+            parser_name=data["parser_name"],
+            parser_version=data.get("parser_version"),
+            processing_time_ms=data.get("processing_time_ms", 0),
+            cost_usd=data.get("cost_usd", 0.0),
+            pdf_type=data.get("pdf_type"),
+            metadata=data.get("metadata") or {},
+        )
+
+    def set(self, content_hash: str, parser: DocumentParser, tier: str, output: ParserOutput) -> None:
+        """Store a parser output (blob first, then the Redis index entry)."""
+        from app.core.storage.artifact_store import get_artifact_store
+
+        ref = self._blob_ref(content_hash, parser, tier)
+        try:
+            get_artifact_store().put_msgpack_at(ref["key"], _to_dict(output))
+        except Exception as e:
+            logger.warning(f"Failed to store parser output in cache: {e}")
+            return
+        if self.client and self.ttl > 0:
+            try:
+                self.client.setex(self.key_for(content_hash, parser, tier), self.ttl, ref["key"])
+            except Exception as e:
+                logger.debug(f"Redis parser cache set failed: {e}")
+
+    # -------- De-duplication --------
+    @contextmanager
+    def lock(self, content_hash: str, parser: DocumentParser, tier: str) -> Iterator[bool]:
+        """
+        Hold the parse lock for an entry; yields False if it could not be acquired in time.
+        """
+        key = self.key_for(content_hash, parser, tier)
+        if self.client:
+            redis_lock = self.client.lock(
+                f"parsecache:lock:{key}",
+                timeout=self.lock_timeout,
+                blocking_timeout=self.lock_wait,
+            )
+            try:
+                acquired = redis_lock.acquire()
+            except Exception as e:
+                logger.debug(f"Redis parser cache lock failed: {e}")
+                acquired = False
+                redis_lock = None
+            try:
+                yield acquired
+            finally:
+                if acquired and redis_lock is not None:
+                    try:
+                        redis_lock.release()
+                    except Exception as e:
+                        logger.debug(f"Redis parser cache unlock failed: {e}")
+            return
+
+        with _local_locks_guard:
+            local_lock = _local_locks.setdefault(key, threading.Lock())
+        acquired = local_lock.acquire(timeout=self.lock_wait)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                local_lock.release()
+
+
+def _to_dict(output: ParserOutput) -> Dict[str, Any]:
+    return {
+        "text": output.text,
+        "page_count": output.page_count,
+        "parser_name": output.parser_name,
+        "parser_version": output.parser_version,
+        "processing_time_ms": output.processing_time_ms,
+        "cost_usd": output.cost_usd,
+        "pdf_type": output.pdf_type,
+        "metadata": output.metadata,
+    }
+
+
+def _from_cache(cached: ParserOutput, lookup_start: float, result: str) -> ParserOutput:
+    """Cached output as this request sees it: no parser cost, lookup time only."""
+    PARSER_CACHE_REQUESTS.labels(result=result).inc()
+    if cached.cost_usd:
+        PARSER_CACHE_SAVED_USD.inc(cached.cost_usd)
+    return replace(
+        cached,
+        processing_time_ms=int((time.perf_counter() - lookup_start) * 1000),
+        cost_usd=0.0,
+        metadata={**(cached.metadata or {}), "parser_cache_hit": True},
+    )
+
+
+def _single_open_parser(tier: str) -> Optional[DocumentParser]:
+    """The tier's digital parser when it classifies PDFs itself (no detect_pdf_type open needed)."""
+    parser = ParserFactory.get_parser(tier, "digital")
+    return parser if parser is not None and parser.classifies_pdf_type else None
+
+
+def _parse_cached(
+    cache: ParserOutputCache,
+    content_hash: str,
+    parser: DocumentParser,
+    tier: str,
+    file_path: str,
+    pdf_type: Optional[str],
+    lookup_start: float
+) -> ParserOutput:
+    """Cached output for this parser, or parse under the entry lock and store it.
+
+    pdf_type=None lets a classifying parser detect the type; a 'scanned' result
+    is returned without being cached (the caller switches parsers).
+    """
+    cached = cache.get(content_hash, parser, tier)
+    if cached:
+        return _from_cache(cached, lookup_start, "hit")
+
+    with cache.lock(content_hash, parser, tier) as acquired:
+        # Another worker may have parsed this file while we waited for the lock
+        cached = cache.get(content_hash, parser, tier)
+        if cached:
+            logger.info("Parser cache hit after waiting for concurrent parse", extra={"content_hash": content_hash})
+            return _from_cache(cached, lookup_start, "wait_hit")
+        if not acquired:
+            logger.warning("Parser cache lock wait timed out; parsing without lock", extra={"content_hash": content_hash})
+
+        output = asyncio.run(parser.parse(file_path, pdf_type))
+        if pdf_type is None and output.pdf_type == "scanned":
+            return output
+        PARSER_CACHE_REQUESTS.labels(result="miss").inc()
+        if output.pdf_type is None:
+            output.pdf_type = pdf_type
+        cache.set(content_hash, parser, tier, output)
+    return output
+
+
+def parse_with_cache(
+    content_hash: Optional[str],
+    tier: str,
+    ensure_local_file: Callable[[], str],
+    detect_pdf_type: Callable[[str], str],
+    cache: Optional[ParserOutputCache] = None
+) -> Tuple[ParserOutput, str]:
+    """
+    Parse a document, reusing a cached output for the same content when possible.
+
+    When the tier's digital parser classifies PDFs itself (PyMuPDF), it is tried
+    first with pdf_type=None and detect_pdf_type is never called: digital PDFs
+    are classified and parsed from one open; scanned ones go to the scanned parser.
+
+    Args:
+        content_hash: SHA256 of the file (None computes it after download)
+        tier: User tier used for parser selection (part of the key)
+        ensure_local_file: Returns a local path, downloading the file if needed
+        detect_pdf_type: PDF type detector (path -> "digital" | "scanned")
+        cache: Cache instance (default: process-wide cache)
+
+    Returns:
+        (ParserOutput, pdf_type)
+
+    Raises:
+        ValueError: If no parser is available for the detected PDF type
+    """
+    if not settings.parser_cache_enabled:
+        file_path = ensure_local_file()
+        single_open = _single_open_parser(tier)
+        if single_open is not None:
+            output = asyncio.run(single_open.parse(file_path, None))
+            if output.pdf_type != "scanned":
+                return output, output.pdf_type or "digital"
+            pdf_type = "scanned"
+        else:
+            pdf_type = detect_pdf_type(file_path)
+        parser = ParserFactory.get_parser(tier, pdf_type)
+        if not parser:
+            raise ValueError("No parser available for detected PDF type")
+        return asyncio.run(parser.parse(file_path, pdf_type)), pdf_type
+
+    cache = cache or get_parser_output_cache()
+    lookup_start = time.perf_counter()
+
+    # Fast path: known file -> no download, no type detection
+    if content_hash:
+        pdf_type = cache.get_pdf_type(content_hash)
+        parser = ParserFactory.get_parser(tier, pdf_type) if pdf_type else None
+        cached = cache.get(content_hash, parser, tier) if parser else None
+        if cached:
+            logger.info(
+                "Parser cache hit",
+                extra={"content_hash": content_hash, "parser": parser.name, "pages": cached.page_count}
+            )
+            return _from_cache(cached, lookup_start, "hit"), pdf_type
+
+    file_path = ensure_local_file()
+    content_hash = content_hash or file_sha256(file_path)
+
+    single_open = _single_open_parser(tier)
+    if single_open is not None:
+        output = _parse_cached(cache, content_hash, single_open, tier, file_path, None, lookup_start)
+        pdf_type = output.pdf_type or "digital"
+        cache.set_pdf_type(content_hash, pdf_type)
+        if pdf_type != "scanned":
+            return output, pdf_type
+    else:
+        pdf_type = detect_pdf_type(file_path)
+        cache.set_pdf_type(content_hash, pdf_type)
+
+    parser = ParserFactory.get_parser(tier, pdf_type)
+    if not parser:
+        raise ValueError("No parser available for detected PDF type")
+    return _parse_cached(cache, content_hash, parser, tier, file_path, pdf_type, lookup_start), pdf_type
+
+
+_parser_output_cache: Optional[ParserOutputCache] = None
+_parser_output_cache_lock = threading.Lock()
+
+
+def get_parser_output_cache() -> ParserOutputCache:
+    """Get (or lazily create) the process-wide parser output cache."""
+    global _parser_output_cache
+    if _parser_output_cache is None:
+        with _parser_output_cache_lock:
+            if _parser_output_cache is None:
+                _parser_output_cache = ParserOutputCache()
+    return _parser_output_cache
@@ -1,11 +1,92 @@
 # backend/app/services/parsers/pymupdf_parser.py
-"""PyMuPDF (fitz) parser for digital PDFs - Free tier"""
+"""PyMuPDF (fitz) parser for digital PDFs - Free tier
+
+The document is opened once: the first pages read also classify it as
+digital or scanned (same sample and threshold as detect_pdf_type), so callers
+may pass pdf_type=None and skip the separate detection open.
+
+Large documents (settings.pymupdf_parallel_min_pages and up) are split into
+contiguous page ranges parsed in a process pool: each worker opens the file
+itself and returns per-page text (plus tables and block layout when
+settings.pymupdf_extract_tables is on), and the results are reassembled in
+page order into the same ParserOutput as the serial path.
+
+Pool workers are started with "spawn": the parent (API executors, the job
+progress flusher, warmed models in Celery workers) holds live threads, and
+forking such a process can deadlock the child.
+"""
 import fitz  # PyMuPDF
+import os
 import time
 import asyncio
-from typing import Optional
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 from .base import DocumentParser, ParserOutput
+from app.config import settings
 from app.utils.logging import logger
+from app.utils.pdf_utils import classify_pdf_text
+
+DETECTION_SAMPLE_PAGES = 3  # Same sample as detect_pdf_type
+MAX_PARALLEL_WORKERS = 8
+
+
+def _extract_page_range(file_path: str, start: int, end: int, extract_structure: bool = False) -> List[Dict[str, Any]]:
+    """Extract pages [start, end) from a PDF (runs in pool workers; opens its own document).
+
+    Returns:
+        One dict per page: page_number, text, tables, layout
+    """
+    doc = fitz.open(file_path)
+    try:
+        return _extract_doc_pages(doc, start, end, extract_structure)
+    finally:
+        doc.close()
+
+
+def _extract_doc_pages(doc, start: int, end: int, extract_structure: bool) -> List[Dict[str, Any]]:
+    """Per-page text for pages [start, end) of an open document.
+
+    With extract_structure, tables and a compact layout (page size and text
+    block bboxes, read from the same text page as the text) are added.
+    """
+    pages = []
+    for page_num in range(start, end):
+        page = doc[page_num]
+        if not extract_structure:
+            pages.append({"page_number": page_num + 1, "text": page.get_text(), "tables": [], "layout": None})
+            continue
+
+        textpage = page.get_textpage()
+        text = page.get_text(textpage=textpage)
+        tables = []
+        try:
+            for table in page.find_tables().tables:
+                rows = table.extract()
+                tables.append({
+                    "rows": rows,
+                    "row_count": len(rows),
+                    "column_count": table.col_count,
+                    "bbox": list(table.bbox),
+                })
+        except Exception as e:
+            logger.debug(f"PyMuPDF table extraction failed on page {page_num + 1}: {e}")
+        layout = {
+            "width": round(page.rect.width, 1),
+            "height": round(page.rect.height, 1),
+            "blocks": [
+                [round(x0, 1), round(y0, 1), round(x1, 1), round(y1, 1)]
+                for x0, y0, x1, y1, *_ in page.get_text("blocks", textpage=textpage)
+            ],
+        }
+        pages.append({"page_number": page_num + 1, "text": text, "tables": tables, "layout": layout})
+    return pages
+
+
+def _page_ranges(start: int, page_count: int, workers: int) -> List[Tuple[int, int]]:
+    """Split [start, page_count) into contiguous ranges (two per worker for load balancing)."""
+    size = max(1, -(-(page_count - start) // (workers * 2)))
+    return [(s, min(s + size, page_count)) for s in range(start, page_count, size)]
 
 
 class PyMuPDFParser(DocumentParser):
@@ -33,23 +114,89 @@ class PyMuPDFParser(DocumentParser):
     def cost_per_page(self) -> float:
         return 0.0  # Free!
 
+    @property
+    def classifies_pdf_type(self) -> bool:
+        return True
+
     def supports_pdf_type(self, pdf_type: str) -> bool:
         """PyMuPDF only supports digital PDFs"""
         return pdf_type == "digital"
 
-    async def parse(self, file_path: str, pdf_type: str) -> ParserOutput:
+    def extract_pages(
+        self,
+        file_path: str,
+        stop_if_scanned: bool = False
+    ) -> Tuple[List[Dict[str, Any]], int, str]:
+        """Classify and extract every page in order, using a process pool for large documents.
+
+        The sample pages are read (and classified) from the single open in this
+        process; in parallel mode only the remaining pages go to the pool.
+
+        Args:
+            file_path: Path to PDF file
+            stop_if_scanned: Return no pages when the sample classifies as scanned
+
+        Returns:
+            (pages, workers, pdf_type) - per-page dicts in page order, the pool size
+            used (1 = serial) and the 'digital'/'scanned' classification
+        """
+        extract_structure = settings.pymupdf_extract_tables
+        min_pages = settings.pymupdf_parallel_min_pages
+        workers = settings.pymupdf_parallel_workers or min(os.cpu_count() or 1, MAX_PARALLEL_WORKERS)
+
+        doc = fitz.open(file_path)
+        try:
+            page_count = len(doc)
+            sample_end = min(DETECTION_SAMPLE_PAGES, page_count)
+            pages = _extract_doc_pages(doc, 0, sample_end, extract_structure)
+            pdf_type = classify_pdf_text([len(p["text"].strip()) for p in pages])
+            if stop_if_scanned and pdf_type == "scanned":
+                return [], 1, pdf_type
+
+            workers = min(workers, page_count - sample_end)
+            if min_pages <= 0 or page_count < min_pages or workers <= 1:
+                # Serial: everything from this single open
+                pages += _extract_doc_pages(doc, sample_end, page_count, extract_structure)
+                return pages, 1, pdf_type
+        finally:
+            doc.close()
+
+        ranges = _page_ranges(sample_end, page_count, workers)
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                futures = [
+                    pool.submit(_extract_page_range, file_path, start, end, extract_structure)
+                    for start, end in ranges
+                ]
+                # Futures are consumed in submission order, so pages come back in document order
+                pages += [page for future in futures for page in future.result()]
+        except Exception as e:
+            # e.g. daemonic Celery pool children cannot start processes; the serial path still works
+            logger.warning(f"PyMuPDF parallel parsing unavailable ({e}); parsing serially")
+            pages = pages[:sample_end] + _extract_page_range(file_path, sample_end, page_count, extract_structure)
+            return pages, 1, pdf_type
+
+        logger.info(
+            f"PyMuPDF parsed {page_count} pages in {len(ranges)} ranges across {workers} processes",
+            extra={"page_count": page_count, "workers": workers}
+        )
+        return pages, workers, pdf_type
+
+    async def parse(self, file_path: str, pdf_type: Optional[str]) -> ParserOutput:
         """Extract text from digital PDF using PyMuPDF without blocking the event loop.
 
         This offloads the CPU-bound page iteration & text extraction to a thread via
         asyncio.to_thread so other requests (e.g. user dashboard queries) aren't starved
-        while large PDFs are being read.
+        while large PDFs are being read. Large PDFs are additionally split across a
+        process pool (see extract_pages).
 
         Args:
             file_path: Path to PDF file
-            pdf_type: Should be 'digital'
+            pdf_type: Should be 'digital'; None classifies the PDF from the same open
 
         Returns:
-            ParserOutput with extracted text
+            ParserOutput with extracted text. With pdf_type=None and a scanned
+            PDF, an empty output with pdf_type='scanned' (nothing else is parsed).
 
         Raises:
             ValueError: If PDF is scanned (not enough text)
@@ -57,25 +204,29 @@ class PyMuPDFParser(DocumentParser):
         """
 
         start_time = time.time()
-        logger.info(f"PyMuPDF parsing (thread offload): {file_path} (type: {pdf_type})")
-
-        def _sync_parse():
-            """Synchronous parsing logic (run in thread)."""
-            doc = fitz.open(file_path)
-            try:
-                page_count_local = len(doc)
-                text_parts = []
-                for page_num in range(page_count_local):
-                    page = doc[page_num]
-                    text_parts.append(page.get_text())
-                full_text_local = "\n\n".join(text_parts)
-            finally:
-                doc.close()
-            return full_text_local, page_count_local
+        logger.info(f"PyMuPDF parsing (thread offload): {file_path} (type: {pdf_type or 'classify'})")
 
         try:
             # Offload CPU-bound parsing
-            full_text, page_count = await asyncio.to_thread(_sync_parse)
+            pages, workers, detected_pdf_type = await asyncio.to_thread(
+                self.extract_pages, file_path, pdf_type is None
+            )
+            if pdf_type is None:
+                pdf_type = detected_pdf_type
+                if pdf_type == "scanned":
+                    return ParserOutput(
+                        text="",
+                        page_count=0,
+                        parser_name=self.name,
+                        parser_version=self.version,
+                        processing_time_ms=int((time.time() - start_time) * 1000),
+                        cost_usd=0.0,
+                        pdf_type=pdf_type,
+                        metadata={},
+                    )
+
+            full_text = "\n\n".join(p["text"] for p in pages)
+            page_count = len(pages)
 
             if len(full_text.strip()) < 100:
                 logger.warning(
@@ -89,9 +240,24 @@ class PyMuPDFParser(DocumentParser):
             processing_time_ms = int((time.time() - start_time) * 1000)
             logger.info(
                 f"PyMuPDF extracted {len(full_text)} chars from {page_count} pages in {processing_time_ms}ms",
-                extra={"parser_offload": True}
+                extra={"parser_offload": True, "parallel_workers": workers}
             )
 
+            metadata = {
+                "char_count": len(full_text),
+                "avg_chars_per_page": len(full_text) / page_count if page_count > 0 else 0,
+                "thread_offloaded": True,
+                "parallel_workers": workers,
+            }
+            if settings.pymupdf_extract_tables:
+                metadata["tables"] = [
+                    {"page_number": p["page_number"], **table}
+                    for p in pages
+                    for table in p["tables"]
+                ]
+                metadata["total_tables"] = len(metadata["tables"])
+                metadata["page_layouts"] = [{"page_number": p["page_number"], **p["layout"]} for p in pages]
+
             return ParserOutput(
                 text=full_text,
                 page_count=page_count,
@@ -100,11 +266,7 @@ class PyMuPDFParser(DocumentParser):
                 processing_time_ms=processing_time_ms,
                 cost_usd=0.0,
                 pdf_type=pdf_type,
-                metadata={
-                    "char_count": len(full_text),
-                    "avg_chars_per_page": len(full_text) / page_count if page_count > 0 else 0,
-                    "thread_offloaded": True,
-                },
+                metadata=metadata,
             )
 
         except ValueError:
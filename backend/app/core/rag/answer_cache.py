@@ -0,0 +1,169 @@
+"""
+Chat Answer Cache (opt-in)
+
+Repeated questions against the same immutable documents used to rerun the
+whole chat pipeline (understanding, retrieval, rerank, expansion, full LLM
+stream). With settings.chat_answer_cache_enabled the final assistant message,
+citation context, source chunk ids and usage are stored and replayed through
+the SSE stream on a repeat.
+
+Key design:
+    cache key: ans:<model>:<org>:<sha256(normalized query)[:32]>:<docset version>
+    normalized query: same as the query understanding cache
+    docset version: sha256 of sorted (document id, index version) pairs, where the
+        index version is completed_at + chunk_count (DocumentRepository.get_index_versions)
+    value JSON: {"answer", "citation_context", "source_chunks", "usage", "query"}
+
+Invalidation:
+    - Re-indexing resets completed_at, deleting a document removes its row and a
+      document being (re)processed has no version: all change or disable the key,
+      so stale answers are never looked up again (they expire via TTL).
+
+Bypass:
+    - Follow-up turns whose meaning depends on earlier messages
+      (see is_history_independent); those answers are neither served nor stored.
+
+Tiers: in-process LRU + Redis (settings.chat_answer_cache_ttl_seconds).
+"""
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+from app.core.rag.query_understanding_cache import QueryUnderstandingCache
+from app.utils.logging import logger
+
+try:
+    import redis  # type: ignore
+except Exception:
+    redis = None
+
+# Words that tie a message to earlier turns ("what about that one?", "and in 2023?")
+FOLLOW_UP_MARKERS = {
+    "it", "its", "that", "this", "these", "those", "they", "them", "their",
+    "he", "she", "his", "her", "above", "previous", "previously", "earlier",
+    "same", "also", "again", "else", "instead", "former", "latter",
+    "elaborate", "expand",
+}
+FOLLOW_UP_OPENERS = ("and ", "but ", "so ", "what about ", "how about ", "ok ", "okay ")
+# Messages shorter than this (in words) are treated as follow-ups when history exists
+MIN_STANDALONE_WORDS = 4
+
+
+def is_history_independent(user_message: str, history_messages: List[Dict[str, Any]]) -> bool:
+    """Heuristic: can this message be answered without the conversation so far?"""
+    if not history_messages:
+        return True
+    words = re.findall(r"[a-z0-9']+", (user_message or "").lower())
+    if len(words) < MIN_STANDALONE_WORDS:
+        return False
+    if " ".join(words).startswith(FOLLOW_UP_OPENERS):
+        return False  # "and for 2023?", "what about opex"
+    return not any(w in FOLLOW_UP_MARKERS for w in words)
+
+
+class ChatAnswerCache:
+    """Two-tier (LRU + Redis) cache of final chat answers."""
+
+    def __init__(
+        self,
+        model_name: str,
+        lru_size: Optional[int] = None,
+        ttl_seconds: Optional[int] = None
+    ):
+        """
+        Initialize answer cache.
+
+        Args:
+            model_name: Synthesis model (part of every key)
+            lru_size: Max in-process entries (default from settings)
+            ttl_seconds: Redis TTL; <= 0 disables the Redis tier (default from settings)
+        """
+        self.model_name = model_name
+        self.lru_size = lru_size if lru_size is not None else settings.chat_answer_cache_lru_size
+        self.ttl = ttl_seconds if ttl_seconds is not None else settings.chat_answer_cache_ttl_seconds
+
+        self._lru: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.client = None
+        if redis is not None and settings.use_redis_cache and self.ttl > 0:
+            try:
+                self.client = redis.Redis.from_url(settings.redis_url)
+            except Exception as e:
+                logger.warning(f"Failed to init Redis for answer cache: {e}; using LRU only")
+
+    # -------- Keys --------
+    def key_for(
+        self,
+        user_message: str,
+        document_ids: List[str],
+        index_versions: Dict[str, str],
+        org_id: Optional[str] = None
+    ) -> Optional[str]:
+        """Build the cache key, or None when a document has no index version."""
+        if not document_ids or any(doc_id not in index_versions for doc_id in document_ids):
+            return None
+        normalized = QueryUnderstandingCache.normalize_query(user_message)
+        query_digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:32]
+        docset = "\n".join(f"{doc_id}={index_versions[doc_id]}" for doc_id in sorted(set(document_ids)))
+        docset_digest = hashlib.sha256(docset.encode("utf-8")).hexdigest()[:16]
+        return f"ans:{self.model_name}:{org_id or '-'}:{query_digest}:{docset_digest}"
+
+    # -------- Get / set --------
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached answer entry (LRU, then Redis)."""
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is not None:
+                self._lru.move_to_end(key)
+                return entry
+
+        if self.client:
+            try:
+                raw = self.client.get(key)
+                if raw:
+                    entry = json.loads(raw)
+                    self._lru_put(key, entry)
+                    return entry
+            except Exception as e:
+                logger.debug(f"Redis answer cache get failed: {e}")
+        return None
+
+    def set(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store an answer entry in both tiers."""
+        self._lru_put(key, entry)
+        if self.client:
+            try:
+                self.client.setex(key, self.ttl, json.dumps(entry, default=str))
+            except Exception as e:
+                logger.debug(f"Redis answer cache set failed: {e}")
+
+    def _lru_put(self, key: str, entry: Dict[str, Any]) -> None:
+        if self.lru_size <= 0:
+            return
+        with self._lock:
+            self._lru[key] = entry
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+
+def replay_chunks(text: str, chunk_chars: int) -> List[str]:
+    """Split a cached answer into stream-sized chunks, breaking after whitespace when possible."""
+    chunk_chars = max(1, chunk_chars)
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(len(text), start + chunk_chars)
+        if end < len(text):
+            space = text.rfind(" ", start, end)
+            if space > start:
+                end = space + 1
+        chunks.append(text[start:end])
+        start = end
+    return chunks
@@ -12,7 +12,7 @@ Can be toggled on/off via config for A/B testing.
 from typing import List, Dict, Optional
 import logging
 from app.config import settings
-from app.utils.token_utils import count_tokens
+from app.utils.token_utils import count_tokens, chunk_token_count
 
 logger = logging.getLogger(__name__)
 
@@ -99,8 +99,8 @@ class ChunkCompressor:
             is_tabular = chunk.get("is_tabular", False)
             section_heading = chunk.get("section_heading", "")
 
-            # Count tokens in original text
-            token_count = count_tokens(text)
+            # Count tokens in original text (indexed count when available)
+            token_count = chunk_token_count(chunk)
 
             # Compress narrative text only
             compressed_text = text
@@ -117,8 +117,8 @@ class ChunkCompressor:
                     compressed_text = text
                     compression_method = "failed"
 
-            # Final token count
-            final_token_count = count_tokens(compressed_text)
+            # Final token count (unchanged text needs no second encode)
+            final_token_count = token_count if compressed_text == text else count_tokens(compressed_text)
 
             chunk["compressed_text"] = compressed_text
             chunk["compression_applied"] = compression_method != "none"
@@ -5,12 +5,14 @@ Retrieves and pairs chunks from multiple documents for side-by-side comparison.
 Uses full retrieval pipeline (hybrid + boost + rerank) per document.
 
 Pairing/Clustering uses cross-encoder model for accurate semantic similarity scoring,
-ensuring high-quality matches between related content across documents.
+ensuring high-quality matches between related content across documents. Candidate
+pairs are pruned with stored bi-encoder embeddings first (see comparison_pairing.py).
 """
 
 from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 import asyncio
+import copy
 import numpy as np
 import logging
 
@@ -18,7 +20,11 @@ from app.core.rag.hybrid_retriever import HybridRetriever
 from app.core.rag.reranker import Reranker
 from app.core.rag.metadata_booster import MetadataBooster
 from app.core.rag.context_expander import ContextExpander
+from app.core.rag.comparison_pairing import ComparisonPairingEngine
+from app.core.executors import run_in_db_executor, run_in_inference_executor
+from app.db_models_chat import DocumentChunk
 from app.repositories.document_repository import DocumentRepository
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -95,10 +101,35 @@ class ComparisonRetriever:
         """
         self.db = db
         self.hybrid_retriever = hybrid_retriever or HybridRetriever(db)
-        self.reranker = reranker or Reranker()
+        if reranker is None:
+            from app.services.model_registry import get_reranker
+            reranker = get_reranker()
+        self.reranker = reranker
         self.metadata_booster = metadata_booster or MetadataBooster.for_reranker()
         self.context_expander = context_expander or ContextExpander()
         self.document_repo = DocumentRepository()
+        self.pairing = ComparisonPairingEngine(self.reranker)
+
+    def bind(
+        self,
+        db: Session,
+        hybrid_retriever: Optional[HybridRetriever] = None,
+        reranker: Optional[Reranker] = None
+    ) -> "ComparisonRetriever":
+        """Return a shallow copy bound to another session.
+
+        Args:
+            db: Request database session
+            hybrid_retriever: Retriever already bound to db (default: bind the shared one)
+            reranker: Optional replacement reranker
+        """
+        bound = copy.copy(self)
+        bound.db = db
+        bound.hybrid_retriever = hybrid_retriever or self.hybrid_retriever.bind(db)
+        if reranker is not None:
+            bound.reranker = reranker
+            bound.pairing = ComparisonPairingEngine(reranker)
+        return bound
 
     async def retrieve_for_comparison(
         self,
@@ -167,12 +198,20 @@ class ComparisonRetriever:
         documents = self._get_doc_metadata(document_ids)
 
         # Step 3: Pair or cluster chunks based on number of documents
+        # (stored embeddings are read on the DB pool; cross-encoder work runs on the
+        # inference pool, off the event loop, and never touches the session)
         paired_chunks = []
         clustered_chunks = []
+        stored_embeddings = await run_in_db_executor(
+            self._stored_embeddings,
+            [c.get("id") for chunks in doc_chunks.values() for c in chunks]
+        )
 
         if num_docs == 2:
             # Use pairwise matching for 2 documents
-            paired_chunks = self._pair_chunks(doc_chunks, similarity_threshold)
+            paired_chunks = await run_in_inference_executor(
+                self._pair_chunks, doc_chunks, similarity_threshold, stored_embeddings
+            )
             logger.info(
                 f"Paired {len(paired_chunks)} chunk pairs (threshold={similarity_threshold})",
                 extra={"doc_a_chunks": len(doc_chunks.get(document_ids[0], [])),
@@ -180,7 +219,9 @@ class ComparisonRetriever:
             )
         else:
             # Use clustering for 3+ documents
-            clustered_chunks = self._cluster_chunks(doc_chunks, similarity_threshold)
+            clustered_chunks = await run_in_inference_executor(
+                self._cluster_chunks, doc_chunks, similarity_threshold, stored_embeddings
+            )
             logger.info(
                 f"Clustered {len(clustered_chunks)} chunk clusters across {num_docs} documents",
                 extra={"avg_cluster_size": np.mean([len(c.chunks) for c in clustered_chunks]) if clustered_chunks else 0}
@@ -261,16 +302,19 @@ class ComparisonRetriever:
     def _pair_chunks(
         self,
         doc_chunks: Dict[str, List[Dict]],
-        similarity_threshold: float
+        similarity_threshold: float,
+        stored_embeddings: Optional[Dict[str, List[float]]] = None
     ) -> List[ChunkPair]:
         """
         Pair chunks from different documents by semantic similarity.
 
-        Uses cross-encoder model for accurate semantic similarity scoring.
+        Uses cross-encoder model for accurate semantic similarity scoring on
+        bi-encoder candidate pairs.
 
         Args:
             doc_chunks: Dict mapping doc_id to list of chunks
             similarity_threshold: Minimum similarity (0-1) to create pair
+            stored_embeddings: chunk_id -> stored embedding (from _stored_embeddings)
 
         Returns:
             List of ChunkPair objects, sorted by similarity (highest first)
@@ -287,40 +331,24 @@ class ComparisonRetriever:
             logger.warning("One or both documents have no chunks")
             return []
 
-        # Compute all pairwise similarities using cross-encoder (batched)
-        similarity_matrix = self._compute_cross_encoder_similarities(chunks_a, chunks_b)
-
-        pairs = []
-        used_b = set()
-
-        # For each chunk in Doc A, find best match in Doc B
-        for i, chunk_a in enumerate(chunks_a):
-            best_match = None
-            best_sim = 0.0
-
-            for j, chunk_b in enumerate(chunks_b):
-                if j in used_b:
-                    continue
-
-                sim = similarity_matrix[i][j]
-
-                if sim > best_sim and sim >= similarity_threshold:
-                    best_sim = sim
-                    best_match = (j, chunk_b)
-
-            if best_match:
-                used_b.add(best_match[0])
-                topic = self._infer_topic(chunk_a, best_match[1])
-
-                pairs.append(ChunkPair(
-                    chunk_a=chunk_a,
-                    chunk_b=best_match[1],
-                    similarity=best_sim,
-                    topic=topic
-                ))
+        # Pairwise similarities: bi-encoder pruned, cross-encoder scored
+        similarity_matrix = self._compute_cross_encoder_similarities(
+            chunks_a,
+            chunks_b,
+            self._chunk_embeddings(chunks_a, stored_embeddings),
+            self._chunk_embeddings(chunks_b, stored_embeddings)
+        )
 
-        # Sort by similarity (highest first)
-        pairs.sort(key=lambda p: p.similarity, reverse=True)
+        # Greedy one-to-one matching, highest similarity first
+        pairs = [
+            ChunkPair(
+                chunk_a=chunks_a[i],
+                chunk_b=chunks_b[j],
+                similarity=sim,
+                topic=self._infer_topic(chunks_a[i], chunks_b[j])
+            )
+            for i, j, sim in self.pairing.assign(similarity_matrix, similarity_threshold)
+        ]
 
         logger.debug(
             f"Created {len(pairs)} pairs from {len(chunks_a)} x {len(chunks_b)} chunks using cross-encoder",
@@ -335,68 +363,87 @@ class ComparisonRetriever:
     def _compute_cross_encoder_similarities(
         self,
         chunks_a: List[Dict],
-        chunks_b: List[Dict]
-    ) -> List[List[float]]:
+        chunks_b: List[Dict],
+        embeddings_a: Optional[np.ndarray] = None,
+        embeddings_b: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         Compute pairwise semantic similarities using cross-encoder model.
 
-        Creates all (chunk_a, chunk_b) pairs and scores them in batch.
-        Returns matrix where similarity_matrix[i][j] = similarity(chunks_a[i], chunks_b[j])
+        Only bi-encoder candidate pairs are scored (token-truncated, batched);
+        similarity_matrix[i, j] = similarity(chunks_a[i], chunks_b[j]), 0 for pruned pairs.
 
         Args:
             chunks_a: List of chunks from document A
             chunks_b: List of chunks from document B
+            embeddings_a: Optional stored embeddings of chunks_a (enables pruning)
+            embeddings_b: Optional stored embeddings of chunks_b (enables pruning)
 
         Returns:
-            2D list of similarity scores (normalized to 0-1 range)
+            (|A|, |B|) array of similarity scores (normalized to 0-1 range)
         """
-        # Build all pairs for batch scoring
-        pairs = []
-        pair_indices = []  # Track which (i, j) each pair corresponds to
-
-        for i, chunk_a in enumerate(chunks_a):
-            for j, chunk_b in enumerate(chunks_b):
-                text_a = chunk_a.get('text', '')
-                text_b = chunk_b.get('text', '')
-                pairs.append([text_a, text_b])
-                pair_indices.append((i, j))
-
-        if not pairs:
+        if not chunks_a or not chunks_b:
             logger.warning("No chunk pairs to score")
-            return [[0.0] * len(chunks_b) for _ in chunks_a]
+            return np.zeros((len(chunks_a), len(chunks_b)), dtype=np.float32)
 
-        # Score all pairs with cross-encoder
         try:
-            scores = self.reranker.model.predict(
-                pairs,
-                batch_size=self.reranker.batch_size,
-                show_progress_bar=False
-            )
+            return self.pairing.similarity_matrix(chunks_a, chunks_b, embeddings_a, embeddings_b)
+        except Exception as e:
+            logger.error(f"Cross-encoder similarity computation failed: {e}", exc_info=True)
+            logger.warning("Falling back to Jaccard similarity")
+            # Fallback: use Jaccard similarity
+            return np.asarray(self._compute_jaccard_similarities(chunks_a, chunks_b), dtype=np.float32)
 
-            # Normalize scores to 0-1 range using sigmoid
-            # Cross-encoder outputs can be negative, sigmoid maps to [0,1]
-            normalized_scores = [1 / (1 + np.exp(-score)) for score in scores]
+    def _stored_embeddings(self, chunk_ids: List[str]) -> Dict[str, List[float]]:
+        """
+        Stored embeddings by chunk id (runs on the DB pool, uses the request session).
 
-            # Build similarity matrix
-            similarity_matrix = [[0.0] * len(chunks_b) for _ in chunks_a]
-            for (i, j), score in zip(pair_indices, normalized_scores):
-                similarity_matrix[i][j] = score
+        Returns an empty dict when they cannot be read; chunks are then embedded on the fly.
+        """
+        ids = [i for i in chunk_ids if i]
+        if self.db is None or not ids:
+            return {}
+        try:
+            rows = self.db.execute(
+                select(DocumentChunk.id, DocumentChunk.embedding)
+                .where(DocumentChunk.id.in_(ids))
+            ).all()
+        except Exception as e:
+            logger.warning(f"Stored chunk embeddings unavailable for pairing: {e}")
+            return {}
+        return {row.id: row.embedding for row in rows if row.embedding is not None}
 
-            logger.debug(
-                f"Computed {len(pairs)} cross-encoder similarities for pairing",
-                extra={
-                    "avg_score": np.mean(normalized_scores),
-                    "max_score": np.max(normalized_scores)
-                }
-            )
+    def _chunk_embeddings(
+        self,
+        chunks: List[Dict],
+        stored: Optional[Dict[str, List[float]]] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Embeddings for chunks (row order preserved), from the prefetched stored vectors.
 
-            return similarity_matrix
+        Chunks without a stored vector are embedded on the fly (cached provider).
+        Returns None when embeddings are unavailable; pairing then scores all pairs.
+        """
+        if not chunks:
+            return None
+        stored = stored or {}
+        try:
+            ids = [c.get("id") for c in chunks]
+            missing = [idx for idx, chunk_id in enumerate(ids) if chunk_id not in stored]
+            embedded = {}
+            if missing:
+                vectors = self.hybrid_retriever.embedder.embed_batch(
+                    [chunks[idx].get("text", "") or "" for idx in missing]
+                )
+                embedded = dict(zip(missing, vectors))
 
+            return np.asarray(
+                [embedded[idx] if idx in embedded else stored[chunk_id] for idx, chunk_id in enumerate(ids)],
+                dtype=np.float32
+            )
         except Exception as e:
-            logger.error(f"Cross-encoder similarity computation failed: {e}", exc_info=True)
-            logger.warning("Falling back to Jaccard similarity")
-            # Fallback: use Jaccard similarity
-            return self._compute_jaccard_similarities(chunks_a, chunks_b)
+            logger.warning(f"Chunk embeddings unavailable for pairing, scoring all pairs: {e}")
+            return None
 
     def _compute_jaccard_similarities(
         self,
@@ -508,12 +555,14 @@ class ComparisonRetriever:
     def _cluster_chunks(
         self,
         doc_chunks: Dict[str, List[Dict]],
-        similarity_threshold: float
+        similarity_threshold: float,
+        stored_embeddings: Optional[Dict[str, List[float]]] = None
     ) -> List[ChunkCluster]:
         """
         Cluster chunks from 3+ documents by semantic similarity.
 
-        Greedy algorithm using cross-encoder for accurate semantic matching:
+        Greedy algorithm using cross-encoder for accurate semantic matching
+        (bi-encoder pruned candidates, see ComparisonPairingEngine):
         1. Start with highest-ranked chunk from first document
         2. Find best matching chunk from each other document (above threshold)
         3. If at least 2 documents have a match, create cluster
@@ -522,6 +571,7 @@ class ComparisonRetriever:
         Args:
             doc_chunks: Dict mapping doc_id to list of chunks
             similarity_threshold: Minimum similarity for clustering
+            stored_embeddings: chunk_id -> stored embedding (from _stored_embeddings)
 
         Returns:
             List of ChunkCluster objects
@@ -531,13 +581,12 @@ class ComparisonRetriever:
             logger.warning("Clustering requires at least 3 documents")
             return []
 
-        # Track which chunks have been used
-        used_chunks = {doc_id: set() for doc_id in doc_ids}
         clusters = []
 
         # Use first document as anchor
         anchor_doc_id = doc_ids[0]
         anchor_chunks = doc_chunks[anchor_doc_id]
+        anchor_embeddings = self._chunk_embeddings(anchor_chunks, stored_embeddings)
 
         # Pre-compute similarities between anchor chunks and all other chunks
         # This is more efficient than computing on-demand
@@ -546,45 +595,38 @@ class ComparisonRetriever:
             other_chunks = doc_chunks[other_doc_id]
             similarity_cache[other_doc_id] = self._compute_cross_encoder_similarities(
                 anchor_chunks,
-                other_chunks
+                other_chunks,
+                anchor_embeddings,
+                self._chunk_embeddings(other_chunks, stored_embeddings)
             )
 
-        for anchor_idx, anchor_chunk in enumerate(anchor_chunks):
-            if id(anchor_chunk) in used_chunks[anchor_doc_id]:
-                continue
+        # Track which chunks have been used (per document, by position)
+        used = {doc_id: np.zeros(len(doc_chunks[doc_id]), dtype=bool) for doc_id in doc_ids}
 
+        for anchor_idx, anchor_chunk in enumerate(anchor_chunks):
             # Try to find matching chunk from each other document
             cluster_chunks = {anchor_doc_id: anchor_chunk}
+            matched = {}
             similarities = []
 
             for other_doc_id in doc_ids[1:]:
-                best_match = None
-                best_sim = 0.0
-                best_idx = -1
-
-                other_chunks = doc_chunks[other_doc_id]
                 similarity_matrix = similarity_cache[other_doc_id]
-
-                for other_idx, other_chunk in enumerate(other_chunks):
-                    if id(other_chunk) in used_chunks[other_doc_id]:
-                        continue
-
-                    sim = similarity_matrix[anchor_idx][other_idx]
-
-                    if sim > best_sim and sim >= similarity_threshold:
-                        best_sim = sim
-                        best_match = other_chunk
-                        best_idx = other_idx
-
-                if best_match:
-                    cluster_chunks[other_doc_id] = best_match
-                    similarities.append(best_sim)
+                if similarity_matrix.size == 0:
+                    continue
+                best_idx = self.pairing.best_available(
+                    similarity_matrix[anchor_idx], used[other_doc_id], similarity_threshold
+                )
+                if best_idx is not None:
+                    cluster_chunks[other_doc_id] = doc_chunks[other_doc_id][best_idx]
+                    matched[other_doc_id] = best_idx
+                    similarities.append(float(similarity_matrix[anchor_idx, best_idx]))
 
             # Create cluster if we have chunks from at least 2 documents (including anchor)
             if len(cluster_chunks) >= 2:
                 # Mark chunks as used
-                for doc_id, chunk in cluster_chunks.items():
-                    used_chunks[doc_id].add(id(chunk))
+                used[anchor_doc_id][anchor_idx] = True
+                for other_doc_id, idx in matched.items():
+                    used[other_doc_id][idx] = True
 
                 # Infer topic from anchor chunk
                 topic = self._infer_topic_from_chunk(anchor_chunk)
@@ -592,7 +634,7 @@ class ComparisonRetriever:
                 clusters.append(ChunkCluster(
                     chunks=cluster_chunks,
                     topic=topic,
-                    avg_similarity=np.mean(similarities) if similarities else 0.0
+                    avg_similarity=float(np.mean(similarities)) if similarities else 0.0
                 ))
 
         logger.debug(
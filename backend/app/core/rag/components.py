@@ -0,0 +1,146 @@
+# backend/app/core/rag/components.py
+"""Process-wide RAG component graph.
+
+RAGService used to build its whole dependency graph on every chat request:
+two LLMClients (each with fresh Anthropic sync/async HTTP clients, i.e. new
+connection pools and TLS handshakes), a Redis client for the summary cache,
+repositories, the hybrid retriever, etc. None of those hold per-request state.
+
+RAGComponents is built once (at lifespan startup, or lazily on first use) and
+shared by every request. Per-request state lives in ChatRequestContext:
+    - db: the request's SQLAlchemy session
+    - last_citation_context / last_comparison_context: SSE payloads for the
+      current turn
+
+Session-bound helpers (HybridRetriever, ComparisonRetriever) are kept here as
+prototypes and bound to the request session with .bind(db), a shallow copy
+that reuses the shared embedder, analyzers and boosters.
+"""
+import threading
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.chat.llm_service import ChatLLMService
+from app.core.embeddings import get_embedding_provider
+from app.core.llm.llm_client import LLMClient
+from app.core.rag.answer_cache import ChatAnswerCache
+from app.core.rag.budget_enforcer import BudgetEnforcer
+from app.core.rag.chat_persistence import ChatPersistence
+from app.core.rag.comparison_retriever import ComparisonRetriever
+from app.core.rag.context_expander import ContextExpander
+from app.core.rag.fact_extractor import FactExtractor
+from app.core.rag.hybrid_retriever import HybridRetriever
+from app.core.rag.memory import ConversationMemory
+from app.core.rag.prompt_builder import PromptBuilder
+from app.core.rag.query_understanding import QueryUnderstandingService
+from app.core.rag.reranker import Reranker
+from app.repositories.document_repository import DocumentRepository
+from app.utils.logging import logger
+
+
+@dataclass(frozen=True)
+class RAGComponents:
+    """Immutable, shareable RAG dependencies (no per-request state)."""
+
+    embedder: Any
+    llm_client: LLMClient
+    chat_llm_service: ChatLLMService
+    prompt_builder: PromptBuilder
+    memory: ConversationMemory
+    budget: BudgetEnforcer
+    query_understanding: QueryUnderstandingService
+    reranker: Optional[Reranker]
+    fact_extractor: FactExtractor
+    context_expander: ContextExpander
+    persistence: ChatPersistence
+    document_repo: DocumentRepository
+    hybrid_retriever: HybridRetriever  # Prototype (db=None); use .bind(db)
+    comparison_retriever: ComparisonRetriever  # Prototype (db=None); use .bind(db, ...)
+    answer_cache: Optional[ChatAnswerCache] = None  # Opt-in (settings.chat_answer_cache_enabled)
+
+    @classmethod
+    def build(cls, reranker: Optional[Reranker] = None) -> "RAGComponents":
+        """Construct the full component graph (expensive; call once per process)."""
+        if reranker is None and settings.rag_use_reranker:
+            from app.services.service_locator import get_reranker
+            reranker = get_reranker()
+
+        llm_client = LLMClient(
+            api_key=settings.anthropic_api_key,
+            model=settings.synthesis_llm_model,
+            max_tokens=settings.synthesis_llm_max_tokens,
+            max_input_chars=settings.llm_max_input_chars,
+            timeout_seconds=settings.synthesis_llm_timeout_seconds,
+        )
+        chat_llm_service = ChatLLMService(llm_client)
+        context_expander = ContextExpander()
+        hybrid_retriever = HybridRetriever(None)
+
+        return cls(
+            embedder=get_embedding_provider(),
+            llm_client=llm_client,
+            chat_llm_service=chat_llm_service,
+            prompt_builder=PromptBuilder(),
+            memory=ConversationMemory(chat_llm_service),
+            budget=BudgetEnforcer(),
+            query_understanding=QueryUnderstandingService(),
+            reranker=reranker,
+            fact_extractor=FactExtractor(),
+            context_expander=context_expander,
+            persistence=ChatPersistence(),
+            document_repo=DocumentRepository(),
+            hybrid_retriever=hybrid_retriever,
+            comparison_retriever=ComparisonRetriever(
+                db=None,
+                hybrid_retriever=hybrid_retriever,
+                reranker=reranker,
+                context_expander=context_expander,
+            ),
+            answer_cache=(
+                ChatAnswerCache(settings.synthesis_llm_model)
+                if settings.chat_answer_cache_enabled else None
+            ),
+        )
+
+    def with_reranker(self, reranker: Optional[Reranker]) -> "RAGComponents":
+        """Return a copy using a different reranker (shares everything else)."""
+        if reranker is self.reranker:
+            return self
+        return replace(
+            self,
+            reranker=reranker,
+            comparison_retriever=self.comparison_retriever.bind(
+                None, self.hybrid_retriever, reranker=reranker
+            ),
+        )
+
+
+@dataclass
+class ChatRequestContext:
+    """Per-request RAG state (one per chat turn)."""
+
+    db: Session
+    last_citation_context: Optional[Dict] = None
+    last_comparison_context: Optional[Dict] = None
+
+
+_components: Optional[RAGComponents] = None
+_components_lock = threading.Lock()
+
+
+def get_rag_components() -> RAGComponents:
+    """Get (or lazily build) the process-wide RAG component graph."""
+    global _components
+    if _components is None:
+        with _components_lock:
+            if _components is None:
+                logger.info("Building shared RAG component graph...")
+                _components = RAGComponents.build()
+                logger.info("Shared RAG component graph ready")
+    return _components
+
+
+__all__ = ["RAGComponents", "ChatRequestContext", "get_rag_components"]
@@ -289,7 +289,8 @@ class ContextExpander:
                     'section_heading': c.section_heading,
                     'chunk_metadata': c.chunk_metadata or {},
                     'metadata': c.chunk_metadata or {},  # Alias for compatibility
-                    'token_count': c.token_count
+                    'token_count': c.token_count,
+                    'token_truncation_offset': c.token_truncation_offset
                 }
                 for c in chunks
             }
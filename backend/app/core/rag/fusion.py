@@ -0,0 +1,252 @@
+"""
+Rank Fusion for RAG
+
+Fuses N ranked result lists (e.g. semantic + keyword, or one list per query)
+into a single scored list.
+
+Supported methods:
+- RRF (Reciprocal Rank Fusion): Σ w / (k + rank)
+- Weighted sum: Σ w * score (scores should be normalized 0-1 per list)
+- CombMNZ: (Σ score) * number_of_lists_containing_the_item
+
+Performance characteristics:
+- Single pass over every input row, id → row map built once: O(total rows)
+- Rows are annotated IN PLACE (no per-row dict copies); the first list an
+  item appears in supplies the row that is returned
+- Optional top-k selection uses a heap instead of a full sort
+
+Pure Python, no app dependencies - safe to import from anywhere.
+"""
+
+import heapq
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+
+RankedList = Sequence[Dict[str, Any]]
+
+FUSION_METHODS = ("rrf", "weighted_sum", "comb_mnz")
+
+
+def _fuse(
+    ranked_lists: Sequence[RankedList],
+    contribution: Callable[[int, int, Dict[str, Any]], float],
+    id_key: str,
+    score_key: str,
+    rank_keys: Optional[Sequence[str]],
+    carry_keys: Sequence[str],
+    multiply_by_hits: bool,
+    top_k: Optional[int],
+    sort: bool
+) -> List[Dict[str, Any]]:
+    """
+    Shared single-pass fusion core.
+
+    Args:
+        ranked_lists: Ranked result lists (best first)
+        contribution: f(list_index, rank, row) -> score contribution of that row
+        id_key: Field identifying the same item across lists
+        score_key: Field the fused score is written to
+        rank_keys: Optional per-list field names to record the item's 1-indexed rank
+                   (None when the item is absent from that list)
+        carry_keys: Fields copied from later lists onto the kept row when missing
+        multiply_by_hits: CombMNZ - multiply summed score by number of lists hit
+        top_k: Return only the top-k fused rows
+        sort: Sort output by fused score (descending)
+
+    Returns:
+        Fused rows (the original dict objects, annotated in place)
+    """
+    if rank_keys is not None and len(rank_keys) != len(ranked_lists):
+        raise ValueError("rank_keys must have one entry per ranked list")
+
+    rows: Dict[Hashable, Dict[str, Any]] = {}
+    scores: Dict[Hashable, float] = {}
+    hits: Dict[Hashable, int] = {}
+
+    for list_idx, results in enumerate(ranked_lists):
+        rank_key = rank_keys[list_idx] if rank_keys is not None else None
+        seen_in_list = set()
+
+        for rank, row in enumerate(results, start=1):
+            item_id = row[id_key]
+
+            # Only the best-ranked occurrence within a list counts
+            if item_id in seen_in_list:
+                continue
+            seen_in_list.add(item_id)
+
+            kept = rows.get(item_id)
+            if kept is None:
+                kept = row
+                rows[item_id] = row
+                scores[item_id] = 0.0
+                hits[item_id] = 0
+            elif carry_keys:
+                for key in carry_keys:
+                    if key not in kept and key in row:
+                        kept[key] = row[key]
+
+            scores[item_id] += contribution(list_idx, rank, row)
+            hits[item_id] += 1
+
+            if rank_key is not None:
+                kept[rank_key] = rank
+
+    # Write fused scores (and absent ranks) onto kept rows
+    for item_id, row in rows.items():
+        score = scores[item_id]
+        if multiply_by_hits:
+            score *= hits[item_id]
+        row[score_key] = score
+        if rank_keys is not None:
+            for rank_key in rank_keys:
+                row.setdefault(rank_key, None)
+
+    fused = list(rows.values())
+
+    if top_k is not None:
+        return heapq.nlargest(top_k, fused, key=lambda r: r[score_key])
+    if sort:
+        fused.sort(key=lambda r: r[score_key], reverse=True)
+    return fused
+
+
+def _resolve_weights(weights: Optional[Sequence[float]], n: int) -> Sequence[float]:
+    if weights is None:
+        return [1.0] * n
+    if len(weights) != n:
+        raise ValueError(f"Expected {n} weights, got {len(weights)}")
+    return weights
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: Sequence[RankedList],
+    k: int = 60,
+    weights: Optional[Sequence[float]] = None,
+    id_key: str = "id",
+    score_key: str = "hybrid_score",
+    rank_keys: Optional[Sequence[str]] = None,
+    carry_keys: Sequence[str] = (),
+    top_k: Optional[int] = None,
+    sort: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Reciprocal Rank Fusion: score = Σ w_i / (k + rank_i)
+
+    Args:
+        ranked_lists: Ranked result lists (best first)
+        k: RRF constant (higher = less emphasis on top ranks)
+        weights: Optional per-list weights (default 1.0 each)
+        id_key: Field identifying the same item across lists
+        score_key: Field the fused score is written to
+        rank_keys: Optional per-list field names for 1-indexed ranks
+        carry_keys: Fields copied from later lists onto the kept row when missing
+        top_k: Return only the top-k fused rows
+        sort: Sort output by fused score (descending)
+
+    Returns:
+        Fused rows with score_key set
+    """
+    w = _resolve_weights(weights, len(ranked_lists))
+    return _fuse(
+        ranked_lists,
+        lambda list_idx, rank, row: w[list_idx] / (k + rank),
+        id_key=id_key,
+        score_key=score_key,
+        rank_keys=rank_keys,
+        carry_keys=carry_keys,
+        multiply_by_hits=False,
+        top_k=top_k,
+        sort=sort
+    )
+
+
+def weighted_sum_fusion(
+    ranked_lists: Sequence[RankedList],
+    score_keys: Sequence[str],
+    weights: Optional[Sequence[float]] = None,
+    id_key: str = "id",
+    score_key: str = "hybrid_score",
+    rank_keys: Optional[Sequence[str]] = None,
+    carry_keys: Sequence[str] = (),
+    top_k: Optional[int] = None,
+    sort: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Weighted score sum: score = Σ w_i * row[score_keys[i]]
+
+    Input scores should already be normalized (0-1) within each list;
+    items absent from a list contribute 0 for that list.
+
+    Args:
+        ranked_lists: Ranked result lists (best first)
+        score_keys: Per-list field holding that list's score
+        weights: Optional per-list weights (default 1.0 each)
+        (remaining args as in reciprocal_rank_fusion)
+
+    Returns:
+        Fused rows with score_key set
+    """
+    if len(score_keys) != len(ranked_lists):
+        raise ValueError("score_keys must have one entry per ranked list")
+    w = _resolve_weights(weights, len(ranked_lists))
+    return _fuse(
+        ranked_lists,
+        lambda list_idx, rank, row: w[list_idx] * (row.get(score_keys[list_idx]) or 0.0),
+        id_key=id_key,
+        score_key=score_key,
+        rank_keys=rank_keys,
+        carry_keys=carry_keys,
+        multiply_by_hits=False,
+        top_k=top_k,
+        sort=sort
+    )
+
+
+def comb_mnz_fusion(
+    ranked_lists: Sequence[RankedList],
+    score_keys: Sequence[str],
+    weights: Optional[Sequence[float]] = None,
+    id_key: str = "id",
+    score_key: str = "hybrid_score",
+    rank_keys: Optional[Sequence[str]] = None,
+    carry_keys: Sequence[str] = (),
+    top_k: Optional[int] = None,
+    sort: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    CombMNZ: score = (Σ w_i * row[score_keys[i]]) * hits
+
+    Rewards items retrieved by several lists. Scores should be normalized
+    (0-1) within each list.
+
+    Args:
+        ranked_lists: Ranked result lists (best first)
+        score_keys: Per-list field holding that list's score
+        weights: Optional per-list weights (default 1.0 each)
+        (remaining args as in reciprocal_rank_fusion)
+
+    Returns:
+        Fused rows with score_key set
+    """
+    if len(score_keys) != len(ranked_lists):
+        raise ValueError("score_keys must have one entry per ranked list")
+    w = _resolve_weights(weights, len(ranked_lists))
+    return _fuse(
+        ranked_lists,
+        lambda list_idx, rank, row: w[list_idx] * (row.get(score_keys[list_idx]) or 0.0),
+        id_key=id_key,
+        score_key=score_key,
+        rank_keys=rank_keys,
+        carry_keys=carry_keys,
+        multiply_by_hits=True,
+        top_k=top_k,
+        sort=sort
+    )
+
+
+__all__ = [
+    "FUSION_METHODS",
+    "reciprocal_rank_fusion",
+    "weighted_sum_fusion",
+    "comb_mnz_fusion",
+]
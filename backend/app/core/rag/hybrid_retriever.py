@@ -3,15 +3,31 @@ Hybrid Retriever for RAG
 
 Combines semantic (vector) search with keyword (BM25/FTS) search
 for improved retrieval quality.
+
+Two execution modes:
+- Legacy: two queries (pgvector, FTS), RRF merge in Python
+- Fused (settings.rag_hybrid_fused_query): both candidate sets as CTEs in a
+  single statement, ranks + RRF computed in Postgres, one DB round-trip
+
+Session-scoped searches (document_ids, no collection) take their semantic
+candidates from the in-memory session vector index when the document set is
+small enough (see session_vector_index.py); the candidate ids and distances
+are passed to SQL as a VALUES list instead of the pgvector ORDER BY.
 """
 
+import copy
+import json
 from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy import select, func, literal, or_, case, values, column, String, Float
 from app.db_models_chat import DocumentChunk, CollectionDocument
 from app.core.embeddings import get_embedding_provider
 from app.core.rag.query_analyzer import QueryAnalyzer
 from app.core.rag.metadata_booster import MetadataBooster
+from app.core.rag.fusion import reciprocal_rank_fusion
+from app.core.rag.session_vector_index import session_index_search
+from app.core.executors import run_in_inference_executor
+from app.core.inference_batcher import get_embedding_batcher
 from app.config import settings
 from app.utils.logging import logger
 
@@ -32,7 +48,8 @@ class HybridRetriever:
     def __init__(
         self,
         db: Session,
-        rrf_k: int = None
+        rrf_k: int = None,
+        use_fused_query: bool = None
     ):
         """
         Initialize hybrid retriever
@@ -40,6 +57,7 @@ class HybridRetriever:
         Args:
             db: SQLAlchemy database session
             rrf_k: RRF constant parameter (default from settings)
+            use_fused_query: Run semantic + keyword search as one SQL statement (default from settings)
         """
         self.db = db
         self.embedder = get_embedding_provider()
@@ -48,11 +66,19 @@ class HybridRetriever:
 
         # RRF configuration
         self.rrf_k = rrf_k or settings.rag_hybrid_rrf_k
+        self.use_fused_query = use_fused_query if use_fused_query is not None else settings.rag_hybrid_fused_query
 
         logger.info(
-            f"HybridRetriever initialized: RRF merging with k={self.rrf_k}"
+            f"HybridRetriever initialized: RRF merging with k={self.rrf_k}, "
+            f"fused_query={self.use_fused_query}"
         )
 
+    def bind(self, db: Session) -> "HybridRetriever":
+        """Return a shallow copy bound to another session (shares embedder/analyzers)."""
+        bound = copy.copy(self)
+        bound.db = db
+        return bound
+
     def retrieve(
         self,
         query: str,
@@ -60,7 +86,8 @@ class HybridRetriever:
         top_k: int = 20,
         document_ids: Optional[List[str]] = None,
         query_understanding=None,  # QueryUnderstanding object (optional, for HyDE)
-        min_semantic_similarity: Optional[float] = None
+        min_semantic_similarity: Optional[float] = None,
+        query_embedding: Optional[List[float]] = None
     ) -> List[Dict]:
         """
         Hybrid retrieval combining vector + keyword search
@@ -71,6 +98,7 @@ class HybridRetriever:
             top_k: Number of chunks to retrieve (for re-ranking)
             document_ids: Optional filter by specific documents (required if collection_id is None)
             query_understanding: Optional QueryUnderstanding object for HyDE enhancement
+            query_embedding: Optional precomputed embedding (from embed_query); skips the model call
 
         Returns:
             List of chunks with hybrid scores, sorted by relevance
@@ -83,23 +111,40 @@ class HybridRetriever:
             extra={"query": query[:50], "collection_id": collection_id}
         )
 
-        # 2. Semantic search (vector similarity, with optional HyDE enhancement)
-        semantic_results = self._semantic_search(
-            query,
-            collection_id,
-            top_k=top_k,
-            document_ids=document_ids,
-            query_understanding=query_understanding,  # Pass for HyDE
-            min_semantic_similarity=min_semantic_similarity
-        )
+        if self.use_fused_query:
+            # 2-4. Semantic + keyword search and RRF in a single statement
+            merged = self._fused_search(
+                query,
+                collection_id,
+                top_k=top_k,
+                document_ids=document_ids,
+                query_understanding=query_understanding,
+                min_semantic_similarity=min_semantic_similarity,
+                query_embedding=query_embedding
+            )
+            semantic_count = sum(1 for c in merged if c["semantic_rank"] is not None)
+            keyword_count = sum(1 for c in merged if c["keyword_rank"] is not None)
+        else:
+            # 2. Semantic search (vector similarity, with optional HyDE enhancement)
+            semantic_results = self._semantic_search(
+                query,
+                collection_id,
+                top_k=top_k,
+                document_ids=document_ids,
+                query_understanding=query_understanding,  # Pass for HyDE
+                min_semantic_similarity=min_semantic_similarity,
+                query_embedding=query_embedding
+            )
 
-        # 3. Keyword search (BM25/FTS)
-        keyword_results = self._keyword_search(
-            query, collection_id, top_k=top_k, document_ids=document_ids
-        )
+            # 3. Keyword search (BM25/FTS)
+            keyword_results = self._keyword_search(
+                query, collection_id, top_k=top_k, document_ids=document_ids
+            )
 
-        # 4. Merge and normalize scores
-        merged = self._merge_results(semantic_results, keyword_results)
+            # 4. Merge and normalize scores
+            merged = self._merge_results(semantic_results, keyword_results)
+            semantic_count = len(semantic_results)
+            keyword_count = len(keyword_results)
 
         # 5. Apply metadata boosting
         # Use QueryUnderstanding if available for LLM-determined boost values, otherwise use QueryAnalyzer result
@@ -129,17 +174,275 @@ class HybridRetriever:
 
         logger.info(
             f"Hybrid retrieval complete: {len(ranked)} chunks, "
-            f"semantic_candidates={len(semantic_results)}, "
-            f"keyword_candidates={len(keyword_results)}",
+            f"semantic_candidates={semantic_count}, "
+            f"keyword_candidates={keyword_count}",
             extra={
                 "top_score": ranked[0]["hybrid_score"] if ranked else 0,
                 "query_type": query_analysis["query_type"],
-                "chunk_type_counts": type_counts
+                "chunk_type_counts": type_counts,
+                "fused_query": self.use_fused_query
             }
         )
 
         return ranked
 
+    def embed_query(self, query: str, query_understanding=None) -> List[float]:
+        """
+        Embed the query, optionally enhanced with HyDE.
+
+        HyDE (Hypothetical Document Embeddings): weighted average of the query
+        embedding (40%) and the hypothetical response embedding (60%).
+
+        Async callers should use aembed_query (micro-batched, off the event loop)
+        and pass the vector back into retrieve(query_embedding=...).
+        """
+        if query_understanding and query_understanding.hypothetical_response:
+            query_emb = self.embedder.embed_text(query)
+            hyde_emb = self.embedder.embed_text(query_understanding.hypothetical_response)
+            return self._combine_hyde(query, query_emb, hyde_emb)
+
+        return self.embedder.embed_text(query)
+
+    async def aembed_query(self, query: str, query_understanding=None) -> List[float]:
+        """
+        Async embed_query for request handlers.
+
+        Query (and HyDE) texts go through the shared embedding micro-batcher so
+        concurrent chat turns share one forward pass. Falls back to embed_query
+        on the inference executor when batching is disabled.
+        """
+        if not settings.inference_batching_enabled:
+            return await run_in_inference_executor(self.embed_query, query, query_understanding)
+
+        hyde_text = query_understanding.hypothetical_response if query_understanding else None
+        texts = [query, hyde_text] if hyde_text else [query]
+        embeddings = await get_embedding_batcher().submit_many(texts)
+
+        if hyde_text:
+            return self._combine_hyde(query, embeddings[0], embeddings[1])
+        return embeddings[0]
+
+    @staticmethod
+    def _combine_hyde(query: str, query_emb: List[float], hyde_emb: List[float]) -> List[float]:
+        # Weighted average (query 40%, HyDE 60%)
+        # HyDE often performs better for complex queries
+        logger.debug(
+            "Using HyDE-enhanced embedding for semantic search",
+            extra={"query": query[:50]}
+        )
+        return [
+            0.4 * q + 0.6 * h
+            for q, h in zip(query_emb, hyde_emb)
+        ]
+
+    @staticmethod
+    def _apply_scope(stmt, collection_id: Optional[str], document_ids: Optional[List[str]]):
+        """Restrict a DocumentChunk statement to a collection and/or document set."""
+        if collection_id:
+            # Collection-based search (legacy)
+            stmt = stmt.join(CollectionDocument, DocumentChunk.document_id == CollectionDocument.document_id)
+            stmt = stmt.where(CollectionDocument.collection_id == collection_id)
+            # Optional additional document filter
+            if document_ids:
+                stmt = stmt.where(DocumentChunk.document_id.in_(document_ids))
+        elif document_ids:
+            # Session-based search (direct document filter)
+            stmt = stmt.where(DocumentChunk.document_id.in_(document_ids))
+        else:
+            raise ValueError("Either collection_id or document_ids must be provided")
+        return stmt
+
+    def _session_index_hits(
+        self,
+        query_embedding: List[float],
+        collection_id: Optional[str],
+        document_ids: Optional[List[str]],
+        top_k: int
+    ) -> Optional[List]:
+        """Semantic candidates from the session vector index, or None to use pgvector."""
+        if collection_id:
+            return None
+        # Empty hits fall back to pgvector too (an empty VALUES list is not valid SQL)
+        return session_index_search(self.db, query_embedding, document_ids, top_k) or None
+
+    @staticmethod
+    def _hits_table(hits: List, name: str):
+        """(chunk_id, distance) pairs as a VALUES table with id / distance columns."""
+        return values(column("id", String), column("distance", Float), name=name).data(hits)
+
+    @staticmethod
+    def _parse_metadata(raw) -> Dict:
+        """Return chunk_metadata as a dict (JSONB may come back as a JSON string)."""
+        metadata = raw or {}
+        if isinstance(metadata, str):
+            try:
+                metadata = json.loads(metadata)
+            except (json.JSONDecodeError, TypeError):
+                metadata = {}
+        return metadata if isinstance(metadata, dict) else {}
+
+    def _fused_search(
+        self,
+        query: str,
+        collection_id: Optional[str],
+        top_k: int,
+        document_ids: Optional[List[str]],
+        query_understanding=None,
+        min_semantic_similarity: Optional[float] = None,
+        query_embedding: Optional[List[float]] = None
+    ) -> List[Dict]:
+        """
+        Semantic + keyword search fused into a single SQL statement.
+
+        Both candidate sets are CTEs that only carry chunk ids and raw scores.
+        Ranks, min-max normalized scores and the RRF score are computed in
+        Postgres; chunk text/metadata is joined once per unique chunk.
+
+        Semantics match the legacy two-query path:
+        - each side keeps its own top_k candidates
+        - the semantic similarity floor falls back to unfiltered results
+          when it would remove every candidate
+        - RRF_score = Σ 1 / (k + rank) over the lists a chunk appears in
+
+        The statement returns the deduplicated candidate union (at most
+        2 * top_k rows) ordered by RRF; the final top-k cut happens after
+        metadata boosting in retrieve(), exactly as in the legacy path.
+
+        Returns:
+            List of chunks with hybrid_score (RRF), semantic/keyword ranks and scores
+        """
+        if query_embedding is None:
+            query_embedding = self.embed_query(query, query_understanding)
+
+        # --- Semantic candidates (ids + distance only) ---
+        hits = self._session_index_hits(query_embedding, collection_id, document_ids, top_k)
+        if hits:
+            session_hits = self._hits_table(hits, "session_hits")
+            semantic_raw = select(session_hits.c.id, session_hits.c.distance).cte("semantic_raw")
+        else:
+            distance_expr = DocumentChunk.embedding.cosine_distance(query_embedding)
+            semantic_raw = self._apply_scope(
+                select(DocumentChunk.id.label("id"), distance_expr.label("distance")),
+                collection_id,
+                document_ids
+            ).order_by(distance_expr).limit(top_k).cte("semantic_raw")
+
+        similarity = 1.0 - semantic_raw.c.distance
+        semantic_stmt = select(
+            semantic_raw.c.id,
+            semantic_raw.c.distance,
+            similarity.label("similarity"),
+            func.row_number().over(order_by=semantic_raw.c.distance).label("rank"),
+            func.min(similarity).over().label("sim_min"),
+            func.max(similarity).over().label("sim_max")
+        )
+        if min_semantic_similarity and min_semantic_similarity > 0:
+            # Keep rows above the floor; if none pass, keep everything (legacy fallback)
+            passes_floor = similarity >= min_semantic_similarity
+            any_passes = select(literal(1)).select_from(semantic_raw).where(passes_floor).exists()
+            semantic_stmt = semantic_stmt.where(or_(passes_floor, ~any_passes))
+        semantic = semantic_stmt.cte("semantic")
+
+        # --- Keyword candidates (ids + ts_rank_cd only) ---
+        tsquery = func.plainto_tsquery('english', query)
+        rank_expr = func.ts_rank_cd(DocumentChunk.text_search_vector, tsquery, 2)
+        keyword_raw = self._apply_scope(
+            select(DocumentChunk.id.label("id"), rank_expr.label("ts_rank")),
+            collection_id,
+            document_ids
+        ).where(
+            DocumentChunk.text_search_vector.op('@@')(tsquery)
+        ).order_by(rank_expr.desc()).limit(top_k).cte("keyword_raw")
+
+        keyword = select(
+            keyword_raw.c.id,
+            keyword_raw.c.ts_rank,
+            func.row_number().over(order_by=keyword_raw.c.ts_rank.desc()).label("rank"),
+            func.min(keyword_raw.c.ts_rank).over().label("rank_min"),
+            func.max(keyword_raw.c.ts_rank).over().label("rank_max")
+        ).cte("keyword")
+
+        # --- Fusion (full outer join on chunk id) ---
+        # Min-max normalization mirrors the legacy path (range of 1.0 when all scores tie)
+        semantic_score = (semantic.c.similarity - semantic.c.sim_min) / case(
+            (semantic.c.sim_max > semantic.c.sim_min, semantic.c.sim_max - semantic.c.sim_min),
+            else_=1.0
+        )
+        keyword_score = (keyword.c.ts_rank - keyword.c.rank_min) / case(
+            (keyword.c.rank_max > keyword.c.rank_min, keyword.c.rank_max - keyword.c.rank_min),
+            else_=1.0
+        )
+        rrf_score = (
+            func.coalesce(1.0 / (self.rrf_k + semantic.c.rank), 0.0) +
+            func.coalesce(1.0 / (self.rrf_k + keyword.c.rank), 0.0)
+        ).label("hybrid_score")
+
+        candidates = semantic.join(keyword, semantic.c.id == keyword.c.id, full=True)
+        stmt = select(
+            DocumentChunk.id,
+            DocumentChunk.document_id,
+            DocumentChunk.text,
+            DocumentChunk.page_number,
+            DocumentChunk.chunk_index,
+            DocumentChunk.is_tabular,
+            DocumentChunk.section_heading,
+            DocumentChunk.section_type,
+            DocumentChunk.chunk_metadata,
+            DocumentChunk.token_count,
+            DocumentChunk.token_truncation_offset,
+            semantic.c.rank.label("semantic_rank"),
+            semantic.c.similarity.label("raw_similarity"),
+            semantic.c.distance,
+            semantic_score.label("semantic_score"),
+            keyword.c.rank.label("keyword_rank"),
+            keyword.c.ts_rank.label("raw_rank"),
+            keyword_score.label("keyword_score"),
+            rrf_score
+        ).select_from(
+            candidates.join(DocumentChunk, DocumentChunk.id == func.coalesce(semantic.c.id, keyword.c.id))
+        ).order_by(rrf_score.desc())
+
+        results = self.db.execute(stmt).all()
+
+        if not results:
+            logger.warning(f"No fused results found for query: {query[:50]}")
+            return []
+
+        chunks = []
+        for r in results:
+            metadata = self._parse_metadata(r.chunk_metadata)
+            chunks.append({
+                "id": r.id,
+                "document_id": r.document_id,
+                "text": r.text,
+                "page_number": r.page_number,
+                "chunk_index": r.chunk_index,
+                "is_tabular": r.is_tabular,
+                "section_heading": r.section_heading,
+                "section_type": r.section_type,
+                "chunk_metadata": metadata,
+                # Extract bbox at top level for easy access
+                "bbox": metadata.get("bbox"),
+                "page_range": metadata.get("page_range"),
+                # Precomputed at indexing (read by reranker/compressor instead of re-tokenizing)
+                "token_count": r.token_count,
+                "token_truncation_offset": r.token_truncation_offset,
+                "semantic_score": float(r.semantic_score) if r.semantic_score is not None else 0.0,
+                "raw_similarity": float(r.raw_similarity) if r.raw_similarity is not None else None,
+                "distance": float(r.distance) if r.distance is not None else None,
+                "keyword_score": float(r.keyword_score) if r.keyword_score is not None else 0.0,
+                "raw_rank": float(r.raw_rank) if r.raw_rank is not None else None,
+                "hybrid_score": float(r.hybrid_score),
+                "semantic_rank": r.semantic_rank,
+                "keyword_rank": r.keyword_rank
+            })
+
+        logger.debug(
+            f"Fused search: {len(chunks)} unique chunks in one round-trip (k={self.rrf_k})"
+        )
+
+        return chunks
+
     def _semantic_search(
         self,
         query: str,
@@ -147,7 +450,8 @@ class HybridRetriever:
         top_k: int,
         document_ids: Optional[List[str]],
         query_understanding=None,
-        min_semantic_similarity: Optional[float] = None
+        min_semantic_similarity: Optional[float] = None,
+        query_embedding: Optional[List[float]] = None
     ) -> List[Dict]:
         """
         Semantic search using pgvector cosine similarity
@@ -157,30 +461,11 @@ class HybridRetriever:
         Returns:
             List of chunks with semantic_score (0-1, normalized)
         """
-        # Generate query embedding, optionally enhanced with HyDE
-        if query_understanding and query_understanding.hypothetical_response:
-            # HyDE: Average query embedding with hypothetical response embedding
-            query_emb = self.embedder.embed_text(query)
-            hyde_emb = self.embedder.embed_text(query_understanding.hypothetical_response)
-
-            # Weighted average (query 40%, HyDE 60%)
-            # HyDE often performs better for complex queries
-            query_embedding = [
-                0.4 * q + 0.6 * h
-                for q, h in zip(query_emb, hyde_emb)
-            ]
-
-            logger.debug(
-                "Using HyDE-enhanced embedding for semantic search",
-                extra={"query": query[:50]}
-            )
-        else:
-            query_embedding = self.embedder.embed_text(query)
+        # Generate query embedding, optionally enhanced with HyDE (unless precomputed)
+        if query_embedding is None:
+            query_embedding = self.embed_query(query, query_understanding)
 
-        # Build query with cosine distance
-        distance_expr = DocumentChunk.embedding.cosine_distance(query_embedding).label("distance")
-
-        stmt = select(
+        columns = (
             DocumentChunk.id,
             DocumentChunk.document_id,
             DocumentChunk.text,
@@ -190,25 +475,28 @@ class HybridRetriever:
             DocumentChunk.section_heading,
             DocumentChunk.section_type,
             DocumentChunk.chunk_metadata,
-            distance_expr
+            DocumentChunk.token_count,
+            DocumentChunk.token_truncation_offset,
         )
 
-        # Filter by collection OR documents
-        if collection_id:
-            # Collection-based search (legacy)
-            stmt = stmt.join(CollectionDocument, DocumentChunk.document_id == CollectionDocument.document_id)
-            stmt = stmt.where(CollectionDocument.collection_id == collection_id)
-            # Optional additional document filter
-            if document_ids:
-                stmt = stmt.where(DocumentChunk.document_id.in_(document_ids))
-        elif document_ids:
-            # Session-based search (direct document filter)
-            stmt = stmt.where(DocumentChunk.document_id.in_(document_ids))
+        hits = self._session_index_hits(query_embedding, collection_id, document_ids, top_k)
+        if hits:
+            # Candidates already ranked in memory: fetch their rows by primary key
+            session_hits = self._hits_table(hits, "session_hits")
+            stmt = select(*columns, session_hits.c.distance.label("distance")).join(
+                session_hits, session_hits.c.id == DocumentChunk.id
+            ).order_by(session_hits.c.distance)
         else:
-            raise ValueError("Either collection_id or document_ids must be provided")
+            # Build query with cosine distance
+            distance_expr = DocumentChunk.embedding.cosine_distance(query_embedding).label("distance")
+
+            stmt = select(*columns, distance_expr)
+
+            # Filter by collection OR documents
+            stmt = self._apply_scope(stmt, collection_id, document_ids)
 
-        # Order by distance (ascending = most similar first)
-        stmt = stmt.order_by(distance_expr).limit(top_k)
+            # Order by distance (ascending = most similar first)
+            stmt = stmt.order_by(distance_expr).limit(top_k)
 
         # Execute query
         results = self.db.execute(stmt).all()
@@ -262,13 +550,7 @@ class HybridRetriever:
             normalized_score = (similarity - min_sim) / sim_range if sim_range > 0 else 1.0
 
             # Extract bbox from chunk_metadata for PDF highlighting
-            metadata = r.chunk_metadata or {}
-            if isinstance(metadata, str):
-                import json
-                try:
-                    metadata = json.loads(metadata)
-                except:
-                    metadata = {}
+            metadata = self._parse_metadata(r.chunk_metadata)
 
             chunks.append({
                 "id": r.id,
@@ -283,6 +565,9 @@ class HybridRetriever:
                 # Extract bbox at top level for easy access
                 "bbox": metadata.get("bbox"),
                 "page_range": metadata.get("page_range"),
+                # Precomputed at indexing (read by reranker/compressor instead of re-tokenizing)
+                "token_count": r.token_count,
+                "token_truncation_offset": r.token_truncation_offset,
                 "semantic_score": normalized_score,
                 "raw_similarity": similarity,
                 "distance": r.distance
@@ -326,22 +611,13 @@ class HybridRetriever:
             DocumentChunk.section_heading,
             DocumentChunk.section_type,
             DocumentChunk.chunk_metadata,
+            DocumentChunk.token_count,
+            DocumentChunk.token_truncation_offset,
             rank_expr
         )
 
         # Filter by collection OR documents
-        if collection_id:
-            # Collection-based search (legacy)
-            stmt = stmt.join(CollectionDocument, DocumentChunk.document_id == CollectionDocument.document_id)
-            stmt = stmt.where(CollectionDocument.collection_id == collection_id)
-            # Optional additional document filter
-            if document_ids:
-                stmt = stmt.where(DocumentChunk.document_id.in_(document_ids))
-        elif document_ids:
-            # Session-based search (direct document filter)
-            stmt = stmt.where(DocumentChunk.document_id.in_(document_ids))
-        else:
-            raise ValueError("Either collection_id or document_ids must be provided")
+        stmt = self._apply_scope(stmt, collection_id, document_ids)
 
         # Match filter (full-text search)
         stmt = stmt.where(DocumentChunk.text_search_vector.op('@@')(tsquery))
@@ -367,13 +643,7 @@ class HybridRetriever:
             normalized_score = (r.rank - min_rank) / rank_range if rank_range > 0 else 1.0
 
             # Extract bbox from chunk_metadata for PDF highlighting
-            metadata = r.chunk_metadata or {}
-            if isinstance(metadata, str):
-                import json
-                try:
-                    metadata = json.loads(metadata)
-                except:
-                    metadata = {}
+            metadata = self._parse_metadata(r.chunk_metadata)
 
             chunks.append({
                 "id": r.id,
@@ -388,6 +658,9 @@ class HybridRetriever:
                 # Extract bbox at top level for easy access
                 "bbox": metadata.get("bbox"),
                 "page_range": metadata.get("page_range"),
+                # Precomputed at indexing (read by reranker/compressor instead of re-tokenizing)
+                "token_count": r.token_count,
+                "token_truncation_offset": r.token_truncation_offset,
                 "keyword_score": normalized_score,
                 "raw_rank": r.rank
             })
@@ -414,64 +687,28 @@ class HybridRetriever:
         Returns:
             List of unique chunks with hybrid_score (RRF score)
         """
-        # Build rank lookups (1-indexed positions)
-        semantic_ranks = {r["id"]: idx + 1 for idx, r in enumerate(semantic_results)}
-        keyword_ranks = {r["id"]: idx + 1 for idx, r in enumerate(keyword_results)}
-
-        # Get all unique chunk IDs
-        all_chunk_ids = set(semantic_ranks.keys()) | set(keyword_ranks.keys())
-
-        # Build merged result dict
-        merged_dict = {}
-
-        for chunk_id in all_chunk_ids:
-            # Find original chunk data (prefer semantic for metadata completeness)
-            chunk_data = None
-            for r in semantic_results:
-                if r["id"] == chunk_id:
-                    chunk_data = r.copy()
-                    break
-
-            if not chunk_data:
-                for r in keyword_results:
-                    if r["id"] == chunk_id:
-                        chunk_data = r.copy()
-                        break
-
-            if not chunk_data:
-                logger.warning(f"Chunk {chunk_id} not found in either result set (should not happen)")
-                continue
-
-            # Calculate RRF score
-            rrf_score = 0.0
-
-            # Add semantic contribution
-            if chunk_id in semantic_ranks:
-                rrf_score += 1.0 / (self.rrf_k + semantic_ranks[chunk_id])
-
-            # Add keyword contribution
-            if chunk_id in keyword_ranks:
-                rrf_score += 1.0 / (self.rrf_k + keyword_ranks[chunk_id])
-
-            # Store RRF score and rank metadata
-            chunk_data["hybrid_score"] = rrf_score
-            chunk_data["semantic_rank"] = semantic_ranks.get(chunk_id)
-            chunk_data["keyword_rank"] = keyword_ranks.get(chunk_id)
-
-            # Preserve normalized scores if available (for analysis/debugging)
-            if "semantic_score" not in chunk_data:
-                chunk_data["semantic_score"] = 0.0
-            if "keyword_score" not in chunk_data:
-                chunk_data["keyword_score"] = 0.0
-
-            merged_dict[chunk_id] = chunk_data
+        # Single pass over both lists via the shared fusion engine.
+        # Rows are annotated in place (semantic row preferred for metadata);
+        # keyword_score/raw_rank are carried over when a chunk hit both lists.
+        merged = reciprocal_rank_fusion(
+            [semantic_results, keyword_results],
+            k=self.rrf_k,
+            rank_keys=("semantic_rank", "keyword_rank"),
+            carry_keys=("keyword_score", "raw_rank"),
+            sort=False
+        )
+
+        # Preserve normalized scores if available (for analysis/debugging)
+        for chunk_data in merged:
+            chunk_data.setdefault("semantic_score", 0.0)
+            chunk_data.setdefault("keyword_score", 0.0)
 
         logger.debug(
             f"RRF merge: {len(semantic_results)} semantic + {len(keyword_results)} keyword "
-            f"→ {len(merged_dict)} unique chunks (k={self.rrf_k})"
+            f"→ {len(merged)} unique chunks (k={self.rrf_k})"
         )
 
-        return list(merged_dict.values())
+        return merged
 
     def _apply_metadata_boost(
         self,
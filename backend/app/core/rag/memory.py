@@ -14,6 +14,7 @@ from typing import List, Dict, Any, Optional, Tuple
 from app.config import settings
 from app.core.cache.conversation_summary_cache import ConversationSummaryCache
 from app.core.chat.llm_service import ChatLLMService
+from app.core.executors import run_in_db_executor
 from app.utils.logging import logger
 from app.utils.token_utils import count_tokens
 from app.repositories.session_repository import SessionRepository
@@ -46,9 +47,23 @@ class ConversationMemory:
     def estimate_tokens(self, text: str) -> int:
         if not text:
             return 0
-        count_tokens
         return max(1, count_tokens(text))
 
+    def estimate_history_tokens(self, history_messages: List[Dict[str, Any]]) -> int:
+        """
+        Token estimate for the formatted history, summed per message.
+
+        count_tokens is memoized by text hash, so each message is encoded once
+        across turns; only the newest messages are tokenized on a new turn.
+        One token per newline separator approximates the joined text.
+        """
+        if not history_messages:
+            return 0
+        message_tokens = sum(
+            count_tokens(f"{m['role'].title()}: {m['content']}") for m in history_messages
+        )
+        return max(1, message_tokens + len(history_messages) - 1)
+
     # -------- Summarization Decision --------
     async def maybe_summarize(
         self,
@@ -60,13 +75,13 @@ class ConversationMemory:
         Return (summary_text, recent_messages, key_facts) based on history & budgeting thresholds.
 
         Uses progressive summarization: instead of re-summarizing all history,
-        only summarizes new messages since last summary.
+        only summarizes new messages since last summary. Summary cache (Redis) and
+        DB reads run on the DB executor pool, off the event loop.
         """
         if not history_messages:
             return None, [], []
 
-        history_text = "\n".join([f"{m['role'].title()}: {m['content']}" for m in history_messages])
-        est_history_tokens = self.estimate_tokens(history_text)
+        est_history_tokens = self.estimate_history_tokens(history_messages)
         est_user_tokens = self.estimate_tokens(user_message)
 
         # Estimate max input tokens from max chars (rough approximation: 1 token ≈ 4 chars)
@@ -85,7 +100,7 @@ class ConversationMemory:
         if should_summarize:
             older_messages = history_messages[:-settings.chat_verbatim_message_count] if settings.chat_verbatim_message_count < len(history_messages) else []
             if older_messages:
-                cached = self.cache.get(session_id)
+                cached = await run_in_db_executor(self.cache.get, session_id)
                 current_message_count = len(history_messages)
 
                 if cached and cached.get("message_count") == current_message_count:
@@ -95,14 +110,15 @@ class ConversationMemory:
                     logger.info("Using cached conversation summary", extra={"session_id": session_id})
                 elif not cached:
                     # Cache miss - try loading from database (persistent storage)
-                    db_summary = self.session_repo.get_summary(session_id)
+                    db_summary = await run_in_db_executor(self.session_repo.get_summary, session_id)
                     if db_summary:
                         logger.info(
                             "Loaded summary from database (cache miss)",
                             extra={"session_id": session_id}
                         )
                         # Warm the cache with DB data
-                        self.cache.set(
+                        await run_in_db_executor(
+                            self.cache.set,
                             session_id=session_id,
                             message_count=current_message_count,
                             summary=db_summary["summary"],
@@ -8,9 +8,10 @@ Provides LLM-powered query analysis that:
 """
 
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from enum import Enum
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -115,6 +116,12 @@ class QueryUnderstandingService:
             timeout_seconds=15,
         )
 
+        # Result cache (exact + near-duplicate queries per document set)
+        self.cache = None
+        if settings.query_understanding_cache_enabled:
+            from app.core.rag.query_understanding_cache import QueryUnderstandingCache
+            self.cache = QueryUnderstandingCache(settings.synthesis_llm_model)
+
     async def understand(
         self,
         query: str,
@@ -131,6 +138,11 @@ class QueryUnderstandingService:
         Returns:
             QueryUnderstanding with all fields populated
         """
+        lookup = None
+        if self.cache is not None:
+            lookup = await self._cache_lookup(query, document_filenames, domain_context)
+            if lookup.get("understanding") is not None:
+                return lookup["understanding"]
 
         docs_context = ""
         if document_filenames:
@@ -188,6 +200,9 @@ Be concise and accurate. Focus on extraction, not explanation."""
 
             understanding = QueryUnderstanding(**result["data"])
 
+            if lookup is not None:
+                await self._cache_store(lookup, understanding, result.get("usage"))
+
             logger.info(
                 "Query understanding complete",
                 extra={
@@ -210,3 +225,118 @@ Be concise and accurate. Focus on extraction, not explanation."""
                 hypothetical_response=f"The answer to '{query}' would include relevant information from the documents.",
                 confidence=0.3,
             )
+
+    # -------- Result cache --------
+    async def _cache_lookup(
+        self,
+        query: str,
+        document_filenames: Optional[List[str]],
+        domain_context: str,
+    ) -> Dict[str, Any]:
+        """Look up a cached understanding (exact, then near-duplicate).
+
+        Returns a lookup dict carrying the keys/embedding needed to store the
+        result on a miss; "understanding" is set on a hit.
+        """
+        from app.core.executors import run_in_db_executor
+        from app.utils.metrics import (
+            QUERY_UNDERSTANDING_CACHE_HITS,
+            QUERY_UNDERSTANDING_CACHE_MISSES,
+            QUERY_UNDERSTANDING_CACHE_SAVED_USD,
+        )
+
+        start = time.monotonic()
+        cache = self.cache
+        lookup: Dict[str, Any] = {
+            "docset": cache.docset_digest(document_filenames, domain_context),
+            "query_digest": cache.query_digest(query),
+            "query": cache.normalize_query(query),
+            "embedding": None,
+            "understanding": None,
+        }
+
+        try:
+            # Redis round-trips stay off the event loop
+            entry = await run_in_db_executor(cache.get, lookup["docset"], lookup["query_digest"])
+            match, similarity = "exact", 1.0
+            if entry is None and cache.near_duplicates_enabled:
+                lookup["embedding"] = await self._embed_query(query)
+                found = await run_in_db_executor(
+                    cache.find_near_duplicate, lookup["docset"], lookup["embedding"], query
+                )
+                if found is not None:
+                    entry, similarity = found
+                    match = "near"
+        except Exception as e:
+            logger.debug(f"Query understanding cache lookup failed: {e}")
+            entry = None
+
+        if entry is None:
+            QUERY_UNDERSTANDING_CACHE_MISSES.inc()
+            return lookup
+
+        QUERY_UNDERSTANDING_CACHE_HITS.labels(match=match).inc()
+        saved_usd = entry.get("cost_usd") or 0.0
+        if saved_usd:
+            QUERY_UNDERSTANDING_CACHE_SAVED_USD.inc(saved_usd)
+
+        lookup["understanding"] = QueryUnderstanding(**entry["understanding"])
+        logger.info(
+            "Query understanding cache hit",
+            extra={
+                "query": query[:50],
+                "match": match,
+                "similarity": round(similarity, 4),
+                "cached_query": (entry.get("query") or "")[:50],
+                "saved_usd": saved_usd,
+                "lookup_ms": round((time.monotonic() - start) * 1000, 2),
+            },
+        )
+        return lookup
+
+    async def _cache_store(
+        self,
+        lookup: Dict[str, Any],
+        understanding: QueryUnderstanding,
+        usage: Optional[Dict[str, Any]],
+    ) -> None:
+        """Cache a successful LLM result (with its cost, for saved-cost accounting)."""
+        from app.core.executors import run_in_db_executor
+        from app.utils.costs import compute_llm_cost
+
+        cost_usd = None
+        if usage and usage.get("input_tokens") and usage.get("output_tokens"):
+            cost_usd = compute_llm_cost(
+                usage.get("model") or self.llm_client.model,
+                usage["input_tokens"],
+                usage["output_tokens"],
+            )
+
+        entry = {
+            "understanding": understanding.model_dump(mode="json"),
+            "query": lookup["query"],
+            "cost_usd": cost_usd,
+        }
+        try:
+            await run_in_db_executor(
+                self.cache.set,
+                lookup["docset"],
+                lookup["query_digest"],
+                entry,
+                lookup["embedding"],
+            )
+        except Exception as e:
+            logger.debug(f"Query understanding cache store failed: {e}")
+
+    @staticmethod
+    async def _embed_query(query: str) -> List[float]:
+        """Embed the raw query (shares the embedding cache with hybrid retrieval)."""
+        from app.config import settings
+
+        if settings.inference_batching_enabled:
+            from app.core.inference_batcher import get_embedding_batcher
+            return (await get_embedding_batcher().submit_many([query]))[0]
+
+        from app.core.embeddings import get_embedding_provider
+        from app.core.executors import run_in_inference_executor
+        return await run_in_inference_executor(get_embedding_provider().embed_text, query)
@@ -0,0 +1,276 @@
+"""
+Query Understanding Cache
+
+QueryUnderstandingService.understand makes an LLM call on every chat turn,
+yet analysts ask the same questions ("what is the EBITDA margin") across many
+sessions over the same documents. Successful results are cached per
+(query, document set) so repeats skip the call.
+
+Key design:
+    exact key: qu:<model>:<docset digest>:<sha256(normalized query)[:32]>
+    normalized query: NFC + casefold + collapsed whitespace, trailing punctuation stripped
+    docset digest: sha256(domain context + sorted document filenames)[:16]
+    value JSON: {"understanding": {...}, "query": str, "cost_usd": float}
+
+Near-duplicates (opt-in: settings.query_understanding_near_duplicate_threshold > 0):
+    Each document set keeps an index of query embeddings (Redis hash
+    qu:near:<model>:<docset digest>, field = query digest, value = packed
+    float32 unit vector). An exact miss falls back to the most similar indexed
+    query when cosine similarity >= threshold and both queries name the same
+    numbers (years, periods) and the cached entities, since "EBITDA 2023" and
+    "EBITDA 2024" embed almost identically but must not share an understanding.
+
+Invalidation:
+    - TTL only (settings.query_understanding_cache_ttl_seconds). A changed
+      document set has a different digest, so it never sees old entries.
+    - LLM failures (fallback understanding) are never cached.
+
+Tiers: in-process LRU + Redis; the near-duplicate index falls back to an
+in-process index when Redis is disabled.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.config import settings
+from app.utils.logging import logger
+
+try:
+    import redis  # type: ignore
+except Exception:
+    redis = None
+
+# Max document sets kept in the in-process near-duplicate index
+_MAX_LOCAL_DOCSETS = 256
+
+# Tokens containing a digit (years, quarters, amounts) must match for a near-duplicate hit
+_NUMERIC_TOKEN = re.compile(r"\w*\d[\w.,%]*")
+_WORD_TOKEN = re.compile(r"[\w%]+(?:\.\w+)*")
+
+
+class QueryUnderstandingCache:
+    """Two-tier (LRU + Redis) cache of QueryUnderstanding results."""
+
+    def __init__(
+        self,
+        model_name: str,
+        lru_size: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        near_duplicate_threshold: Optional[float] = None
+    ):
+        """
+        Initialize query understanding cache.
+
+        Args:
+            model_name: LLM model producing the understanding (part of every key)
+            lru_size: Max in-process entries (default from settings)
+            ttl_seconds: Redis TTL; <= 0 disables the Redis tier (default from settings)
+            near_duplicate_threshold: Cosine similarity for near-duplicate hits; <= 0 disables
+        """
+        self.model_name = model_name
+        self.lru_size = lru_size if lru_size is not None else settings.query_understanding_cache_lru_size
+        self.ttl = ttl_seconds if ttl_seconds is not None else settings.query_understanding_cache_ttl_seconds
+        self.near_duplicate_threshold = (
+            near_duplicate_threshold if near_duplicate_threshold is not None
+            else settings.query_understanding_near_duplicate_threshold
+        )
+        self.near_duplicate_max_entries = settings.query_understanding_near_duplicate_max_entries
+
+        self._lru: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._near: "OrderedDict[str, OrderedDict[str, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.client = None
+        if redis is not None and settings.use_redis_cache and self.ttl > 0:
+            try:
+                self.client = redis.Redis.from_url(settings.redis_url)
+            except Exception as e:
+                logger.warning(f"Failed to init Redis for query understanding cache: {e}; using LRU only")
+
+    @property
+    def near_duplicates_enabled(self) -> bool:
+        return self.near_duplicate_threshold > 0
+
+    # -------- Keys --------
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Normalize a query for exact matching (case/whitespace/trailing punctuation)."""
+        normalized = " ".join(unicodedata.normalize("NFC", query or "").casefold().split())
+        return normalized.rstrip("?!.;: ")
+
+    def docset_digest(self, document_filenames: Optional[List[str]], domain_context: str) -> str:
+        """Digest of the document set (order-insensitive) and domain context."""
+        material = "\n".join([domain_context, *sorted(document_filenames or [])])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+
+    def query_digest(self, query: str) -> str:
+        return hashlib.sha256(self.normalize_query(query).encode("utf-8")).hexdigest()[:32]
+
+    def _entry_key(self, docset: str, query_digest: str) -> str:
+        return f"qu:{self.model_name}:{docset}:{query_digest}"
+
+    def _near_key(self, docset: str) -> str:
+        return f"qu:near:{self.model_name}:{docset}"
+
+    # -------- Exact entries --------
+    def get(self, docset: str, query_digest: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for this query + document set (LRU, then Redis)."""
+        key = self._entry_key(docset, query_digest)
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is not None:
+                self._lru.move_to_end(key)
+                return entry
+
+        if self.client:
+            try:
+                raw = self.client.get(key)
+                if raw:
+                    entry = json.loads(raw)
+                    self._lru_put(key, entry)
+                    return entry
+            except Exception as e:
+                logger.debug(f"Redis query understanding cache get failed: {e}")
+        return None
+
+    def set(
+        self,
+        docset: str,
+        query_digest: str,
+        entry: Dict[str, Any],
+        embedding: Optional[List[float]] = None
+    ) -> None:
+        """Store an entry (and index its embedding for near-duplicate lookup)."""
+        key = self._entry_key(docset, query_digest)
+        self._lru_put(key, entry)
+
+        vector = _unit_vector(embedding) if embedding is not None and self.near_duplicates_enabled else None
+        if vector is not None:
+            self._local_index_put(docset, query_digest, vector)
+
+        if self.client:
+            try:
+                pipe = self.client.pipeline(transaction=False)
+                pipe.setex(key, self.ttl, json.dumps(entry))
+                if vector is not None:
+                    near_key = self._near_key(docset)
+                    if self.client.hlen(near_key) >= self.near_duplicate_max_entries:
+                        pipe.delete(near_key)  # Full: start a fresh index for this document set
+                    pipe.hset(near_key, query_digest, vector.tobytes())
+                    pipe.expire(near_key, self.ttl)
+                pipe.execute()
+            except Exception as e:
+                logger.debug(f"Redis query understanding cache set failed: {e}")
+
+    def _lru_put(self, key: str, entry: Dict[str, Any]) -> None:
+        if self.lru_size <= 0:
+            return
+        with self._lock:
+            self._lru[key] = entry
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+    # -------- Near-duplicates --------
+    def find_near_duplicate(
+        self,
+        docset: str,
+        embedding: List[float],
+        query: Optional[str] = None
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Most similar cached query for this document set above the threshold.
+
+        Args:
+            docset: Document set digest
+            embedding: Query embedding
+            query: Query text; when given, the cached query must name the same
+                numbers and the new query must contain the cached entities
+
+        Returns:
+            (entry, similarity) or None
+        """
+        if not self.near_duplicates_enabled:
+            return None
+        query_vector = _unit_vector(embedding)
+        if query_vector is None:
+            return None
+
+        candidates = self._index_vectors(docset)
+        if not candidates:
+            return None
+
+        digests = list(candidates.keys())
+        matrix = np.stack([candidates[d] for d in digests])
+        similarities = matrix @ query_vector
+        best = int(np.argmax(similarities))
+        similarity = float(similarities[best])
+        if similarity < self.near_duplicate_threshold:
+            return None
+
+        entry = self.get(docset, digests[best])
+        if entry is None:
+            return None
+        if query is not None and not _same_anchors(self.normalize_query(query), entry):
+            return None
+        return entry, similarity
+
+    def _index_vectors(self, docset: str) -> Dict[str, np.ndarray]:
+        if self.client:
+            try:
+                raw = self.client.hgetall(self._near_key(docset))
+                vectors = {}
+                for field, value in raw.items():
+                    digest = field.decode() if isinstance(field, bytes) else field
+                    vectors[digest] = np.frombuffer(value, dtype=np.float32)
+                return vectors
+            except Exception as e:
+                logger.debug(f"Redis query understanding index read failed: {e}")
+
+        with self._lock:
+            index = self._near.get(docset)
+            return dict(index) if index else {}
+
+    def _local_index_put(self, docset: str, query_digest: str, vector: np.ndarray) -> None:
+        with self._lock:
+            index = self._near.setdefault(docset, OrderedDict())
+            self._near.move_to_end(docset)
+            index[query_digest] = vector
+            index.move_to_end(query_digest)
+            while len(index) > self.near_duplicate_max_entries:
+                index.popitem(last=False)
+            while len(self._near) > _MAX_LOCAL_DOCSETS:
+                self._near.popitem(last=False)
+
+
+def _same_anchors(normalized_query: str, entry: Dict[str, Any]) -> bool:
+    """Whether a near-duplicate entry refers to the same numbers and entities as the query."""
+    if _numeric_tokens(normalized_query) != _numeric_tokens(entry.get("query") or ""):
+        return False
+
+    words = f" {' '.join(_WORD_TOKEN.findall(normalized_query))} "
+    for entity in (entry.get("understanding") or {}).get("entities") or []:
+        name = " ".join(_WORD_TOKEN.findall(QueryUnderstandingCache.normalize_query(entity.get("name") or "")))
+        if name and f" {name} " not in words:
+            return False
+    return True
+
+
+def _numeric_tokens(text: str) -> set:
+    return {token.rstrip(".,%") for token in _NUMERIC_TOKEN.findall(text)}
+
+
+def _unit_vector(embedding: Optional[List[float]]) -> Optional[np.ndarray]:
+    if embedding is None:
+        return None
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if norm == 0.0:
+        return None
+    return vector / norm
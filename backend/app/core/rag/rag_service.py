@@ -16,30 +16,46 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select
 from app.db_models_chat import DocumentChunk, CollectionDocument
 from app.db_models_documents import Document
-from app.repositories.document_repository import DocumentRepository
-from app.core.embeddings import get_embedding_provider
-from app.core.llm.llm_client import LLMClient
-from app.core.chat.llm_service import ChatLLMService
 from app.config import settings
 from app.utils.logging import logger
-from app.utils.metrics import CHAT_LATENCY_SECONDS
-from app.core.rag.prompt_builder import PromptBuilder
-from app.core.rag.memory import ConversationMemory
-from app.core.rag.budget_enforcer import BudgetEnforcer
-from app.core.rag.hybrid_retriever import HybridRetriever
+from app.utils.metrics import CHAT_LATENCY_SECONDS, CHAT_ANSWER_CACHE_REQUESTS
 from app.core.rag.reranker import Reranker
-from app.core.rag.comparison_retriever import ComparisonRetriever
-from app.core.rag.query_understanding import QueryUnderstandingService, QueryType
-from app.core.rag.fact_extractor import FactExtractor
-from app.core.rag.context_expander import ContextExpander
+from app.core.rag.query_understanding import QueryType
+from app.core.rag.components import RAGComponents, ChatRequestContext, get_rag_components
+from app.core.rag.answer_cache import is_history_independent, replay_chunks
 from app.utils.chunk_metadata import validate_and_normalize_chunks
-from app.core.rag.chat_persistence import ChatPersistence
 from app.core.rag.comparison_flow import ComparisonChatHandler
 from app.core.rag.document_matching import DocumentMatcher
+import asyncio
 import re
 import json
 import time
-from app.services.service_locator import get_reranker
+from app.core.executors import run_in_db_executor
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.monotonic() - start) * 1000, 2)
+
+
+def _abandon_task(task: Optional[asyncio.Task]) -> None:
+    """Cancel a background task whose result is no longer needed.
+
+    The done callback retrieves a failure that happened before the cancel, so
+    asyncio does not log "Task exception was never retrieved".
+    """
+    if task is None:
+        return
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+def _token_overlap(a: str, b: str) -> float:
+    """Jaccard overlap of lowercase word tokens (1.0 = same bag of words)."""
+    tokens_a = set(re.findall(r"\w+", (a or "").lower()))
+    tokens_b = set(re.findall(r"\w+", (b or "").lower()))
+    if not tokens_a and not tokens_b:
+        return 1.0
+    return len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
 
 
 class RAGService:
@@ -55,61 +71,50 @@ class RAGService:
     6. Save history: Persist messages to database
     """
 
-    def __init__(self, db: Session, reranker: Reranker | None = None):
+    def __init__(
+        self,
+        db: Session,
+        reranker: Reranker | None = None,
+        components: RAGComponents | None = None
+    ):
         """
         Initialize RAG service.
 
+        Only per-request objects are created here; LLM clients, caches, models and
+        repositories come from the shared component graph (see components.py).
+
         Args:
             db: SQLAlchemy database session
+            reranker: Optional reranker override (default: the shared reranker)
+            components: Optional component graph (default: process-wide graph)
         """
-        self.db = db
-        self.embedder = get_embedding_provider()
-        self.llm_client = LLMClient(
-            api_key=settings.anthropic_api_key,
-            model=settings.synthesis_llm_model,
-            max_tokens=settings.synthesis_llm_max_tokens,
-            max_input_chars=settings.llm_max_input_chars,
-            timeout_seconds=settings.synthesis_llm_timeout_seconds,
-        )
-
-        # Initialize chat LLM service for conversation operations
-        self.chat_llm_service = ChatLLMService(self.llm_client)
-
-        # Inject modular components
-        self.prompt_builder = PromptBuilder()
-        self.memory = ConversationMemory(self.chat_llm_service)
-        self.budget = BudgetEnforcer()
-        self.hybrid_retriever = HybridRetriever(db)  # Hybrid retrieval (semantic + keyword)
-        self.query_understanding = QueryUnderstandingService()  # Query understanding & enhancement
-
-        # Re-ranker (cross-encoder based, optional via config)
-        self.reranker = reranker if reranker is not None else (get_reranker() if settings.rag_use_reranker else None)
-
-        # Comparison retriever (for multi-document comparison)
-        self.comparison_retriever = ComparisonRetriever(
-            db=db,
-            hybrid_retriever=self.hybrid_retriever,
-            reranker=self.reranker
-        )
-
-        # Fact extractor (for Map-Reduce comparison flow)
-        self.fact_extractor = FactExtractor()
-
-        # Context expander (for expanding chunks with related context)
-        self.context_expander = ContextExpander()
-
-        # Persistence helper
-        self.persistence = ChatPersistence()
-
-        # Comparison context for SSE emission (set during comparison queries)
-        self.last_comparison_context = None
-
-        # Citation context for SSE emission (set during general chat queries)
-        self.last_citation_context = None
+        components = components or get_rag_components()
+        if reranker is not None:
+            components = components.with_reranker(reranker)
+        self.components = components
+        self.context = ChatRequestContext(db=db)
+
+        # Shared components (no per-request state)
+        self.embedder = components.embedder
+        self.llm_client = components.llm_client
+        self.chat_llm_service = components.chat_llm_service
+        self.prompt_builder = components.prompt_builder
+        self.memory = components.memory
+        self.budget = components.budget
+        self.query_understanding = components.query_understanding
+        self.reranker = components.reranker
+        self.fact_extractor = components.fact_extractor
+        self.context_expander = components.context_expander
+        self.persistence = components.persistence
+        self.document_repo = components.document_repo
+        self.answer_cache = components.answer_cache
+
+        # Session-bound views of the shared retrievers
+        self.hybrid_retriever = components.hybrid_retriever.bind(db)
+        self.comparison_retriever = components.comparison_retriever.bind(db, self.hybrid_retriever)
 
         # Document matching helper
         self.document_matcher = DocumentMatcher(db)
-        self.document_repo = DocumentRepository()
 
         # Comparison handler
         self.comparison_handler = ComparisonChatHandler(
@@ -133,6 +138,29 @@ class RAGService:
         self._thanks_words = {"thanks", "thank", "thx", "appreciate", "appreciated"}
         self._farewell_words = {"bye", "goodbye", "later", "cheers"}
 
+    # -------- Per-request state (kept as attributes for existing callers) --------
+    @property
+    def db(self) -> Session:
+        return self.context.db
+
+    @property
+    def last_comparison_context(self) -> Optional[Dict]:
+        """Comparison context for SSE emission (set during comparison queries)."""
+        return self.context.last_comparison_context
+
+    @last_comparison_context.setter
+    def last_comparison_context(self, value: Optional[Dict]) -> None:
+        self.context.last_comparison_context = value
+
+    @property
+    def last_citation_context(self) -> Optional[Dict]:
+        """Citation context for SSE emission (set during general chat queries)."""
+        return self.context.last_citation_context
+
+    @last_citation_context.setter
+    def last_citation_context(self, value: Optional[Dict]) -> None:
+        self.context.last_citation_context = value
+
     def _is_low_signal_message(self, user_message: str) -> bool:
         if not user_message:
             return False
@@ -162,6 +190,210 @@ class RAGService:
     def _set_comparison_context(self, comparison_data: Dict):
         self.last_comparison_context = comparison_data
 
+    # -------- Answer cache --------
+    async def _answer_cache_key(
+        self,
+        session_id: str,
+        user_message: str,
+        document_ids: Optional[List[str]],
+        org_id: Optional[str],
+        history_messages: List[Dict[str, Any]]
+    ) -> Optional[str]:
+        """Answer cache key for this turn, or None when the cache must be bypassed."""
+        reason = None
+        key = None
+        if not document_ids:
+            reason = "no_document_ids"
+        elif not is_history_independent(user_message, history_messages):
+            reason = "history_dependent"
+        else:
+            versions = await run_in_db_executor(self.document_repo.get_index_versions, document_ids, org_id)
+            key = self.answer_cache.key_for(user_message, document_ids, versions, org_id)
+            if key is None:
+                reason = "documents_not_indexed"
+
+        if reason:
+            CHAT_ANSWER_CACHE_REQUESTS.labels(result="bypass").inc()
+            logger.debug("Answer cache bypassed", extra={"session_id": session_id, "reason": reason})
+        return key
+
+    async def _replay_cached_answer(
+        self,
+        cached: Dict[str, Any],
+        session_id: str,
+        user_message: str,
+        org_id: Optional[str],
+        start_time: float
+    ) -> AsyncIterator[str]:
+        """Stream a cached answer in chunks and persist the turn like a live answer."""
+        # Set before the first chunk so the SSE layer emits citation_context first
+        self.last_citation_context = cached.get("citation_context")
+        answer = cached.get("answer") or ""
+        for text_chunk in replay_chunks(answer, settings.chat_answer_cache_replay_chunk_chars):
+            yield text_chunk
+            await asyncio.sleep(0)  # Let the SSE response flush between chunks
+
+        # No LLM call was made, so no usage is recorded for this turn
+        await self.persistence.save_chat_messages(
+            session_id=session_id,
+            user_message=user_message,
+            assistant_message=answer,
+            source_chunks=cached.get("source_chunks") or [],
+            usage_data=None,
+            citation_context=self.last_citation_context,
+            org_id=org_id
+        )
+
+        cached_usage = cached.get("usage") or {}
+        logger.info(
+            "Chat answer served from cache",
+            extra={
+                "session_id": session_id,
+                "response_length": len(answer),
+                "saved_input_tokens": cached_usage.get("input_tokens"),
+                "saved_output_tokens": cached_usage.get("output_tokens"),
+                "total_ms": _elapsed_ms(start_time)
+            }
+        )
+        self.last_comparison_context = None
+        self.last_citation_context = None
+
+    # -------- Retrieval (standard + speculative) --------
+    async def _refined_retrieve(
+        self,
+        understanding,
+        collection_id: Optional[str],
+        document_ids: Optional[List[str]],
+        top_k: int
+    ) -> List[Dict]:
+        """Hybrid retrieval with the reformulated query + HyDE embedding."""
+        # Embedding via the micro-batched inference path, SQL on the DB pool
+        query_embedding = await self.hybrid_retriever.aembed_query(
+            understanding.reformulated_query,
+            understanding  # For HyDE enhancement
+        )
+        return await run_in_db_executor(
+            self.hybrid_retriever.retrieve,
+            query=understanding.reformulated_query,  # Use reformulated query for keyword search
+            collection_id=collection_id,
+            top_k=top_k,
+            document_ids=document_ids,
+            query_understanding=understanding,  # For HyDE enhancement
+            min_semantic_similarity=settings.rag_chat_semantic_similarity_floor,
+            query_embedding=query_embedding
+        )
+
+    def _retrieve_in_own_session(self, **kwargs) -> List[Dict]:
+        """Run HybridRetriever.retrieve on a private session.
+
+        The speculative task may be abandoned (comparison flow) while its SQL is
+        still running on the DB pool, so it must not share the request session.
+        """
+        from app.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            return self.hybrid_retriever.bind(db).retrieve(**kwargs)
+        finally:
+            db.close()
+
+    async def _speculative_retrieve(
+        self,
+        user_message: str,
+        collection_id: Optional[str],
+        document_ids: Optional[List[str]],
+        top_k: int,
+        stage_ms: Dict[str, float]
+    ) -> Dict[str, Any]:
+        """Retrieve and score candidates for the raw message (overlaps query understanding).
+
+        Cross-encoder scores land in the rerank score cache, so the final rerank
+        (same user message, understanding-aware boosting) only scores new chunks.
+        """
+        start = time.monotonic()
+        query_embedding = await self.hybrid_retriever.aembed_query(user_message)
+        results = await run_in_db_executor(
+            self._retrieve_in_own_session,
+            query=user_message,
+            collection_id=collection_id,
+            top_k=top_k,
+            document_ids=document_ids,
+            min_semantic_similarity=settings.rag_chat_semantic_similarity_floor,
+            query_embedding=query_embedding
+        )
+        stage_ms["speculative_retrieval_ms"] = _elapsed_ms(start)
+
+        if self.reranker and results and getattr(self.reranker, "score_cache", None) is not None:
+            rerank_start = time.monotonic()
+            await self.reranker.arerank(query=user_message, chunks=results)
+            stage_ms["speculative_rerank_ms"] = _elapsed_ms(rerank_start)
+
+        stage_ms["speculative_ms"] = _elapsed_ms(start)
+        return {"results": results, "embedding": query_embedding, "top_k": top_k}
+
+    async def _resolve_speculative_candidates(
+        self,
+        speculative: Dict[str, Any],
+        understanding,
+        user_message: str,
+        collection_id: Optional[str],
+        document_ids: Optional[List[str]],
+        top_k: int
+    ) -> tuple:
+        """Reuse, top up or merge speculative candidates once understanding is known.
+
+        - reuse:  reformulation ~= raw message and no HyDE text -> same retrieval
+        - top_up: as reuse, but adaptive sizing wants more candidates -> re-run SQL
+                  with the speculative embedding (no model call)
+        - merge:  refined retrieval (reformulated query + HyDE), then append
+                  speculative candidates it missed; the reranker picks the final set
+
+        Returns:
+            (hybrid_results, outcome)
+        """
+        results = speculative["results"]
+        same_query = (
+            _token_overlap(understanding.reformulated_query, user_message)
+            >= settings.rag_speculative_reuse_overlap
+        )
+
+        if same_query and not understanding.hypothetical_response:
+            if top_k <= speculative["top_k"]:
+                return results[:top_k], "reuse"
+            topped_up = await run_in_db_executor(
+                self.hybrid_retriever.retrieve,
+                query=user_message,
+                collection_id=collection_id,
+                top_k=top_k,
+                document_ids=document_ids,
+                query_understanding=understanding,
+                min_semantic_similarity=settings.rag_chat_semantic_similarity_floor,
+                query_embedding=speculative["embedding"]
+            )
+            return topped_up, "top_up"
+
+        refined = await self._refined_retrieve(understanding, collection_id, document_ids, top_k)
+        seen = {c["id"] for c in refined}
+        merged = refined + [c for c in results if c["id"] not in seen]
+        return merged, "merge"
+
+    @staticmethod
+    def _log_stage_timings(
+        session_id: str,
+        stage_ms: Dict[str, float],
+        speculative_outcome: Optional[str],
+        start_time: float
+    ) -> None:
+        """Log per-stage timings up to the end of reranking."""
+        extra = {"session_id": session_id, **stage_ms, "speculative_outcome": speculative_outcome}
+        if "speculative_ms" in stage_ms:
+            # Speculative work hidden behind query understanding
+            extra["speculative_overlap_ms"] = round(
+                min(stage_ms["speculative_ms"], stage_ms.get("understanding_ms", 0.0)), 2
+            )
+        extra["time_to_context_ms"] = _elapsed_ms(start_time)
+        logger.info("Chat retrieval stage timings", extra=extra)
+
     async def chat(
         self,
         session_id: str,
@@ -221,9 +453,13 @@ class RAGService:
             similarity_threshold = 0.0
 
         # STEP 0: History & optional summarization via memory component
+        # Blocking stages (sync DB, model inference) run on executor pools so other
+        # chat streams on this worker keep progressing (see app/core/executors.py)
         start_time = time.monotonic()
-        history_messages = self.memory.load_history(session_id)
+        stage_ms: Dict[str, float] = {}  # Per-stage timings, logged once retrieval is done
+        history_messages = await run_in_db_executor(self.memory.load_history, session_id)
         summary_text, recent_messages, key_facts = await self.memory.maybe_summarize(session_id, history_messages, user_message)
+        stage_ms["history_ms"] = _elapsed_ms(start_time)
 
         # STEP 0.25: Short-circuit low-signal messages (skip retrieval/rerank)
         if self._is_low_signal_message(user_message):
@@ -240,19 +476,57 @@ class RAGService:
             self.last_comparison_context = None
             return
 
+        # STEP 0.3: Answer cache (opt-in) - replay a stored answer for the same
+        # question over unchanged documents
+        answer_cache_key = None
+        if self.answer_cache is not None and force_comparison is not True:
+            answer_cache_key = await self._answer_cache_key(
+                session_id, user_message, document_ids, org_id, history_messages
+            )
+            if answer_cache_key:
+                cached_answer = await run_in_db_executor(self.answer_cache.get, answer_cache_key)
+                if cached_answer is not None:
+                    CHAT_ANSWER_CACHE_REQUESTS.labels(result="hit").inc()
+                    async for text_chunk in self._replay_cached_answer(
+                        cached_answer, session_id, user_message, org_id, start_time
+                    ):
+                        yield text_chunk
+                    return
+                CHAT_ANSWER_CACHE_REQUESTS.labels(result="miss").inc()
+
+        # STEP 0.4: Speculative retrieval on the raw message (optional)
+        # Runs hybrid retrieval + cross-encoder scoring while the query-understanding
+        # LLM call is in flight; candidates are reused/merged in STEP 1.
+        speculative_task = None
+        if settings.rag_speculative_retrieval_enabled and force_comparison is not True:
+            speculative_task = asyncio.create_task(self._speculative_retrieve(
+                user_message=user_message,
+                collection_id=collection_id,
+                document_ids=document_ids,
+                top_k=settings.rag_retrieval_candidates,
+                stage_ms=stage_ms
+            ))
+
         # STEP 0.5: Query Understanding (LLM-powered analysis)
         # Load document metadata for query understanding context
-        doc_info = []
-        if document_ids:
-            doc_info = self.document_repo.get_doc_info_by_ids(document_ids)
+        understanding_start = time.monotonic()
+        try:
+            doc_info = []
+            if document_ids:
+                doc_info = await run_in_db_executor(self.document_repo.get_doc_info_by_ids, document_ids)
 
-        doc_filenames = [d["filename"] for d in doc_info]
+            doc_filenames = [d["filename"] for d in doc_info]
 
-        # Analyze query with LLM (cheap Haiku call)
-        understanding = await self.query_understanding.understand(
-            query=user_message,
-            document_filenames=doc_filenames
-        )
+            # Analyze query with LLM (cheap Haiku call)
+            understanding = await self.query_understanding.understand(
+                query=user_message,
+                document_filenames=doc_filenames
+            )
+        except BaseException:
+            # Request failed (or was cancelled): don't leave speculative retrieval running
+            _abandon_task(speculative_task)
+            raise
+        stage_ms["understanding_ms"] = _elapsed_ms(understanding_start)
 
         # STEP 0.75: Adaptive retrieval sizing based on query intent
         retrieval_candidates = settings.rag_retrieval_candidates
@@ -286,6 +560,7 @@ class RAGService:
         )
 
         if should_compare and document_ids and len(document_ids) >= 2 and getattr(settings, 'comparison_enabled', True) and force_comparison is not False:
+            _abandon_task(speculative_task)  # Comparison flow retrieves per document
             max_docs = getattr(settings, 'comparison_max_documents', 3)
 
             # ≤3 docs in session: proceed automatically
@@ -398,17 +673,34 @@ class RAGService:
         )
         retrieval_start = time.monotonic()
 
-        # Use hybrid retriever (combines semantic + keyword search)
-        # Use reformulated query for better keyword matching, but pass understanding for HyDE
-        # Retrieve more candidates for potential re-ranking
-        hybrid_results = self.hybrid_retriever.retrieve(
-            query=understanding.reformulated_query,  # Use reformulated query for keyword search
-            collection_id=collection_id,
-            top_k=retrieval_candidates,
-            document_ids=document_ids,
-            query_understanding=understanding,  # For HyDE enhancement
-            min_semantic_similarity=settings.rag_chat_semantic_similarity_floor
-        )
+        speculative = None
+        if speculative_task is not None:
+            try:
+                speculative = await speculative_task
+            except Exception as e:
+                logger.warning(
+                    f"Speculative retrieval failed, using standard retrieval: {e}",
+                    extra={"session_id": session_id}
+                )
+
+        if speculative is not None:
+            hybrid_results, speculative_outcome = await self._resolve_speculative_candidates(
+                speculative,
+                understanding=understanding,
+                user_message=user_message,
+                collection_id=collection_id,
+                document_ids=document_ids,
+                top_k=retrieval_candidates
+            )
+        else:
+            speculative_outcome = None
+            hybrid_results = await self._refined_retrieve(
+                understanding=understanding,
+                collection_id=collection_id,
+                document_ids=document_ids,
+                top_k=retrieval_candidates
+            )
+        stage_ms["retrieval_ms"] = _elapsed_ms(retrieval_start)
 
         logger.info(
             f"Hybrid retrieval complete: {len(hybrid_results)} candidates retrieved",
@@ -418,7 +710,8 @@ class RAGService:
                 "document_count": len(document_ids) if document_ids else 0,
                 "retrieval_candidates": retrieval_candidates,
                 "query_type": understanding.query_type.value,
-                "retrieval_ms": round((time.monotonic() - retrieval_start) * 1000, 2)
+                "retrieval_ms": stage_ms["retrieval_ms"],
+                "speculative_outcome": speculative_outcome
             }
         )
 
@@ -430,21 +723,25 @@ class RAGService:
                 extra={"session_id": session_id}
             )
             rerank_start = time.monotonic()
+            rerank_stats = {}
 
             # Re-rank with compression and metadata boosting
-            relevant_chunks = self.reranker.rerank(
+            relevant_chunks = await self.reranker.arerank(
                 query=user_message,
                 chunks=hybrid_results,
                 query_understanding=understanding,
-                top_k=final_top_k
+                top_k=final_top_k,
+                stats=rerank_stats
             )
 
+            stage_ms["rerank_ms"] = _elapsed_ms(rerank_start)
             logger.info(
                 f"Re-ranking complete: {len(relevant_chunks)} final chunks selected",
                 extra={
                     "session_id": session_id,
                     "top_rerank_score": relevant_chunks[0]["rerank_score"] if relevant_chunks else 0,
-                    "rerank_ms": round((time.monotonic() - rerank_start) * 1000, 2)
+                    "rerank_ms": stage_ms["rerank_ms"],
+                    **rerank_stats  # Score cache hit ratio + saved inference time
                 }
             )
         else:
@@ -455,6 +752,8 @@ class RAGService:
                 extra={"session_id": session_id}
             )
 
+        self._log_stage_timings(session_id, stage_ms, speculative_outcome, start_time)
+
         # Edge case: Handle when no relevant chunks are found
         if not relevant_chunks:
             logger.warning(
@@ -560,7 +859,8 @@ class RAGService:
             verbatim_count = settings.chat_verbatim_message_count
             last_summarized_index = max(0, len(history_messages) - verbatim_count)
 
-            self.memory.cache_summary(
+            await run_in_db_executor(
+                self.memory.cache_summary,
                 session_id,
                 len(history_messages),
                 summary_text,
@@ -572,7 +872,7 @@ class RAGService:
         # STEP 3.5: Build citation context for frontend (general chat mode)
         if relevant_chunks:
             citation_start = time.monotonic()
-            self.last_citation_context = self._build_citation_context(relevant_chunks)
+            self.last_citation_context = await run_in_db_executor(self._build_citation_context, relevant_chunks)
             logger.info(
                 "Citation context built",
                 extra={
@@ -655,6 +955,16 @@ class RAGService:
             except Exception as e:
                 logger.warning(f"Failed to record chat latency metric: {e}", exc_info=True)
 
+            # Store for replay (only grounded, non-empty answers)
+            if answer_cache_key and full_response and relevant_chunks:
+                await run_in_db_executor(self.answer_cache.set, answer_cache_key, {
+                    "answer": full_response,
+                    "citation_context": self.last_citation_context,
+                    "source_chunks": [chunk["id"] for chunk in relevant_chunks],
+                    "usage": usage_data,
+                    "query": user_message,
+                })
+
             # Clear comparison and citation context after saving to prevent leaking to next request
             self.last_comparison_context = None
             self.last_citation_context = None
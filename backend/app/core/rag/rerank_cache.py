@@ -0,0 +1,147 @@
+"""
+Cross-Encoder Score Cache for RAG
+
+Caches raw cross-encoder scores for (query, chunk) pairs so regenerate/retry,
+per-document comparison retrieval and workflow re-runs with identical
+retrieval specs skip tokenization and CrossEncoder.predict for pairs already
+scored.
+
+Key design:
+    cache key: rr:<model>:<sha256(normalized query)[:32]>:<chunk_id>:<chunk version>
+    normalized query: NFC + collapsed whitespace (case preserved)
+    chunk version: sha1(chunk text)[:12]
+    value: raw cross-encoder score (before metadata boosting)
+
+Invalidation:
+    - Re-indexing inserts chunks with new ids, and any change to a chunk's
+      text changes its version, so stale scores are never looked up again
+      (they simply expire via TTL). No delete fan-out is needed.
+
+Tiers: in-process LRU + Redis (settings.rag_rerank_cache_ttl_seconds).
+"""
+
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from app.config import settings
+from app.utils.logging import logger
+
+try:
+    import redis  # type: ignore
+except Exception:
+    redis = None
+
+
+class RerankScoreCache:
+    """Two-tier (LRU + Redis) cache of raw cross-encoder scores."""
+
+    def __init__(
+        self,
+        model_name: str,
+        lru_size: Optional[int] = None,
+        ttl_seconds: Optional[int] = None
+    ):
+        """
+        Initialize score cache.
+
+        Args:
+            model_name: Cross-encoder model name (part of every key)
+            lru_size: Max in-process entries (default from settings)
+            ttl_seconds: Redis TTL; <= 0 disables the Redis tier (default from settings)
+        """
+        self.model_name = model_name
+        self.lru_size = lru_size if lru_size is not None else settings.rag_rerank_cache_lru_size
+        self.ttl = ttl_seconds if ttl_seconds is not None else settings.rag_rerank_cache_ttl_seconds
+
+        self._lru: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Running average of per-pair inference time (for saved-time estimates)
+        self._avg_pair_ms: Optional[float] = None
+
+        self.client = None
+        if redis is not None and settings.use_redis_cache and self.ttl > 0:
+            try:
+                self.client = redis.Redis.from_url(settings.redis_url)
+            except Exception as e:
+                logger.warning(f"Failed to init Redis for rerank cache: {e}; using LRU only")
+
+    # -------- Keys --------
+    def keys_for(self, query: str, chunks: List[Dict]) -> List[str]:
+        """Build one cache key per chunk for this query."""
+        normalized = " ".join(unicodedata.normalize("NFC", query).split())
+        query_digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:32]
+        prefix = f"rr:{self.model_name}:{query_digest}:"
+        keys = []
+        for chunk in chunks:
+            text = chunk.get("text", "") or ""
+            version = hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+            keys.append(f"{prefix}{chunk.get('id')}:{version}")
+        return keys
+
+    # -------- Get / set --------
+    def get_many(self, keys: List[str]) -> Dict[str, float]:
+        """Return cached scores for the given keys (LRU first, then one Redis MGET)."""
+        found: Dict[str, float] = {}
+        redis_keys = []
+        with self._lock:
+            for key in keys:
+                score = self._lru.get(key)
+                if score is not None:
+                    self._lru.move_to_end(key)
+                    found[key] = score
+                else:
+                    redis_keys.append(key)
+
+        if redis_keys and self.client:
+            try:
+                for key, raw in zip(redis_keys, self.client.mget(redis_keys)):
+                    if raw is not None:
+                        found[key] = float(raw)
+                self._lru_put({k: found[k] for k in redis_keys if k in found})
+            except Exception as e:
+                logger.debug(f"Redis rerank cache get failed: {e}")
+        return found
+
+    def set_many(self, scores: Dict[str, float]) -> None:
+        """Store raw scores in both tiers."""
+        if not scores:
+            return
+        self._lru_put(scores)
+        if self.client:
+            try:
+                pipe = self.client.pipeline(transaction=False)
+                for key, score in scores.items():
+                    pipe.setex(key, self.ttl, repr(float(score)))
+                pipe.execute()
+            except Exception as e:
+                logger.debug(f"Redis rerank cache set failed: {e}")
+
+    def _lru_put(self, scores: Dict[str, float]) -> None:
+        if self.lru_size <= 0 or not scores:
+            return
+        with self._lock:
+            for key, score in scores.items():
+                self._lru[key] = float(score)
+                self._lru.move_to_end(key)
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+    # -------- Saved-time accounting --------
+    def record_inference(self, pairs: int, elapsed_ms: float) -> None:
+        """Update the running per-pair inference time from a real predict call."""
+        if pairs <= 0:
+            return
+        per_pair = elapsed_ms / pairs
+        with self._lock:
+            if self._avg_pair_ms is None:
+                self._avg_pair_ms = per_pair
+            else:
+                self._avg_pair_ms = 0.8 * self._avg_pair_ms + 0.2 * per_pair
+
+    def estimate_saved_ms(self, hits: int) -> float:
+        """Estimated inference time saved by `hits` cached pairs."""
+        return round(hits * (self._avg_pair_ms or 0.0), 2)
@@ -10,14 +10,20 @@ making them more accurate than bi-encoder (embedding) based ranking.
 Cross-encoder token limit: 512 tokens
 Chunks exceeding this limit are truncated for scoring only.
 Original chunks are preserved and returned to caller.
+
+Raw scores are cached per (model, query, chunk) - see rerank_cache.py.
+Only cache misses are tokenized and sent to CrossEncoder.predict.
 """
 
-from typing import List, Dict, Optional, TYPE_CHECKING
+from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
 import logging
+import time
 from sentence_transformers import CrossEncoder
 from app.config import settings
 from app.core.rag.metadata_booster import MetadataBooster
-from app.utils.token_utils import count_tokens, truncate_to_token_limit
+from app.core.rag.rerank_cache import RerankScoreCache
+from app.core.inference_backend import backend_tag, load_transformer_model, normalize_backend
+from app.utils.token_utils import chunk_text_within_limit
 
 if TYPE_CHECKING:
     from app.core.rag.query_understanding import QueryUnderstanding, QueryType
@@ -47,7 +53,9 @@ class Reranker:
         self,
         model_name: str = None,
         batch_size: int = None,
-        apply_metadata_boost: bool = None
+        apply_metadata_boost: bool = None,
+        use_score_cache: bool = None,
+        backend: str = None
     ):
         """
         Initialize re-ranker.
@@ -56,19 +64,31 @@ class Reranker:
             model_name: Cross-encoder model name (default from settings)
             batch_size: Batch size for scoring (default from settings)
             apply_metadata_boost: Apply metadata boosting to scores (default from settings)
+            use_score_cache: Cache raw scores per (query, chunk) (default from settings)
+            backend: Inference backend - "torch", "onnx" or "onnx-int8" (default from settings)
         """
         self.model_name = model_name or settings.rag_reranker_model
+        self.backend = normalize_backend(backend or settings.rag_reranker_backend)
         self.batch_size = batch_size or settings.rag_reranker_batch_size
         self.apply_metadata_boost = apply_metadata_boost if apply_metadata_boost is not None else settings.rag_reranker_apply_metadata_boost
 
         # Initialize metadata booster (gentler weights for re-ranker)
         self.metadata_booster = MetadataBooster.for_reranker()
 
+        # Async micro-batcher (created on first arerank call)
+        self._batcher = None
+
+        # Raw score cache (skips predict for (query, chunk) pairs already scored)
+        use_score_cache = use_score_cache if use_score_cache is not None else settings.rag_rerank_cache_enabled
+        # Scores from non-torch backends differ slightly, so they get their own cache namespace
+        cache_model = f"{self.model_name}@{backend_tag(self.backend)}" if backend_tag(self.backend) else self.model_name
+        self.score_cache = RerankScoreCache(cache_model) if use_score_cache else None
+
         # Load cross-encoder model
         try:
-            self.model = CrossEncoder(self.model_name, max_length=512)
+            self.model = load_transformer_model(CrossEncoder, self.model_name, backend=self.backend, max_length=512)
             logger.info(
-                f"Reranker initialized: model={self.model_name}, "
+                f"Reranker initialized: model={self.model_name}, backend={self.backend}, "
                 f"batch_size={self.batch_size}, "
                 f"metadata_boost={self.apply_metadata_boost}"
             )
@@ -102,7 +122,8 @@ class Reranker:
         query: str,
         chunks: List[Dict],
         query_understanding: Optional['QueryUnderstanding'] = None,
-        top_k: Optional[int] = None
+        top_k: Optional[int] = None,
+        stats: Optional[Dict] = None
     ) -> List[Dict]:
         """
         Re-rank chunks based on relevance to query.
@@ -112,6 +133,7 @@ class Reranker:
             chunks: List of chunk dicts from hybrid retrieval
             query_understanding: Optional QueryUnderstanding for metadata boosting
             top_k: Number of top chunks to return (default: return all, sorted)
+            stats: Optional dict filled with score-cache stats (hits, misses, hit ratio, saved ms)
 
         Returns:
             List of chunks sorted by rerank_score (descending)
@@ -133,74 +155,236 @@ class Reranker:
             }
         )
 
-        # Step 1: Prepare text for scoring
-        # Truncate chunks > 512 tokens to fit cross-encoder limit (for scoring only)
-        # We return ORIGINAL chunks to caller (not truncated)
+        try:
+            # Step 1: Serve already-scored pairs from cache
+            keys, scores, miss_idx = self._lookup_cached_scores(query, chunks)
+
+            # Step 2: Prepare (query, text) pairs for misses only, truncated to the cross-encoder limit
+            if miss_idx:
+                pairs = self._build_pairs(query, [chunks[i] for i in miss_idx])
+
+                # Step 3: Score misses with cross-encoder
+                miss_scores = self.score_pairs(pairs)
+                self._store_scores(keys, scores, miss_idx, miss_scores)
+
+            self._fill_cache_stats(stats, len(chunks), len(miss_idx))
+            return self._apply_scores(query, chunks, scores, query_understanding, top_k, query_type_str)
+        except Exception as e:
+            return self._fallback(chunks, top_k, e)
+
+    async def arerank(
+        self,
+        query: str,
+        chunks: List[Dict],
+        query_understanding: Optional['QueryUnderstanding'] = None,
+        top_k: Optional[int] = None,
+        stats: Optional[Dict] = None
+    ) -> List[Dict]:
+        """
+        Async re-rank for request handlers.
+
+        Pairs are scored through the shared micro-batcher so concurrent chat
+        turns share cross-encoder forward passes. Falls back to rerank() on the
+        inference executor when batching is disabled.
+
+        Args/Returns: same as rerank()
+        """
+        if not settings.inference_batching_enabled:
+            from app.core.executors import run_in_inference_executor
+            return await run_in_inference_executor(
+                self.rerank,
+                query=query,
+                chunks=chunks,
+                query_understanding=query_understanding,
+                top_k=top_k,
+                stats=stats
+            )
+
+        if not chunks:
+            logger.warning("No chunks provided for re-ranking")
+            return []
+
+        query_type_str = "generic_query"
+        if query_understanding:
+            query_type_str = self._map_query_type_for_metadata_boost(query_understanding)
+
+        from app.core.executors import run_in_db_executor
+        try:
+            # Cache lookup/store touch Redis - keep them off the event loop
+            keys, scores, miss_idx = await run_in_db_executor(self._lookup_cached_scores, query, chunks)
+
+            if miss_idx:
+                pairs = self._build_pairs(query, [chunks[i] for i in miss_idx])
+                miss_scores = await self._get_batcher().submit_many(pairs)
+                await run_in_db_executor(self._store_scores, keys, scores, miss_idx, miss_scores)
+
+            self._fill_cache_stats(stats, len(chunks), len(miss_idx))
+            return self._apply_scores(query, chunks, scores, query_understanding, top_k, query_type_str)
+        except Exception as e:
+            return self._fallback(chunks, top_k, e)
+
+    def _get_batcher(self):
+        """Lazily create this model's micro-batcher."""
+        if self._batcher is None:
+            from app.core.inference_batcher import MicroBatcher
+            self._batcher = MicroBatcher(
+                name="rerank",
+                batch_fn=lambda pairs: self.score_pairs(pairs, batch_size=settings.inference_rerank_max_batch_size),
+                max_batch_size=settings.inference_rerank_max_batch_size,
+                max_wait_ms=settings.inference_rerank_max_wait_ms
+            )
+        return self._batcher
+
+    def _build_pairs(self, query: str, chunks: List[Dict]) -> List[List[str]]:
+        """
+        Build (query, text) pairs for scoring.
+
+        Truncate chunks > 512 tokens to fit cross-encoder limit (for scoring only).
+        We return ORIGINAL chunks to caller (not truncated).
+        """
         pairs = []
         for chunk in chunks:
-            text = chunk.get("text", "")
-
-            # Check token count
-            token_count = count_tokens(text)
+            # Uses the indexed truncation offset when present; otherwise one
+            # (memoized) encode gives both the count and the cut point
+            text, token_count = chunk_text_within_limit(chunk, self.CROSS_ENCODER_TOKEN_LIMIT)
 
-            # Truncate if > 512 tokens (for scoring only)
             if token_count > self.CROSS_ENCODER_TOKEN_LIMIT:
-                text = truncate_to_token_limit(text, self.CROSS_ENCODER_TOKEN_LIMIT)
                 logger.debug(
                     f"Truncated chunk for re-ranking: {token_count} → {self.CROSS_ENCODER_TOKEN_LIMIT} tokens"
                 )
 
             pairs.append([query, text])
+        return pairs
 
-        # Step 2: Score all pairs with cross-encoder
-        try:
-            # Cross-encoder returns relevance scores (higher = more relevant)
-            scores = self.model.predict(
-                pairs,
-                batch_size=self.batch_size,
-                show_progress_bar=False
-            )
+    def score_pairs(self, pairs: List[List[str]], batch_size: Optional[int] = None) -> List[float]:
+        """
+        Score (query, text) pairs with the cross-encoder.
 
-            # Add rerank scores to ORIGINAL chunks (not compressed copies)
-            for chunk, score in zip(chunks, scores):
-                chunk["rerank_score"] = float(score)
-
-            # Step 4: Optionally apply metadata boosting (gentle nudge)
-            if self.apply_metadata_boost:
-                # Pass QueryUnderstanding directly if available, otherwise use basic dict
-                boost_input = query_understanding if query_understanding else {"query_type": query_type_str}
-                chunks = self.metadata_booster.apply_boost(
-                    chunks,
-                    boost_input,
-                    score_field="rerank_score"
-                )
-                logger.debug("Applied metadata boosting to rerank scores")
+        Pairs are scored in length order so each forward pass pads to similar
+        lengths (matters for mixed-request micro-batches); scores are returned
+        in input order.
 
-            # Step 5: Sort by rerank score (descending)
-            ranked_chunks = sorted(chunks, key=lambda x: x["rerank_score"], reverse=True)
+        Args:
+            pairs: [query, text] pairs
+            batch_size: Pairs per forward pass (default: self.batch_size)
 
-            # Step 6: Return top-k if specified
-            if top_k is not None:
-                ranked_chunks = ranked_chunks[:top_k]
+        Returns:
+            Relevance scores (higher = more relevant)
+        """
+        if not pairs:
+            return []
 
-            logger.info(
-                f"Re-ranking complete: {len(ranked_chunks)} chunks returned",
-                extra={
-                    "top_score": ranked_chunks[0]["rerank_score"] if ranked_chunks else 0,
-                    "query": query[:50],
-                    "query_type": query_type_str
-                }
-            )
+        order = sorted(range(len(pairs)), key=lambda i: len(pairs[i][0]) + len(pairs[i][1]))
+        predict_start = time.monotonic()
+        sorted_scores = self.model.predict(
+            [pairs[i] for i in order],
+            batch_size=batch_size or self.batch_size,
+            show_progress_bar=False
+        )
+        if self.score_cache:
+            self.score_cache.record_inference(len(pairs), (time.monotonic() - predict_start) * 1000)
 
-            return ranked_chunks
+        scores = [0.0] * len(pairs)
+        for pos, i in enumerate(order):
+            scores[i] = float(sorted_scores[pos])
+        return scores
 
-        except Exception as e:
-            logger.error(f"Re-ranking failed: {e}", exc_info=True)
-            # Fallback: return original chunks sorted by hybrid_score
-            logger.warning("Falling back to hybrid scores (no re-ranking)")
-            fallback_chunks = sorted(
+    def _lookup_cached_scores(
+        self,
+        query: str,
+        chunks: List[Dict]
+    ) -> Tuple[Optional[List[str]], List[Optional[float]], List[int]]:
+        """
+        Resolve cached raw scores.
+
+        Returns:
+            (cache keys or None, per-chunk scores with None for misses, miss indices)
+        """
+        if not self.score_cache:
+            return None, [None] * len(chunks), list(range(len(chunks)))
+
+        keys = self.score_cache.keys_for(query, chunks)
+        cached = self.score_cache.get_many(keys)
+        scores = [cached.get(key) for key in keys]
+        miss_idx = [i for i, score in enumerate(scores) if score is None]
+        return keys, scores, miss_idx
+
+    def _store_scores(
+        self,
+        keys: Optional[List[str]],
+        scores: List[Optional[float]],
+        miss_idx: List[int],
+        miss_scores: List[float]
+    ) -> None:
+        """Fill miss scores in place and write them to the cache."""
+        for i, score in zip(miss_idx, miss_scores):
+            scores[i] = float(score)
+        if self.score_cache and keys is not None:
+            self.score_cache.set_many({keys[i]: scores[i] for i in miss_idx})
+
+    def _fill_cache_stats(self, stats: Optional[Dict], total: int, misses: int) -> None:
+        if stats is None or not self.score_cache:
+            return
+        hits = total - misses
+        stats.update({
+            "rerank_cache_hits": hits,
+            "rerank_cache_misses": misses,
+            "rerank_cache_hit_ratio": round(hits / total, 3) if total else 0.0,
+            "rerank_saved_ms": self.score_cache.estimate_saved_ms(hits)
+        })
+
+    def _apply_scores(
+        self,
+        query: str,
+        chunks: List[Dict],
+        scores: List[float],
+        query_understanding: Optional['QueryUnderstanding'],
+        top_k: Optional[int],
+        query_type_str: str
+    ) -> List[Dict]:
+        """Attach scores, apply metadata boost, sort and cut to top_k."""
+        # Add rerank scores to ORIGINAL chunks (not compressed copies)
+        for chunk, score in zip(chunks, scores):
+            chunk["rerank_score"] = float(score)
+
+        # Step 3: Optionally apply metadata boosting (gentle nudge)
+        if self.apply_metadata_boost:
+            # Pass QueryUnderstanding directly if available, otherwise use basic dict
+            boost_input = query_understanding if query_understanding else {"query_type": query_type_str}
+            chunks = self.metadata_booster.apply_boost(
                 chunks,
-                key=lambda x: x.get("hybrid_score", 0),
-                reverse=True
+                boost_input,
+                score_field="rerank_score"
             )
-            return fallback_chunks[:top_k] if top_k else fallback_chunks
+            logger.debug("Applied metadata boosting to rerank scores")
+
+        # Step 4: Sort by rerank score (descending)
+        ranked_chunks = sorted(chunks, key=lambda x: x["rerank_score"], reverse=True)
+
+        # Step 5: Return top-k if specified
+        if top_k is not None:
+            ranked_chunks = ranked_chunks[:top_k]
+
+        logger.info(
+            f"Re-ranking complete: {len(ranked_chunks)} chunks returned",
+            extra={
+                "top_score": ranked_chunks[0]["rerank_score"] if ranked_chunks else 0,
+                "query": query[:50],
+                "query_type": query_type_str
+            }
+        )
+
+        return ranked_chunks
+
+    @staticmethod
+    def _fallback(chunks: List[Dict], top_k: Optional[int], error: Exception) -> List[Dict]:
+        """Return chunks sorted by hybrid_score when cross-encoder scoring fails."""
+        logger.error(f"Re-ranking failed: {error}", exc_info=error)
+        # Fallback: return original chunks sorted by hybrid_score
+        logger.warning("Falling back to hybrid scores (no re-ranking)")
+        fallback_chunks = sorted(
+            chunks,
+            key=lambda x: x.get("hybrid_score", 0),
+            reverse=True
+        )
+        return fallback_chunks[:top_k] if top_k else fallback_chunks
@@ -0,0 +1,314 @@
+# backend/app/core/rag/session_vector_index.py
+"""
+Session-scoped in-memory vector index.
+
+Chat sessions usually search 1-10 documents (a few thousand chunks), but the
+pgvector HNSW index covers the whole document_chunks table: a
+`document_id IN (...)` filter is applied after the graph walk (losing recall
+when the session's chunks are a small share of the table) or the planner
+falls back to an exact scan. For document sets up to
+settings.rag_session_index_max_chunks, the set's embeddings are instead loaded
+once into a normalized float32 NumPy matrix and searched exactly (one matmul).
+
+Cache:
+    key: sorted document ids
+    LRU of settings.rag_session_index_cache_size document sets per process,
+    also bounded to settings.rag_session_index_max_mb of embedding matrices
+
+Invalidation:
+    Each entry records a signature of its documents (id, status, chunk_count,
+    completed_at). Searches re-read the signature with one primary-key query
+    once it is older than settings.rag_session_index_signature_ttl_seconds and
+    rebuild the entry when it changed (re-indexing in a worker, deletion, new
+    chunks). invalidate_document() drops entries eagerly in the process that
+    deletes a document. Document sets with a document still being indexed are
+    searched with pgvector: streaming indexing inserts chunks long before
+    chunk_count or completed_at change, so the signature cannot see them.
+
+Searches return (chunk_id, cosine_distance) pairs, ordered like pgvector's
+`ORDER BY embedding <=> query`, so callers keep their SQL for the chunk rows.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.db_models_chat import DocumentChunk
+from app.db_models_documents import Document
+from app.utils.logging import logger
+from app.utils.metrics import SESSION_VECTOR_INDEX_LOOKUPS, SESSION_VECTOR_INDEX_BUILD_SECONDS
+
+# Document statuses after which a document's chunks no longer change
+_SETTLED_STATUSES = ("completed", "failed")
+
+
+class SessionVectorIndex:
+    """Exact cosine search over one document set's chunk embeddings."""
+
+    def __init__(self, chunk_ids: List[str], embeddings: np.ndarray, signature: Tuple):
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.chunk_ids = chunk_ids
+        self.matrix = (embeddings / norms).astype(np.float32, copy=False)
+        self.signature = signature
+        self.checked_at = time.monotonic()  # When the signature was last confirmed current
+
+    def __len__(self) -> int:
+        return len(self.chunk_ids)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.matrix.nbytes)
+
+    def search(
+        self,
+        embedding: Sequence[float],
+        top_k: int,
+        max_distance: Optional[float] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Top-k chunks by cosine distance (ascending).
+
+        Args:
+            embedding: Query embedding
+            top_k: Number of results
+            max_distance: Optional cosine distance cut-off
+
+        Returns:
+            (chunk_id, cosine_distance) pairs, most similar first
+        """
+        if not self.chunk_ids or top_k <= 0:
+            return []
+        query = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm > 0:
+            query = query / norm
+        similarity = self.matrix @ query
+
+        candidates = np.arange(len(self.chunk_ids))
+        if max_distance is not None:
+            candidates = candidates[(1.0 - similarity[candidates]) <= max_distance]
+        if candidates.size == 0:
+            return []
+
+        k = min(top_k, candidates.size)
+        scores = similarity[candidates]
+        top = np.argpartition(-scores, k - 1)[:k] if k < candidates.size else np.arange(candidates.size)
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.chunk_ids[i], float(1.0 - similarity[i])) for i in candidates[top]]
+
+
+class SessionVectorIndexCache:
+    """Process-wide LRU of session vector indexes keyed by document set."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_chunks: Optional[int] = None,
+        signature_ttl_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Document sets kept in memory (default: settings.rag_session_index_cache_size)
+            max_chunks: Larger document sets are not indexed (default: settings.rag_session_index_max_chunks)
+            signature_ttl_seconds: How long a checked signature is trusted
+                (default: settings.rag_session_index_signature_ttl_seconds)
+            max_bytes: Total embedding matrix bytes kept in memory
+                (default: settings.rag_session_index_max_mb)
+        """
+        self.max_entries = max_entries if max_entries is not None else settings.rag_session_index_cache_size
+        self.max_chunks = max_chunks if max_chunks is not None else settings.rag_session_index_max_chunks
+        self.signature_ttl = (
+            signature_ttl_seconds if signature_ttl_seconds is not None
+            else settings.rag_session_index_signature_ttl_seconds
+        )
+        self.max_bytes = max_bytes if max_bytes is not None else settings.rag_session_index_max_mb * 1024 * 1024
+        self._entries: "OrderedDict[Tuple[str, ...], SessionVectorIndex]" = OrderedDict()
+        # key -> (signature, checked_at) of document sets found too large; LRU bounded like _entries
+        self._too_large: "OrderedDict[Tuple[str, ...], Tuple[Tuple, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_locks: Dict[Tuple[str, ...], threading.Lock] = {}  # Only while a build is in flight
+
+    @staticmethod
+    def _signature(db: Session, key: Tuple[str, ...]) -> Tuple:
+        rows = db.execute(
+            select(Document.id, Document.status, Document.chunk_count, Document.completed_at)
+            .where(Document.id.in_(key))
+        ).all()
+        return tuple(sorted(
+            (r.id, r.status, r.chunk_count, r.completed_at.isoformat() if r.completed_at else None)
+            for r in rows
+        ))
+
+    def _fresh(self, checked_at: float) -> bool:
+        return time.monotonic() - checked_at < self.signature_ttl
+
+    def _hit(self, key: Tuple[str, ...], index: SessionVectorIndex) -> SessionVectorIndex:
+        self._entries.move_to_end(key)
+        SESSION_VECTOR_INDEX_LOOKUPS.labels(result="hit").inc()
+        return index
+
+    def _bypass(self, key: Tuple[str, ...], signature: Tuple) -> None:
+        with self._lock:
+            self._too_large[key] = (signature, time.monotonic())
+            self._too_large.move_to_end(key)
+            while len(self._too_large) > self.max_entries:
+                self._too_large.popitem(last=False)
+        SESSION_VECTOR_INDEX_LOOKUPS.labels(result="bypass").inc()
+
+    def get(self, db: Session, document_ids: Sequence[str]) -> Optional[SessionVectorIndex]:
+        """
+        Return a current index for the document set, building it if needed.
+
+        Returns:
+            SessionVectorIndex, or None when the set is too large (caller uses pgvector)
+        """
+        key = tuple(sorted(set(document_ids)))
+        if not key or self.max_entries <= 0:
+            return None
+
+        # Recently confirmed entries skip the signature query
+        with self._lock:
+            index = self._entries.get(key)
+            if index is not None and self._fresh(index.checked_at):
+                return self._hit(key, index)
+            too_large = self._too_large.get(key)
+            if too_large is not None and self._fresh(too_large[1]):
+                self._too_large.move_to_end(key)
+                SESSION_VECTOR_INDEX_LOOKUPS.labels(result="bypass").inc()
+                return None
+
+        signature = self._signature(db, key)
+        if any(status not in _SETTLED_STATUSES for _, status, _, _ in signature):
+            # Chunks are still being inserted; an index built now would miss later ones
+            SESSION_VECTOR_INDEX_LOOKUPS.labels(result="indexing").inc()
+            return None
+
+        expected_chunks = sum(chunk_count or 0 for _, _, chunk_count, _ in signature)
+        if expected_chunks > self.max_chunks or (too_large is not None and too_large[0] == signature):
+            self._bypass(key, signature)
+            return None
+
+        with self._lock:
+            index = self._entries.get(key)
+            if index is not None and index.signature == signature:
+                index.checked_at = time.monotonic()
+                return self._hit(key, index)
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        # One build per document set; concurrent requests wait and reuse it
+        with build_lock:
+            with self._lock:
+                index = self._entries.get(key)
+                if index is not None and index.signature == signature:
+                    return self._hit(key, index)
+                stale = index is not None
+
+            try:
+                index = self._build(db, key, signature)
+            finally:
+                with self._lock:
+                    self._build_locks.pop(key, None)
+            if index is None or index.nbytes > self.max_bytes:
+                self._bypass(key, signature)
+                return None
+
+            with self._lock:
+                self._too_large.pop(key, None)
+                self._entries[key] = index
+                self._entries.move_to_end(key)
+                cached_bytes = sum(entry.nbytes for entry in self._entries.values())
+                while len(self._entries) > self.max_entries or cached_bytes > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    cached_bytes -= evicted.nbytes
+            SESSION_VECTOR_INDEX_LOOKUPS.labels(result="rebuild" if stale else "build").inc()
+            return index
+
+    def _build(self, db: Session, key: Tuple[str, ...], signature: Tuple) -> Optional[SessionVectorIndex]:
+        start = time.perf_counter()
+        rows = db.execute(
+            select(DocumentChunk.id, DocumentChunk.embedding)
+            .where(DocumentChunk.document_id.in_(key), DocumentChunk.embedding.isnot(None))
+            .limit(self.max_chunks + 1)
+        ).all()
+        if len(rows) > self.max_chunks:
+            return None
+
+        dimension = settings.embedding_dimension
+        embeddings = (
+            np.vstack([np.asarray(r.embedding, dtype=np.float32) for r in rows])
+            if rows else np.zeros((0, dimension), dtype=np.float32)
+        )
+        index = SessionVectorIndex([r.id for r in rows], embeddings, signature)
+
+        elapsed = time.perf_counter() - start
+        SESSION_VECTOR_INDEX_BUILD_SECONDS.observe(elapsed)
+        logger.info(
+            f"Session vector index built: {len(index)} chunks from {len(key)} documents",
+            extra={"documents": len(key), "chunks": len(index), "mb": round(index.nbytes / 1e6, 2),
+                   "build_ms": round(elapsed * 1000, 1)}
+        )
+        return index
+
+    def invalidate_document(self, document_id: str) -> int:
+        """Drop every cached index containing the document; returns the number dropped."""
+        with self._lock:
+            stale = [key for key in self._entries if document_id in key]
+            for key in stale:
+                del self._entries[key]
+            for key in [key for key in self._too_large if document_id in key]:
+                del self._too_large[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._too_large.clear()
+
+
+def session_index_search(
+    db: Session,
+    embedding: Sequence[float],
+    document_ids: Optional[Sequence[str]],
+    top_k: int,
+    max_distance: Optional[float] = None
+) -> Optional[List[Tuple[str, float]]]:
+    """
+    Semantic search through the session index when it applies.
+
+    Returns:
+        (chunk_id, cosine_distance) pairs, or None when the caller should use pgvector
+        (index disabled, no document scope, document set too large, or index failure)
+    """
+    if not settings.rag_session_index_enabled or not document_ids:
+        return None
+    try:
+        index = get_session_vector_index_cache().get(db, document_ids)
+        if index is None:
+            return None
+        return index.search(embedding, top_k, max_distance=max_distance)
+    except Exception as e:
+        logger.warning(f"Session vector index unavailable, using pgvector: {e}", exc_info=True)
+        return None
+
+
+_cache: Optional[SessionVectorIndexCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_session_vector_index_cache() -> SessionVectorIndexCache:
+    """Get (or lazily create) the process-wide session vector index cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SessionVectorIndexCache()
+    return _cache
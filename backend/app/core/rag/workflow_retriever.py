@@ -13,7 +13,6 @@ from typing import List, Dict
 import logging
 from sqlalchemy.orm import Session
 from app.core.rag.hybrid_retriever import HybridRetriever
-from app.core.rag.reranker import Reranker
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -56,7 +55,8 @@ class WorkflowRetriever:
         self.use_reranker = use_reranker if use_reranker is not None else settings.rag_use_reranker
         self.reranker = None
         if self.use_reranker:
-            self.reranker = Reranker()
+            from app.services.model_registry import get_reranker
+            self.reranker = get_reranker()  # Process-wide instance, not reloaded per task
 
         logger.info(
             f"WorkflowRetriever initialized: reranker={self.use_reranker}, "
@@ -0,0 +1,162 @@
+"""Intermediate artifact store for the document indexing pipeline.
+
+Indexing stages (parse → chunk → embed → store) used to return their full
+output inside the Celery payload, so parser text, every chunk dict and every
+embedding list were JSON-serialized through Redis on each hop. Stages now
+write a compact binary artifact here and pass only a small reference dict:
+
+    {"backend": "local", "key": "<job_id>/chunks.msgpack", "format": "msgpack", "size": 123456}
+
+Formats:
+    - msgpack: structured data (parser output, chunk dicts)
+    - npy: float32 matrices (embeddings)
+
+Backends:
+    - "local": files under settings.indexing_artifact_dir (a volume shared by workers)
+    - "r2": Cloudflare R2 objects under indexing_artifacts/ (workers on different hosts)
+
+Artifacts are deleted by the last stage once vectors are stored; failed jobs
+keep theirs so a retried stage can re-read its input. Shared artifacts written
+under an explicit key (the parser output cache) are not tied to a job.
+"""
+import io
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import msgpack
+import numpy as np
+
+from app.config import settings
+from app.utils.logging import logger
+
+R2_PREFIX = "indexing_artifacts/"
+
+
+class ArtifactStore:
+    """Reads and writes indexing artifacts on the configured backend."""
+
+    def __init__(self, backend: Optional[str] = None, base_dir: Optional[Path] = None):
+        """
+        Initialize artifact store.
+
+        Args:
+            backend: "local" or "r2" (default: settings.indexing_artifact_backend)
+            base_dir: Root directory for the local backend (default: settings.indexing_artifact_dir)
+        """
+        self.backend = backend or settings.indexing_artifact_backend
+        self.base_dir = Path(base_dir or settings.indexing_artifact_dir)
+        self._r2 = None
+
+        if self.backend == "r2":
+            from app.core.storage.cloudflare_r2 import get_r2_storage
+            try:
+                self._r2 = get_r2_storage()
+            except RuntimeError as e:
+                logger.warning(f"R2 not configured for indexing artifacts: {e}. Falling back to local files.")
+                self.backend = "local"
+
+        if self.backend == "local":
+            self.base_dir.mkdir(parents=True, exist_ok=True)
+
+    def _r2_client(self):
+        # Refs written on another host may point at R2 even if this store defaults to local
+        if self._r2 is None:
+            from app.core.storage.cloudflare_r2 import get_r2_storage
+            self._r2 = get_r2_storage()
+        return self._r2
+
+    # -------- Raw bytes --------
+    def _put_bytes(self, key: str, data: bytes, content_type: str) -> None:
+        if self.backend == "r2":
+            self._r2.store_bytes(R2_PREFIX + key, data, content_type)
+            return
+
+        path = self.base_dir / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a reader never sees a partial artifact
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _get_bytes(self, ref: Dict[str, Any]) -> bytes:
+        if ref.get("backend") == "r2":
+            return self._r2_client().get_bytes(R2_PREFIX + ref["key"])
+
+        path = self.base_dir / ref["key"]
+        if not path.exists():
+            raise FileNotFoundError(f"Indexing artifact not found: {ref['key']}")
+        return path.read_bytes()
+
+    def _ref(self, key: str, fmt: str, size: int) -> Dict[str, Any]:
+        return {"backend": self.backend, "key": key, "format": fmt, "size": size}
+
+    # -------- Typed artifacts --------
+    def put_msgpack(self, job_id: str, name: str, obj: Any) -> Dict[str, Any]:
+        """Serialize obj with msgpack and return its reference."""
+        return self.put_msgpack_at(f"{job_id}/{name}.msgpack", obj)
+
+    def put_msgpack_at(self, key: str, obj: Any) -> Dict[str, Any]:
+        """Serialize obj with msgpack under an explicit key and return its reference."""
+        data = msgpack.packb(obj, use_bin_type=True)
+        self._put_bytes(key, data, "application/msgpack")
+        return self._ref(key, "msgpack", len(data))
+
+    def ref_for(self, key: str, fmt: str = "msgpack") -> Dict[str, Any]:
+        """Reference to an artifact at a known key on this store's backend."""
+        return self._ref(key, fmt, 0)
+
+    def get_msgpack(self, ref: Dict[str, Any]) -> Any:
+        """Load a msgpack artifact."""
+        return msgpack.unpackb(self._get_bytes(ref), raw=False)
+
+    def put_array(self, job_id: str, name: str, array: np.ndarray) -> Dict[str, Any]:
+        """Store a float32 matrix as .npy and return its reference."""
+        buffer = io.BytesIO()
+        np.save(buffer, np.ascontiguousarray(array, dtype=np.float32), allow_pickle=False)
+        data = buffer.getvalue()
+        key = f"{job_id}/{name}.npy"
+        self._put_bytes(key, data, "application/octet-stream")
+        return self._ref(key, "npy", len(data))
+
+    def get_array(self, ref: Dict[str, Any]) -> np.ndarray:
+        """Load a .npy artifact."""
+        return np.load(io.BytesIO(self._get_bytes(ref)), allow_pickle=False)
+
+    # -------- Cleanup --------
+    def delete(self, refs: Iterable[Optional[Dict[str, Any]]]) -> None:
+        """Delete artifacts (missing ones are ignored)."""
+        for ref in refs:
+            if not ref:
+                continue
+            try:
+                if ref.get("backend") == "r2":
+                    self._r2_client().delete(R2_PREFIX + ref["key"])
+                else:
+                    path = self.base_dir / ref["key"]
+                    path.unlink(missing_ok=True)
+                    try:
+                        path.parent.rmdir()  # Remove the job directory once empty
+                    except OSError:
+                        pass
+            except Exception as e:
+                logger.warning(f"Failed to delete indexing artifact {ref.get('key')}: {e}")
+
+
+_artifact_store: Optional[ArtifactStore] = None
+_artifact_store_lock = threading.Lock()
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Get (or lazily create) the process-wide artifact store."""
+    global _artifact_store
+    if _artifact_store is None:
+        with _artifact_store_lock:
+            if _artifact_store is None:
+                _artifact_store = ArtifactStore()
+    return _artifact_store
+
+
+__all__ = ["ArtifactStore", "get_artifact_store"]
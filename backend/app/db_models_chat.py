@@ -119,8 +119,11 @@ class DocumentChunk(Base):
     section_heading = Column(Text, nullable=True)
     is_tabular = Column(Boolean, default=False)
 
-    # Token count (for cost estimation)
+    # Token count (for cost estimation; exact cl100k count for chunks indexed with token_truncation_offset)
     token_count = Column(Integer, nullable=True)
+    # Char offset where the first 512 cl100k tokens end (== len(text) if the text fits).
+    # Lets the reranker truncate without re-tokenizing; NULL for chunks indexed before it existed
+    token_truncation_offset = Column(Integer, nullable=True)
 
     # Rich chunk metadata (JSONB) for smart chunking
     # Schema: {
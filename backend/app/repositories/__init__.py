@@ -14,8 +14,10 @@ Available repositories:
 - JobRepository: Job tracking and progress
 - WorkflowRepository: Workflow execution tracking
 - RAGRepository: Chunk retrieval for RAG (semantic/keyword search)
+- ChunkIngestRepository: Bulk chunk ingestion (binary COPY)
 """
 from app.repositories.extraction_repository import ExtractionRepository
 from app.repositories.rag_repository import RAGRepository
+from app.repositories.chunk_ingest_repository import ChunkIngestRepository
 
-__all__ = ["ExtractionRepository", "RAGRepository"]
+__all__ = ["ExtractionRepository", "RAGRepository", "ChunkIngestRepository"]
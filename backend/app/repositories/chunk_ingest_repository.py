@@ -0,0 +1,136 @@
+"""Repository for bulk DocumentChunk ingestion.
+
+Write-side counterpart to RAGRepository. Indexing used to insert chunks with
+ORM objects + bulk_save_objects, i.e. parameterized INSERTs with text-encoded
+vectors. This repository streams rows with PostgreSQL
+`COPY ... FROM STDIN (FORMAT BINARY)` instead (pgvector's binary dumper sends
+embeddings as packed float4), falling back to a Core executemany INSERT when
+the driver is not psycopg 3.
+
+Large batches also get transaction-local index maintenance hints:
+- gin_pending_list_limit raised so GIN (FTS / metadata) entries accumulate in
+  the fast-update pending list instead of being merged row by row
+- synchronous_commit off for the ingest transaction (no WAL flush wait; a
+  crash can lose the last commit but never corrupts it, and indexing retries)
+HNSW has no deferral knob; its per-row insert cost is unchanged.
+
+Usage:
+    ingest_repo = ChunkIngestRepository(db)
+    ingest_repo.bulk_insert(rows)   # rows: dicts keyed by column name
+    db.commit()
+"""
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import Table, insert, text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.db_models_chat import DocumentChunk
+from app.utils.logging import logger
+
+try:
+    from pgvector.psycopg import register_vector  # type: ignore
+except Exception:
+    register_vector = None
+
+# Columns written by indexing, with their Postgres types (binary COPY needs explicit types)
+INGEST_COLUMNS: Sequence[tuple] = (
+    ("id", "varchar"),
+    ("document_id", "varchar"),
+    ("text", "text"),
+    ("narrative_text", "text"),
+    ("tables", "jsonb"),
+    ("chunk_index", "int4"),
+    ("embedding", "vector"),
+    ("embedding_model", "varchar"),
+    ("embedding_version", "varchar"),
+    ("page_number", "int4"),
+    ("section_type", "varchar"),
+    ("section_heading", "text"),
+    ("is_tabular", "bool"),
+    ("token_count", "int4"),
+    ("token_truncation_offset", "int4"),
+    ("chunk_metadata", "jsonb"),
+)
+
+
+class ChunkIngestRepository:
+    """Bulk insert of chunk rows (binary COPY with executemany fallback)."""
+
+    def __init__(self, db: Session, table: Optional[Table] = None):
+        """Initialize repository.
+
+        Args:
+            db: SQLAlchemy session; rows join its current transaction (caller commits)
+            table: Target table (default: document_chunks; benchmarks pass a scratch copy)
+        """
+        self.db = db
+        self.table = table if table is not None else DocumentChunk.__table__
+
+    def bulk_insert(self, rows: List[Dict], method: Optional[str] = None) -> int:
+        """Insert chunk rows.
+
+        Args:
+            rows: Dicts keyed by INGEST_COLUMNS names
+            method: "copy", "insert" or None (settings.chunk_ingest_method; "copy" falls
+                    back to "insert" when binary COPY is unavailable)
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+
+        method = method or settings.chunk_ingest_method
+        if len(rows) >= settings.chunk_ingest_large_batch_rows:
+            self._apply_large_batch_hints()
+
+        if method == "copy":
+            driver_conn = self._psycopg_connection()
+            if driver_conn is not None:
+                return self._copy_rows(driver_conn, rows)
+            logger.debug("Binary COPY unavailable for this driver; using executemany INSERT")
+
+        return self._insert_rows(rows)
+
+    # -------- COPY path --------
+    def _psycopg_connection(self):
+        """Return the psycopg 3 connection under the session (None for other drivers)."""
+        if register_vector is None:
+            return None
+        driver_conn = self.db.connection().connection.driver_connection
+        if type(driver_conn).__module__.split(".")[0] != "psycopg":
+            return None
+        if driver_conn.adapters.types.get("vector") is None:
+            # Registers the vector type's text/binary dumpers on this pooled connection
+            register_vector(driver_conn)
+        return driver_conn
+
+    def _copy_rows(self, driver_conn, rows: List[Dict]) -> int:
+        names = [name for name, _ in INGEST_COLUMNS]
+        types = [pg_type for _, pg_type in INGEST_COLUMNS]
+        statement = (
+            f"COPY {self.table.name} ({', '.join(names)}) FROM STDIN (FORMAT BINARY)"
+        )
+        with driver_conn.cursor() as cur:
+            with cur.copy(statement) as copy:
+                copy.set_types(types)
+                for row in rows:
+                    copy.write_row([row.get(name) for name in names])
+        return len(rows)
+
+    # -------- executemany fallback --------
+    def _insert_rows(self, rows: List[Dict]) -> int:
+        names = [name for name, _ in INGEST_COLUMNS]
+        self.db.execute(insert(self.table), [{name: row.get(name) for name in names} for row in rows])
+        return len(rows)
+
+    # -------- Index maintenance hints --------
+    def _apply_large_batch_hints(self) -> None:
+        """Transaction-local settings that cut per-row index/WAL overhead for big batches."""
+        if self.db.get_bind().dialect.name != "postgresql":
+            return
+        self.db.execute(text(
+            f"SET LOCAL gin_pending_list_limit = {int(settings.chunk_ingest_gin_pending_list_kb)}"
+        ))
+        self.db.execute(text("SET LOCAL synchronous_commit = off"))
@@ -9,6 +9,7 @@ from app.db_models_documents import Document
 from app.db_models_chat import DocumentChunk, SessionDocument, ChatSession, CollectionDocument, Collection
 from app.db_models import Extraction
 from app.db_models_workflows import WorkflowRun
+from app.core.rag.session_vector_index import get_session_vector_index_cache
 from app.utils.logging import logger
 
 
@@ -174,7 +175,7 @@ class DocumentRepository:
         parser_used: str
     ) -> bool:
         """Mark document as completed."""
-        return self.update_document(
+        updated = self.update_document(
             document_id=document_id,
             status="completed",
             chunk_count=chunk_count,
@@ -182,6 +183,10 @@ class DocumentRepository:
             processing_time_ms=processing_time_ms,
             parser_used=parser_used
         )
+        if updated:
+            # Re-indexed chunks: drop this process's session indexes (others re-check the signature)
+            get_session_vector_index_cache().invalidate_document(document_id)
+        return updated
 
     def update_file_path(self, document_id: str, file_path: str) -> bool:
         """Update document file path."""
@@ -239,6 +244,8 @@ class DocumentRepository:
                         "extractions_preserved": extractions_updated
                     }
                 )
+                # Other processes notice within the index signature TTL
+                get_session_vector_index_cache().invalidate_document(document_id)
                 return True
 
             except SQLAlchemyError as e:
@@ -340,6 +347,39 @@ class DocumentRepository:
                 )
                 return []
 
+    def get_index_versions(self, document_ids: List[str], org_id: Optional[str] = None) -> Dict[str, str]:
+        """Return an index version per fully indexed document.
+
+        The version changes whenever indexing completes again (completed_at is
+        reset), so answer caches keyed on it invalidate on re-index. Documents
+        that are missing (deleted) or not completed are omitted.
+        """
+        if not document_ids:
+            return {}
+        with self._get_session() as db:
+            try:
+                stmt = select(
+                    Document.id,
+                    Document.completed_at,
+                    Document.chunk_count
+                ).where(
+                    Document.id.in_(document_ids),
+                    Document.status == "completed"
+                )
+                if org_id:
+                    stmt = stmt.where(Document.org_id == org_id)
+                result = db.execute(stmt).all()
+                return {
+                    str(row.id): f"{row.completed_at.isoformat() if row.completed_at else ''}:{row.chunk_count or 0}"
+                    for row in result
+                }
+            except SQLAlchemyError as e:
+                logger.error(
+                    "Failed to load document index versions",
+                    extra={"document_ids_count": len(document_ids), "org_id": org_id, "error": str(e)}
+                )
+                return {}
+
     def get_doc_metadata_by_ids(self, document_ids: List[str], org_id: Optional[str] = None) -> List[Dict[str, Optional[str]]]:
         """Return document metadata for a list of IDs."""
         if not document_ids:
@@ -14,6 +14,7 @@ from sqlalchemy import select, func, or_, and_
 from pgvector.sqlalchemy import Vector
 
 from app.db_models_chat import DocumentChunk, CollectionDocument
+from app.core.rag.session_vector_index import session_index_search
 from app.utils.logging import logger
 
 
@@ -85,17 +86,35 @@ class RAGRepository:
             else:
                 raise ValueError("Either collection_id or document_ids must be provided")
 
-            # Apply distance threshold if specified
-            if distance_threshold:
-                query = query.filter(
-                    DocumentChunk.embedding.cosine_distance(embedding) <= distance_threshold
-                )
+            # Small document sets are ranked in the session vector index (None = use pgvector)
+            hits = None if collection_id else session_index_search(
+                self.db, embedding, document_ids, top_k, max_distance=distance_threshold or None
+            )
+
+            if hits is not None:
+                # Load the ranked chunks by primary key, keeping the index order
+                chunks_by_id = {
+                    chunk.id: chunk
+                    for chunk in self.db.execute(
+                        select(DocumentChunk).where(DocumentChunk.id.in_([chunk_id for chunk_id, _ in hits]))
+                    ).scalars()
+                } if hits else {}
+                results = [
+                    (chunks_by_id[chunk_id], 1 - distance)
+                    for chunk_id, distance in hits if chunk_id in chunks_by_id
+                ]
+            else:
+                # Apply distance threshold if specified
+                if distance_threshold:
+                    query = query.filter(
+                        DocumentChunk.embedding.cosine_distance(embedding) <= distance_threshold
+                    )
 
-            # Order by similarity and limit
-            query = query.order_by(func.desc("similarity")).limit(top_k)
+                # Order by similarity and limit
+                query = query.order_by(func.desc("similarity")).limit(top_k)
 
-            # Execute query
-            results = self.db.execute(query).all()
+                # Execute query
+                results = self.db.execute(query).all()
 
             # Convert to dict format
             chunks = []
@@ -112,6 +131,7 @@ class RAGRepository:
                     "section_heading": chunk.section_heading,
                     "is_tabular": chunk.is_tabular,
                     "token_count": chunk.token_count,
+                    "token_truncation_offset": chunk.token_truncation_offset,
                     "chunk_metadata": chunk.chunk_metadata,
                     "similarity": float(similarity),
                     "semantic_rank": len(chunks) + 1  # 1-indexed rank
@@ -220,6 +240,7 @@ class RAGRepository:
                     "section_heading": chunk.section_heading,
                     "is_tabular": chunk.is_tabular,
                     "token_count": chunk.token_count,
+                    "token_truncation_offset": chunk.token_truncation_offset,
                     "chunk_metadata": chunk.chunk_metadata,
                     "bm25_score": float(rank),
                     "keyword_rank": len(chunks) + 1  # 1-indexed rank
@@ -298,6 +319,7 @@ class RAGRepository:
                 "section_heading": chunk.section_heading,
                 "is_tabular": chunk.is_tabular,
                 "token_count": chunk.token_count,
+                "token_truncation_offset": chunk.token_truncation_offset,
                 "chunk_metadata": chunk.chunk_metadata
             }
         except Exception as e:
@@ -348,6 +370,7 @@ class RAGRepository:
                 "section_heading": chunk.section_heading,
                 "is_tabular": chunk.is_tabular,
                 "token_count": chunk.token_count,
+                "token_truncation_offset": chunk.token_truncation_offset,
                 "chunk_metadata": chunk.chunk_metadata
             } for chunk in chunks]
 
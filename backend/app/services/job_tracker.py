@@ -3,16 +3,95 @@
 
 Manages job state updates and persistence.
 Separated from jobs.py API to avoid circular imports with orchestrator services.
+
+Write-behind design:
+ - Each tracker keeps the job's state in memory (one SELECT on first use)
+ - Every visible change is published immediately over the pooled Redis connection
+ - DB writes are coalesced: progress/message changes are persisted at most every
+   settings.job_progress_flush_seconds (inline on the next update, or by a
+   background flusher thread if no update follows); status/stage changes and
+   stage-completion flags are persisted synchronously
+ - The flusher holds trackers with pending writes until they are flushed, so a
+   task's last coalesced update survives the tracker going out of scope;
+   flush_pending_job_progress() also runs at Celery task exit (task_postrun)
+ - Terminal states (mark_error / mark_completed) flush synchronously
+ - Writes are single UPDATE statements (no SELECT + refresh per call)
 """
+import logging
+import os
+import threading
+import time
 from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
+from app.config import settings
 from app.db_models import JobState
 from app.repositories.job_repository import JobRepository
 from app.utils.logging import logger
+from app.utils.metrics import JOB_PROGRESS_UPDATES, JOB_PROGRESS_DB_WRITES
 from app.services.pubsub import publish_event  # lightweight fire-and-forget
 
+_JOB_COLUMNS = set(JobState.__table__.columns.keys())
+_SNAPSHOT_FIELDS = ("status", "current_stage", "progress_percent", "message", "details", "extraction_id")
+
+
+class _WriteBehindFlusher:
+    """Process-wide daemon thread that persists trackers left with pending writes.
+
+    Trackers are held by strong reference until their pending values are written:
+    tasks create short-lived trackers and often return before the timer fires.
+    """
+
+    def __init__(self):
+        self._trackers: "set[JobProgressTracker]" = set()
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+
+    def register(self, tracker: "JobProgressTracker") -> None:
+        with self._lock:
+            # (Re)start after fork: threads do not survive into Celery worker children
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._trackers = set()
+                threading.Thread(target=self._run, name="job-progress-flusher", daemon=True).start()
+            self._trackers.add(tracker)
+
+    def _flush(self, force: bool) -> None:
+        with self._lock:
+            trackers = list(self._trackers)
+        for tracker in trackers:
+            try:
+                if tracker.has_pending() and (force or tracker.flush_due()):
+                    tracker.flush_in_background()
+            except Exception:
+                logger.exception("Background job progress flush failed", extra={"job_id": tracker.job_id})
+            if not tracker.has_pending():
+                with self._lock:
+                    self._trackers.discard(tracker)
+
+    def flush_all(self) -> None:
+        """Persist every registered tracker's pending values now."""
+        if self._pid == os.getpid():
+            self._flush(force=True)
+
+    def _run(self) -> None:
+        interval = max(0.1, settings.job_progress_flush_seconds / 2)
+        while True:
+            time.sleep(interval)
+            self._flush(force=False)
+
+
+_flusher = _WriteBehindFlusher()
+
+
+def flush_pending_job_progress() -> None:
+    """Persist coalesced progress of every tracker in this process (e.g. at task exit)."""
+    _flusher.flush_all()
+
 
 class JobProgressTracker:
     """Manages job state updates and broadcasts progress events"""
@@ -21,21 +100,92 @@ class JobProgressTracker:
         self.db = db
         self.job_id = job_id
         self._listeners = []
-        # Commit throttling state to avoid hammering the DB and blocking event loop
-        self._last_progress_percent: int | None = None
-        self._last_status: str | None = None
-        self._last_stage: str | None = None
-        self._last_commit_monotonic: float = 0.0
-        self._throttle_seconds: float = 0.75  # minimum interval between lightweight progress commits
-        self._min_progress_delta: int = 3     # commit only if progress advanced this much
+        self._snapshot: Optional[Dict[str, Any]] = None  # In-memory job state
+        self._pending: Dict[str, Any] = {}               # Column values not yet written
+        self._last_flush_monotonic: float = time.monotonic()
+        self._flush_interval: float = settings.job_progress_flush_seconds
+        self._lock = threading.RLock()  # Serializes pending swaps and writes (caller vs flusher thread)
+
+    # -------- State --------
+    def _state(self) -> Dict[str, Any]:
+        """In-memory job state, loaded from the database once."""
+        if self._snapshot is None:
+            row = (
+                self.db.query(*(getattr(JobState, f) for f in _SNAPSHOT_FIELDS))
+                .filter(JobState.job_id == self.job_id)
+                .first()
+            )
+            if not row:
+                raise HTTPException(status_code=404, detail=f"Job {self.job_id} not found")
+            self._snapshot = dict(zip(_SNAPSHOT_FIELDS, row))
+        return self._snapshot
 
     def get_job_state(self) -> JobState:
-        """Get current job state from database using the tracker's session"""
-        job = self.db.query(JobState).filter(JobState.job_id == self.job_id).first()
+        """Get current job state from database using the tracker's session (flushes pending writes first)"""
+        self.flush()
+        job = (
+            self.db.query(JobState)
+            .filter(JobState.job_id == self.job_id)
+            .populate_existing()
+            .first()
+        )
         if not job:
             raise HTTPException(status_code=404, detail=f"Job {self.job_id} not found")
         return job
 
+    # -------- Persistence --------
+    def _write(self, db: Session, values: Dict[str, Any], trigger: str) -> bool:
+        """Persist column values with a single UPDATE; returns False on failure."""
+        values = {**values, "updated_at": datetime.now()}
+        try:
+            result = db.execute(update(JobState).where(JobState.job_id == self.job_id).values(**values))
+            db.commit()
+        except Exception:
+            try:
+                db.rollback()
+            except Exception:
+                pass
+            logger.exception(f"DB write failed for job progress ({trigger}), rolled back", extra={"job_id": self.job_id})
+            return False
+        JOB_PROGRESS_DB_WRITES.labels(trigger=trigger).inc()
+        if result.rowcount == 0:
+            logger.warning(f"Job {self.job_id} not found while persisting progress", extra={"job_id": self.job_id})
+        return True
+
+    def flush(self, trigger: str = "explicit") -> None:
+        """Synchronously persist pending progress using the tracker's session."""
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            if not self._write(self.db, pending, trigger):
+                # Keep the values so a later flush can retry them (newer values win)
+                self._pending = {**pending, **self._pending}
+            self._last_flush_monotonic = time.monotonic()
+
+    def has_pending(self) -> bool:
+        return bool(self._pending)
+
+    def flush_due(self) -> bool:
+        return bool(self._pending) and (time.monotonic() - self._last_flush_monotonic) >= self._flush_interval
+
+    def flush_in_background(self) -> None:
+        """Persist pending progress from the flusher thread (own short-lived session)."""
+        from app.database import SessionLocal
+
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            db = SessionLocal()
+            try:
+                if not self._write(db, pending, "timer"):
+                    self._pending = {**pending, **self._pending}
+            finally:
+                db.close()
+            self._last_flush_monotonic = time.monotonic()
+
+    # -------- Progress --------
     def update_progress(
         self,
         status: str = None,
@@ -45,101 +195,70 @@ class JobProgressTracker:
         details: dict = None,
         **stage_flags
     ):
-        """Update job progress and persist to database"""
-        job = self.get_job_state()
-
-        if status:
-            job.status = status
-        if current_stage:
-            job.current_stage = current_stage
-        if progress_percent is not None:
-            job.progress_percent = progress_percent
-        if message:
-            job.message = message
-        if details:
-            job.details = details
-
-        # Update stage completion flags
-        for flag_name, flag_value in stage_flags.items():
-            if hasattr(job, flag_name):
-                setattr(job, flag_name, flag_value)
-
-        # Decide whether to commit (throttle simple progress updates)
-        import time as _time
-        now = _time.monotonic()
-
-        stage_changed = (current_stage and current_stage != self._last_stage)
-        status_changed = (status and status != self._last_status)
-        progress_changed = (
-            progress_percent is not None and
-            (self._last_progress_percent is None or abs(progress_percent - self._last_progress_percent) >= self._min_progress_delta)
-        )
+        """Update job progress in memory, publish it and persist it (write-behind)"""
+        JOB_PROGRESS_UPDATES.inc()
+        with self._lock:
+            state = self._state()
 
-        # Force commit if stage/status changed or we have flags marking stage completion
-        flags_set = any(stage_flags.values())
-        time_elapsed = (now - self._last_commit_monotonic) >= self._throttle_seconds
+            changes: Dict[str, Any] = {}
+            if status and status != state["status"]:
+                changes["status"] = status
+            if current_stage and current_stage != state["current_stage"]:
+                changes["current_stage"] = current_stage
+            if progress_percent is not None and progress_percent != state["progress_percent"]:
+                changes["progress_percent"] = progress_percent
+            if message and message != state["message"]:
+                changes["message"] = message
+            if details:
+                changes["details"] = details
 
-        should_commit = stage_changed or status_changed or flags_set or progress_changed or time_elapsed
+            # Update stage completion flags
+            flags = {name: value for name, value in stage_flags.items() if name in _JOB_COLUMNS}
 
-        if should_commit:
-            job.updated_at = datetime.now()
-            # Use safe commit to avoid leaving the session in an aborted state
-            try:
-                self.db.commit()
-            except Exception:
-                try:
-                    self.db.rollback()
-                except Exception:
-                    pass
-                logger.exception("DB commit failed during update_progress, rolled back", extra={"job_id": self.job_id})
+            if not changes and not flags:
+                logger.debug(f"Job {self.job_id} progress unchanged", extra={"job_id": self.job_id})
+                return
+
+            state.update({k: v for k, v in changes.items() if k in state})
+            self._pending.update(changes)
+            self._pending.update(flags)
+
+            # Stage/status transitions and completion flags are persisted now; progress is coalesced
+            substantive = "status" in changes or "current_stage" in changes or any(flags.values())
+            if substantive:
+                self.flush(trigger="stage")
+            elif self.flush_due():
+                self.flush(trigger="interval")
             else:
-                # refresh only on substantive change to reduce DB round-trips
-                if stage_changed or status_changed or flags_set:
-                    try:
-                        self.db.refresh(job)
-                    except Exception:
-                        logger.exception("DB refresh failed after commit", extra={"job_id": self.job_id})
-
-            # Update last commit state trackers
-            if progress_percent is not None:
-                self._last_progress_percent = progress_percent
-            if status:
-                self._last_status = status
-            if current_stage:
-                self._last_stage = current_stage
-            self._last_commit_monotonic = now
-
-        if should_commit:
-            logger.info(
-                f"Job {self.job_id} updated: {status or 'progress'} - {message}",
-                extra={
-                    "job_id": self.job_id,
-                    "status": job.status,
-                    "progress": job.progress_percent,
-                    "details": job.details if job.details else {},
-                    "throttled": False
-                }
-            )
-            # Publish progress event (only on commit)
+                _flusher.register(self)
+
+            snapshot = dict(state)
+
+        # Info for stage transitions only; per-item progress would flood the logs
+        logger.log(
+            logging.INFO if substantive else logging.DEBUG,
+            f"Job {self.job_id} updated: {status or 'progress'} - {message}",
+            extra={
+                "job_id": self.job_id,
+                "status": snapshot["status"],
+                "progress": snapshot["progress_percent"],
+                "details": snapshot["details"] or {},
+                "persisted": substantive
+            }
+        )
+        if changes:
+            # Publish every visible change (pooled connection, independent of DB writes)
             try:
                 publish_event(self.job_id, "progress", {
-                    "status": job.status,
-                    "current_stage": job.current_stage,
-                    "progress_percent": job.progress_percent,
-                    "message": job.message,
-                    "details": job.details or {}
+                    "status": snapshot["status"],
+                    "current_stage": snapshot["current_stage"],
+                    "progress_percent": snapshot["progress_percent"],
+                    "message": snapshot["message"],
+                    "details": snapshot["details"] or {}
                 })
             except Exception:
                 # Already logged inside publish_event; no re-raise
                 pass
-        else:
-            logger.debug(f"Job {self.job_id} progress throttled (no commit)", extra={
-                "job_id": self.job_id,
-                "status": job.status,
-                "progress": job.progress_percent,
-                "details": job.details or {},
-                "throttled": True
-            })
 
     def mark_error(
         self,
@@ -148,75 +267,65 @@ class JobProgressTracker:
         error_type: str = "unknown_error",
         is_retryable: bool = True
     ):
-        """Mark job as failed with error details"""
-        job = self.get_job_state()
-        job.status = "failed"
-        job.error_stage = error_stage
-        job.error_message = error_message[:1000]  # Truncate long errors
-        job.error_type = error_type
-        job.is_retryable = is_retryable
-        job.updated_at = datetime.now()
-        try:
-            self.db.commit()
-        except Exception:
-            try:
-                self.db.rollback()
-            except Exception:
-                pass
-            logger.exception("DB commit failed in mark_error, rolled back", extra={"job_id": self.job_id})
-        else:
-            try:
-                self.db.refresh(job)
-            except Exception:
-                logger.exception("DB refresh failed in mark_error", extra={"job_id": self.job_id})
+        """Mark job as failed with error details (flushed synchronously)"""
+        error_message = error_message[:1000]  # Truncate long errors
+        with self._lock:
+            self._pending.update({
+                "status": "failed",
+                "error_stage": error_stage,
+                "error_message": error_message,
+                "error_type": error_type,
+                "is_retryable": is_retryable,
+            })
+            if self._snapshot is not None:
+                self._snapshot["status"] = "failed"
+            self.flush(trigger="terminal")
+            details = (self._snapshot or {}).get("details") or {}
 
         logger.error(f"Job {self.job_id} failed at {error_stage}: {error_message}", extra={
             "job_id": self.job_id,
             "error_stage": error_stage,
             "error_type": error_type,
-            "details": job.details or {}
+            "details": details
         })
         try:
             publish_event(self.job_id, "error", {
-                "stage": job.error_stage,
-                "message": job.error_message,
-                "type": job.error_type,
-                "retryable": job.is_retryable
+                "stage": error_stage,
+                "message": error_message,
+                "type": error_type,
+                "retryable": is_retryable
             })
             publish_event(self.job_id, "end", {"reason": "failed", "job_id": self.job_id})
         except Exception:
             pass
 
     def mark_completed(self):
-        """Mark job as successfully completed"""
-        job = self.get_job_state()
-        job.status = "completed"
-        job.progress_percent = 100
-        job.current_stage = "completed"
-        job.message = "Extraction completed successfully"
-        job.completed_at = datetime.now()
-        job.updated_at = datetime.now()
-        try:
-            self.db.commit()
-        except Exception:
+        """Mark job as successfully completed (flushed synchronously)"""
+        message = "Extraction completed successfully"
+        with self._lock:
             try:
-                self.db.rollback()
-            except Exception:
-                pass
-            logger.exception("DB commit failed in mark_completed, rolled back", extra={"job_id": self.job_id})
-        else:
-            try:
-                self.db.refresh(job)
-            except Exception:
-                logger.exception("DB refresh failed in mark_completed", extra={"job_id": self.job_id})
+                state = self._state()
+            except HTTPException:
+                state = {}
+            now = datetime.now()
+            self._pending.update({
+                "status": "completed",
+                "progress_percent": 100,
+                "current_stage": "completed",
+                "message": message,
+                "completed_at": now,
+            })
+            state.update({"status": "completed", "progress_percent": 100, "current_stage": "completed", "message": message})
+            self.flush(trigger="terminal")
+            extraction_id = state.get("extraction_id")
 
         logger.info(f"Job {self.job_id} completed successfully", extra={
             "job_id": self.job_id
         })
         try:
             publish_event(self.job_id, "complete", {
-                "message": job.message or "Extraction completed successfully",
-                "extraction_id": job.extraction_id
+                "message": message,
+                "extraction_id": extraction_id
             })
             publish_event(self.job_id, "end", {"reason": "completed", "job_id": self.job_id})
         except Exception:
@@ -228,8 +337,6 @@ class JobProgressTracker:
         file_path: str
     ):
         """Save path to intermediate result for resume capability"""
-        job = self.get_job_state()
-
         path_mapping = {
             "parsing": "parsed_output_path",
             "chunking": "chunks_path",
@@ -238,16 +345,10 @@ class JobProgressTracker:
         }
 
         if stage in path_mapping:
-            setattr(job, path_mapping[stage], file_path)
-            job.updated_at = datetime.now()
-            try:
-                self.db.commit()
-            except Exception:
-                try:
-                    self.db.rollback()
-                except Exception:
-                    pass
-                logger.exception("DB commit failed in save_intermediate_result, rolled back", extra={"job_id": self.job_id})
+            with self._lock:
+                self._pending[path_mapping[stage]] = file_path
+                self.flush(trigger="stage")
+                state = dict(self._snapshot or {})
 
             logger.info(f"Saved {stage} result to {file_path}", extra={
                 "job_id": self.job_id,
@@ -256,9 +357,9 @@ class JobProgressTracker:
             # Optional: publish intermediate artifact path for frontend debugging (not consumed yet)
             try:
                 publish_event(self.job_id, "progress", {
-                    "status": job.status,
+                    "status": state.get("status"),
                     "current_stage": stage,
-                    "progress_percent": job.progress_percent,
+                    "progress_percent": state.get("progress_percent"),
                     "message": f"Saved {stage} result",
                     "details": {"artifact_path": file_path}
                 })
@@ -0,0 +1,131 @@
+# backend/app/services/model_registry.py
+"""
+Process-wide model registry.
+
+Heavy models (embedding model, cross-encoder, LLMLingua-2 compressor) are
+loaded once per process and shared by every caller. Celery workers used to
+build a fresh Reranker on every prepare_context_task and reload LLMLingua on
+every direct-mode workflow run; they now warm the registry in a
+worker_process_init hook (see app/celery_app.py) and tasks reuse the instances.
+
+Each load records:
+    - model_load_seconds (label: model)
+    - model_loads_total (label: model)
+    - model_memory_bytes (label: model, process RSS growth during the load)
+"""
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List
+
+from app.config import settings
+from app.utils.logging import logger
+
+EMBEDDER = "embedder"
+RERANKER = "reranker"
+COMPRESSOR = "compressor"
+
+_models: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def _rss_bytes() -> int:
+    """Current resident set size of this process (0 if unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        pass
+    try:
+        import resource
+        # Peak RSS (KiB on Linux); only a rough fallback on non-procfs platforms
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except Exception:
+        return 0
+
+
+def get_model(name: str, factory: Callable[[], Any]) -> Any:
+    """
+    Return the registered model, loading it with factory on first use (thread-safe).
+
+    Args:
+        name: Registry key (also the metrics label)
+        factory: Zero-arg callable that loads the model
+    """
+    model = _models.get(name)
+    if model is not None:
+        return model
+
+    with _lock:
+        model = _models.get(name)
+        if model is None:
+            from app.utils.metrics import MODEL_LOAD_SECONDS, MODEL_LOADS_TOTAL, MODEL_MEMORY_BYTES
+
+            rss_before = _rss_bytes()
+            start = time.perf_counter()
+            model = factory()
+            elapsed = time.perf_counter() - start
+            rss_delta = max(0, _rss_bytes() - rss_before)
+
+            MODEL_LOAD_SECONDS.labels(model=name).observe(elapsed)
+            MODEL_LOADS_TOTAL.labels(model=name).inc()
+            MODEL_MEMORY_BYTES.labels(model=name).set(rss_delta)
+            _models[name] = model
+            logger.info(
+                f"Model loaded: {name}",
+                extra={"model": name, "load_seconds": round(elapsed, 2), "rss_delta_mb": round(rss_delta / 1e6, 1)}
+            )
+    return model
+
+
+def get_embedder():
+    """Shared embedding provider."""
+    from app.core.embeddings import get_embedding_provider
+    return get_model(EMBEDDER, get_embedding_provider)
+
+
+def get_reranker():
+    """Shared cross-encoder Reranker (loaded regardless of settings.rag_use_reranker)."""
+    from app.core.rag.reranker import Reranker
+    return get_model(RERANKER, Reranker)
+
+
+def get_chunk_compressor():
+    """Shared ChunkCompressor (LLMLingua-2 loaded once when compression is enabled)."""
+    from app.core.rag.chunk_compressor import ChunkCompressor
+    return get_model(COMPRESSOR, ChunkCompressor)
+
+
+_LOADERS: Dict[str, Callable[[], Any]] = {
+    EMBEDDER: get_embedder,
+    RERANKER: get_reranker,
+    COMPRESSOR: get_chunk_compressor,
+}
+
+
+def warm_models(names: Iterable[str]) -> List[str]:
+    """
+    Load the named models now; failures are logged and skipped.
+
+    Returns:
+        Names that are loaded after the call
+    """
+    loaded = []
+    for name in names:
+        name = name.strip()
+        if not name:
+            continue
+        loader = _LOADERS.get(name)
+        if loader is None:
+            logger.warning(f"Unknown model in warm-up list: {name}")
+            continue
+        if name == RERANKER and not settings.rag_use_reranker:
+            continue
+        if name == COMPRESSOR and not settings.rag_use_compression:
+            continue
+        try:
+            loader()
+            loaded.append(name)
+        except Exception as e:
+            logger.error(f"Model warm-up failed for {name}: {e}", exc_info=True)
+    return loaded
@@ -4,6 +4,7 @@ Design goals:
  - Decouple persistence (database) from streaming delivery (SSE)
  - Provide lightweight, fire-and-forget publishing from task/Tracker code
  - Avoid blocking the event loop if Redis is slow/unavailable
+ - Reuse pooled connections (progress events are published on every update)
  - Offer defensive fallbacks: silent failure on publish, optional health check
 
 Message schema (JSON string published to Redis channel):
@@ -18,6 +19,7 @@ Consumers (SSE endpoint) subscribe to channel and forward each message as SSE ev
 """
 from __future__ import annotations
 import json
+import threading
 from typing import Any, Dict
 from functools import lru_cache
 from urllib.parse import urlparse
@@ -42,8 +44,23 @@ def _get_connection_params() -> Dict[str, Any]:
     return {"host": host, "port": port, "db": db, "decode_responses": True}
 
 
+_pool: redis.ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> redis.ConnectionPool:
+    """Process-wide connection pool (redis-py resets it in forked children)."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = redis.ConnectionPool(**_get_connection_params())
+    return _pool
+
+
 def get_redis() -> redis.Redis:
-    return redis.Redis(**_get_connection_params())
+    """Redis client over the shared pool (publishing no longer opens a connection per event)."""
+    return redis.Redis(connection_pool=_get_pool())
 
 
 def publish_event(job_id: str, event: str, payload: Dict[str, Any]) -> None:
@@ -58,7 +75,7 @@ def publish_event(job_id: str, event: str, payload: Dict[str, Any]) -> None:
     try:
         redis_client = get_redis()
         redis_client.publish(channel, json.dumps(message))
-        logger.info(f"✅ Published pubsub event: {event}", extra={"job_id": job_id, "event": event, "channel": channel})
+        logger.debug(f"✅ Published pubsub event: {event}", extra={"job_id": job_id, "event": event, "channel": channel})
     except Exception as e:
         logger.warning(f"❌ Redis publish failed: {event}", extra={"job_id": job_id, "event": event, "error": str(e)})
 
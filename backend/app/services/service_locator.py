@@ -2,20 +2,11 @@
 
 from app.core.rag.reranker import Reranker  # Use NEW reranker (supports QueryUnderstanding)
 from app.config import settings
-from app.utils.logging import logger
+from app.services import model_registry
 
-_reranker: Reranker | None = None
 
 def get_reranker() -> Reranker | None:
-    """Get or create global reranker instance."""
-    global _reranker
-    
+    """Get the process-wide reranker instance (None when re-ranking is disabled)."""
     if not settings.rag_use_reranker:
         return None
-    
-    if _reranker is None:
-        logger.info("Initializing reranker (one-time load)...")
-        _reranker = Reranker()
-        logger.info("Reranker ready")
-    
-    return _reranker
\ No newline at end of file
+    return model_registry.get_reranker()
@@ -26,6 +26,7 @@ from app.verticals.private_equity.extraction.tasks import (
 from app.services.tasks.document_processor import (
     embed_chunks_task,
     store_vectors_task,
+    stream_index_document_task,
 )
 from app.verticals.private_equity.workflows.tasks import (
     prepare_context_task,
@@ -44,6 +45,7 @@ __all__ = [
     "extract_structured_task",
     "embed_chunks_task",
     "store_vectors_task",
+    "stream_index_document_task",
     "prepare_context_task",
     "generate_artifact_task",
 ]
@@ -2,39 +2,284 @@
 """Celery tasks for Document indexing pipeline (Library uploads).
 
 Pipeline: Parse → Chunk → Embed → Store
+Streaming mode: Parse → (Chunk → Embed → Store in rolling, committed batches)
 
 This pipeline is ONLY for document uploads to the Library.
 It does NOT handle extraction logic (that's in tasks/extractions/).
 """
 from __future__ import annotations
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, List
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import json
-import asyncio
 import os
+import uuid
 from pathlib import Path
 
+import numpy as np
+
 from celery import shared_task, chain
 from sqlalchemy.sql import func
 
 from app.database import get_db
 from app.services.job_tracker import JobProgressTracker
 from app.core.embeddings import get_embedding_provider
-from app.core.parsers import ParserFactory
+from app.core.parsers.output_cache import parse_with_cache
 from app.core.chunkers import ChunkerFactory
 from app.repositories.collection_repository import CollectionRepository
 from app.repositories.document_repository import DocumentRepository
+from app.repositories.chunk_ingest_repository import ChunkIngestRepository
 from app.db_models_chat import DocumentChunk
 from app.utils.logging import logger
 from app.utils.pdf_utils import detect_pdf_type
 from app.utils.file_utils import save_raw_text, save_chunks
+from app.utils.token_utils import token_stats
 from app.config import settings
 from app.core.storage.storage_factory import get_storage_backend
+from app.core.storage.artifact_store import get_artifact_store
 
 
 def _get_db_session():
     return next(get_db())
 
 
+def _load_parser_output(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Parser output with text/metadata resolved from its artifact (inline payloads still accepted)."""
+    parser_output = dict(payload.get("parser_output", {}))
+    if payload.get("parser_output_ref"):
+        parser_output.update(get_artifact_store().get_msgpack(payload["parser_output_ref"]))
+    return parser_output
+
+
+def _load_chunks(payload: Dict[str, Any]) -> list:
+    """Chunk dicts from the chunks artifact (inline payloads still accepted)."""
+    if payload.get("chunks_ref"):
+        return get_artifact_store().get_msgpack(payload["chunks_ref"])
+    return payload.get("chunks", [])
+
+
+def _load_embeddings(payload: Dict[str, Any]):
+    """Embedding matrix (float32 rows) from the embeddings artifact (inline payloads still accepted)."""
+    if payload.get("embeddings_ref"):
+        return get_artifact_store().get_array(payload["embeddings_ref"])
+    return payload.get("embeddings", [])
+
+
+def _to_parser_output(parser_output: Dict[str, Any]):
+    """Convert a parser_output dict back to a ParserOutput object (chunkers expect attributes)."""
+    from app.core.parsers.base import ParserOutput
+    return ParserOutput(
+        text=parser_output["text"],
+        page_count=parser_output["page_count"],
+        parser_name=parser_output["parser_name"],
+        parser_version=parser_output.get("parser_version", "1.0.0"),
+        processing_time_ms=parser_output.get("processing_time_ms", 0),
+        cost_usd=parser_output.get("cost_usd", 0.0),
+        metadata=parser_output.get("metadata", {})
+    )
+
+
+def _chunk_to_dict(chunk) -> Dict[str, Any]:
+    """Convert a Chunk dataclass (or chunk-like object) to a plain dict."""
+    from dataclasses import asdict, is_dataclass
+    if is_dataclass(chunk):
+        return asdict(chunk)
+    if isinstance(chunk, dict):
+        return chunk
+    # Fallback: try to convert to dict manually
+    return {
+        'chunk_id': getattr(chunk, 'chunk_id', ''),
+        'text': getattr(chunk, 'text', ''),
+        'metadata': getattr(chunk, 'metadata', {}),
+        'narrative_text': getattr(chunk, 'narrative_text', None),
+        'tables': getattr(chunk, 'tables', None),
+    }
+
+
+# Chunk metadata fields copied into the chunk_metadata JSONB column
+SMART_METADATA_FIELDS = [
+    "section_id", "parent_chunk_id", "sibling_chunk_ids",
+    "linked_narrative_id", "linked_table_ids",
+    "is_continuation", "chunk_sequence", "total_chunks_in_section",
+    "heading_hierarchy", "paragraph_roles", "page_range",
+    "table_caption", "table_context", "table_row_count", "table_column_count",
+    "figure_id", "figure_caption", "has_figures", "content_type",
+    # Citation metadata fields
+    "document_filename", "document_title", "page_label",
+    "first_sentence", "content_summary", "bbox", "source_url",
+    # Key-value pairs and table data for template filling
+    "key_value_pairs", "total_kv_pairs",  # Azure DI KV pairs
+    "column_headers", "table_data", "table_name",  # Table metadata
+    "chunk_type", "source_parser"  # Additional metadata
+]
+
+
+def _build_chunk_row(
+    chunk: Dict[str, Any],
+    embedding,
+    chunk_index: int,
+    document_id: str,
+    document_filename: str,
+    embedding_model: str | None
+) -> Dict[str, Any]:
+    """Build a document_chunks row dict (citation metadata, JSONB fields, token stats) from a chunk dict."""
+    metadata = chunk.get("metadata", {})
+
+    # Inject citation metadata if not already present
+    if "document_filename" not in metadata:
+        metadata["document_filename"] = document_filename
+
+    # Extract first sentence for citation snippet (if not already set)
+    if "first_sentence" not in metadata and chunk.get("text"):
+        text = chunk["text"]
+        # Simple sentence extraction (split on period, take first)
+        sentences = text.split('.')
+        if sentences:
+            first_sentence = sentences[0].strip() + '.' if len(sentences) > 1 else sentences[0].strip()
+            # Limit to 200 chars
+            metadata["first_sentence"] = first_sentence[:200]
+
+    # Build chunk_metadata dict (only include fields that exist)
+    chunk_metadata = {
+        key: metadata[key]
+        for key in SMART_METADATA_FIELDS
+        if key in metadata
+    }
+
+    # JSONB fields are stored as serialized JSON (same format as rows written by the
+    # previous bulk_save_objects path; readers accept both strings and dicts)
+    tables_data = chunk.get("tables", [])
+    tables_json = json.dumps(tables_data) if tables_data else None
+
+    chunk_metadata_json = json.dumps(chunk_metadata) if chunk_metadata else None
+
+    # Tokenize once here so retrieval hot paths never re-encode this chunk
+    token_count, truncation_offset = token_stats(chunk["text"])
+
+    return dict(
+        id=str(uuid.uuid4()),  # COPY bypasses the ORM default
+        document_id=document_id,
+        text=chunk["text"],
+        narrative_text=chunk.get("narrative_text", ""),
+        tables=tables_json,  # JSON string for JSONB column
+        chunk_index=chunk_index,
+        embedding=embedding,
+        embedding_model=embedding_model,
+        embedding_version="1.0",  # Version for future migration tracking
+        page_number=metadata.get("page_number"),
+        section_type=metadata.get("section_type"),
+        section_heading=metadata.get("section_heading"),
+        is_tabular=metadata.get("has_tables", False),
+        token_count=token_count,
+        token_truncation_offset=truncation_offset,
+        chunk_metadata=chunk_metadata_json  # JSON string for JSONB column
+    )
+
+
+def _finalize_indexed_document(payload: Dict[str, Any], chunk_count: int) -> None:
+    """Mark the canonical Document completed and recompute its collection's stats."""
+    document_id = payload["document_id"]
+    collection_id = payload["collection_id"]
+
+    # Update canonical Document status and stats
+    doc_repo = DocumentRepository()
+    parser_info = payload.get("parser_output", {})
+    page_count = parser_info.get("page_count", 0)
+    processing_time_ms = parser_info.get("processing_time_ms", 0)
+    parser_used = parser_info.get("parser_name", "unknown")
+
+    doc_updated = doc_repo.mark_completed(
+        document_id=document_id,
+        chunk_count=chunk_count,
+        page_count=page_count,
+        processing_time_ms=processing_time_ms,
+        parser_used=parser_used
+    )
+
+    if not doc_updated:
+        logger.warning(
+            f"Failed to update document status for {document_id}",
+            extra={"document_id": document_id, "collection_id": collection_id}
+        )
+
+    # Update Collection stats using database aggregate functions
+    # This recomputes document_count and total_chunks from the database,
+    # ensuring accuracy and preventing race conditions from concurrent operations
+    collection_repo = CollectionRepository()
+    stats_updated = collection_repo.recompute_collection_stats(
+        collection_id=collection_id,
+        embedding_model=payload.get("embedding_model"),
+        embedding_dimension=payload.get("embedding_dimension")
+    )
+
+    if not stats_updated:
+        # Collection might have been deleted during indexing (edge case)
+        logger.warning(
+            f"Failed to recompute collection stats - collection may have been deleted",
+            extra={"collection_id": collection_id, "document_id": document_id}
+        )
+
+
+def _batched(items: Iterable, size: int) -> Iterator[List]:
+    """Yield lists of up to `size` items from an iterable."""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _store_chunk_batch(
+    document_id: str,
+    document_filename: str,
+    embedding_model: str | None,
+    chunks: List[Dict[str, Any]],
+    embeddings,
+    start_index: int
+) -> int:
+    """Insert one batch of chunks in its own session and commit it (runs on the storage thread)."""
+    db = _get_db_session()
+    try:
+        db_chunks = [
+            _build_chunk_row(chunk, embedding, start_index + offset, document_id, document_filename, embedding_model)
+            for offset, (chunk, embedding) in enumerate(zip(chunks, embeddings))
+        ]
+        ChunkIngestRepository(db).bulk_insert(db_chunks)
+        db.commit()
+        return len(db_chunks)
+    except Exception as bulk_error:
+        db.rollback()
+        logger.error(
+            f"Batch insert failed: {bulk_error}",
+            extra={"document_id": document_id, "start_index": start_index, "chunks_count": len(chunks)}
+        )
+        raise ValueError(f"Failed to insert chunk batch at {start_index}: {str(bulk_error)}")
+    finally:
+        db.close()
+
+
+def _delete_document_chunks(document_id: str) -> int:
+    """Remove all chunks of a document (restart/cleanup for streaming indexing)."""
+    db = _get_db_session()
+    try:
+        deleted = db.query(DocumentChunk).filter(
+            DocumentChunk.document_id == document_id
+        ).delete(synchronize_session=False)
+        db.commit()
+        return deleted
+    finally:
+        db.close()
+
+
+def _chunk_last_page(chunk: Dict[str, Any]) -> int | None:
+    metadata = chunk.get("metadata") or {}
+    page_range = metadata.get("page_range")
+    if isinstance(page_range, (list, tuple)) and page_range:
+        return page_range[-1]
+    return metadata.get("page_number")
+
+
 # ============================================================================
 # DOCUMENT INDEXING TASKS (Library Upload Pipeline)
 # ============================================================================
@@ -55,7 +300,8 @@ def parse_document_for_indexing_task(self, payload: Dict[str, Any]) -> Dict[str,
     Output payload:
         - All input fields
         - pdf_type: "digital" or "scanned"
-        - parser_output: Parser output with text and metadata
+        - parser_output: Parser stats (page_count, parser_name, timing, cost)
+        - parser_output_ref: Artifact reference holding text and metadata
     """
     job_id = payload["job_id"]
     document_id = payload["document_id"]
@@ -76,39 +322,43 @@ def parse_document_for_indexing_task(self, payload: Dict[str, Any]) -> Dict[str,
             message="Parsing document..."
         )
 
-        # Download from storage if needed (file_path is storage key, not local path)
-        if not Path(file_path).exists():
-            storage = get_storage_backend()
-            local_file_path = f"/tmp/doc_{document_id}_{filename}"
-
-            logger.info(
-                f"Downloading document from storage",
-                extra={"storage_key": file_path, "local_path": local_file_path}
-            )
+        def _ensure_local_file() -> str:
+            """Download from storage if needed (file_path is storage key, not local path)."""
+            nonlocal local_file_path
+            if Path(file_path).exists():
+                return file_path
+            if local_file_path is None:
+                storage = get_storage_backend()
+                local_file_path = f"/tmp/doc_{document_id}_{filename}"
 
-            storage.download(file_path, local_file_path)
-            file_path = local_file_path  # Use local path for processing
-
-        # Detect PDF type
-        pdf_type = detect_pdf_type(file_path)
-        tracker.update_progress(
-            progress_percent=8,
-            message=f"Detected {pdf_type} PDF"
-        )
+                logger.info(
+                    f"Downloading document from storage",
+                    extra={"storage_key": file_path, "local_path": local_file_path}
+                )
 
-        # Get parser
-        parser = ParserFactory.get_parser(settings.force_user_tier or "free", pdf_type)
-        if not parser:
-            raise ValueError("No parser available for detected PDF type")
+                storage.download(file_path, local_file_path)
+            return local_file_path  # Use local path for processing
 
-        logger.info(
-            f"Parsing document for indexing: {filename}",
-            extra={"document_id": document_id, "job_id": job_id, "pdf_type": pdf_type}
+        def _detect_pdf_type(path: str) -> str:
+            pdf_type = detect_pdf_type(path)
+            tracker.update_progress(
+                progress_percent=8,
+                message=f"Detected {pdf_type} PDF"
+            )
+            logger.info(
+                f"Parsing document for indexing: {filename}",
+                extra={"document_id": document_id, "job_id": job_id, "pdf_type": pdf_type}
+            )
+            return pdf_type
+
+        # Identical files (same SHA256) reuse a cached parser output: no download, detection or parse
+        parser_output, pdf_type = parse_with_cache(
+            content_hash=payload.get("content_hash"),
+            tier=settings.force_user_tier or "free",
+            ensure_local_file=_ensure_local_file,
+            detect_pdf_type=_detect_pdf_type,
         )
 
-        # Run async parser
-        parser_output = asyncio.run(parser.parse(file_path, pdf_type))
-
         # Save raw text for debugging
         save_raw_text(document_id, parser_output.text, filename)
 
@@ -123,18 +373,23 @@ def parse_document_for_indexing_task(self, payload: Dict[str, Any]) -> Dict[str,
             extra={"document_id": document_id, "parser": parser_output.parser_name}
         )
 
+        # Large fields go to the artifact store; only the pointer travels through the broker
+        parser_output_ref = get_artifact_store().put_msgpack(job_id, "parser_output", {
+            "text": parser_output.text,
+            "metadata": parser_output.metadata,
+        })
+
         return {
             **payload,
             "pdf_type": pdf_type,
             "parser_output": {
-                "text": parser_output.text,
                 "page_count": parser_output.page_count,
                 "parser_name": parser_output.parser_name,
                 "parser_version": parser_output.parser_version,
                 "processing_time_ms": parser_output.processing_time_ms,
                 "cost_usd": parser_output.cost_usd,
-                "metadata": parser_output.metadata,
             },
+            "parser_output_ref": parser_output_ref,
         }
 
     except Exception as e:
@@ -174,17 +429,17 @@ def chunk_document_for_indexing_task(self, payload: Dict[str, Any]) -> Dict[str,
     Chunk document for library indexing.
 
     Input payload:
-        - parser_output: Parser output from previous task
+        - parser_output / parser_output_ref: Parser output from previous task
         - job_id: JobState ID
         - document_id: Document ID
 
     Output payload:
         - All input fields
-        - chunks: List of chunks with metadata
+        - chunks_ref: Artifact reference holding the list of chunks with metadata
+        - chunks_count: Number of chunks
     """
     job_id = payload["job_id"]
     document_id = payload["document_id"]
-    parser_output = payload.get("parser_output", {})
 
     db = _get_db_session()
     tracker = JobProgressTracker(db, job_id)
@@ -198,6 +453,8 @@ def chunk_document_for_indexing_task(self, payload: Dict[str, Any]) -> Dict[str,
             message="Chunking document..."
         )
 
+        parser_output = _load_parser_output(payload)
+
         # Get chunker based on parser type
         parser_name = parser_output.get("parser_name", "unknown")
         chunker = ChunkerFactory.get_chunker(parser_name)
@@ -209,40 +466,16 @@ def chunk_document_for_indexing_task(self, payload: Dict[str, Any]) -> Dict[str,
 
         # Convert parser_output dict back to ParserOutput object for chunker compatibility
         # The chunker expects an object with attributes, not a dict
-        from app.core.parsers.base import ParserOutput
-        parser_output_obj = ParserOutput(
-            text=parser_output["text"],
-            page_count=parser_output["page_count"],
-            parser_name=parser_output["parser_name"],
-            parser_version=parser_output.get("parser_version", "1.0.0"),
-            processing_time_ms=parser_output.get("processing_time_ms", 0),
-            cost_usd=parser_output.get("cost_usd", 0.0),
-            metadata=parser_output.get("metadata", {})
-        )
+        parser_output_obj = _to_parser_output(parser_output)
 
         # Chunk the document
         chunking_output = chunker.chunk(parser_output_obj)
 
-        # Convert ChunkingOutput object to list of chunk dicts for JSON serialization
+        # Convert ChunkingOutput object to list of chunk dicts for serialization
         chunks_raw = chunking_output.chunks if hasattr(chunking_output, 'chunks') else chunking_output
 
-        # Convert Chunk dataclass objects to plain dicts for Celery serialization
-        from dataclasses import asdict, is_dataclass
-        chunks_list = []
-        for chunk in chunks_raw:
-            if is_dataclass(chunk):
-                chunks_list.append(asdict(chunk))
-            elif isinstance(chunk, dict):
-                chunks_list.append(chunk)
-            else:
-                # Fallback: try to convert to dict manually
-                chunks_list.append({
-                    'chunk_id': getattr(chunk, 'chunk_id', ''),
-                    'text': getattr(chunk, 'text', ''),
-                    'metadata': getattr(chunk, 'metadata', {}),
-                    'narrative_text': getattr(chunk, 'narrative_text', None),
-                    'tables': getattr(chunk, 'tables', None),
-                })
+        # Convert Chunk dataclass objects to plain dicts for the chunks artifact
+        chunks_list = [_chunk_to_dict(chunk) for chunk in chunks_raw]
 
         # Save chunks for debugging
         try:
@@ -262,9 +495,12 @@ def chunk_document_for_indexing_task(self, payload: Dict[str, Any]) -> Dict[str,
             extra={"document_id": document_id, "chunker": chunker.__class__.__name__}
         )
 
+        chunks_ref = get_artifact_store().put_msgpack(job_id, "chunks", chunks_list)
+
         return {
             **payload,
-            "chunks": chunks_list,
+            "chunks_ref": chunks_ref,
+            "chunks_count": len(chunks_list),
         }
 
     except Exception as e:
@@ -289,13 +525,13 @@ def embed_chunks_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
     Generate embeddings for document chunks (Document indexing pipeline).
 
     Input payload:
-        - chunks: List of chunks from chunk_document_task
+        - chunks_ref: Chunks artifact from chunk_document_for_indexing_task
         - job_id: JobState ID for progress tracking
         - document_id: Canonical Document ID (from documents table)
 
     Output payload:
         - All input fields
-        - embeddings: List of embedding vectors
+        - embeddings_ref: Artifact reference holding the float32 embedding matrix
         - embedding_model: Model name used
         - embedding_dimension: Vector dimension
     """
@@ -313,17 +549,17 @@ def embed_chunks_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
             message="Generating embeddings..."
         )
 
-        chunks = payload.get("chunks", [])
+        chunks = _load_chunks(payload)
         if not chunks:
             tracker.update_progress(
                 progress_percent=50,
                 message="No chunks to embed",
                 details={"chunks_count": 0}
             )
-            return {**payload, "embeddings": []}
+            return {**payload, "embeddings_ref": None}
 
-        # Initialize embedding provider
-        embedder = get_embedding_provider()
+        # Initialize embedding provider (uncached: chunk texts are unique, keep the query cache warm)
+        embedder = get_embedding_provider().uncached
         logger.info(
             f"Embedding {len(chunks)} chunks using {embedder.provider_name} ({embedder.model_name})",
             extra={"job_id": job_id, "document_id": document_id}
@@ -358,9 +594,11 @@ def embed_chunks_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
             }
         )
 
+        embeddings_ref = get_artifact_store().put_array(job_id, "embeddings", np.asarray(all_embeddings, dtype=np.float32))
+
         return {
             **payload,
-            "embeddings": all_embeddings,
+            "embeddings_ref": embeddings_ref,
             "embedding_model": embedder.model_name,
             "embedding_dimension": embedder.get_dimension()
         }
@@ -394,8 +632,8 @@ def store_vectors_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
     Creates DocumentChunk records with pgvector embeddings for semantic search.
 
     Input payload:
-        - chunks: List of chunks
-        - embeddings: List of embedding vectors
+        - chunks_ref: Chunks artifact
+        - embeddings_ref: Embedding matrix artifact
         - job_id: JobState ID
         - document_id: Canonical Document ID (from documents table)
         - collection_id: Collection ID
@@ -420,8 +658,8 @@ def store_vectors_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
             message="Storing vectors in database..."
         )
 
-        chunks = payload.get("chunks", [])
-        embeddings = payload.get("embeddings", [])
+        chunks = _load_chunks(payload)
+        embeddings = _load_embeddings(payload)
         embedding_dimension = payload.get("embedding_dimension")
 
         # Validate inputs
@@ -432,8 +670,8 @@ def store_vectors_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
             raise ValueError("No chunks to store")
 
         # Validate embedding dimensions if provided
-        if embeddings and embedding_dimension:
-            actual_dim = len(embeddings[0]) if embeddings[0] else 0
+        if len(embeddings) and embedding_dimension:
+            actual_dim = len(embeddings[0])
             if actual_dim != embedding_dimension:
                 logger.warning(
                     f"Embedding dimension mismatch: expected {embedding_dimension}, got {actual_dim}",
@@ -449,75 +687,13 @@ def store_vectors_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         embedding_model = payload.get("embedding_model")
         db_chunks = []
         for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-            metadata = chunk.get("metadata", {})
-
-            # Inject citation metadata if not already present
-            if "document_filename" not in metadata:
-                metadata["document_filename"] = document_filename
-
-            # Extract first sentence for citation snippet (if not already set)
-            if "first_sentence" not in metadata and chunk.get("text"):
-                text = chunk["text"]
-                # Simple sentence extraction (split on period, take first)
-                sentences = text.split('.')
-                if sentences:
-                    first_sentence = sentences[0].strip() + '.' if len(sentences) > 1 else sentences[0].strip()
-                    # Limit to 200 chars
-                    metadata["first_sentence"] = first_sentence[:200]
-
-            # Extract smart chunking metadata fields
-            # These fields go into the chunk_metadata JSONB column
-            smart_metadata_fields = [
-                "section_id", "parent_chunk_id", "sibling_chunk_ids",
-                "linked_narrative_id", "linked_table_ids",
-                "is_continuation", "chunk_sequence", "total_chunks_in_section",
-                "heading_hierarchy", "paragraph_roles", "page_range",
-                "table_caption", "table_context", "table_row_count", "table_column_count",
-                "figure_id", "figure_caption", "has_figures", "content_type",
-                # Citation metadata fields
-                "document_filename", "document_title", "page_label",
-                "first_sentence", "content_summary", "bbox", "source_url",
-                # Key-value pairs and table data for template filling
-                "key_value_pairs", "total_kv_pairs",  # Azure DI KV pairs
-                "column_headers", "table_data", "table_name",  # Table metadata
-                "chunk_type", "source_parser"  # Additional metadata
-            ]
-
-            # Build chunk_metadata dict (only include fields that exist)
-            chunk_metadata = {
-                key: metadata[key]
-                for key in smart_metadata_fields
-                if key in metadata
-            }
-
-            # Serialize JSONB fields for bulk_save_objects compatibility
-            # bulk_save_objects() bypasses ORM type conversion, so we must manually serialize dicts/lists to JSON
-            tables_data = chunk.get("tables", [])
-            tables_json = json.dumps(tables_data) if tables_data else None
+            db_chunks.append(_build_chunk_row(
+                chunk, embedding, i, document_id, document_filename, embedding_model
+            ))
 
-            chunk_metadata_json = json.dumps(chunk_metadata) if chunk_metadata else None
-
-            db_chunk = DocumentChunk(
-                document_id=document_id,
-                text=chunk["text"],
-                narrative_text=chunk.get("narrative_text", ""),
-                tables=tables_json,  # JSON string for JSONB column
-                chunk_index=i,
-                embedding=embedding,
-                embedding_model=embedding_model,
-                embedding_version="1.0",  # Version for future migration tracking
-                page_number=metadata.get("page_number"),
-                section_type=metadata.get("section_type"),
-                section_heading=metadata.get("section_heading"),
-                is_tabular=metadata.get("has_tables", False),
-                token_count=metadata.get("token_count") or len(chunk["text"].split()),  # Use actual token count if available
-                chunk_metadata=chunk_metadata_json  # JSON string for JSONB column
-            )
-            db_chunks.append(db_chunk)
-
-        # Bulk insert chunks with error handling
+        # Bulk insert chunks (binary COPY) with error handling
         try:
-            db.bulk_save_objects(db_chunks)
+            ChunkIngestRepository(db).bulk_insert(db_chunks)
             db.commit()
             logger.info(
                 f"Successfully bulk inserted {len(db_chunks)} chunks",
@@ -531,53 +707,180 @@ def store_vectors_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
             )
             raise ValueError(f"Failed to bulk insert chunks: {str(bulk_error)}")
 
-        # Update canonical Document status and stats
-        doc_repo = DocumentRepository()
-        parser_info = payload.get("parser_output", {})
-        page_count = parser_info.get("page_count", 0)
-        processing_time_ms = parser_info.get("processing_time_ms", 0)
-        parser_used = parser_info.get("parser_name", "unknown")
+        _finalize_indexed_document(payload, len(db_chunks))
 
-        doc_updated = doc_repo.mark_completed(
-            document_id=document_id,
-            chunk_count=len(db_chunks),
-            page_count=page_count,
-            processing_time_ms=processing_time_ms,
-            parser_used=parser_used
+        tracker.update_progress(
+            progress_percent=95,
+            message="Vectors stored successfully"
         )
 
-        if not doc_updated:
-            logger.warning(
-                f"Failed to update document status for {document_id}",
-                extra={"document_id": document_id, "collection_id": collection_id}
+        tracker.mark_completed()
+
+        # Intermediate artifacts are no longer needed once vectors are in Postgres
+        get_artifact_store().delete([
+            payload.get("parser_output_ref"),
+            payload.get("chunks_ref"),
+            payload.get("embeddings_ref"),
+        ])
+
+        logger.info(
+            f"Stored {len(db_chunks)} chunks with embeddings for document {document_id}",
+            extra={"job_id": job_id, "collection_id": collection_id}
+        )
+
+        return {
+            "status": "completed",
+            "document_id": document_id,
+            "collection_id": collection_id,
+            "chunks_stored": len(db_chunks)
+        }
+
+    except Exception as e:
+        tracker.mark_error(
+            error_stage="storing",
+            error_message=str(e),
+            error_type="storage_error",
+            is_retryable=True
+        )
+        # Mark canonical document as failed
+        try:
+            doc_repo = DocumentRepository()
+            doc_repo.mark_failed(
+                document_id=document_id,
+                error_message=str(e)[:500]
+            )
+        except Exception:
+            pass
+        raise
+    finally:
+        db.close()
+
+
+@shared_task(bind=True)
+def stream_index_document_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Chunk, embed and store a parsed document as one pipelined stage (streaming mode).
+
+    Chunks are pulled from chunker.iter_chunks() in rolling batches of
+    settings.indexing_stream_batch_size. While batch N is committed on a
+    storage thread (its own DB session), batch N+1 is embedded, so the
+    embedder and the database work concurrently. Every committed batch is
+    immediately searchable, and progress is reported per batch.
+
+    Input payload:
+        - parser_output / parser_output_ref: From parse_document_for_indexing_task
+        - job_id, document_id, collection_id
+
+    Output:
+        - status: "completed"
+        - document_id: Document ID
+        - chunks_stored: Number of chunks stored
+    """
+    job_id = payload["job_id"]
+    document_id = payload["document_id"]
+    collection_id = payload["collection_id"]
+
+    db = _get_db_session()
+    tracker = JobProgressTracker(db, job_id)
+    store_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="index-store")
+
+    try:
+        tracker.update_progress(
+            status="embedding",
+            current_stage="embedding",
+            progress_percent=20,
+            message="Indexing document in batches..."
+        )
+
+        parser_output = _load_parser_output(payload)
+        parser_name = parser_output.get("parser_name", "unknown")
+        chunker = ChunkerFactory.get_chunker(parser_name)
+        if chunker is None:
+            raise ValueError(f"No chunker available for parser '{parser_name}'")
+
+        embedder = get_embedding_provider().uncached
+        embedding_model = embedder.model_name
+        page_count = parser_output.get("page_count") or 0
+        batch_size = max(1, settings.indexing_stream_batch_size)
+
+        from app.db_models_documents import Document
+        document = db.query(Document).filter(Document.id == document_id).first()
+        document_filename = document.filename if document else "Unknown"
+
+        # A retried task must not duplicate rows committed by an earlier partial attempt
+        removed = _delete_document_chunks(document_id)
+        if removed:
+            logger.info(
+                f"Removed {removed} chunks from a previous partial indexing attempt",
+                extra={"document_id": document_id, "job_id": job_id}
             )
 
-        # Update Collection stats using database aggregate functions
-        # This recomputes document_count and total_chunks from the database,
-        # ensuring accuracy and preventing race conditions from concurrent operations
-        collection_repo = CollectionRepository()
-        stats_updated = collection_repo.recompute_collection_stats(
-            collection_id=collection_id,
-            embedding_model=payload.get("embedding_model"),
-            embedding_dimension=payload.get("embedding_dimension")
+        logger.info(
+            f"Streaming index with {chunker.__class__.__name__} ({embedder.provider_name}/{embedding_model})",
+            extra={"document_id": document_id, "job_id": job_id, "batch_size": batch_size}
         )
 
-        if not stats_updated:
-            # Collection might have been deleted during indexing (edge case)
-            logger.warning(
-                f"Failed to recompute collection stats - collection may have been deleted",
-                extra={"collection_id": collection_id, "document_id": document_id}
+        chunks_queued = 0
+        chunks_stored = 0
+        pending = None  # (future, last_page) of the batch being committed
+
+        def _collect(pending_batch) -> None:
+            nonlocal chunks_stored
+            future, last_page = pending_batch
+            chunks_stored += future.result()
+            if page_count and last_page:
+                fraction = min(1.0, last_page / page_count)
+                message = f"Indexed {chunks_stored} chunks (through page {last_page}/{page_count})"
+            else:
+                fraction = chunks_stored / max(chunks_queued, 1)
+                message = f"Indexed {chunks_stored} chunks"
+            tracker.update_progress(
+                progress_percent=20 + int(fraction * 70),  # 20% to 90%
+                message=message,
+                details={"chunks_stored": chunks_stored}
             )
 
+        for batch in _batched(chunker.iter_chunks(_to_parser_output(parser_output)), batch_size):
+            chunk_dicts = [_chunk_to_dict(chunk) for chunk in batch]
+            embeddings = embedder.embed_batch([chunk["text"] for chunk in chunk_dicts])
+
+            # Wait for the previous commit only after this batch is embedded
+            if pending is not None:
+                _collect(pending)
+
+            future = store_pool.submit(
+                _store_chunk_batch,
+                document_id, document_filename, embedding_model,
+                chunk_dicts, embeddings, chunks_queued
+            )
+            pending = (future, _chunk_last_page(chunk_dicts[-1]))
+            chunks_queued += len(chunk_dicts)
+
+        if pending is not None:
+            _collect(pending)
+
+        if not chunks_stored:
+            raise ValueError("No chunks to store")
+
+        _finalize_indexed_document(
+            {**payload, "embedding_model": embedding_model, "embedding_dimension": embedder.get_dimension()},
+            chunks_stored
+        )
+
         tracker.update_progress(
             progress_percent=95,
-            message="Vectors stored successfully"
+            message="Vectors stored successfully",
+            chunking_completed=True,
+            embedding_completed=True,
+            storing_completed=True
         )
 
         tracker.mark_completed()
 
+        get_artifact_store().delete([payload.get("parser_output_ref")])
+
         logger.info(
-            f"Stored {len(db_chunks)} chunks with embeddings for document {document_id}",
+            f"Stream-indexed {chunks_stored} chunks for document {document_id}",
             extra={"job_id": job_id, "collection_id": collection_id}
         )
 
@@ -585,17 +888,20 @@ def store_vectors_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
             "status": "completed",
             "document_id": document_id,
             "collection_id": collection_id,
-            "chunks_stored": len(db_chunks)
+            "chunks_stored": chunks_stored
         }
 
     except Exception as e:
         tracker.mark_error(
-            error_stage="storing",
+            error_stage="embedding",
             error_message=str(e),
-            error_type="storage_error",
+            error_type="indexing_error",
             is_retryable=True
         )
-        # Mark canonical document as failed
+        try:
+            _delete_document_chunks(document_id)
+        except Exception as cleanup_error:
+            logger.warning(f"Failed to remove partial chunks: {cleanup_error}", extra={"document_id": document_id})
         try:
             doc_repo = DocumentRepository()
             doc_repo.mark_failed(
@@ -606,6 +912,7 @@ def store_vectors_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
             pass
         raise
     finally:
+        store_pool.shutdown(wait=True)
         db.close()
 
 
@@ -628,6 +935,7 @@ def start_document_indexing_chain(
     Start the document indexing pipeline chain.
 
     Pipeline: Parse → Chunk → Embed → Store
+    (Parse → Stream index when settings.indexing_streaming_enabled)
 
     Args:
         file_path: Path to uploaded PDF file
@@ -655,12 +963,19 @@ def start_document_indexing_chain(
 
     # Chain: Parse → Chunk → Embed → Store
     # Uses dedicated document indexing tasks (NOT shared with extraction pipeline)
-    task_chain = chain(
-        parse_document_for_indexing_task.s(payload),
-        chunk_document_for_indexing_task.s(),
-        embed_chunks_task.s(),
-        store_vectors_task.s(),
-    )
+    if settings.indexing_streaming_enabled:
+        # Streaming: chunk/embed/store pipelined in rolling batches (partially searchable early)
+        task_chain = chain(
+            parse_document_for_indexing_task.s(payload),
+            stream_index_document_task.s(),
+        )
+    else:
+        task_chain = chain(
+            parse_document_for_indexing_task.s(payload),
+            chunk_document_for_indexing_task.s(),
+            embed_chunks_task.s(),
+            store_vectors_task.s(),
+        )
 
     result = task_chain.apply_async()
     logger.info(
@@ -340,6 +340,7 @@ class ChunkRelationshipExpander:
             "section_heading": chunk.section_heading,
             "is_tabular": chunk.is_tabular,
             "token_count": chunk.token_count,
+            "token_truncation_offset": chunk.token_truncation_offset,
             "chunk_metadata": chunk.chunk_metadata,
         }
 
@@ -29,8 +29,35 @@ Chat:
 Extractions:
     - extractions_completed_total
     - extractions_failed_total
+Inference micro-batching (label: model = embed | rerank):
+    - inference_queue_depth (gauge, items waiting for a batch)
+    - inference_batch_size (items per forward pass)
+    - inference_batch_wait_seconds (oldest item wait before dispatch)
+    - inference_batch_seconds (forward pass duration)
+Embedding cache:
+    - embedding_cache_hits_total (label: tier = lru | redis)
+    - embedding_cache_misses_total
+Query understanding cache:
+    - query_understanding_cache_hits_total (label: match = exact | near)
+    - query_understanding_cache_misses_total
+    - query_understanding_cache_saved_usd_total (LLM cost of the calls skipped)
+Chat answer cache:
+    - chat_answer_cache_requests_total (label: result = hit | miss | bypass)
+Model registry (label: model = embedder | reranker | compressor):
+    - model_load_seconds (time to load a model into the process)
+    - model_loads_total (loads per process; > 1 per worker child means a leak)
+    - model_memory_bytes (gauge, process RSS growth during the load)
+Parser output cache:
+    - parser_cache_requests_total (label: result = hit | wait_hit | miss)
+    - parser_cache_saved_usd_total (parser cost of the runs skipped)
+Session vector index:
+    - session_vector_index_lookups_total (label: result = hit | build | rebuild | bypass)
+    - session_vector_index_build_seconds (load + normalize a document set's embeddings)
+Job progress tracking:
+    - job_progress_updates_total (update_progress calls)
+    - job_progress_db_writes_total (label: trigger = stage | interval | timer | terminal | explicit)
 """
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 # Counters
 WORKFLOW_RUNS_COMPLETED = Counter(
@@ -188,6 +215,117 @@ HTTP_SUSPICIOUS_REQUESTS = Counter(
     ["client_ip", "pattern"]
 )
 
+# Inference micro-batching (embed / rerank scheduler)
+INFERENCE_QUEUE_DEPTH = Gauge(
+    "inference_queue_depth",
+    "Items waiting in the inference micro-batch queue",
+    ["model"]
+)
+INFERENCE_BATCH_SIZE = Histogram(
+    "inference_batch_size",
+    "Items per micro-batched forward pass",
+    ["model"],
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256)
+)
+INFERENCE_BATCH_WAIT_SECONDS = Histogram(
+    "inference_batch_wait_seconds",
+    "Time the oldest item waited before its batch was dispatched",
+    ["model"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+)
+INFERENCE_BATCH_SECONDS = Histogram(
+    "inference_batch_seconds",
+    "Forward pass duration per micro-batch",
+    ["model"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2)
+)
+
+# Embedding cache (hit rate = hits / (hits + misses))
+EMBEDDING_CACHE_HITS = Counter(
+    "embedding_cache_hits_total",
+    "Embedding cache hits by tier",
+    ["tier"]
+)
+EMBEDDING_CACHE_MISSES = Counter(
+    "embedding_cache_misses_total",
+    "Embedding cache misses (texts sent to the embedding model)"
+)
+
+# Query understanding cache (hit rate = hits / (hits + misses))
+QUERY_UNDERSTANDING_CACHE_HITS = Counter(
+    "query_understanding_cache_hits_total",
+    "Query understanding cache hits by match type",
+    ["match"]
+)
+QUERY_UNDERSTANDING_CACHE_MISSES = Counter(
+    "query_understanding_cache_misses_total",
+    "Query understanding cache misses (LLM calls made)"
+)
+QUERY_UNDERSTANDING_CACHE_SAVED_USD = Counter(
+    "query_understanding_cache_saved_usd_total",
+    "Estimated LLM cost saved by query understanding cache hits"
+)
+
+# Chat answer cache (opt-in full-answer replay)
+CHAT_ANSWER_CACHE_REQUESTS = Counter(
+    "chat_answer_cache_requests_total",
+    "Chat answer cache lookups by result",
+    ["result"]  # hit, miss, bypass
+)
+
+# Model registry (one load per process; see app/services/model_registry.py)
+MODEL_LOAD_SECONDS = Histogram(
+    "model_load_seconds",
+    "Time to load a model into the process",
+    ["model"],
+    buckets=(0.5, 1, 2, 5, 10, 20, 30, 60, 120),
+)
+MODEL_LOADS_TOTAL = Counter(
+    "model_loads_total",
+    "Model loads by model",
+    ["model"]
+)
+MODEL_MEMORY_BYTES = Gauge(
+    "model_memory_bytes",
+    "Process RSS growth while loading a model",
+    ["model"],
+    multiprocess_mode="max",
+)
+
+# Parser output cache (content-hash keyed; wait_hit = served after a concurrent parse)
+PARSER_CACHE_REQUESTS = Counter(
+    "parser_cache_requests_total",
+    "Parser output cache lookups by result",
+    ["result"]  # hit, wait_hit, miss
+)
+PARSER_CACHE_SAVED_USD = Counter(
+    "parser_cache_saved_usd_total",
+    "Estimated parser cost saved by parser output cache hits"
+)
+
+# Session vector index (bypass = document set too large, pgvector used)
+SESSION_VECTOR_INDEX_LOOKUPS = Counter(
+    "session_vector_index_lookups_total",
+    "Session vector index lookups by result",
+    ["result"]  # hit, build, rebuild, bypass, indexing
+)
+SESSION_VECTOR_INDEX_BUILD_SECONDS = Histogram(
+    "session_vector_index_build_seconds",
+    "Time to build a session vector index from chunk embeddings",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+)
+
+# Job progress tracking (write ratio = db_writes / updates)
+JOB_PROGRESS_UPDATES = Counter(
+    "job_progress_updates_total",
+    "JobProgressTracker.update_progress calls"
+)
+JOB_PROGRESS_DB_WRITES = Counter(
+    "job_progress_db_writes_total",
+    "Job state rows written by JobProgressTracker, by trigger",
+    ["trigger"]
+)
+
 __all__ = [
     "WORKFLOW_RUNS_COMPLETED",
     "WORKFLOW_RUNS_FAILED",
@@ -215,4 +353,23 @@ __all__ = [
     "LLM_COST_USD",
     "HTTP_REQUESTS_RATE_LIMITED",
     "HTTP_SUSPICIOUS_REQUESTS",
+    "INFERENCE_QUEUE_DEPTH",
+    "INFERENCE_BATCH_SIZE",
+    "INFERENCE_BATCH_WAIT_SECONDS",
+    "INFERENCE_BATCH_SECONDS",
+    "EMBEDDING_CACHE_HITS",
+    "EMBEDDING_CACHE_MISSES",
+    "QUERY_UNDERSTANDING_CACHE_HITS",
+    "QUERY_UNDERSTANDING_CACHE_MISSES",
+    "QUERY_UNDERSTANDING_CACHE_SAVED_USD",
+    "CHAT_ANSWER_CACHE_REQUESTS",
+    "MODEL_LOAD_SECONDS",
+    "MODEL_LOADS_TOTAL",
+    "MODEL_MEMORY_BYTES",
+    "PARSER_CACHE_REQUESTS",
+    "PARSER_CACHE_SAVED_USD",
+    "SESSION_VECTOR_INDEX_LOOKUPS",
+    "SESSION_VECTOR_INDEX_BUILD_SECONDS",
+    "JOB_PROGRESS_UPDATES",
+    "JOB_PROGRESS_DB_WRITES",
 ]
@@ -1,9 +1,29 @@
 # backend/app/utils/pdf_utils.py
 """PDF utility functions"""
+from typing import Sequence
+
 import fitz  # PyMuPDF
 from app.utils.logging import logger
 
 
+def classify_pdf_text(char_counts: Sequence[int], threshold: int = 100) -> str:
+    """Classify a PDF from the stripped text length of its sampled pages
+
+    Args:
+        char_counts: Stripped character count of each sampled page
+        threshold: Minimum average chars per page to consider digital
+
+    Returns:
+        'digital' or 'scanned'
+    """
+    avg_chars_per_page = sum(char_counts) / len(char_counts) if char_counts else 0
+    pdf_type = "digital" if avg_chars_per_page >= threshold else "scanned"
+
+    logger.info(f"PDF type detection: {pdf_type} (avg chars/page: {avg_chars_per_page:.0f}, threshold: {threshold})")
+
+    return pdf_type
+
+
 def detect_pdf_type(pdf_path: str, sample_pages: int = 3, threshold: int = 100) -> str:
     """Detect if PDF is digital (has text) or scanned (images only)
 
@@ -23,26 +43,14 @@ def detect_pdf_type(pdf_path: str, sample_pages: int = 3, threshold: int = 100)
     """
     try:
         doc = fitz.open(pdf_path)
-        total_chars = 0
         pages_to_check = min(sample_pages, len(doc))
 
         # Sample first few pages for speed
-        for page_num in range(pages_to_check):
-            page = doc[page_num]
-            text = page.get_text()
-            total_chars += len(text.strip())
+        char_counts = [len(doc[page_num].get_text().strip()) for page_num in range(pages_to_check)]
 
         doc.close()
 
-        # Calculate average characters per page
-        avg_chars_per_page = total_chars / pages_to_check if pages_to_check > 0 else 0
-
-        # Determine PDF type based on threshold
-        pdf_type = "digital" if avg_chars_per_page >= threshold else "scanned"
-
-        logger.info(f"PDF type detection: {pdf_type} (avg chars/page: {avg_chars_per_page:.0f}, threshold: {threshold})")
-
-        return pdf_type
+        return classify_pdf_text(char_counts, threshold)
 
     except Exception as e:
         logger.warning(f"Error detecting PDF type: {e}. Defaulting to 'digital'")
@@ -3,15 +3,73 @@
 Provides shared utilities for token operations used across the application:
 - count_tokens: Count tokens in text using tiktoken
 - truncate_to_token_limit: Truncate text to fit within token limit
+- token_stats: Token count + truncation offset from a single encode
+- chunk_token_count / chunk_text_within_limit: Read stats precomputed at
+  indexing time (DocumentChunk.token_count / token_truncation_offset)
 
 These utilities use the cl100k_base encoding for compatibility with most models.
+Results for non-indexed text are memoized in a small LRU keyed by text hash,
+so repeated text (history messages, re-scored chunks) is encoded once.
 """
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+
 import tiktoken
 from app.utils.logging import logger
 
 # Initialize tokenizer (using cl100k_base for compatibility with most models)
 _tokenizer = tiktoken.get_encoding("cl100k_base")
 
+# Token limit whose truncation offset is stored on DocumentChunk (cross-encoder max_length)
+INDEXED_TRUNCATION_LIMIT = 512
+
+# LRU of (sha1(text), limit) -> (token_count, truncation_offset)
+_STATS_CACHE_SIZE = 8192
+_stats_cache: "OrderedDict[Tuple[str, int], Tuple[int, int]]" = OrderedDict()
+_stats_lock = threading.Lock()
+
+
+def _compute_token_stats(text: str, token_limit: int) -> Tuple[int, int]:
+    tokens = _tokenizer.encode(text)
+    if len(tokens) <= token_limit:
+        return len(tokens), len(text)
+    # Decode the prefix bytes; drop a trailing partial UTF-8 character so the
+    # offset always lands on a character boundary of the original text
+    prefix = _tokenizer.decode_bytes(tokens[:token_limit]).decode("utf-8", errors="ignore")
+    return len(tokens), len(prefix)
+
+
+def token_stats(text: str, token_limit: int = INDEXED_TRUNCATION_LIMIT) -> Tuple[int, int]:
+    """
+    Token count and truncation offset from a single encode (memoized).
+
+    Args:
+        text: Text to analyze
+        token_limit: Token limit for the truncation offset
+
+    Returns:
+        (token_count, offset) where text[:offset] is the longest prefix within
+        token_limit tokens (offset == len(text) when the text fits)
+    """
+    if not text:
+        return 0, 0
+
+    key = (hashlib.sha1(text.encode("utf-8")).hexdigest(), token_limit)
+    with _stats_lock:
+        cached = _stats_cache.get(key)
+        if cached is not None:
+            _stats_cache.move_to_end(key)
+            return cached
+
+    stats = _compute_token_stats(text, token_limit)
+    with _stats_lock:
+        _stats_cache[key] = stats
+        while len(_stats_cache) > _STATS_CACHE_SIZE:
+            _stats_cache.popitem(last=False)
+    return stats
+
 
 def count_tokens(text: str) -> int:
     """
@@ -25,7 +83,51 @@ def count_tokens(text: str) -> int:
     """
     if not text:
         return 0
-    return len(_tokenizer.encode(text))
+    return token_stats(text)[0]
+
+
+def _has_indexed_stats(chunk: Dict) -> bool:
+    # token_truncation_offset is only set by the indexer that also stores an exact
+    # token_count; older rows carry a heuristic token_count and no offset
+    return chunk.get("token_truncation_offset") is not None and chunk.get("token_count") is not None
+
+
+def chunk_token_count(chunk: Dict, text_field: str = "text") -> int:
+    """
+    Token count for a chunk dict, using the indexed count when available.
+
+    Args:
+        chunk: Chunk dict (from retrieval) with "text" and optional indexed stats
+        text_field: Field holding the text the stats were computed for
+
+    Returns:
+        Number of tokens
+    """
+    if text_field == "text" and _has_indexed_stats(chunk):
+        return chunk["token_count"]
+    return count_tokens(chunk.get(text_field, "") or "")
+
+
+def chunk_text_within_limit(chunk: Dict, token_limit: int = INDEXED_TRUNCATION_LIMIT) -> Tuple[str, int]:
+    """
+    Chunk text cut to token_limit without re-tokenizing indexed chunks.
+
+    Args:
+        chunk: Chunk dict with "text" and optional indexed stats
+        token_limit: Maximum number of tokens
+
+    Returns:
+        (text within limit, original token count)
+    """
+    text = chunk.get("text", "") or ""
+    if _has_indexed_stats(chunk):
+        if chunk["token_count"] <= token_limit:
+            return text, chunk["token_count"]
+        if token_limit == INDEXED_TRUNCATION_LIMIT:
+            return text[:chunk["token_truncation_offset"]], chunk["token_count"]
+
+    token_count, offset = token_stats(text, token_limit)
+    return text[:offset], token_count
 
 
 def truncate_to_token_limit(text: str, token_limit: int) -> str:
@@ -7,9 +7,12 @@ It depends on the core LLMClient for API calls but contains extraction-specific
 
 import asyncio
 import re
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional
 
+from app.config import settings
+from app.core.llm.rate_limiter import get_token_rate_limiter
 from app.services.llm_client import LLMClient
+from app.utils.token_utils import count_tokens
 from .prompts import (
     SUMMARY_SYSTEM_PROMPT,
     create_summary_prompt,
@@ -25,6 +28,7 @@ class ExtractionLLMService:
     Handles:
     - Single chunk summarization
     - Batch chunk summarization
+    - Concurrent summarization of token-sized batches
     - Batch output parsing
 
     Uses cheap LLM model for cost efficiency.
@@ -105,6 +109,88 @@ class ExtractionLLMService:
         """
         return await asyncio.to_thread(self._summarize_chunks_batch_sync, chunks)
 
+    @staticmethod
+    def plan_batches(
+        chunks: List[Dict],
+        max_batch_size: Optional[int] = None,
+        max_batch_tokens: Optional[int] = None
+    ) -> List[List[Dict]]:
+        """
+        Split chunks into consecutive batches bounded by chunk count and token count.
+
+        Short chunks share a call; long chunks close a batch early so no single
+        prompt dwarfs the others. A chunk over the token budget gets its own batch.
+
+        Args:
+            chunks: List of chunk dicts with "text" field
+            max_batch_size: Max chunks per batch (default: settings.chunk_batch_size)
+            max_batch_tokens: Max chunk tokens per batch (default: settings.chunk_batch_max_tokens)
+
+        Returns:
+            Batches in input order
+        """
+        max_batch_size = max(1, max_batch_size or settings.chunk_batch_size)
+        max_batch_tokens = max_batch_tokens or settings.chunk_batch_max_tokens
+
+        batches: List[List[Dict]] = []
+        current: List[Dict] = []
+        current_tokens = 0
+        for chunk in chunks:
+            tokens = count_tokens(chunk.get("text") or "")
+            if current and (len(current) >= max_batch_size or current_tokens + tokens > max_batch_tokens):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(chunk)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    async def summarize_chunks_concurrently(
+        self,
+        chunks: List[Dict],
+        concurrency: Optional[int] = None,
+        on_batch_complete: Optional[Callable[[int, int], None]] = None
+    ) -> List[str]:
+        """
+        Summarize chunks in token-sized batches with bounded concurrency.
+
+        Each batch reserves its prompt tokens on the shared token-rate limiter
+        for the cheap model before calling the API.
+
+        Args:
+            chunks: List of chunk dicts with "text" field
+            concurrency: Batch calls in flight (default: settings.chunk_summary_concurrency)
+            on_batch_complete: Called with (completed_batches, total_batches) as batches finish
+
+        Returns:
+            List of summary strings in input order (one per chunk)
+        """
+        batches = self.plan_batches(chunks)
+        if not batches:
+            return []
+
+        semaphore = asyncio.Semaphore(max(1, concurrency or settings.chunk_summary_concurrency))
+        limiter = get_token_rate_limiter(self.cheap_model)
+        completed = 0
+
+        async def _run(batch: List[Dict]) -> List[str]:
+            nonlocal completed
+            async with semaphore:
+                await limiter.acquire(count_tokens(SUMMARY_SYSTEM_PROMPT + create_batch_summary_prompt(batch)))
+                summaries = await self.summarize_chunks_batch(batch)
+            completed += 1
+            if on_batch_complete:
+                on_batch_complete(completed, len(batches))
+            return summaries
+
+        logger.info(
+            f"Summarizing {len(chunks)} chunks in {len(batches)} batches",
+            extra={"chunk_count": len(chunks), "batch_count": len(batches)}
+        )
+        results = await asyncio.gather(*(_run(batch) for batch in batches))
+        return [summary for batch_summaries in results for summary in batch_summaries]
+
     def _summarize_chunks_batch_sync(self, chunks: List[Dict]) -> List[str]:
         """
         Synchronous batch summarization.
@@ -20,7 +20,7 @@ from celery import shared_task, chain
 
 from app.config import settings
 from app.database import get_db
-from app.core.parsers import ParserFactory
+from app.core.parsers.output_cache import parse_with_cache
 from app.core.chunkers import ChunkerFactory
 from app.services.llm_client import LLMClient
 from app.verticals.private_equity.extraction.llm_service import ExtractionLLMService
@@ -160,15 +160,19 @@ def parse_document_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
 
         # --- CONTINUE WITH PARSING ---
         tracker.update_progress(status="parsing", current_stage="parsing", progress_percent=5, message="Parsing document...")
-        pdf_type = detect_pdf_type(file_path)
-        tracker.update_progress(progress_percent=8, message=f"Detected {pdf_type} PDF")
 
-        parser = ParserFactory.get_parser(settings.force_user_tier or "free", pdf_type)
-        if not parser:
-            raise ValueError("No parser available for detected PDF type")
-
-        # Run async parser in sync Celery task using asyncio.run
-        parser_output = asyncio.run(parser.parse(file_path, pdf_type))
+        def _detect_pdf_type(path: str) -> str:
+            detected = detect_pdf_type(path)
+            tracker.update_progress(progress_percent=8, message=f"Detected {detected} PDF")
+            return detected
+
+        # Identical files reuse a cached parser output (hash computed from the local file)
+        parser_output, pdf_type = parse_with_cache(
+            content_hash=payload.get("content_hash"),
+            tier=settings.force_user_tier or "free",
+            ensure_local_file=lambda: file_path,
+            detect_pdf_type=_detect_pdf_type,
+        )
         text = parser_output.text
 
         # Check per-document page limit for full extraction (scalability limit)
@@ -383,16 +387,22 @@ def summarize_context_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         narrative_chunks = [c for c in chunks if c.get("narrative_text")]
         tracker.update_progress(status="summarizing", current_stage="summarizing", progress_percent=40, message="Summarizing sections...")
 
-        summaries = []
         batch_size = settings.chunk_batch_size
-        for i in range(0, len(narrative_chunks), batch_size):
-            batch = narrative_chunks[i : i + batch_size]
-            batch_data = [
-                {"page": c["metadata"].get("page_number"), "text": c.get("narrative_text") or ""}
-                for c in batch
-            ]
-            batch_summaries = asyncio.run(extraction_service.summarize_chunks_batch(batch_data))
-            summaries.extend(batch_summaries)
+        chunk_data = [
+            {"page": c["metadata"].get("page_number"), "text": c.get("narrative_text") or ""}
+            for c in narrative_chunks
+        ]
+
+        def _on_batch_complete(completed: int, total: int) -> None:
+            tracker.update_progress(
+                progress_percent=40 + int(10 * completed / total),
+                message=f"Summarized batch {completed}/{total}",
+            )
+
+        # One event loop for all batches; batches run concurrently, results keep chunk order
+        summaries = asyncio.run(
+            extraction_service.summarize_chunks_concurrently(chunk_data, on_batch_complete=_on_batch_complete)
+        )
 
         summaries_path = save_summaries(
             extraction_id,
@@ -870,12 +880,15 @@ def start_extraction_chain(
     job_id: str,
     extraction_id: str,
     user_id: str,
-    context: str | None
+    context: str | None,
+    content_hash: str | None = None
 ):
     """
     Start the extraction pipeline chain.
 
     Pipeline: Parse → Chunk → Summarize → Extract → Store
+
+    content_hash (SHA256 of the file) lets the parse step reuse a cached parser output.
     """
     payload = {
         "file_path": file_path,
@@ -884,6 +897,7 @@ def start_extraction_chain(
         "extraction_id": extraction_id,
         "user_id": user_id,
         "context": context,
+        "content_hash": content_hash,
         "mode": "extraction",  # Mark as extraction mode
     }
     task_chain = chain(
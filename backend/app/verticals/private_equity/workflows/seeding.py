@@ -1,8 +1,12 @@
 """Workflow template seeding on application startup.
 
 Idempotent: only creates templates if they do not already exist by (domain, name).
+Also pre-embeds every template's retrieval queries into the embedding cache so
+the first workflow run does not pay for them.
 """
+from typing import List
 from sqlalchemy.orm import Session
+from app.utils.logging import logger
 from app.repositories.workflow_repository import WorkflowRepository
 from app.verticals.private_equity.workflows.core import get_registry, initialize_registry
 
@@ -49,3 +53,48 @@ def seed_workflows(db: Session):
         )
         created.append(f"{domain}/{wf.name}")
     return created
+
+
+def collect_retrieval_queries(templates: List[dict]) -> List[str]:
+    """Collect the unique section queries from all templates' retrieval specs."""
+    queries = []
+    seen = set()
+    for cfg in templates:
+        for section in cfg.get("retrieval_spec") or []:
+            for query in section.get("queries", []):
+                if query and query not in seen:
+                    seen.add(query)
+                    queries.append(query)
+    return queries
+
+
+def warm_retrieval_query_embeddings() -> int:
+    """
+    Pre-embed workflow retrieval queries into the embedding cache.
+
+    No-op when the embedding cache is disabled. Best effort: failures are logged.
+
+    Returns:
+        Number of queries that had to be embedded (cache misses)
+    """
+    from app.core.embeddings import get_embedding_provider
+
+    registry = get_registry()
+    if not registry.list_all():
+        initialize_registry()
+    queries = collect_retrieval_queries(registry.list_all())
+
+    embedder = get_embedding_provider()
+    if not queries or not hasattr(embedder, "warm"):
+        return 0
+
+    try:
+        embedded = embedder.warm(queries)
+        logger.info(
+            "Workflow retrieval query embeddings warmed",
+            extra={"query_count": len(queries), "embedded": embedded}
+        )
+        return embedded
+    except Exception as e:
+        logger.warning(f"Failed to warm workflow query embeddings: {e}")
+        return 0
@@ -5,15 +5,25 @@ Implements threshold-based execution:
 - Map-reduce execution (>10K tokens): Section summaries → synthesis
 
 Map-reduce strategy:
-1. Phase 1 (Map): Summarize each section independently with cheap model
-   - Compress narratives (cost savings)
+1. Phase 1 (Map): Summarize sections concurrently with cheap model
+   - At most settings.workflow_map_concurrency sections in flight
+   - Input tokens reserved against the shared per-model token-rate limiter
+   - Failed summaries retried per section (settings.workflow_map_section_retries);
+     429/overloaded errors are not, LLMClient already retried those with backoff
+   - Each summary persisted to WorkflowRun.section_summaries as it finishes;
+     a task retry reuses complete summaries whose chunks are unchanged
    - Tables pass through unchanged (preserve fidelity)
    - Validate citations preserved
 2. Phase 2 (Reduce): Synthesize summaries into final output with expensive model
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import asyncio
+import hashlib
+import time
 
+from app.config import settings
+from app.core.llm.llm_client import is_retryable_api_error
+from app.core.llm.rate_limiter import get_token_rate_limiter
 from app.utils.logging import logger
 from app.utils.token_utils import count_tokens
 from app.verticals.private_equity.workflows.schemas.investment_memo_schema import InvestmentMemo
@@ -49,6 +59,34 @@ def _estimate_token_budget(sections_content: Dict[str, List[Dict]]) -> int:
     return total_tokens
 
 
+def _section_digest(section_key: str, chunks: List[Dict]) -> str:
+    """Fingerprint of a section's input chunks (detects stale persisted summaries)."""
+    digest = hashlib.sha256(section_key.encode("utf-8"))
+    for chunk in chunks:
+        digest.update(b"\x1f")
+        digest.update((chunk.get("text") or "").encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _persist_section_summary(repo: Any, run_id: str, section_key: str, result: Dict[str, Any]) -> None:
+    """Merge one section summary into WorkflowRun.section_summaries."""
+    try:
+        run = repo.get_run(run_id)
+        # New dict so the JSONB column is seen as changed
+        current_summaries = dict(run.section_summaries or {})
+        current_summaries[section_key] = result
+        repo.update_run_metadata(run_id, {"section_summaries": current_summaries})
+        logger.info(
+            f"Saved section summary for '{section_key}' to database",
+            extra={"run_id": run_id, "section_key": section_key}
+        )
+    except Exception as save_err:
+        logger.warning(
+            f"Failed to save section summary for {section_key}: {save_err}",
+            extra={"run_id": run_id, "section_key": section_key}
+        )
+
+
 async def _summarize_section(
     section_key: str,
     section_spec: Dict,
@@ -56,7 +94,8 @@ async def _summarize_section(
     workflow_name: str,
     run_id: str,
     db: Any,
-    compressor: Any = None
+    compressor: Any = None,
+    max_retries: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Summarize a single workflow section (narratives only, tables pass through).
@@ -75,9 +114,12 @@ async def _summarize_section(
         workflow_name: Workflow name for logging
         run_id: Workflow run ID
         db: Database session
+        max_retries: Extra LLM attempts after a parse or non-transient failure
+                     (default: settings.workflow_map_section_retries)
 
     Returns:
-        Dict with narrative_summary, table_chunks, citations, token_count
+        Dict with narrative_summary, table_chunks, citations, token_count,
+        source_digest and complete (False when the narrative summary failed)
     """
     from app.verticals.private_equity.workflows.section_summary_prompt import (
         build_narrative_summary_prompt,
@@ -102,6 +144,7 @@ async def _summarize_section(
     narrative_citations = []
     table_key_metrics = []
     table_citations = []
+    narrative_failed = False
 
     # Process narrative chunks if present
     if narrative_chunks:
@@ -121,6 +164,9 @@ async def _summarize_section(
 
         # Call LLM with system-level caching (cheap model for summarization)
         llm_client = _llm()
+        limiter = get_token_rate_limiter(llm_client.model)
+        estimated_tokens = count_tokens(prompt_parts["system_prompt"]) + count_tokens(prompt_parts["user_message"])
+        attempts = 1 + (max_retries if max_retries is not None else settings.workflow_map_section_retries)
 
         try:
             logger.info(
@@ -128,13 +174,28 @@ async def _summarize_section(
                 extra={"run_id": run_id, "section_key": section_key}
             )
 
-            # Use cheap model with caching enabled
-            # System prompt is cached (100% reuse across all sections)
-            response = await llm_client.extract_structured_data(
-                text=prompt_parts["user_message"],      # Dynamic chunks
-                system_prompt=prompt_parts["system_prompt"],  # Cached instructions
-                use_cache=True  # ✅ Enable caching!
-            )
+            for attempt in range(attempts):
+                await limiter.acquire(estimated_tokens)
+                try:
+                    # Use cheap model with caching enabled
+                    # System prompt is cached (100% reuse across all sections)
+                    response = await llm_client.extract_structured_data(
+                        text=prompt_parts["user_message"],      # Dynamic chunks
+                        system_prompt=prompt_parts["system_prompt"],  # Cached instructions
+                        use_cache=True  # ✅ Enable caching!
+                    )
+                    break
+                except Exception as llm_err:
+                    # Rate limit / overload errors reach here only after LLMClient's own retries
+                    if attempt == attempts - 1 or is_retryable_api_error(llm_err):
+                        raise
+                    wait_time = 2 * (2 ** attempt)
+                    logger.warning(
+                        f"Section '{section_key}' summary failed, retrying in {wait_time}s "
+                        f"(attempt {attempt + 1}/{attempts}): {llm_err}",
+                        extra={"run_id": run_id, "section_key": section_key}
+                    )
+                    await asyncio.sleep(wait_time)
 
             summary_result = response.get("data", {})
 
@@ -157,6 +218,7 @@ async def _summarize_section(
             )
 
         except Exception as e:
+            narrative_failed = True
             logger.error(
                 f"Failed to summarize narratives for section '{section_key}': {e}",
                 extra={"run_id": run_id, "section_key": section_key},
@@ -196,23 +258,13 @@ async def _summarize_section(
         "token_count": (
             len(narrative_summary or "") // 4 +  # Estimate narrative tokens
             sum(len(t) // 4 for t in tables_text)  # Estimate table tokens
-        )
+        ),
+        "source_digest": _section_digest(section_key, chunks),
+        "complete": not narrative_failed,
     }
 
-    # Save to WorkflowRun.section_summaries
-    try:
-        current_summaries = repo.get_run(run_id).section_summaries or {}
-        current_summaries[section_key] = result
-        repo.update_run_metadata(run_id, {"section_summaries": current_summaries})
-        logger.info(
-            f"Saved section summary for '{section_key}' to database",
-            extra={"run_id": run_id, "section_key": section_key}
-        )
-    except Exception as save_err:
-        logger.warning(
-            f"Failed to save section summary for {section_key}: {save_err}",
-            extra={"run_id": run_id, "section_key": section_key}
-        )
+    # Save to WorkflowRun.section_summaries (as soon as this section finishes)
+    _persist_section_summary(repo, run_id, section_key, result)
 
     logger.info(
         f"Section '{section_key}' complete: {len(narrative_chunks)} narratives + {len(table_chunks)} tables → "
@@ -234,7 +286,8 @@ async def _execute_map_reduce(
     """
     Execute map-reduce workflow: section summaries → final synthesis.
 
-    Phase 1 (Map): Summarize each section independently (parallel-capable)
+    Phase 1 (Map): Summarize sections concurrently (settings.workflow_map_concurrency),
+                   reusing complete summaries persisted by an earlier attempt
     Phase 2 (Reduce): Synthesize summaries into final output
 
     Args:
@@ -264,6 +317,28 @@ async def _execute_map_reduce(
         import json
         retrieval_spec = json.loads(retrieval_spec)
 
+    # Summaries persisted by a previous attempt of this run (task retry)
+    from app.repositories.workflow_repository import WorkflowRepository
+    run = WorkflowRepository(db).get_run(run_id)
+    persisted = dict((run.section_summaries if run else None) or {})
+
+    semaphore = asyncio.Semaphore(max(1, settings.workflow_map_concurrency))
+
+    async def _map_section(section_key: str, section_spec: Dict, chunks: List[Dict]) -> Dict[str, Any]:
+        async with semaphore:
+            return await _summarize_section(
+                section_key=section_key,
+                section_spec=section_spec,
+                chunks=chunks,
+                workflow_name=workflow_template.name,
+                run_id=run_id,
+                db=db,
+                compressor=None  # No longer using compression
+            )
+
+    ordered_keys = []
+    pending = {}
+    reused = 0
     for section_spec in retrieval_spec:
         section_key = section_spec.get("key")
         chunks = sections_content.get(section_key, [])
@@ -275,22 +350,29 @@ async def _execute_map_reduce(
             )
             continue
 
-        # Summarize section
-        summary = await _summarize_section(
-            section_key=section_key,
-            section_spec=section_spec,
-            chunks=chunks,
-            workflow_name=workflow_template.name,
-            run_id=run_id,
-            db=db,
-            compressor=None  # No longer using compression
-        )
+        ordered_keys.append(section_key)
+        previous = persisted.get(section_key)
+        if (
+            previous
+            and previous.get("complete")
+            and previous.get("source_digest") == _section_digest(section_key, chunks)
+        ):
+            section_summaries[section_key] = previous
+            reused += 1
+            continue
+
+        pending[section_key] = _map_section(section_key, section_spec, chunks)
 
-        section_summaries[section_key] = summary
+    map_start = time.perf_counter()
+    results = await asyncio.gather(*pending.values())
+    section_summaries.update(zip(pending.keys(), results))
+    # Keep retrieval_spec order for synthesis regardless of completion order
+    section_summaries = {key: section_summaries[key] for key in ordered_keys}
 
     logger.info(
-        f"Map phase complete: {len(section_summaries)} sections summarized",
-        extra={"run_id": run_id, "summaries": section_summaries.keys()}
+        f"Map phase complete: {len(section_summaries)} sections summarized "
+        f"({len(pending)} new, {reused} reused) in {time.perf_counter() - map_start:.1f}s",
+        extra={"run_id": run_id, "summaries": list(section_summaries.keys())}
     )
 
     # Phase 2: Synthesize summaries (Reduce)
@@ -198,8 +198,8 @@ def prepare_context_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
             # For map-reduce, compression happens later in _summarize_section
             if not use_map_reduce:
                 # Direct execution: Compress ALL narrative chunks now
-                from app.core.rag.chunk_compressor import ChunkCompressor
-                compressor = ChunkCompressor()
+                from app.services.model_registry import get_chunk_compressor
+                compressor = get_chunk_compressor()
 
                 for spec in sections_spec:
                     section_key = spec["key"]
@@ -11,6 +11,7 @@ from anthropic import Anthropic
 from pydantic import BaseModel, Field
 
 from app.config import settings
+from app.core.llm.rate_limiter import get_token_rate_limiter
 from app.utils.logging import logger
 
 
@@ -264,6 +265,15 @@ Each chunk has metadata in the header:
         - Total per call: ~12k (cached) + ~9k (user) = ~21k tokens
         - Total calls: ~6 calls for 21 sheets (vs 9 calls with old PDF batching)
 
+        **Concurrency:**
+        - With caching, batch 1 runs alone to write the prompt cache; the rest
+          then run concurrently (settings.template_map_concurrency) under the
+          shared token-rate limiter; each failed batch is retried on its own
+          (settings.template_map_batch_retries)
+        - on_batch_complete fires in batch order; a batch that still fails is
+          reported in "failed_batches" and the rest are returned (raises only
+          when every batch fails)
+
         **Token Efficiency:**
         - PDF fields cached once, reused across all sheet batches
         - Each sheet batch creates unique user message
@@ -323,17 +333,13 @@ Each chunk has metadata in the header:
                 f"({len(stripped_fields)} fields, will be cached)"
             )
 
-            # Step 3: Process Excel sheets in batches
+            # Step 3: Build all sheet batches (independent; they share the cached system prompt)
+            batches = []
             for i in range(0, total_sheets, SHEETS_PER_BATCH):
                 sheet_batch = sheets[i:i + SHEETS_PER_BATCH]
                 batch_num = (i // SHEETS_PER_BATCH) + 1
                 sheet_names = [s.get("name", f"Sheet{idx}") for idx, s in enumerate(sheet_batch, start=i)]
 
-                logger.info(
-                    f"\n📋 Batch {batch_num}/{total_batches}: Processing {len(sheet_batch)} sheets: "
-                    f"{', '.join(sheet_names[:3])}{'...' if len(sheet_names) > 3 else ''}"
-                )
-
                 # Build sheet batch schema
                 sheet_batch_schema = self._extract_sheet_batch_schema(compressed_schema, sheet_batch)
                 user_message = self._build_sheet_batch_user_message(sheet_batch_schema)
@@ -342,8 +348,9 @@ Each chunk has metadata in the header:
                 user_tokens = self._estimate_tokens(user_message)
                 total_tokens = system_tokens + user_tokens
                 logger.info(
-                    f"   📊 Tokens: system ~{system_tokens:,} (cached) + "
-                    f"user ~{user_tokens:,} = ~{total_tokens:,} total"
+                    f"\n📋 Batch {batch_num}/{total_batches}: {len(sheet_batch)} sheets: "
+                    f"{', '.join(sheet_names[:3])}{'...' if len(sheet_names) > 3 else ''} | "
+                    f"Tokens: system ~{system_tokens:,} (cached) + user ~{user_tokens:,} = ~{total_tokens:,} total"
                 )
 
                 # Warn if approaching limit
@@ -353,30 +360,77 @@ Each chunk has metadata in the header:
                         f"(max 200k). Consider reducing SHEETS_PER_BATCH."
                     )
 
-                # Build cached system prompt
-                system_arg: Any
-                if use_cache:
-                    system_arg = [
-                        {
-                            "type": "text",
-                            "text": system_prompt,
-                            "cache_control": {"type": "ephemeral"},
-                        }
-                    ]
-                else:
-                    system_arg = system_prompt
-
-                # Use Anthropic Structured Outputs
-                message = await asyncio.to_thread(
-                    self.client.messages.parse,
-                    model=self.model,
-                    max_tokens=settings.synthesis_llm_max_tokens,
-                    temperature=0.0,
-                    timeout=settings.synthesis_llm_timeout_seconds,
-                    system=system_arg,
-                    messages=[{"role": "user", "content": user_message}],
-                    output_format=AutoMappingResult
-                )
+                batches.append((batch_num, sheet_names, user_message, total_tokens))
+
+            # Build cached system prompt
+            system_arg: Any
+            if use_cache:
+                system_arg = [
+                    {
+                        "type": "text",
+                        "text": system_prompt,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ]
+            else:
+                system_arg = system_prompt
+
+            # Step 4: Map batches concurrently (capped), retrying each failed batch on its own
+            semaphore = asyncio.Semaphore(max(1, settings.template_map_concurrency))
+            limiter = get_token_rate_limiter(self.model)
+            attempts = 1 + settings.template_map_batch_retries
+
+            async def _map_batch(batch_num: int, user_message: str, estimated_tokens: int):
+                async with semaphore:
+                    for attempt in range(attempts):
+                        await limiter.acquire(estimated_tokens)
+                        try:
+                            # Use Anthropic Structured Outputs
+                            return await asyncio.to_thread(
+                                self.client.messages.parse,
+                                model=self.model,
+                                max_tokens=settings.synthesis_llm_max_tokens,
+                                temperature=0.0,
+                                timeout=settings.synthesis_llm_timeout_seconds,
+                                system=system_arg,
+                                messages=[{"role": "user", "content": user_message}],
+                                output_format=AutoMappingResult
+                            )
+                        except Exception as batch_err:
+                            if attempt == attempts - 1:
+                                raise
+                            wait_time = 2 * (2 ** attempt)
+                            logger.warning(
+                                f"⚠️  Batch {batch_num}/{total_batches} failed, retrying in {wait_time}s "
+                                f"(attempt {attempt + 1}/{attempts}): {batch_err}"
+                            )
+                            await asyncio.sleep(wait_time)
+
+            tasks = [
+                asyncio.create_task(_map_batch(batch_num, user_message, estimated_tokens))
+                for batch_num, _, user_message, estimated_tokens in batches[:1]
+            ]
+            if use_cache and len(batches) > 1:
+                # Run the first batch alone so it writes the system-prompt cache once
+                # (1.25x); concurrent first calls would each write it instead of reading (0.1x)
+                await asyncio.wait(tasks)
+            tasks += [
+                asyncio.create_task(_map_batch(batch_num, user_message, estimated_tokens))
+                for batch_num, _, user_message, estimated_tokens in batches[1:]
+            ]
+
+            # Consume results in batch order so mappings and progress callbacks stay ordered
+            failed_batches = []
+            for (batch_num, sheet_names, _, _), task in zip(batches, tasks):
+                try:
+                    message = await task
+                except Exception as batch_err:
+                    logger.error(
+                        f"❌ Batch {batch_num}/{total_batches} failed after {attempts} attempts "
+                        f"(sheets: {', '.join(sheet_names)}): {batch_err}"
+                    )
+                    failed_batches.append({"batch": batch_num, "sheets": sheet_names, "error": str(batch_err)})
+                    continue
 
                 # Log actual cache usage from Anthropic and accumulate totals
                 usage = getattr(message, "usage", None)
@@ -416,6 +470,9 @@ Each chunk has metadata in the header:
                 if on_batch_complete:
                     on_batch_complete(batch_num, total_batches, batch_mappings)
 
+            if batches and len(failed_batches) == len(batches):
+                raise RuntimeError(f"All {total_batches} auto-mapping batches failed: {failed_batches[0]['error']}")
+
             # Aggregate results
             result = {
                 "mappings": all_mappings,
@@ -430,7 +487,9 @@ Each chunk has metadata in the header:
                     "cache_read_input_tokens": total_cache_read_tokens,
                     "total_batches": total_batches,
                     "model": self.model,
-                }
+                },
+                # Batches that still failed after retries (their sheets stay unmapped)
+                "failed_batches": failed_batches,
             }
 
             # Add status to all mappings
@@ -521,6 +521,7 @@ def auto_map_fields_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         pdf_fields = detection_result.get("fields", [])
         schema_mappings = []
         generic_mappings = []
+        failed_batches = []
 
         # === STEP 1: Try schema-based mapping (unless skipped) ===
         if not skip_schema:
@@ -620,6 +621,15 @@ def auto_map_fields_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
 
                 generic_mappings = mapping_result.get("mappings") or []
 
+                # Batches that failed after retries leave their sheets unmapped
+                failed_batches = mapping_result.get("failed_batches") or []
+                if failed_batches:
+                    failed_sheets = [sheet for b in failed_batches for sheet in b.get("sheets", [])]
+                    logger.warning(
+                        f"Auto-mapping incomplete: {len(failed_batches)} batch(es) failed, "
+                        f"sheets left unmapped: {', '.join(failed_sheets)}"
+                    )
+
                 # Extract token usage for observability
                 usage = mapping_result.get("usage", {})
                 llm_input_tokens = usage.get("input_tokens", 0)
@@ -698,12 +708,15 @@ def auto_map_fields_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
             "total_mapped": total_mapped_fields,
             "schema_mapped_count": schema_count,
             "generic_mapped_count": len(mappings) - schema_count,
-            "high_confidence_count": sum(1 for m in mappings if m.get("confidence", 0) >= 0.85)
+            "high_confidence_count": sum(1 for m in mappings if m.get("confidence", 0) >= 0.85),
+            "failed_batches": failed_batches
         }
 
         field_mapping = {
             "pdf_fields": detection_result.get("fields", []),
-            "mappings": mappings
+            "mappings": mappings,
+            # Sheets whose mapping batch failed are shown to the reviewer as unmapped
+            "failed_batches": failed_batches
         }
 
         # Persist token data if LLM was used
@@ -746,11 +759,18 @@ def auto_map_fields_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         else:
             status_msg = f"Mapped {len(mappings)} cells ({mapping_result.get('high_confidence_count', 0)} high confidence)"
 
+        details = None
+        if failed_batches:
+            failed_sheets = [sheet for b in failed_batches for sheet in b.get("sheets", [])]
+            status_msg += f" - mapping failed for {len(failed_sheets)} sheet(s): {', '.join(failed_sheets)}"
+            details = {"partial_mapping": True, "failed_batches": failed_batches}
+
         tracker.update_progress(
             status="awaiting_review",
             current_stage="auto_mapping",
             progress_percent=60,
-            message=status_msg
+            message=status_msg,
+            details=details
         )
 
         payload["mapping_result"] = mapping_result
@@ -0,0 +1,30 @@
+"""Add token_truncation_offset to document_chunks.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add the precomputed 512-token truncation offset column."""
+    # Existing rows stay NULL; readers fall back to tokenizing those chunks
+    op.add_column(
+        'document_chunks',
+        sa.Column('token_truncation_offset', sa.Integer, nullable=True)
+    )
+
+
+def downgrade():
+    """Drop the token_truncation_offset column."""
+    op.drop_column('document_chunks', 'token_truncation_offset')
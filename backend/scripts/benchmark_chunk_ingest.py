@@ -0,0 +1,137 @@
+# backend/scripts/benchmark_chunk_ingest.py
+"""Chunk ingestion benchmark
+
+Inserts synthetic chunk rows (384-d embeddings, ~1.2KB text, JSON metadata)
+into a scratch copy of document_chunks (same HNSW/GIN/btree indexes) and
+reports rows/sec for:
+
+    orm     - DocumentChunk-style objects + bulk_save_objects (previous path)
+    insert  - ChunkIngestRepository executemany INSERT fallback
+    copy    - ChunkIngestRepository binary COPY (psycopg 3 + pgvector)
+
+Requires DATABASE_URL pointing at a Postgres with pgvector. The scratch
+table (bench_document_chunks) is dropped at the end.
+
+Usage:
+    python scripts/benchmark_chunk_ingest.py
+    python scripts/benchmark_chunk_ingest.py --sizes 1000 10000 --methods insert copy
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import numpy as np
+from sqlalchemy import MetaData, text
+from sqlalchemy.orm import registry
+
+from app.database import SessionLocal
+from app.db_models_chat import DocumentChunk
+from app.repositories.chunk_ingest_repository import ChunkIngestRepository
+
+BENCH_TABLE = "bench_document_chunks"
+WORDS = "revenue ebitda margin growth customer retention pipeline forecast capex debt covenant".split()
+
+
+def _make_rows(n: int, dim: int, seed: int = 0):
+    """Build n synthetic chunk row dicts."""
+    rng = random.Random(seed)
+    vectors = np.random.default_rng(seed).standard_normal((n, dim), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    document_id = str(uuid.uuid4())
+    rows = []
+    for i in range(n):
+        body = " ".join(rng.choice(WORDS) for _ in range(180))
+        rows.append({
+            "id": str(uuid.uuid4()),
+            "document_id": document_id,
+            "text": body,
+            "narrative_text": body,
+            "tables": None,
+            "chunk_index": i,
+            "embedding": vectors[i],
+            "embedding_model": "all-MiniLM-L6-v2",
+            "embedding_version": "1.0",
+            "page_number": i // 4 + 1,
+            "section_type": "narrative",
+            "section_heading": f"Section {i // 20}",
+            "is_tabular": False,
+            "token_count": 180,
+            "token_truncation_offset": len(body),
+            "chunk_metadata": json.dumps({"section_id": f"sec_{i // 20}", "page_range": [i // 4 + 1, i // 4 + 1]}),
+        })
+    return rows
+
+
+def _create_scratch_table(db) -> None:
+    db.execute(text(f"DROP TABLE IF EXISTS {BENCH_TABLE}"))
+    db.execute(text(
+        f"CREATE TABLE {BENCH_TABLE} (LIKE {DocumentChunk.__tablename__} INCLUDING DEFAULTS INCLUDING INDEXES)"
+    ))
+    db.commit()
+
+
+def _bench(name: str, db, rows, insert_fn) -> float:
+    db.execute(text(f"TRUNCATE {BENCH_TABLE}"))
+    db.commit()
+    start = time.perf_counter()
+    insert_fn(rows)
+    db.commit()
+    elapsed = time.perf_counter() - start
+    rate = len(rows) / elapsed if elapsed > 0 else float("inf")
+    print(f"  {name:<8} {elapsed:8.2f}s  {rate:10.0f} rows/sec")
+    return rate
+
+
+def main():
+    """Run the chunk ingestion benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="Rows per run")
+    parser.add_argument("--methods", nargs="+", default=["orm", "insert", "copy"], choices=["orm", "insert", "copy"])
+    parser.add_argument("--dim", type=int, default=384, help="Embedding dimension")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        _create_scratch_table(db)
+        bench_table = DocumentChunk.__table__.to_metadata(MetaData(), name=BENCH_TABLE)
+
+        # Plain mapped class over the scratch table to reproduce the bulk_save_objects path
+        class BenchChunk:
+            def __init__(self, **kwargs):
+                for key, value in kwargs.items():
+                    setattr(self, key, value)
+
+        registry().map_imperatively(BenchChunk, bench_table)
+        repo = ChunkIngestRepository(db, table=bench_table)
+
+        for n in args.sizes:
+            print(f"\n{n} rows (dim={args.dim})")
+            rows = _make_rows(n, args.dim)
+            rates = {}
+            if "orm" in args.methods:
+                rates["orm"] = _bench("orm", db, rows, lambda r: db.bulk_save_objects([BenchChunk(**row) for row in r]))
+            if "insert" in args.methods:
+                rates["insert"] = _bench("insert", db, rows, lambda r: repo.bulk_insert(r, method="insert"))
+            if "copy" in args.methods:
+                rates["copy"] = _bench("copy", db, rows, lambda r: repo.bulk_insert(r, method="copy"))
+            if "orm" in rates:
+                for name in ("insert", "copy"):
+                    if name in rates:
+                        print(f"  {name} speedup vs orm: {rates[name] / rates['orm']:.1f}x")
+    finally:
+        db.rollback()
+        db.execute(text(f"DROP TABLE IF EXISTS {BENCH_TABLE}"))
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# backend/scripts/benchmark_comparison_pairing.py
+"""Comparison pairing benchmark
+
+Pairs synthetic chunks from two documents (shared financial topics, shuffled
+order) and compares:
+
+    legacy  - every |A|x|B| pair cross-encoded with untruncated texts,
+              per-score Python sigmoid, nested greedy loop (previous path)
+    engine  - ComparisonPairingEngine: bi-encoder top-k pruning, token-truncated
+              cross-encoding of candidates only, vectorized sigmoid + assignment
+
+Reports wall time, pairs scored and how many legacy pairs the engine reproduces.
+Loads the configured embedding model and cross-encoder (no database needed).
+
+Usage:
+    python scripts/benchmark_comparison_pairing.py
+    python scripts/benchmark_comparison_pairing.py --sizes 10 20 40 --top-k 3 --threshold 0.6
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import numpy as np
+
+from app.core.embeddings import get_embedding_provider
+from app.core.rag.comparison_pairing import ComparisonPairingEngine
+from app.core.rag.reranker import Reranker
+
+TOPICS = [
+    "revenue growth year over year driven by new customer acquisition",
+    "EBITDA margin expansion from operating leverage and pricing",
+    "customer retention and net revenue retention by cohort",
+    "capital expenditures for facility upgrades and equipment",
+    "senior debt facility covenants and leverage ratio",
+    "working capital needs and cash conversion cycle",
+    "management team background and key hires",
+    "competitive landscape and market share trends",
+    "gross margin by product line and mix shift",
+    "sales pipeline coverage and bookings forecast",
+]
+FILLER = "the company reported results for the period compared with prior year as described in the notes".split()
+
+
+def _make_doc(n: int, doc_label: str, rng: random.Random):
+    chunks = []
+    for i in range(n):
+        topic = TOPICS[i % len(TOPICS)]
+        body = " ".join(rng.choice(FILLER) for _ in range(rng.randint(120, 400)))
+        chunks.append({"id": f"{doc_label}-{i}", "text": f"{topic}. {body} {topic}."})
+    rng.shuffle(chunks)
+    return chunks
+
+
+def _legacy(reranker, chunks_a, chunks_b, threshold):
+    pairs = [[a["text"], b["text"]] for a in chunks_a for b in chunks_b]
+    scores = reranker.model.predict(pairs, batch_size=reranker.batch_size, show_progress_bar=False)
+    normalized = [1 / (1 + np.exp(-score)) for score in scores]
+    matrix = [[0.0] * len(chunks_b) for _ in chunks_a]
+    for k, score in enumerate(normalized):
+        matrix[k // len(chunks_b)][k % len(chunks_b)] = score
+
+    matches, used_b = [], set()
+    for i in range(len(chunks_a)):
+        best, best_sim = None, 0.0
+        for j in range(len(chunks_b)):
+            if j in used_b:
+                continue
+            if matrix[i][j] > best_sim and matrix[i][j] >= threshold:
+                best, best_sim = j, matrix[i][j]
+        if best is not None:
+            used_b.add(best)
+            matches.append((i, best))
+    return matches, len(pairs)
+
+
+def _engine(engine, chunks_a, chunks_b, emb_a, emb_b, threshold):
+    mask = engine.candidate_mask(emb_a, emb_b, (len(chunks_a), len(chunks_b)))
+    similarity = engine.similarity_matrix(chunks_a, chunks_b, emb_a, emb_b)
+    matches = [(i, j) for i, j, _ in engine.assign(similarity, threshold)]
+    return matches, int(mask.sum())
+
+
+def main():
+    """Run the pairing benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 20, 40], help="Chunks per document")
+    parser.add_argument("--top-k", type=int, default=3, help="Bi-encoder neighbours per chunk")
+    parser.add_argument("--threshold", type=float, default=0.6, help="Pairing similarity threshold")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size (best time reported)")
+    args = parser.parse_args()
+
+    embedder = get_embedding_provider()
+    reranker = Reranker(use_score_cache=False)
+    engine = ComparisonPairingEngine(reranker, top_k=args.top_k)
+
+    for n in args.sizes:
+        rng = random.Random(n)
+        chunks_a = _make_doc(n, "a", rng)
+        chunks_b = _make_doc(n, "b", rng)
+        # Chunk embeddings are stored at indexing time, so they are computed outside the timed region
+        emb_a = np.asarray(embedder.embed_batch([c["text"] for c in chunks_a]), dtype=np.float32)
+        emb_b = np.asarray(embedder.embed_batch([c["text"] for c in chunks_b]), dtype=np.float32)
+
+        legacy_times, engine_times = [], []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            legacy_matches, legacy_scored = _legacy(reranker, chunks_a, chunks_b, args.threshold)
+            legacy_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            engine_matches, engine_scored = _engine(engine, chunks_a, chunks_b, emb_a, emb_b, args.threshold)
+            engine_times.append(time.perf_counter() - start)
+
+        legacy_ms = min(legacy_times) * 1000
+        engine_ms = min(engine_times) * 1000
+        overlap = len(set(legacy_matches) & set(engine_matches))
+        print(f"\n{n} chunks per document")
+        print(f"  legacy  {legacy_ms:9.1f} ms   {legacy_scored:5d} pairs scored   {len(legacy_matches):3d} matches")
+        print(f"  engine  {engine_ms:9.1f} ms   {engine_scored:5d} pairs scored   {len(engine_matches):3d} matches")
+        print(f"  speedup {legacy_ms / engine_ms:.1f}x, legacy matches reproduced: {overlap}/{len(legacy_matches)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# backend/scripts/benchmark_fusion.py
+"""Rank fusion micro-benchmark
+
+Fuses synthetic semantic + keyword candidate lists (default 1k and 10k
+candidates per list, ~50% overlap) with the linear-time fusion engine and,
+for comparison, the previous quadratic RRF merge.
+
+Usage:
+    python scripts/benchmark_fusion.py
+    python scripts/benchmark_fusion.py --sizes 1000 10000 50000 --skip-legacy
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.rag.fusion import (
+    reciprocal_rank_fusion,
+    weighted_sum_fusion,
+    comb_mnz_fusion,
+)
+
+RRF_K = 60
+
+
+def _make_lists(n: int, overlap: float = 0.5, seed: int = 0):
+    """Build two ranked lists of n chunk dicts sharing ~overlap of their ids."""
+    rng = random.Random(seed)
+    shared = int(n * overlap)
+    semantic_ids = [f"chunk-{i}" for i in range(n)]
+    keyword_ids = semantic_ids[:shared] + [f"chunk-{n + i}" for i in range(n - shared)]
+    rng.shuffle(keyword_ids)
+
+    semantic = [
+        {"id": cid, "text": "x" * 200, "semantic_score": 1.0 - i / n}
+        for i, cid in enumerate(semantic_ids)
+    ]
+    keyword = [
+        {"id": cid, "text": "x" * 200, "keyword_score": 1.0 - i / n}
+        for i, cid in enumerate(keyword_ids)
+    ]
+    return semantic, keyword
+
+
+def _legacy_merge(semantic_results, keyword_results, rrf_k=RRF_K):
+    """Previous HybridRetriever._merge_results (linear scan per id + dict copy)."""
+    semantic_ranks = {r["id"]: idx + 1 for idx, r in enumerate(semantic_results)}
+    keyword_ranks = {r["id"]: idx + 1 for idx, r in enumerate(keyword_results)}
+    merged = {}
+    for chunk_id in set(semantic_ranks) | set(keyword_ranks):
+        chunk_data = None
+        for r in semantic_results:
+            if r["id"] == chunk_id:
+                chunk_data = r.copy()
+                break
+        if not chunk_data:
+            for r in keyword_results:
+                if r["id"] == chunk_id:
+                    chunk_data = r.copy()
+                    break
+        score = 0.0
+        if chunk_id in semantic_ranks:
+            score += 1.0 / (rrf_k + semantic_ranks[chunk_id])
+        if chunk_id in keyword_ranks:
+            score += 1.0 / (rrf_k + keyword_ranks[chunk_id])
+        chunk_data["hybrid_score"] = score
+        merged[chunk_id] = chunk_data
+    return list(merged.values())
+
+
+def _bench(name, fn, make_args, repeat) -> float:
+    """Print and return best-of-N wall time in milliseconds (fresh inputs per run)."""
+    best = float("inf")
+    for _ in range(repeat):
+        inputs = make_args()
+        start = time.perf_counter()
+        fn(*inputs)
+        best = min(best, time.perf_counter() - start)
+    ms = best * 1000
+    print(f"  {name:<24} {ms:>10.2f} ms")
+    return ms
+
+
+def main():
+    """Run the fusion benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000], help="Candidates per list")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per method (best time reported)")
+    parser.add_argument("--skip-legacy", action="store_true", help="Skip the quadratic legacy merge")
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        print(f"\n{n} candidates per list (2 lists)")
+
+        def make_args(n=n):
+            return (list(_make_lists(n)),)
+
+        rrf_ms = _bench(
+            "rrf",
+            lambda lists: reciprocal_rank_fusion(
+                lists, k=RRF_K, rank_keys=("semantic_rank", "keyword_rank"), sort=False
+            ),
+            make_args,
+            args.repeat,
+        )
+        _bench("rrf top_k=18", lambda lists: reciprocal_rank_fusion(lists, k=RRF_K, top_k=18), make_args, args.repeat)
+        _bench(
+            "weighted_sum",
+            lambda lists: weighted_sum_fusion(lists, score_keys=("semantic_score", "keyword_score"), weights=(0.6, 0.4)),
+            make_args,
+            args.repeat,
+        )
+        _bench(
+            "comb_mnz",
+            lambda lists: comb_mnz_fusion(lists, score_keys=("semantic_score", "keyword_score")),
+            make_args,
+            args.repeat,
+        )
+
+        if not args.skip_legacy:
+            legacy_ms = _bench("legacy (quadratic)", lambda lists: _legacy_merge(*lists), make_args, 1)
+            print(f"  speedup vs legacy: {legacy_ms / max(rrf_ms, 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# backend/scripts/benchmark_inference_backends.py
+"""Inference backend benchmark (embedder + cross-encoder on CPU)
+
+For each backend (torch, onnx, onnx-int8) loads the configured embedding model
+and cross-encoder and measures:
+
+    chat turn  - one query embedding + cross-encoding of --pairs (query, chunk)
+                 pairs, the per-turn model work of the chat pipeline
+    bulk embed - embedding --chunks chunk texts in one call (embed_chunks_task)
+
+Reports latency, throughput, chat turns per core-second and speedup vs torch.
+Pin the thread count (--threads) to compare per-core throughput; ONNX exports
+are built on first use under settings.onnx_model_dir (excluded from timings).
+
+Usage:
+    python scripts/benchmark_inference_backends.py
+    python scripts/benchmark_inference_backends.py --threads 1 --pairs 20 --chunks 512
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.config import settings
+from app.core.embeddings.sentence_transformer import SentenceTransformerEmbedding
+from app.core.rag.reranker import Reranker
+
+WORDS = (
+    "revenue EBITDA margin customer retention growth capital expenditure working "
+    "capital senior debt covenant leverage ratio management pipeline bookings "
+    "forecast gross margin product mix market share acquisition integration the "
+    "company reported results for the period compared with prior year"
+).split()
+
+
+def _texts(n: int, rng: random.Random):
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(80, 250))) for _ in range(n)]
+
+
+def _best(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    """Run the inference backend benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs="+", default=["torch", "onnx", "onnx-int8"], help="Backends to compare")
+    parser.add_argument("--threads", type=int, default=1, help="Intra-op threads per model (0 = library default)")
+    parser.add_argument("--pairs", type=int, default=20, help="Cross-encoder pairs per chat turn")
+    parser.add_argument("--chunks", type=int, default=256, help="Chunks per bulk embedding call")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best time reported)")
+    args = parser.parse_args()
+
+    settings.inference_threads = args.threads
+    rng = random.Random(7)
+    query = "What was EBITDA margin in fiscal 2023 and how did it change?"
+    turn_texts = _texts(args.pairs, rng)
+    bulk_texts = _texts(args.chunks, rng)
+    cores = args.threads or None
+
+    baseline = {}
+    print(f"threads={args.threads or 'default'}  pairs/turn={args.pairs}  bulk chunks={args.chunks}")
+    for backend in args.backends:
+        embedder = SentenceTransformerEmbedding(settings.sentence_transformer_model, backend=backend)
+        reranker = Reranker(use_score_cache=False, backend=backend)
+        pairs = [[query, text] for text in turn_texts]
+
+        # Warm-up (first forward pass allocates)
+        embedder.embed_text(query)
+        reranker.score_pairs(pairs)
+
+        turn_s = _best(lambda: (embedder.embed_text(query), reranker.score_pairs(pairs)), args.repeat)
+        bulk_s = _best(lambda: embedder.embed_batch(bulk_texts), max(1, args.repeat // 2))
+
+        turns_per_s = 1 / turn_s
+        chunks_per_s = args.chunks / bulk_s
+        if not baseline:
+            baseline = {"turn": turns_per_s, "bulk": chunks_per_s}
+        per_core = f"{turns_per_s / cores:7.1f} turns/core-s" if cores else ""
+        print(
+            f"\n{backend}\n"
+            f"  chat turn   {turn_s * 1000:8.1f} ms   {turns_per_s:7.1f} turns/s  {per_core}"
+            f"   speedup {turns_per_s / baseline['turn']:.2f}x\n"
+            f"  bulk embed  {bulk_s * 1000:8.1f} ms   {chunks_per_s:7.1f} chunks/s"
+            f"   speedup {chunks_per_s / baseline['bulk']:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# backend/scripts/benchmark_rag_service_setup.py
+"""RAGService per-request setup benchmark
+
+Measures the cost of constructing RAGService for one chat request:
+
+    per-request  - full component graph built per request (previous behaviour:
+                   new LLMClients / Anthropic HTTP clients, Redis client,
+                   repositories, retrievers)
+    shared       - RAGService over the process-wide RAGComponents graph
+                   (only session-bound retrievers and handlers are created)
+
+Models (embedder, reranker) are loaded once before timing in both modes, as
+they were already process singletons. No network calls are made; the numbers
+exclude the connection/TLS setup the per-request mode also paid on first use.
+
+Usage:
+    python scripts/benchmark_rag_service_setup.py
+    python scripts/benchmark_rag_service_setup.py --iterations 500
+"""
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database import SessionLocal
+from app.core.rag.components import RAGComponents, get_rag_components
+from app.core.rag.rag_service import RAGService
+
+
+def _bench(name: str, iterations: int, make_service) -> float:
+    db = SessionLocal()
+    try:
+        make_service(db)  # Warm up imports / lazy singletons
+        timings = []
+        tracemalloc.start()
+        for _ in range(iterations):
+            start = time.perf_counter()
+            make_service(db)
+            timings.append((time.perf_counter() - start) * 1000)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        db.close()
+
+    timings.sort()
+    p50 = statistics.median(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"  {name:<12} p50 {p50:8.3f} ms   p95 {p95:8.3f} ms   peak alloc {peak / 1024:8.1f} KiB")
+    return p50
+
+
+def main():
+    """Run the setup benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200, help="Constructions per mode")
+    args = parser.parse_args()
+
+    print("Loading shared components (models, clients)...")
+    components = get_rag_components()
+
+    print(f"\nRAGService setup cost ({args.iterations} iterations)")
+    before = _bench(
+        "per-request",
+        args.iterations,
+        lambda db: RAGService(db, components=RAGComponents.build(reranker=components.reranker)),
+    )
+    after = _bench("shared", args.iterations, lambda db: RAGService(db, components=components))
+    if after > 0:
+        print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# backend/scripts/benchmark_session_vector_index.py
+"""Session vector index benchmark
+
+Runs document-scoped semantic search over real chunks and compares:
+
+    pgvector  - ORDER BY embedding <=> query with the document_id filter
+                (what the planner picks: HNSW + post-filter or exact scan)
+    session   - SessionVectorIndex (in-memory exact NumPy search)
+
+Ground truth is an exact scan in Postgres (index scans disabled). Reports
+median / p95 latency and recall@k per mode, plus the one-off index build time.
+
+Query vectors are chunk embeddings from the set with Gaussian noise added,
+so no query is an exact copy of a stored vector.
+
+Requires DATABASE_URL pointing at a Postgres with pgvector and indexed documents.
+
+Usage:
+    python scripts/benchmark_session_vector_index.py --documents 5
+    python scripts/benchmark_session_vector_index.py --document-ids <id> <id> --queries 200 --top-k 18
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import numpy as np
+from sqlalchemy import select, text
+
+from app.database import SessionLocal
+from app.db_models_chat import DocumentChunk
+from app.db_models_documents import Document
+from app.core.rag.session_vector_index import SessionVectorIndexCache
+
+
+def _pgvector_search(db, embedding, document_ids, top_k):
+    distance = DocumentChunk.embedding.cosine_distance(embedding)
+    stmt = (
+        select(DocumentChunk.id)
+        .where(DocumentChunk.document_id.in_(document_ids))
+        .order_by(distance)
+        .limit(top_k)
+    )
+    return [row.id for row in db.execute(stmt)]
+
+
+def _exact_search(db, embedding, document_ids, top_k):
+    db.execute(text("SET LOCAL enable_indexscan = off"))
+    db.execute(text("SET LOCAL enable_bitmapscan = off"))
+    try:
+        return _pgvector_search(db, embedding, document_ids, top_k)
+    finally:
+        db.rollback()
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def _report(name, latencies, recalls):
+    p95 = sorted(latencies)[max(0, int(len(latencies) * 0.95) - 1)]
+    print(f"  {name:<10} median {statistics.median(latencies):8.3f} ms   p95 {p95:8.3f} ms   "
+          f"recall@k {statistics.mean(recalls):.4f}")
+
+
+def main():
+    """Run the session vector index benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=5, help="Use the N most recent completed documents")
+    parser.add_argument("--document-ids", nargs="+", help="Explicit document ids (overrides --documents)")
+    parser.add_argument("--queries", type=int, default=100, help="Number of query vectors")
+    parser.add_argument("--top-k", type=int, default=18, help="Results per query")
+    parser.add_argument("--noise", type=float, default=0.05, help="Std-dev of noise added to query vectors")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        document_ids = args.document_ids or [
+            row.id for row in db.execute(
+                select(Document.id)
+                .where(Document.status == "completed", Document.chunk_count > 0)
+                .order_by(Document.completed_at.desc())
+                .limit(args.documents)
+            )
+        ]
+        if not document_ids:
+            print("No completed documents found")
+            return
+
+        cache = SessionVectorIndexCache(max_entries=1, max_chunks=10_000_000)
+        index, build_ms = _timed(lambda: cache.get(db, document_ids))
+        print(f"{len(document_ids)} documents, {len(index)} chunks, "
+              f"index {index.nbytes / 1e6:.1f} MB built in {build_ms:.1f} ms, top_k={args.top_k}")
+        if not len(index):
+            return
+
+        rng = np.random.default_rng(0)
+        rows = rng.choice(len(index), size=min(args.queries, len(index)), replace=False)
+        queries = index.matrix[rows] + rng.normal(0, args.noise, (len(rows), index.matrix.shape[1]))
+        queries = [q.astype(np.float32).tolist() for q in queries]
+
+        pg_latencies, pg_recalls, session_latencies, session_recalls = [], [], [], []
+        for query in queries:
+            truth = set(_exact_search(db, query, document_ids, args.top_k))
+
+            pg_ids, elapsed = _timed(lambda: _pgvector_search(db, query, document_ids, args.top_k))
+            pg_latencies.append(elapsed)
+            pg_recalls.append(len(truth & set(pg_ids)) / len(truth))
+
+            # Cache lookup included (one signature query), as in the retriever
+            hits, elapsed = _timed(lambda: cache.get(db, document_ids).search(query, args.top_k))
+            session_latencies.append(elapsed)
+            session_recalls.append(len(truth & {chunk_id for chunk_id, _ in hits}) / len(truth))
+
+        # Search only (matmul + top-k), excluding the signature round-trip
+        search_latencies = [_timed(lambda: index.search(query, args.top_k))[1] for query in queries]
+
+        print()
+        _report("pgvector", pg_latencies, pg_recalls)
+        _report("session", session_latencies, session_recalls)
+        print(f"  {'(search)':<10} median {statistics.median(search_latencies):8.3f} ms")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# backend/scripts/load_test_chat.py
+"""Chat SSE load test
+
+Fires N concurrent chat turns at a running API process and reports
+time-to-first-chunk and total latency percentiles (p50/p95/p99). While the
+chats run, a probe polls /api/health; if blocking work leaks onto the event
+loop, probe latency spikes alongside the chat turns.
+
+Usage:
+    python scripts/load_test_chat.py --token $CLERK_JWT --session-id <id> [--session-id <id> ...]
+    python scripts/load_test_chat.py --token $CLERK_JWT --session-id <id> --concurrency 20 --rounds 3
+
+Sessions are used round-robin; pass several to avoid serializing on one
+session's history. Every turn is persisted like a real chat message.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[idx]
+
+
+def _report(name: str, values: List[float]) -> None:
+    if not values:
+        print(f"  {name:<22} no samples")
+        return
+    print(
+        f"  {name:<22} n={len(values):<4} "
+        f"p50={_percentile(values, 50):8.0f}ms  "
+        f"p95={_percentile(values, 95):8.0f}ms  "
+        f"p99={_percentile(values, 99):8.0f}ms  "
+        f"max={max(values):8.0f}ms"
+    )
+
+
+async def _chat_turn(client: httpx.AsyncClient, session_id: str, message: str) -> Dict[str, Optional[float]]:
+    """Run one chat turn; return first-chunk and total latency in ms (None on error)."""
+    start = time.perf_counter()
+    first_chunk_ms = None
+    error = None
+    try:
+        async with client.stream(
+            "POST",
+            f"/api/chat/sessions/{session_id}/chat",
+            data={"message": message},
+        ) as response:
+            if response.status_code != 200:
+                error = f"HTTP {response.status_code}"
+            else:
+                event = None
+                async for line in response.aiter_lines():
+                    if line.startswith("event:"):
+                        event = line[len("event:"):].strip()
+                        if event == "chunk" and first_chunk_ms is None:
+                            first_chunk_ms = (time.perf_counter() - start) * 1000
+                        elif event == "error":
+                            error = "SSE error event"
+    except httpx.HTTPError as e:
+        error = type(e).__name__
+    return {
+        "first_chunk_ms": first_chunk_ms,
+        "total_ms": (time.perf_counter() - start) * 1000,
+        "error": error,
+    }
+
+
+async def _probe(client: httpx.AsyncClient, stop: asyncio.Event, interval: float, samples: List[float]) -> None:
+    """Poll the health endpoint; its latency tracks event-loop responsiveness."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            await client.get("/api/health")
+            samples.append((time.perf_counter() - start) * 1000)
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(interval)
+
+
+async def run(args) -> None:
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    timeout = httpx.Timeout(args.timeout, connect=10.0)
+    limits = httpx.Limits(max_connections=args.concurrency + 2)
+
+    async with httpx.AsyncClient(base_url=args.base_url, headers=headers, timeout=timeout, limits=limits) as client:
+        probe_samples: List[float] = []
+        stop = asyncio.Event()
+        probe_task = asyncio.create_task(_probe(client, stop, args.probe_interval, probe_samples))
+
+        results = []
+        wall_start = time.perf_counter()
+        for round_idx in range(args.rounds):
+            turns = [
+                _chat_turn(client, args.session_id[i % len(args.session_id)], f"{args.message} (#{round_idx}-{i})")
+                for i in range(args.concurrency)
+            ]
+            results.extend(await asyncio.gather(*turns))
+        wall_s = time.perf_counter() - wall_start
+
+        stop.set()
+        await probe_task
+
+    ok = [r for r in results if r["error"] is None]
+    errors = [r["error"] for r in results if r["error"] is not None]
+
+    print(f"\n{len(results)} chat turns ({args.concurrency} concurrent x {args.rounds} rounds) in {wall_s:.1f}s")
+    _report("first chunk", [r["first_chunk_ms"] for r in ok if r["first_chunk_ms"] is not None])
+    _report("total", [r["total_ms"] for r in ok])
+    _report("health probe", probe_samples)
+    if probe_samples:
+        print(f"  health probe mean      {statistics.mean(probe_samples):.0f}ms")
+    if errors:
+        print(f"  errors: {len(errors)} ({', '.join(sorted(set(errors)))})")
+
+
+def main():
+    """Run the chat load test"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default=os.getenv("LOAD_TEST_BASE_URL", "http://localhost:8000"))
+    parser.add_argument("--token", default=os.getenv("LOAD_TEST_TOKEN", ""), help="Bearer token (Clerk session JWT)")
+    parser.add_argument("--session-id", action="append", required=True, help="Chat session id (repeatable)")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent chat turns per round")
+    parser.add_argument("--rounds", type=int, default=1)
+    parser.add_argument("--message", default="Summarize the key financial metrics in these documents")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Per-request timeout (seconds)")
+    parser.add_argument("--probe-interval", type=float, default=0.25, help="Health probe interval (seconds)")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
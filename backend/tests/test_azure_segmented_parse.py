@@ -0,0 +1,138 @@
+import asyncio
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import fitz
+
+from app.core.parsers.azure_document_intelligence_parser import AzureDocumentIntelligenceParser
+
+SEGMENT_LATENCY_SECONDS = 0.3
+
+
+def _ns(value):
+    """Recorded JSON response -> attribute objects (like the SDK models)."""
+    if isinstance(value, dict):
+        return SimpleNamespace(**{k: _ns(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return [_ns(v) for v in value]
+    return value
+
+
+def _recorded_response(page_texts):
+    """Response shaped like a recorded prebuilt-layout result for one segment (page numbers 1..n)."""
+    content, pages, paragraphs, tables, kvs = "", [], [], [], []
+    for i, text in enumerate(page_texts, start=1):
+        region = [{"page_number": i, "polygon": [0, 0, 1, 0, 1, 1, 0, 1]}]
+        span = {"offset": len(content), "length": len(text)}
+        pages.append({"page_number": i, "spans": [span], "lines": [{"content": text, "spans": [span]}]})
+        paragraphs.append({"content": text, "role": "sectionHeading" if i == 1 else None,
+                           "bounding_regions": region, "spans": [span]})
+        tables.append({
+            "row_count": 1, "column_count": 2, "bounding_regions": region, "spans": [],
+            "cells": [
+                {"row_index": 0, "column_index": 0, "content": "Revenue", "bounding_regions": region, "spans": []},
+                {"row_index": 0, "column_index": 1, "content": str(i), "bounding_regions": region, "spans": []},
+            ],
+        })
+        kvs.append({"confidence": 0.9,
+                    "key": {"content": f"Key {i}", "bounding_regions": region, "spans": []},
+                    "value": {"content": text, "bounding_regions": region, "spans": []}})
+        content += text + "\n"
+    return _ns({
+        "content": content,
+        "pages": pages,
+        "paragraphs": paragraphs,
+        "tables": tables,
+        "key_value_pairs": kvs,
+        "sections": [{"spans": [], "elements": [f"/paragraphs/{j}" for j in range(len(page_texts))]}],
+        "figures": [],
+    })
+
+
+class _FakePoller:
+    def __init__(self, result):
+        self._result = result
+
+    async def result(self):
+        await asyncio.sleep(SEGMENT_LATENCY_SECONDS)
+        return self._result
+
+
+class _FakeAsyncClient:
+    """Answers begin_analyze_document with a recorded-style response for the submitted pages."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def begin_analyze_document(self, model_id, body=None, features=None):
+        self.calls += 1
+        doc = fitz.open(stream=body.bytes_source, filetype="pdf")
+        page_texts = [page.get_text().strip() for page in doc]
+        doc.close()
+        return _FakePoller(_recorded_response(page_texts))
+
+
+def _make_pdf(path: Path, pages: int) -> None:
+    doc = fitz.open()
+    for i in range(pages):
+        doc.new_page().insert_text((72, 72), f"Page {i + 1} of the confidential information memorandum")
+    doc.save(str(path))
+    doc.close()
+
+
+def _parser(client, segment_pages=50, max_concurrency=8):
+    parser = AzureDocumentIntelligenceParser(
+        endpoint="https://example.invalid", api_key="test", async_client=client
+    )
+    parser.segment_pages = segment_pages
+    parser.parallel_min_pages = 100
+    parser.max_concurrency = max_concurrency
+    return parser
+
+
+def test_segmented_parse_merges_and_rebases(tmp_path: Path):
+    pdf = tmp_path / "cim.pdf"
+    _make_pdf(pdf, 400)
+    client = _FakeAsyncClient()
+
+    start = time.perf_counter()
+    output = asyncio.run(_parser(client).parse(str(pdf), "digital"))
+    elapsed = time.perf_counter() - start
+
+    assert client.calls == 8
+    assert output.metadata["segments"] == 8
+    assert output.page_count == 400
+    assert output.cost_usd == 400 * 0.01
+    # 8 concurrent segments finish in about one segment's latency, not eight
+    assert elapsed < SEGMENT_LATENCY_SECONDS * 3
+
+    pages = output.metadata["pages_data"]
+    assert [p["page_number"] for p in pages] == list(range(1, 401))
+    for p in (pages[0], pages[49], pages[50], pages[399]):
+        assert p["narrative_text"].startswith(f"Page {p['page_number']} ")
+        assert p["tables"][0]["bounding_regions"][0]["page_number"] == p["page_number"]
+
+    kv = output.metadata["key_value_pairs"][275]
+    assert kv["key"] == "Key 26"  # Key numbering is per segment; page is rebased
+    assert kv["page_number"] == 276
+    assert all(br["page_number"] == 276 for br in kv["bounding_regions"])
+
+    structured = output.metadata["structured_data"]
+    content = asyncio.run(_parser(_FakeAsyncClient())._analyze(pdf.read_bytes()))[0].content
+    para = structured["paragraphs"][333]
+    span = para["spans"][0]
+    assert content[span["offset"]:span["offset"] + span["length"]] == para["content"]
+    assert structured["sections"][1]["elements"][0] == "/paragraphs/50"
+
+
+def test_small_document_is_one_request(tmp_path: Path):
+    pdf = tmp_path / "short.pdf"
+    _make_pdf(pdf, 20)
+    client = _FakeAsyncClient()
+
+    output = asyncio.run(_parser(client).parse(str(pdf), "digital"))
+
+    assert client.calls == 1
+    assert output.metadata["segments"] == 1
+    assert [p["page_number"] for p in output.metadata["pages_data"]] == list(range(1, 21))
@@ -0,0 +1,57 @@
+import pytest
+
+from app.core.rag.fusion import (
+    reciprocal_rank_fusion,
+    weighted_sum_fusion,
+    comb_mnz_fusion,
+)
+
+
+def _lists():
+    semantic = [{"id": "a", "semantic_score": 1.0}, {"id": "b", "semantic_score": 0.5}]
+    keyword = [{"id": "b", "keyword_score": 1.0, "raw_rank": 0.3}, {"id": "c", "keyword_score": 0.2}]
+    return semantic, keyword
+
+
+def test_rrf_scores_ranks_and_carry():
+    semantic, keyword = _lists()
+    fused = reciprocal_rank_fusion(
+        [semantic, keyword],
+        k=60,
+        rank_keys=("semantic_rank", "keyword_rank"),
+        carry_keys=("keyword_score", "raw_rank"),
+    )
+    by_id = {r["id"]: r for r in fused}
+
+    assert [r["id"] for r in fused] == ["b", "a", "c"]
+    assert by_id["b"]["hybrid_score"] == pytest.approx(1 / 62 + 1 / 61)
+    assert by_id["a"]["keyword_rank"] is None
+    assert by_id["c"]["semantic_rank"] is None
+    # Semantic row is kept (no copy) and keyword fields are carried onto it
+    assert by_id["b"] is semantic[1]
+    assert by_id["b"]["keyword_score"] == 1.0
+    assert by_id["b"]["raw_rank"] == 0.3
+
+
+def test_rrf_top_k_and_duplicate_within_list():
+    fused = reciprocal_rank_fusion([[{"id": "a"}, {"id": "a"}, {"id": "b"}]], k=0, top_k=1)
+    assert len(fused) == 1
+    assert fused[0]["id"] == "a"
+    assert fused[0]["hybrid_score"] == pytest.approx(1.0)
+
+
+def test_weighted_sum_and_comb_mnz():
+    semantic, keyword = _lists()
+    fused = weighted_sum_fusion(
+        [semantic, keyword], score_keys=("semantic_score", "keyword_score"), weights=(0.5, 0.5)
+    )
+    assert {r["id"]: r["hybrid_score"] for r in fused} == pytest.approx({"a": 0.5, "b": 0.75, "c": 0.1})
+
+    semantic, keyword = _lists()
+    fused = comb_mnz_fusion([semantic, keyword], score_keys=("semantic_score", "keyword_score"))
+    assert {r["id"]: r["hybrid_score"] for r in fused} == pytest.approx({"a": 1.0, "b": 3.0, "c": 0.2})
+
+
+def test_mismatched_weights_raise():
+    with pytest.raises(ValueError):
+        reciprocal_rank_fusion([[], []], weights=(1.0,))
@@ -0,0 +1,66 @@
+"""ONNX export paths of load_transformer_model (models and exporter faked; runs by default)."""
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from app.config import settings
+from app.core.inference_backend import load_transformer_model
+
+
+class _FakeModel:
+    """Stands in for SentenceTransformer / CrossEncoder; records how it was constructed."""
+
+    loads = []
+
+    def __init__(self, name_or_path, backend="torch", model_kwargs=None, **kwargs):
+        self.name_or_path = name_or_path
+        _FakeModel.loads.append({"path": name_or_path, "backend": backend, "model_kwargs": model_kwargs})
+
+    def save_pretrained(self, path):
+        (Path(path) / "onnx").mkdir(parents=True, exist_ok=True)
+        (Path(path) / "onnx" / "model.onnx").write_bytes(b"fp32")
+
+
+@pytest.fixture
+def exporter(monkeypatch, tmp_path):
+    """Fake sentence_transformers exporter that names files like the real one."""
+    calls = []
+
+    def export_dynamic_quantized_onnx_model(model, quantization_config, model_name_or_path, file_suffix=None):
+        # Real default: f"{weights_dtype.name.lower()}_{config}" -> "quint8_avx2" for avx2
+        file_suffix = file_suffix or f"quint8_{quantization_config}"
+        calls.append(file_suffix)
+        (Path(model_name_or_path) / "onnx" / f"model_{file_suffix}.onnx").write_bytes(b"int8")
+
+    monkeypatch.setitem(sys.modules, "sentence_transformers", types.SimpleNamespace(
+        export_dynamic_quantized_onnx_model=export_dynamic_quantized_onnx_model
+    ))
+    monkeypatch.setitem(sys.modules, "onnxruntime", types.SimpleNamespace(
+        SessionOptions=types.SimpleNamespace,
+        GraphOptimizationLevel=types.SimpleNamespace(ORT_ENABLE_ALL="all"),
+    ))
+    monkeypatch.setattr(settings, "onnx_model_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "onnx_quantization_config", "avx2")
+    _FakeModel.loads = []
+    return calls
+
+
+def test_int8_export_is_loaded_and_reused(exporter, tmp_path):
+    first = load_transformer_model(_FakeModel, "org/model", backend="onnx-int8")
+    second = load_transformer_model(_FakeModel, "org/model", backend="onnx-int8")
+
+    assert len(exporter) == 1  # Second process start reuses the export
+    file_name = _FakeModel.loads[-1]["model_kwargs"]["file_name"]
+    assert (Path(second.name_or_path) / file_name).exists()
+    assert (Path(first.name_or_path) / file_name).read_bytes() == b"int8"
+    assert Path(first.name_or_path).parent == tmp_path / "org__model"
+
+
+def test_fp32_export_path(exporter):
+    model = load_transformer_model(_FakeModel, "org/model", backend="onnx")
+
+    assert exporter == []
+    assert _FakeModel.loads[-1]["model_kwargs"]["file_name"] == "onnx/model.onnx"
+    assert (Path(model.name_or_path) / "onnx" / "model.onnx").exists()
@@ -0,0 +1,87 @@
+"""Parity of the ONNX inference backends against PyTorch.
+
+Downloads and exports the configured models, so it only runs when
+RUN_MODEL_PARITY_TESTS=1 (and onnxruntime is installed):
+
+    RUN_MODEL_PARITY_TESTS=1 pytest tests/test_inference_backend_parity.py
+"""
+import os
+
+import numpy as np
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("RUN_MODEL_PARITY_TESTS") != "1", reason="set RUN_MODEL_PARITY_TESTS=1 to load and export models"
+)
+
+# Minimum per-text cosine (embeddings) / Spearman correlation (cross-encoder scores) vs torch
+THRESHOLDS = {"onnx": (0.999, 0.999), "onnx-int8": (0.98, 0.95)}
+
+QUERY = "What was EBITDA margin in fiscal 2023?"
+TEXTS = [
+    "EBITDA margin expanded to 24.1% in fiscal 2023 from 21.7% in fiscal 2022, driven by pricing.",
+    "Revenue grew 18% year over year to $142.3 million on new customer acquisition.",
+    "The senior credit facility carries a maximum total leverage covenant of 4.50x.",
+    "Management team: CEO joined in 2019 after 12 years at a leading competitor.",
+    "Gross margin by product line: Software 81%, Services 34%, Hardware 22%.",
+    "Adjusted EBITDA of $34.2 million excludes one-time integration costs of $2.1 million.",
+    "Customer retention remained above 95% for the top 50 accounts across all cohorts.",
+    "Capital expenditures were $6.8 million, primarily facility upgrades and equipment.",
+    "Net revenue retention by cohort: 2020 cohort 118%, 2021 cohort 112%, 2022 cohort 109%.",
+    "Working capital needs are seasonal, peaking in the third quarter ahead of holiday demand.",
+    "The company operates 14 distribution centers across North America.",
+    "EBITDA margin is expected to reach 26% in fiscal 2024 as operating leverage improves.",
+]
+
+
+def _spearman(a, b):
+    rank_a = np.argsort(np.argsort(a))
+    rank_b = np.argsort(np.argsort(b))
+    return float(np.corrcoef(rank_a, rank_b)[0, 1])
+
+
+@pytest.fixture(scope="module")
+def torch_models():
+    pytest.importorskip("sentence_transformers")
+    from app.config import settings
+    from app.core.embeddings.sentence_transformer import SentenceTransformerEmbedding
+    from app.core.rag.reranker import Reranker
+
+    embedder = SentenceTransformerEmbedding(settings.sentence_transformer_model, backend="torch")
+    reranker = Reranker(use_score_cache=False, backend="torch")
+    return embedder, reranker
+
+
+@pytest.mark.parametrize("backend", ["onnx", "onnx-int8"])
+def test_embedding_parity(torch_models, backend):
+    pytest.importorskip("onnxruntime")
+    from app.core.embeddings.sentence_transformer import SentenceTransformerEmbedding
+
+    reference, _ = torch_models
+    candidate = SentenceTransformerEmbedding(reference.model_name, backend=backend)
+
+    expected = np.asarray(reference.embed_batch(TEXTS + [QUERY]), dtype=np.float32)
+    actual = np.asarray(candidate.embed_batch(TEXTS + [QUERY]), dtype=np.float32)
+    cosine = (expected * actual).sum(axis=1) / (
+        np.linalg.norm(expected, axis=1) * np.linalg.norm(actual, axis=1)
+    )
+
+    assert actual.shape == expected.shape
+    assert cosine.min() >= THRESHOLDS[backend][0]
+
+
+@pytest.mark.parametrize("backend", ["onnx", "onnx-int8"])
+def test_cross_encoder_parity(torch_models, backend):
+    pytest.importorskip("onnxruntime")
+    from app.core.rag.reranker import Reranker
+
+    _, reference = torch_models
+    candidate = Reranker(use_score_cache=False, backend=backend)
+
+    pairs = [[QUERY, text] for text in TEXTS]
+    expected = reference.score_pairs(pairs)
+    actual = candidate.score_pairs(pairs)
+
+    assert _spearman(expected, actual) >= THRESHOLDS[backend][1]
+    # Same top result, so reranked context is unchanged for the typical turn
+    assert int(np.argmax(actual)) == int(np.argmax(expected))
@@ -0,0 +1,64 @@
+import gc
+import time
+
+import pytest
+
+from app.config import settings
+from app.services import job_tracker
+from app.services.job_tracker import JobProgressTracker, flush_pending_job_progress
+
+
+class _FakeSession:
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Record UPDATE values instead of touching the database."""
+    recorded = []
+
+    def _write(self, db, values, trigger):
+        recorded.append((self.job_id, values, trigger))
+        return True
+
+    monkeypatch.setattr(JobProgressTracker, "_write", _write)
+    monkeypatch.setattr(job_tracker, "publish_event", lambda *args, **kwargs: None)
+    monkeypatch.setattr("app.database.SessionLocal", _FakeSession)
+    return recorded
+
+
+def _run_task(job_id: str, flush_seconds: float):
+    """Like a Celery task: short-lived tracker whose last update is coalesced, not written."""
+    tracker = JobProgressTracker(db=None, job_id=job_id)
+    tracker._flush_interval = flush_seconds
+    tracker._snapshot = {
+        "status": "processing", "current_stage": "combining", "progress_percent": 60,
+        "message": "Combining", "details": None, "extraction_id": None,
+    }
+    tracker.update_progress(progress_percent=65, message="Context combined")
+    assert tracker.has_pending()
+
+
+def _progress_writes(writes, job_id):
+    return [values for written_job, values, _ in writes if written_job == job_id and values.get("progress_percent") == 65]
+
+
+def test_last_update_is_written_after_tracker_goes_out_of_scope(writes):
+    _run_task("job-timer", flush_seconds=0.2)
+    gc.collect()
+
+    deadline = time.monotonic() + max(5.0, settings.job_progress_flush_seconds * 3)
+    while not _progress_writes(writes, "job-timer") and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert _progress_writes(writes, "job-timer")[0]["message"] == "Context combined"
+
+
+def test_task_exit_flush_writes_pending_update(writes):
+    _run_task("job-postrun", flush_seconds=3600)
+    gc.collect()
+
+    flush_pending_job_progress()
+
+    assert len(_progress_writes(writes, "job-postrun")) == 1
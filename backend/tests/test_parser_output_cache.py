@@ -0,0 +1,119 @@
+import pytest
+
+from app.config import settings
+from app.core.parsers import output_cache
+from app.core.parsers.base import DocumentParser, ParserOutput
+from app.core.parsers.output_cache import ParserOutputCache, parse_with_cache
+
+CONTENT_HASH = "a" * 64
+
+
+class _FakeParser(DocumentParser):
+    def __init__(self):
+        self.calls = 0
+
+    async def parse(self, file_path: str, pdf_type: str) -> ParserOutput:
+        self.calls += 1
+        return ParserOutput(text="Revenue 10", page_count=1, parser_name=self.name,
+                            parser_version=self.version, cost_usd=0.01)
+
+    @property
+    def name(self) -> str:
+        return "fake"
+
+    @property
+    def version(self) -> str:
+        return "1"
+
+    @property
+    def cost_per_page(self) -> float:
+        return 0.01
+
+    def supports_pdf_type(self, pdf_type: str) -> bool:
+        return True
+
+
+class _MemoryParserOutputCache(ParserOutputCache):
+    """Index and blobs in dicts (stands in for Redis + the artifact store)."""
+
+    def __init__(self):
+        super().__init__(ttl_seconds=60, lock_wait_seconds=1)
+        self.client = None
+        self.pdf_types = {}
+        self.outputs = {}
+
+    def get_pdf_type(self, content_hash):
+        return self.pdf_types.get(content_hash)
+
+    def set_pdf_type(self, content_hash, pdf_type):
+        self.pdf_types[content_hash] = pdf_type
+
+    def get(self, content_hash, parser, tier):
+        return self.outputs.get(self.key_for(content_hash, parser, tier))
+
+    def set(self, content_hash, parser, tier, output):
+        self.outputs[self.key_for(content_hash, parser, tier)] = output
+
+
+@pytest.fixture
+def parser(monkeypatch):
+    fake = _FakeParser()
+    monkeypatch.setattr(settings, "parser_cache_enabled", True)
+    monkeypatch.setattr(output_cache.ParserFactory, "get_parser", staticmethod(lambda tier, pdf_type: fake))
+    return fake
+
+
+def test_known_hash_skips_download_and_detection(parser):
+    cache = _MemoryParserOutputCache()
+    downloads, detections = [], []
+
+    def ensure_local_file():
+        downloads.append(1)
+        return "/tmp/doc.pdf"
+
+    def detect(path):
+        detections.append(path)
+        return "digital"
+
+    first, _ = parse_with_cache(CONTENT_HASH, "free", ensure_local_file, detect, cache=cache)
+    assert (len(downloads), len(detections), parser.calls) == (1, 1, 1)
+
+    def fail_download():
+        raise AssertionError("known file must not be downloaded")
+
+    second, pdf_type = parse_with_cache(CONTENT_HASH, "free", fail_download, detect, cache=cache)
+
+    assert pdf_type == "digital"
+    assert second.text == first.text
+    assert second.cost_usd == 0.0
+    assert second.metadata["parser_cache_hit"] is True
+    assert (len(downloads), len(detections), parser.calls) == (1, 1, 1)
+
+
+class _ClassifyingParser(_FakeParser):
+    @property
+    def classifies_pdf_type(self) -> bool:
+        return True
+
+    async def parse(self, file_path: str, pdf_type) -> ParserOutput:
+        output = await super().parse(file_path, pdf_type)
+        output.pdf_type = pdf_type or "digital"
+        return output
+
+
+def test_classifying_parser_skips_detection(monkeypatch):
+    fake = _ClassifyingParser()
+    monkeypatch.setattr(settings, "parser_cache_enabled", True)
+    monkeypatch.setattr(output_cache.ParserFactory, "get_parser", staticmethod(lambda tier, pdf_type: fake))
+    cache = _MemoryParserOutputCache()
+
+    def detect(path):
+        raise AssertionError("single-open parser must not need detect_pdf_type")
+
+    first, pdf_type = parse_with_cache(CONTENT_HASH, "free", lambda: "/tmp/doc.pdf", detect, cache=cache)
+    assert pdf_type == "digital"
+    assert cache.get_pdf_type(CONTENT_HASH) == "digital"
+
+    second, _ = parse_with_cache(CONTENT_HASH, "free", lambda: "/tmp/doc.pdf", detect, cache=cache)
+    assert second.metadata["parser_cache_hit"] is True
+    assert fake.calls == 1